@@ -489,9 +489,20 @@ if __name__ == '__main__':
     if config.cmd_args.ml_task_queue_consumer is True:
         trunc_processes_struct[TrunkProcessEnum.ML_TASK_QUEUE].need_to_run = True
 
+    start_method = config['processes']['start_method']
+    if start_method == 'forkserver':
+        if 'forkserver' in mp.get_all_start_methods():
+            # heavy modules are imported once by forkserver, API processes are forked from it
+            mp.get_context('forkserver').set_forkserver_preload(config['processes']['forkserver_preload'])
+        else:
+            logger.warning("'forkserver' start method is not supported by this OS, 'spawn' is used instead")
+            start_method = 'spawn'
+    elif start_method != 'spawn':
+        start_method = 'spawn'
+
     def start_process(trunc_process_data):
         # TODO this 'ctx' is eclipsing 'context' class imported as 'ctx'
-        ctx = mp.get_context("spawn")
+        ctx = mp.get_context(start_method)
         logger.info(f"{trunc_process_data.name} API: starting...")
         try:
             trunc_process_data.process = ctx.Process(
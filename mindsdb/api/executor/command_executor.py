@@ -85,6 +85,9 @@ from .exceptions import (
     WrongArgumentError,
     TableNotExistError,
 )
+from mindsdb.api.executor.utilities.extended_sql import (
+    CreateMaterializedView, RefreshMaterializedView, FlushResultCache
+)
 from mindsdb.api.executor.utilities.functions import download_file
 from mindsdb.api.executor.utilities.sql import query_df
 from mindsdb.integrations.libs.const import (
@@ -94,6 +97,8 @@ from mindsdb.integrations.libs.const import (
 from mindsdb.integrations.libs.response import HandlerStatusResponse
 from mindsdb.interfaces.chatbot.chatbot_controller import ChatBotController
 from mindsdb.interfaces.database.projects import ProjectController
+from mindsdb.interfaces.database.result_cache import integration_result_cache
+from mindsdb.interfaces.database.views import get_refresh_job_name
 from mindsdb.interfaces.jobs.jobs_controller import JobsController
 from mindsdb.interfaces.model.functions import (
     get_model_record,
@@ -527,6 +532,8 @@ class ExecuteCommands:
                         profiler.disable()
                 elif param == "predictor_cache":
                     self.session.predictor_cache = value in (1, True)
+                elif param == "integration_cache":
+                    self.session.integration_cache = value in (1, True)
                 elif param == "context":
                     if value in (0, False, None):
                         # drop context
@@ -574,8 +581,12 @@ class ExecuteCommands:
             CreateAnomalyDetectionModel,  # we may want to specialize these in the future
         ):
             return self.answer_create_predictor(statement, database_name)
-        elif statement_type is CreateView:
+        elif statement_type in (CreateView, CreateMaterializedView):
             return self.answer_create_view(statement, database_name)
+        elif statement_type is RefreshMaterializedView:
+            return self.answer_refresh_view(statement, database_name)
+        elif statement_type is FlushResultCache:
+            return self.answer_flush_result_cache(statement)
         elif statement_type is DropView:
             return self.answer_drop_view(statement, database_name)
         elif statement_type is Delete:
@@ -1312,13 +1323,57 @@ class ExecuteCommands:
                 )
 
         project = self.session.database_controller.get_project(project_name)
+        materialized = isinstance(statement, CreateMaterializedView)
         try:
-            project.create_view(view_name, query=query_str)
+            project.create_view(
+                view_name,
+                query=query_str,
+                materialized=materialized,
+                refresh_key=getattr(statement, "refresh_key", None),
+            )
         except EntityExistsError:
             if getattr(statement, "if_not_exists", False) is False:
                 raise
+            return ExecuteAnswer()
+
+        if materialized:
+            try:
+                affected_rows = project.refresh_view(view_name, session=self.session)
+                if statement.schedule is not None:
+                    refresh_query = RefreshMaterializedView(name=Identifier(parts=[project.name, view_name]))
+                    JobsController().add(
+                        get_refresh_job_name(view_name),
+                        project.name,
+                        query=str(refresh_query),
+                        schedule_str="every " + statement.schedule,
+                        system=True,
+                    )
+            except Exception:
+                project.drop_view(view_name)
+                raise
+            return ExecuteAnswer(affected_rows=affected_rows)
         return ExecuteAnswer()
 
+    def answer_refresh_view(self, statement: RefreshMaterializedView, database_name):
+        name = statement.name
+        view_name = name.parts[-1]
+        project_name = name.parts[-2] if len(name.parts) > 1 else database_name
+
+        project = self.session.database_controller.get_project(project_name)
+        try:
+            affected_rows = project.refresh_view(view_name, session=self.session, full=statement.full)
+        except ValueError as e:
+            raise ExecutorException(str(e)) from e
+        return ExecuteAnswer(affected_rows=affected_rows)
+
+    def answer_flush_result_cache(self, statement: FlushResultCache):
+        name = statement.name.parts[-1]
+        integration = self.session.integration_controller.get(name)
+        if integration is None:
+            raise EntityNotExistsError("Integration does not exist", name)
+        affected_rows = integration_result_cache.invalidate(integration['id'])
+        return ExecuteAnswer(affected_rows=affected_rows)
+
     def answer_drop_view(self, statement, database_name):
         names = statement.names
 
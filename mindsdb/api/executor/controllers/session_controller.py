@@ -47,10 +47,7 @@ class SessionController:
         self.database_controller = DatabaseController()
         self.skills_controller = SkillsController()
         self.function_controller = FunctionController(self)
-
-        # to prevent circular imports
-        from mindsdb.interfaces.knowledge_base.controller import KnowledgeBaseController
-        self.kb_controller = KnowledgeBaseController(self)
+        self._kb_controller = None
 
         self.datahub = InformationSchemaDataNode(self)
         self.agents_controller = AgentsController()
@@ -59,8 +56,18 @@ class SessionController:
         self.packet_sequence_number = 0
         self.profiling = False
         self.predictor_cache = False if self.config.get('cache')['type'] == 'none' else True
+        # results of integrations are cached if it is enabled for integration
+        self.integration_cache = True
         self.show_secrets = False
 
+    @property
+    def kb_controller(self):
+        # knowledge base controller requires langchain, it is imported on the first use
+        if self._kb_controller is None:
+            from mindsdb.interfaces.knowledge_base.controller import KnowledgeBaseController
+            self._kb_controller = KnowledgeBaseController(self)
+        return self._kb_controller
+
     def inc_packet_sequence_number(self):
         self.packet_sequence_number = (self.packet_sequence_number + 1) % 256
 
@@ -92,6 +92,7 @@ class InformationSchemaDataNode(DataNode):
                 database_name,
                 ds_type=integration["engine"],
                 integration_controller=self.session.integration_controller,
+                integration=integration,
             )
         if database_meta["type"] == "project":
             project = self.database_controller.get_project(name=database_name)
@@ -109,6 +110,7 @@ class InformationSchemaDataNode(DataNode):
                     integration_name,
                     ds_type=datasource["engine"],
                     integration_controller=self.session.integration_controller,
+                    integration=datasource,
                 )
 
         return None
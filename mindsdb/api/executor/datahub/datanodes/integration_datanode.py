@@ -1,6 +1,7 @@
 import time
 import inspect
-from dataclasses import astuple
+from dataclasses import astuple, replace
+from typing import Callable, Iterable, List
 
 import numpy as np
 from numpy import dtype as np_dtype
@@ -20,6 +21,10 @@ from mindsdb.api.executor.data_types.response_type import RESPONSE_TYPE
 from mindsdb.api.executor.sql_query.result_set import ResultSet
 from mindsdb.integrations.libs.response import HandlerResponse, INF_SCHEMA_COLUMNS_NAMES
 from mindsdb.integrations.utilities.utils import get_class_name
+from mindsdb.interfaces.database.result_cache import (
+    integration_result_cache, get_result_cache_params, get_dataframe_size, is_select_query
+)
+from mindsdb.interfaces.database.integrations import JOIN_KEYS_TEMP_TABLE_PARAM
 from mindsdb.metrics import metrics
 from mindsdb.utilities import log
 from mindsdb.utilities.profiler import profiler
@@ -27,20 +32,62 @@ from mindsdb.api.executor.datahub.datanodes.system_tables import infer_mysql_typ
 
 logger = log.getLogger(__name__)
 
+# limits of one INSERT statement if handler doesn't have native insert.
+# handler can override them with attributes 'insert_batch_size' and 'insert_batch_max_bytes'
+DEFAULT_INSERT_BATCH_SIZE = 10000
+DEFAULT_INSERT_BATCH_MAX_BYTES = 4 * 1024 * 1024
+
 
 class DBHandlerException(Exception):
     pass
 
 
+def split_insert_values(values: List[list], batch_size: int, max_bytes: int) -> Iterable[List[list]]:
+    """Split rows to batches, every batch has limited count of rows and approximate size of rendered values
+
+    Args:
+        values (List[list]): rows to insert
+        batch_size (int): max count of rows in batch
+        max_bytes (int): max size of rendered values in batch
+
+    Yields:
+        List[list]: batch of rows
+    """
+    batch, batch_bytes = [], 0
+    for row in values:
+        # value, quotes and delimiter
+        row_bytes = sum(len(str(value)) + 3 for value in row)
+        if batch and (len(batch) >= batch_size or batch_bytes + row_bytes > max_bytes):
+            yield batch
+            batch, batch_bytes = [], 0
+        batch.append(row)
+        batch_bytes += row_bytes
+    if batch:
+        yield batch
+
+
 class IntegrationDataNode(DataNode):
     type = 'integration'
 
-    def __init__(self, integration_name, ds_type, integration_controller):
+    def __init__(self, integration_name, ds_type, integration_controller, integration: dict | None = None):
         self.integration_name = integration_name
         self.ds_type = ds_type
         self.integration_controller = integration_controller
         self.integration_handler = self.integration_controller.get_data_handler(self.integration_name)
 
+        # integration record is required to cache results
+        self.result_cache_params = None
+        # keys of joined table can be loaded into a table created in the database, it has to be allowed explicitly
+        self.join_keys_temp_table = False
+        if integration is not None:
+            self.integration_id = integration['id']
+            self.integration_version = integration['date_last_update']
+            self.result_cache_params = get_result_cache_params(integration['connection_data'])
+            connection_data = integration['connection_data']
+            self.join_keys_temp_table = (
+                isinstance(connection_data, dict) and connection_data.get(JOIN_KEYS_TEMP_TABLE_PARAM) is True
+            )
+
     def get_type(self):
         return self.type
 
@@ -116,20 +163,41 @@ class IntegrationDataNode(DataNode):
         df = self.get_table_columns_df(table_name, schema_name)
         return df[INF_SCHEMA_COLUMNS_NAMES.COLUMN_NAME].to_list()
 
-    def drop_table(self, name: Identifier, if_exists=False):
+    def drop_table(self, name: Identifier, if_exists=False, invalidate_cache=True):
         drop_ast = DropTables(
             tables=[name],
             if_exists=if_exists
         )
-        result = self._query(drop_ast)
+        result = self._query(drop_ast, invalidate_cache=invalidate_cache)
         if result.type == RESPONSE_TYPE.ERROR:
             raise Exception(result.error_message)
 
+    def _get_insert_batch_limits(self) -> tuple:
+        """Get limits of one INSERT statement: count of rows and size of values
+
+        Returns:
+            tuple: (batch_size, max_bytes)
+        """
+        limits = []
+        for attr_name, default in (
+            ('insert_batch_size', DEFAULT_INSERT_BATCH_SIZE),
+            ('insert_batch_max_bytes', DEFAULT_INSERT_BATCH_MAX_BYTES)
+        ):
+            value = getattr(self.integration_handler, attr_name, None)
+            if not isinstance(value, int) or value <= 0:
+                value = default
+            limits.append(value)
+        return tuple(limits)
+
     def create_table(self, table_name: Identifier, result_set: ResultSet = None, columns=None,
-                     is_replace=False, is_create=False) -> DataHubResponse:
+                     is_replace=False, is_create=False,
+                     progress_callback: Callable[[int, int], None] | None = None,
+                     invalidate_cache=True) -> DataHubResponse:
         # is_create - create table
         # is_replace - drop table if exists
         # is_create==False and is_replace==False: just insert
+        # progress_callback - is called with count of inserted and total rows after every insert batch
+        # invalidate_cache - False if the table isn't used by cached queries
 
         table_columns_meta = {}
 
@@ -166,7 +234,7 @@ class IntegrationDataNode(DataNode):
                 tables=[table_name],
                 if_exists=True
             )
-            result = self._query(drop_ast)
+            result = self._query(drop_ast, invalidate_cache=invalidate_cache)
             if result.type == RESPONSE_TYPE.ERROR:
                 raise Exception(result.error_message)
             is_create = True
@@ -177,7 +245,7 @@ class IntegrationDataNode(DataNode):
                 columns=columns,
                 is_replace=is_replace
             )
-            result = self._query(create_table_ast)
+            result = self._query(create_table_ast, invalidate_cache=invalidate_cache)
             if result.type == RESPONSE_TYPE.ERROR:
                 raise Exception(result.error_message)
 
@@ -189,7 +257,14 @@ class IntegrationDataNode(DataNode):
         if hasattr(self.integration_handler, 'insert'):
             df = result_set.to_df()
 
-            result: HandlerResponse = self.integration_handler.insert(table_name.parts[-1], df)
+            try:
+                with profiler.Phase(
+                    metrics.INTEGRATION_HANDLER_CALL_TIME, get_class_name(self.integration_handler), 'insert'
+                ):
+                    result: HandlerResponse = self.integration_handler.insert(table_name.parts[-1], df)
+            finally:
+                if invalidate_cache:
+                    self._invalidate_result_cache()
             return DataHubResponse(affected_rows=result.affected_rows)
 
         insert_columns = [Identifier(parts=[x.alias]) for x in result_set.columns]
@@ -216,58 +291,152 @@ class IntegrationDataNode(DataNode):
             # not need to insert
             return DataHubResponse()
 
-        insert_ast = Insert(
-            table=table_name,
-            columns=insert_columns,
-            values=values,
-            is_plain=True
-        )
+        # big insert is split to several statements: to not exceed limits of database
+        batch_size, max_bytes = self._get_insert_batch_limits()
+        affected_rows = None
+        inserted_rows = 0
+        for batch in split_insert_values(values, batch_size, max_bytes):
+            insert_ast = Insert(
+                table=table_name,
+                columns=insert_columns,
+                values=batch,
+                is_plain=True
+            )
 
-        try:
-            result = self._query(insert_ast)
-        except Exception as e:
-            msg = f'[{self.ds_type}/{self.integration_name}]: {str(e)}'
-            raise DBHandlerException(msg) from e
+            try:
+                result = self._query(insert_ast, invalidate_cache=invalidate_cache)
+            except Exception as e:
+                msg = f'[{self.ds_type}/{self.integration_name}]: {str(e)}'
+                raise DBHandlerException(msg) from e
 
-        if result.type == RESPONSE_TYPE.ERROR:
-            raise Exception(result.error_message)
+            if result.type == RESPONSE_TYPE.ERROR:
+                raise Exception(result.error_message)
+
+            if result.affected_rows is not None:
+                affected_rows = (affected_rows or 0) + result.affected_rows
+            inserted_rows += len(batch)
+            if progress_callback is not None:
+                progress_callback(inserted_rows, len(values))
+
+        return DataHubResponse(affected_rows=affected_rows)
+
+    def _invalidate_result_cache(self):
+        if self.result_cache_params is not None:
+            integration_result_cache.invalidate(self.integration_id)
 
-        return DataHubResponse(affected_rows=result.affected_rows)
+    def _get_result_cache_key(self, query: ASTNode | None, native_query: str | None, session) -> tuple | None:
+        """Key of the result of select in the result cache
+
+        Returns:
+            tuple | None: key, None if the result can't be taken from cache
+        """
+        if self.result_cache_params is None:
+            return None
+        try:
+            if query is not None:
+                query_str = query.to_string() if is_select_query(query) else None
+            else:
+                query_str = native_query if is_select_query(native_query) else None
+        except Exception as e:
+            logger.debug(f'Unable to render query for result cache: {e}')
+            query_str = None
+        if query_str is None:
+            return None
+
+        if getattr(session, 'integration_cache', True) is False:
+            metrics.INTEGRATION_RESULT_CACHE_REQUESTS.labels(
+                get_class_name(self.integration_handler), 'bypass').inc()
+            return None
+        return self.integration_id, self.integration_version, query_str
+
+    def _get_cached_result(self, cache_key: tuple) -> DataHubResponse | None:
+        handler_name = get_class_name(self.integration_handler)
+        cached = integration_result_cache.get(cache_key)
+        if cached is None:
+            metrics.INTEGRATION_RESULT_CACHE_REQUESTS.labels(handler_name, 'miss').inc()
+            return None
+
+        response, size = cached
+        metrics.INTEGRATION_RESULT_CACHE_REQUESTS.labels(handler_name, 'hit').inc()
+        metrics.INTEGRATION_RESULT_CACHE_SAVED_BYTES.labels(handler_name).inc(size)
+        # stored dataframe is not changed by the caller
+        return replace(response, data_frame=response.data_frame.copy(), columns=list(response.columns))
+
+    def _set_cached_result(self, cache_key: tuple, response: DataHubResponse, generation: int):
+        size = get_dataframe_size(response.data_frame, self.result_cache_params.max_entry_size)
+        if size is None:
+            return
+        response = replace(response, data_frame=response.data_frame.copy(), columns=list(response.columns))
+        integration_result_cache.set(
+            cache_key, response, size, self.result_cache_params.ttl, self.integration_id, generation
+        )
 
-    def _query(self, query) -> HandlerResponse:
+    def _query(self, query, invalidate_cache=True) -> HandlerResponse:
+        handler_name = get_class_name(self.integration_handler)
         time_before_query = time.perf_counter()
-        result = self.integration_handler.query(query)
+        try:
+            with profiler.Phase(metrics.INTEGRATION_HANDLER_CALL_TIME, handler_name, 'query'):
+                result = self.integration_handler.query(query)
+        finally:
+            # after the change: select executed in parallel could cache the previous state of data
+            if invalidate_cache and not is_select_query(query):
+                self._invalidate_result_cache()
         elapsed_seconds = time.perf_counter() - time_before_query
         query_time_with_labels = metrics.INTEGRATION_HANDLER_QUERY_TIME.labels(
-            get_class_name(self.integration_handler), result.type)
+            handler_name, result.type)
         query_time_with_labels.observe(elapsed_seconds)
 
         num_rows = 0
         if result.data_frame is not None:
             num_rows = len(result.data_frame.index)
         response_size_with_labels = metrics.INTEGRATION_HANDLER_RESPONSE_SIZE.labels(
-            get_class_name(self.integration_handler), result.type)
+            handler_name, result.type)
         response_size_with_labels.observe(num_rows)
         return result
 
     def _native_query(self, native_query) -> HandlerResponse:
+        handler_name = get_class_name(self.integration_handler)
         time_before_query = time.perf_counter()
-        result = self.integration_handler.native_query(native_query)
+        try:
+            with profiler.Phase(metrics.INTEGRATION_HANDLER_CALL_TIME, handler_name, 'native_query'):
+                result = self.integration_handler.native_query(native_query)
+        finally:
+            if not is_select_query(native_query):
+                self._invalidate_result_cache()
         elapsed_seconds = time.perf_counter() - time_before_query
         query_time_with_labels = metrics.INTEGRATION_HANDLER_QUERY_TIME.labels(
-            get_class_name(self.integration_handler), result.type)
+            handler_name, result.type)
         query_time_with_labels.observe(elapsed_seconds)
 
         num_rows = 0
         if result.data_frame is not None:
             num_rows = len(result.data_frame.index)
         response_size_with_labels = metrics.INTEGRATION_HANDLER_RESPONSE_SIZE.labels(
-            get_class_name(self.integration_handler), result.type)
+            handler_name, result.type)
         response_size_with_labels.observe(num_rows)
         return result
 
+    def observe_join_keys(self, strategy: str, keys_count: int):
+        """Record how keys of joined table were sent to the integration
+
+        Args:
+            strategy (str): 'in_list', 'chunks' or 'temp_table'
+            keys_count (int): count of keys
+        """
+        handler_name = get_class_name(self.integration_handler)
+        metrics.INTEGRATION_JOIN_KEYS_STRATEGY.labels(handler_name, strategy).inc()
+        metrics.INTEGRATION_JOIN_KEYS_COUNT.labels(handler_name, strategy).observe(keys_count)
+
     @profiler.profile()
     def query(self, query: ASTNode | None = None, native_query: str | None = None, session=None) -> DataHubResponse:
+        cache_key = self._get_result_cache_key(query, native_query, session)
+        if cache_key is not None:
+            response = self._get_cached_result(cache_key)
+            if response is not None:
+                return response
+            # result is not stored if the integration is changed while query is executed
+            cache_generation = integration_result_cache.get_generation(self.integration_id)
+
         try:
             if query is not None:
                 result: HandlerResponse = self._query(query)
@@ -307,8 +476,11 @@ class IntegrationDataNode(DataNode):
             for k, v in df.dtypes.items()
         ]
 
-        return DataHubResponse(
+        response = DataHubResponse(
             data_frame=df,
             columns=columns_info,
             affected_rows=result.affected_rows
         )
+        if cache_key is not None:
+            self._set_cached_result(cache_key, response, cache_generation)
+        return response
@@ -432,7 +432,10 @@ class AgentsTable(MdbTable):
 
 class ViewsTable(MdbTable):
     name = 'VIEWS'
-    columns = ["NAME", "PROJECT", "QUERY"]
+    columns = [
+        "NAME", "PROJECT", "QUERY", "MATERIALIZED", "REFRESH_KEY",
+        "REFRESHED_AT", "STALENESS", "ROW_COUNT", "REFRESH_ERROR"
+    ]
 
     @classmethod
     def get_data(cls, query: ASTNode = None, **kwargs):
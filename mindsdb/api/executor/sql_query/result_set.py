@@ -1,4 +1,5 @@
 import copy
+from collections import defaultdict
 from typing import List, Optional
 
 import numpy as np
@@ -8,6 +9,10 @@ from mindsdb.api.executor.exceptions import WrongArgumentError
 
 
 class Column:
+    """Immutable description of the column of ResultSet. Use `replace` to get a modified copy"""
+
+    __slots__ = ('name', 'alias', 'table_name', 'table_alias', 'type', 'database', 'flags', 'charset')
+
     def __init__(self, name=None, alias=None,
                  table_name=None, table_alias=None,
                  type=None, database=None, flags=None,
@@ -16,14 +21,31 @@ class Column:
             alias = name
         if table_alias is None:
             table_alias = table_name
-        self.name = name
-        self.alias = alias
-        self.table_name = table_name
-        self.table_alias = table_alias
-        self.type = type
-        self.database = database
-        self.flags = flags
-        self.charset = charset
+        set_attr = object.__setattr__
+        set_attr(self, 'name', name)
+        set_attr(self, 'alias', alias)
+        set_attr(self, 'table_name', table_name)
+        set_attr(self, 'table_alias', table_alias)
+        set_attr(self, 'type', type)
+        set_attr(self, 'database', database)
+        set_attr(self, 'flags', flags)
+        set_attr(self, 'charset', charset)
+
+    def __setattr__(self, key, value):
+        raise AttributeError(f'{self.__class__.__name__} is immutable, use replace() to change "{key}"')
+
+    def __delattr__(self, key):
+        raise AttributeError(f'{self.__class__.__name__} is immutable')
+
+    def __reduce__(self):
+        # used by copy, deepcopy and pickle: the copy is a new column
+        return self.__class__, tuple(getattr(self, attr) for attr in self.__slots__)
+
+    def replace(self, **kwargs) -> 'Column':
+        """Returns new column with changed attributes"""
+        attrs = {attr: getattr(self, attr) for attr in self.__slots__}
+        attrs.update(kwargs)
+        return self.__class__(**attrs)
 
     def get_hash_name(self, prefix):
         table_name = self.table_name if self.table_alias is None else self.table_alias
@@ -33,7 +55,15 @@ class Column:
         return name
 
     def __repr__(self):
-        return f'{self.__class__.__name__}({self.__dict__})'
+        attrs = {attr: getattr(self, attr) for attr in self.__slots__}
+        return f'{self.__class__.__name__}({attrs})'
+
+
+def _index_key(value):
+    # columns are searched by name case-insensitive
+    if isinstance(value, str):
+        return value.lower()
+    return value
 
 
 def rename_df_columns(df: pd.DataFrame, names: Optional[List] = None) -> None:
@@ -61,6 +91,7 @@ class ResultSet:
         if columns is None:
             columns = []
         self._columns = columns
+        self._reset_columns_index()
 
         if values is None:
             df = None
@@ -100,6 +131,7 @@ class ResultSet:
             ) for column_name, column_dtype
             in zip(df.columns, df.dtypes)
         ]
+        self._reset_columns_index()
 
         rename_df_columns(df)
         self._df = df
@@ -163,24 +195,47 @@ class ResultSet:
 
     # --- columns ---
 
+    def _reset_columns_index(self):
+        # position of column object in the list of columns
+        self._col_positions = {}
+        # columns by lowercase alias and by lowercase table alias, in order of the columns
+        self._cols_by_alias = defaultdict(list)
+        self._cols_by_table_alias = defaultdict(list)
+        self._indexed_count = 0
+
+    def _update_columns_index(self):
+        """Adds to the index columns which were appended after the last update.
+        The index is rebuilt if columns were removed"""
+        if self._indexed_count > len(self._columns):
+            self._reset_columns_index()
+
+        for position in range(self._indexed_count, len(self._columns)):
+            col = self._columns[position]
+            self._col_positions.setdefault(id(col), position)
+            self._cols_by_alias[_index_key(col.alias)].append(col)
+            self._cols_by_table_alias[_index_key(col.table_alias)].append(col)
+        self._indexed_count = len(self._columns)
+
     def get_col_index(self, col):
         """
         Get column index
         :param col: column object
         :return: index of column
         """
-
-        col_idx = None
-        for i, col0 in enumerate(self._columns):
-            if col0 is col:
-                col_idx = i
-                break
+        self._update_columns_index()
+        col_idx = self._col_positions.get(id(col))
+        if col_idx is None or self._columns[col_idx] is not col:
+            # list of columns was changed outside of ResultSet
+            self._reset_columns_index()
+            self._update_columns_index()
+            col_idx = self._col_positions.get(id(col))
         if col_idx is None:
             raise WrongArgumentError(f'Column is not found: {col}')
         return col_idx
 
     def add_column(self, col, values=None):
         self._columns.append(col)
+        self._update_columns_index()
 
         col_idx = len(self._columns) - 1
         if self._df is not None:
@@ -190,6 +245,7 @@ class ResultSet:
     def del_column(self, col):
         idx = self.get_col_index(col)
         self._columns.pop(idx)
+        self._reset_columns_index()
 
         self._df.drop(idx, axis=1, inplace=True)
         rename_df_columns(self._df)
@@ -206,21 +262,24 @@ class ResultSet:
         return columns
 
     def find_columns(self, alias=None, table_alias=None):
-        col_list = []
-        for col in self.columns:
-            if alias is not None and col.alias.lower() != alias.lower():
-                continue
-            if table_alias is not None and col.table_alias.lower() != table_alias.lower():
-                continue
-            col_list.append(col)
+        self._update_columns_index()
+        if alias is not None:
+            col_list = self._cols_by_alias.get(_index_key(alias), [])
+            if table_alias is not None:
+                table_alias = _index_key(table_alias)
+                col_list = [col for col in col_list if _index_key(col.table_alias) == table_alias]
+        elif table_alias is not None:
+            col_list = self._cols_by_table_alias.get(_index_key(table_alias), [])
+        else:
+            col_list = self._columns
 
-        return col_list
+        return list(col_list)
 
     def copy_column_to(self, col, result_set2):
         # copy with values
         idx = self.get_col_index(col)
 
-        values = [row[idx] for row in self._records]
+        values = self.get_column_values(idx)
 
         col2 = copy.deepcopy(col)
 
@@ -228,10 +287,22 @@ class ResultSet:
         return col2
 
     def set_col_type(self, col_idx, type_name):
-        self.columns[col_idx].type = type_name
         if self._df is not None:
             self._df[col_idx] = self._df[col_idx].astype(type_name)
 
+        # column is immutable: replace it with the copy
+        self._update_columns_index()
+        col = self._columns[col_idx]
+        new_col = col.replace(type=type_name)
+        self._columns[col_idx] = new_col
+
+        if self._col_positions.get(id(col)) == col_idx:
+            del self._col_positions[id(col)]
+        self._col_positions.setdefault(id(new_col), col_idx)
+        for index, key in ((self._cols_by_alias, col.alias), (self._cols_by_table_alias, col.table_alias)):
+            cols = index[_index_key(key)]
+            cols[cols.index(col)] = new_col
+
     # --- records ---
 
     def get_raw_df(self):
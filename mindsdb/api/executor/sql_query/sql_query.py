@@ -31,6 +31,7 @@ from mindsdb.api.executor.exceptions import (
     LogicError,
 )
 import mindsdb.utilities.profiler as profiler
+from mindsdb.metrics import metrics
 from mindsdb.utilities.fs import create_process_mark, delete_process_mark
 from mindsdb.utilities.exception import EntityNotExistsError
 from mindsdb.interfaces.query_context.context_controller import query_context_controller
@@ -251,7 +252,8 @@ class SQLQuery:
             if any(s in predict_steps for s in steps_classes):
                 process_mark = create_process_mark('predict')
             for step in steps:
-                with profiler.Context(f'step: {step.__class__.__name__}'):
+                step_name = step.__class__.__name__
+                with profiler.Context(f'step: {step_name}'), profiler.Phase(metrics.EXECUTOR_STEP_TIME, step_name):
                     step_result = self.execute_step(step)
                 self.steps_data[step.step_num] = step_result
         except Exception as e:
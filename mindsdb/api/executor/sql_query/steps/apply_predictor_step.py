@@ -32,6 +32,70 @@ def get_preditor_alias(step, mindsdb_database):
     return (mindsdb_database, predictor_name, predictor_alias)
 
 
+def get_column_position(df: pd.DataFrame, name: str) -> int:
+    """Returns position of the column in dataframe, the last one if there are several columns with the name"""
+    positions = [i for i, col in enumerate(df.columns) if col == name]
+    if len(positions) == 0:
+        raise KeyError(name)
+    return positions[-1]
+
+
+def get_group_keys(df: pd.DataFrame, group_cols: list, none_as_nan: bool = False) -> pd.Series:
+    """Combines string representation of group columns to the key of the group
+
+    Args:
+        df (pd.DataFrame): data
+        group_cols (list): names of group columns
+        none_as_nan (bool): represent missing values as 'None' regardless of their type
+
+    Returns:
+        pd.Series: keys of the groups
+    """
+    keys = None
+    for name in group_cols:
+        column = df.iloc[:, get_column_position(df, name)]
+        if pd.api.types.is_object_dtype(column) or pd.api.types.is_numeric_dtype(column):
+            key = column.astype(str)
+        else:
+            key = column.map(str)
+        if none_as_nan:
+            key = key.where(column.notna(), 'None')
+
+        # separator can't be in the string representation of tuple of values
+        keys = key if keys is None else keys + '\x00' + key
+    return keys
+
+
+def get_date_format(samples: list) -> str:
+    # dateinfer reads sql date 2020-04-01 as yyyy-dd-mm. workaround for in
+    for date_format, pattern in (
+        ('%Y-%m-%d', r'[\d]{4}-[\d]{2}-[\d]{2}'),
+        ('%Y-%m-%d %H:%M:%S', r'[\d]{4}-[\d]{2}-[\d]{2} [\d]{2}:[\d]{2}:[\d]{2}'),
+        # ('%Y-%m-%d %H:%M:%S%z', r'[\d]{4}-[\d]{2}-[\d]{2} [\d]{2}:[\d]{2}:[\d]{2}\+[\d]{2}:[\d]{2}'),
+        # ('%Y', '[\d]{4}')
+    ):
+        if re.match(pattern, samples[0]):
+            # suggested format
+            if pd.to_datetime(pd.Series(samples), format=date_format, errors='coerce').notna().all():
+                return date_format
+
+    return dateinfer.infer(list(samples))
+
+
+def cast_ts_dates(values: pd.Series) -> pd.Series:
+    """Converts strings and dates to datetime, type is detected by the first value"""
+    first_value = values.iloc[0]
+    if isinstance(first_value, str):
+        date_format = get_date_format(values.tolist())
+        return pd.to_datetime(values, format=date_format)
+    elif isinstance(first_value, dt.datetime):
+        pass  # check because dt.datetime is instance of dt.date but here we don't need to add HH:MM:SS
+    elif isinstance(first_value, dt.date):
+        # convert to datetime
+        return pd.to_datetime(values)
+    return values
+
+
 class ApplyPredictorBaseCall(BaseStepCall):
 
     def apply_predictor(self, project_name, predictor_name, df, version, params):
@@ -226,10 +290,7 @@ class ApplyPredictorStepCall(ApplyPredictorBaseCall):
 
             # apply filter
             if is_timeseries:
-                pred_data = predictions.to_dict(orient='records')
-                where_data = list(data.get_records())
-                pred_data = self.apply_ts_filter(pred_data, where_data, step, predictor_metadata)
-                predictions = pd.DataFrame(pred_data)
+                predictions = self.apply_ts_filter(predictions, data.to_df(), step, predictor_metadata)
 
             result.from_df(
                 predictions,
@@ -240,7 +301,7 @@ class ApplyPredictorStepCall(ApplyPredictorBaseCall):
 
         return result
 
-    def apply_ts_filter(self, predictor_data, table_data, step, predictor_metadata):
+    def apply_ts_filter(self, predictor_data: pd.DataFrame, table_data: pd.DataFrame, step, predictor_metadata):
 
         if step.output_time_filter is None:
             # no filter, exit
@@ -261,26 +322,13 @@ class ApplyPredictorStepCall(ApplyPredictorBaseCall):
             # exit otherwise
             return predictor_data
 
-        def get_date_format(samples):
-            # dateinfer reads sql date 2020-04-01 as yyyy-dd-mm. workaround for in
-            for date_format, pattern in (
-                ('%Y-%m-%d', r'[\d]{4}-[\d]{2}-[\d]{2}'),
-                ('%Y-%m-%d %H:%M:%S', r'[\d]{4}-[\d]{2}-[\d]{2} [\d]{2}:[\d]{2}:[\d]{2}'),
-                # ('%Y-%m-%d %H:%M:%S%z', r'[\d]{4}-[\d]{2}-[\d]{2} [\d]{2}:[\d]{2}:[\d]{2}\+[\d]{2}:[\d]{2}'),
-                # ('%Y', '[\d]{4}')
-            ):
-                if re.match(pattern, samples[0]):
-                    # suggested format
-                    for sample in samples:
-                        try:
-                            dt.datetime.strptime(sample, date_format)
-                        except ValueError:
-                            date_format = None
-                            break
-                    if date_format is not None:
-                        return date_format
-
-            return dateinfer.infer(samples)
+        if len(predictor_data) == 0:
+            return predictor_data
+
+        # if columns have the same name: the last one is used
+        pred_order_idx = get_column_position(predictor_data, order_col)
+        pred_order = predictor_data.iloc[:, pred_order_idx]
+        table_order = table_data.iloc[:, get_column_position(table_data, order_col)]
 
         model_types = predictor_metadata['model_types']
         if model_types.get(order_col) in ('float', 'integer'):
@@ -290,63 +338,21 @@ class ApplyPredictorStepCall(ApplyPredictorBaseCall):
                 'float': float
             }[model_types[order_col]]
 
-            # convert predictor_data
-            if len(predictor_data) > 0:
-                if isinstance(predictor_data[0][order_col], str):
-
-                    for row in predictor_data:
-                        row[order_col] = fnc(row[order_col])
-                elif isinstance(predictor_data[0][order_col], dt.date):
-                    # convert to datetime
-                    for row in predictor_data:
-                        row[order_col] = fnc(row[order_col])
+            if isinstance(pred_order.iloc[0], (str, dt.date)):
+                pred_order = pred_order.map(fnc)
 
-            # convert predictor_data
-            if isinstance(table_data[0][order_col], str):
-
-                for row in table_data:
-                    row[order_col] = fnc(row[order_col])
-            elif isinstance(table_data[0][order_col], dt.date):
-                # convert to datetime
-                for row in table_data:
-                    row[order_col] = fnc(row[order_col])
-
-            # convert args to date
-            samples = [
-                arg.value
-                for arg in filter_args
-                if isinstance(arg, Constant) and isinstance(arg.value, str)
-            ]
-            if len(samples) > 0:
+            if isinstance(table_order.iloc[0], (str, dt.date)):
+                table_order = table_order.map(fnc)
 
-                for arg in filter_args:
-                    if isinstance(arg, Constant) and isinstance(arg.value, str):
-                        arg.value = fnc(arg.value)
+            # convert args to digits
+            for arg in filter_args:
+                if isinstance(arg, Constant) and isinstance(arg.value, str):
+                    arg.value = fnc(arg.value)
 
-        if model_types.get(order_col) in ('date', 'datetime') or isinstance(predictor_data[0][order_col], pd.Timestamp):  # noqa
+        if model_types.get(order_col) in ('date', 'datetime') or isinstance(pred_order.iloc[0], pd.Timestamp):
             # convert strings to date
-            # it is making side effect on original data by changing it but let it be
-
-            def _cast_samples(data, order_col):
-                if isinstance(data[0][order_col], str):
-                    samples = [row[order_col] for row in data]
-                    date_format = get_date_format(samples)
-
-                    for row in data:
-                        row[order_col] = dt.datetime.strptime(row[order_col], date_format)
-                elif isinstance(data[0][order_col], dt.datetime):
-                    pass  # check because dt.datetime is instance of dt.date but here we don't need to add HH:MM:SS
-                elif isinstance(data[0][order_col], dt.date):
-                    # convert to datetime
-                    for row in data:
-                        row[order_col] = dt.datetime.combine(row[order_col], dt.datetime.min.time())
-
-            # convert predictor_data
-            if len(predictor_data) > 0:
-                _cast_samples(predictor_data, order_col)
-
-            # convert table data
-            _cast_samples(table_data, order_col)
+            pred_order = cast_ts_dates(pred_order)
+            table_order = cast_ts_dates(table_order)
 
             # convert args to date
             samples = [
@@ -362,61 +368,48 @@ class ApplyPredictorStepCall(ApplyPredictorBaseCall):
                         arg.value = dt.datetime.strptime(arg.value, date_format)
             # TODO can be dt.date in args?
 
-        # first pass: get max values for Latest in table data
-        latest_vals = {}
-        if Latest() in filter_args:
-
-            for row in table_data:
+        predictor_data = predictor_data.copy()
+        predictor_data.isetitem(pred_order_idx, pred_order)
+
+        if isinstance(step.output_time_filter, BetweenOperation):
+            mask = (pred_order >= filter_args[1].value) & (pred_order <= filter_args[2].value)
+
+        elif isinstance(step.output_time_filter, BinaryOperation):
+            op_map = {
+                '<': '__lt__',
+                '<=': '__le__',
+                '>': '__gt__',
+                '>=': '__ge__',
+                '=': '__eq__',
+            }
+            if filter_op not in op_map:
+                # unknown operation, exit immediately
+                return predictor_data
+
+            arg = filter_args[1]
+            if isinstance(arg, Latest):
+                # max values in table data for every group, rows of other groups are skipped
                 if group_cols is None:
-                    key = 0  # the same for any value
+                    table_keys = pd.Series(0, index=table_data.index)
+                    pred_keys = pd.Series(0, index=predictor_data.index)
                 else:
-                    key = tuple([str(row[i]) for i in group_cols])
-                val = row[order_col]
-                if key not in latest_vals or latest_vals[key] < val:
-                    latest_vals[key] = val
-
-        # second pass: do filter rows
-        data2 = []
-        for row in predictor_data:
-            val = row[order_col]
-
-            if isinstance(step.output_time_filter, BetweenOperation):
-                if val >= filter_args[1].value and val <= filter_args[2].value:
-                    data2.append(row)
-            elif isinstance(step.output_time_filter, BinaryOperation):
-                op_map = {
-                    '<': '__lt__',
-                    '<=': '__le__',
-                    '>': '__gt__',
-                    '>=': '__ge__',
-                    '=': '__eq__',
-                }
-                arg = filter_args[1]
-                if isinstance(arg, Latest):
-                    if group_cols is None:
-                        key = 0  # the same for any value
-                    else:
-                        key = tuple([str(row[i]) for i in group_cols])
-                    if key not in latest_vals:
-                        # pass this row
-                        continue
-                    arg = latest_vals[key]
-                elif isinstance(arg, Constant):
-                    arg = arg.value
-
-                if filter_op not in op_map:
-                    # unknown operation, exit immediately
-                    return predictor_data
-
-                # check condition
-                filter_op2 = op_map[filter_op]
-                if getattr(val, filter_op2)(arg):
-                    data2.append(row)
+                    table_keys = get_group_keys(table_data, group_cols, none_as_nan=True)
+                    pred_keys = get_group_keys(predictor_data, group_cols)
+                latest_vals = table_order.groupby(table_keys.values).max()
+
+                found = pred_keys.isin(latest_vals.index).to_numpy()
+                mask = pd.Series(False, index=pred_order.index)
+                mask[found] = getattr(pred_order[found], op_map[filter_op])(pred_keys[found].map(latest_vals))
+            elif isinstance(arg, Constant):
+                mask = getattr(pred_order, op_map[filter_op])(arg.value)
             else:
-                # unknown operation, add anyway
-                data2.append(row)
+                # can't be compared, keep all rows
+                return predictor_data
+        else:
+            # unknown operation, keep all rows
+            return predictor_data
 
-        return data2
+        return predictor_data[mask.to_numpy(dtype=bool)].reset_index(drop=True)
 
 
 class ApplyTimeseriesPredictorStepCall(ApplyPredictorStepCall):
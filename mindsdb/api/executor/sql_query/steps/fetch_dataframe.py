@@ -1,3 +1,6 @@
+import uuid
+
+import pandas as pd
 from mindsdb_sql_parser.ast import (
     Identifier,
     Constant,
@@ -6,16 +9,33 @@ from mindsdb_sql_parser.ast import (
     Parameter,
     BinaryOperation,
     Tuple,
+    Function,
 )
 from mindsdb.api.executor.planner.steps import FetchDataframeStep
+from mindsdb.integrations.libs.base import DatabaseHandler
 from mindsdb.integrations.utilities.query_traversal import query_traversal
 
 from mindsdb.api.executor.sql_query.result_set import ResultSet
 from mindsdb.api.executor.exceptions import UnknownError
 from mindsdb.interfaces.query_context.context_controller import query_context_controller
+from mindsdb.utilities import log
 
 from .base import BaseStepCall
 
+logger = log.getLogger(__name__)
+
+# max count of join keys which are sent to integration in one IN-list
+JOIN_KEYS_IN_LIST_SIZE = 1000
+# since this count, join keys are loaded to temporary table
+# (if integration supports it and allows it with 'join_keys_temp_table' parameter)
+JOIN_KEYS_TEMP_TABLE_SIZE = 20000
+
+
+class JoinKeysStrategy:
+    IN_LIST = 'in_list'
+    CHUNKS = 'chunks'
+    TEMP_TABLE = 'temp_table'
+
 
 def get_table_alias(table_obj, default_db_name):
     # (database, table, alias)
@@ -73,6 +93,87 @@ def get_fill_param_fnc(steps_data):
     return fill_params
 
 
+class JoinKeys:
+    """
+    Condition 'column IN Parameter' which filters fetched table by keys of another table of the join
+    """
+
+    def __init__(self, condition: BinaryOperation, values: list):
+        self.condition = condition
+        self.values = values
+        self.column = condition.args[0]
+
+    @classmethod
+    def find(cls, query, steps_data):
+        """
+        Find condition with the biggest list of keys which is too long to be sent as one IN-list.
+        Condition has to be a part of 'AND' chain in WHERE of the query
+
+        Keys are deduplicated: the same key in different chunks would fetch its rows several times.
+        Parameter in condition is replaced with a tuple, it will be filled later
+        """
+        if not isinstance(query, Select) or query.where is None:
+            return None
+
+        found = None
+        stack = [query.where]
+        while stack:
+            node = stack.pop()
+            if not isinstance(node, BinaryOperation):
+                continue
+            op = node.op.lower()
+            if op == 'and':
+                stack.extend(node.args)
+            elif op == 'in' and isinstance(node.args[0], Identifier) and isinstance(node.args[1], Parameter):
+                rs = steps_data[node.args[1].value.step_num]
+                if rs.length() <= JOIN_KEYS_IN_LIST_SIZE:
+                    continue
+                values = rs.get_column_values(col_idx=0)
+                try:
+                    values = list(dict.fromkeys(values))
+                except TypeError:
+                    # unhashable values
+                    continue
+                if len(values) > JOIN_KEYS_IN_LIST_SIZE and (found is None or len(values) > len(found.values)):
+                    found = cls(node, values)
+
+        if found is not None:
+            found.condition.args[1] = Tuple([])
+        return found
+
+    def set_values(self, values: list):
+        self.condition.args[1] = Tuple([Constant(i) for i in values])
+
+    def set_table(self, table_name: str, column_name: str):
+        self.condition.args[1] = Select(
+            targets=[Identifier(column_name)],
+            from_table=Identifier(table_name),
+            parentheses=True
+        )
+
+
+def is_splittable_query(query: Select) -> bool:
+    """
+    Check if results of query with parts of IN-list can be concatenated: it doesn't aggregate or limit rows
+    """
+    if (
+        query.group_by is not None or query.having is not None or query.order_by
+        or query.limit is not None or query.offset is not None or query.distinct
+        or not isinstance(query.from_table, Identifier)
+    ):
+        return False
+
+    functions = []
+
+    def find_functions(node, **kwargs):
+        if isinstance(node, Function):
+            functions.append(node)
+
+    for target in query.targets:
+        query_traversal(target, find_functions)
+    return len(functions) == 0
+
+
 class FetchDataframeStepCall(BaseStepCall):
 
     bind = FetchDataframeStep
@@ -100,19 +201,23 @@ class FetchDataframeStepCall(BaseStepCall):
             # TODO for information_schema we have 'database' = 'mindsdb'
 
             # fill params
+            join_keys = JoinKeys.find(query, self.steps_data)
             fill_params = get_fill_param_fnc(self.steps_data)
             query_traversal(query, fill_params)
 
             query, context_callback = query_context_controller.handle_db_context_vars(query, dn, self.session)
 
-            response = dn.query(
-                query=query,
-                session=self.session
-            )
-            df = response.data_frame
+            if join_keys is None:
+                response = dn.query(
+                    query=query,
+                    session=self.session
+                )
+                df, columns = response.data_frame, response.columns
+            else:
+                df, columns = self.fetch_by_join_keys(dn, query, join_keys)
 
             if context_callback:
-                context_callback(df, response.columns)
+                context_callback(df, columns)
 
         result = ResultSet()
 
@@ -124,3 +229,69 @@ class FetchDataframeStepCall(BaseStepCall):
         )
 
         return result
+
+    def fetch_by_join_keys(self, dn, query: Select, join_keys: JoinKeys) -> tuple:
+        """
+        Fetch data filtered by long list of join keys. Strategy depends on count of keys:
+         - temporary table in the database: keys are loaded into it and query is filtered by subselect from it.
+           It creates a table in the database, so it is used only if integration has 'join_keys_temp_table' parameter
+         - chunks: query is executed for every chunk of keys, results are concatenated
+         - IN-list: all keys in one query, if the query can't be split
+        """
+        handler = getattr(dn, 'integration_handler', None)
+
+        strategy = JoinKeysStrategy.IN_LIST
+        if is_splittable_query(query):
+            strategy = JoinKeysStrategy.CHUNKS
+        if (
+            len(join_keys.values) >= JOIN_KEYS_TEMP_TABLE_SIZE
+            and getattr(dn, 'join_keys_temp_table', False)
+            and isinstance(handler, DatabaseHandler)
+            and hasattr(handler, 'insert')
+        ):
+            strategy = JoinKeysStrategy.TEMP_TABLE
+
+        result = None
+        if strategy == JoinKeysStrategy.TEMP_TABLE:
+            try:
+                result = self._fetch_with_temp_table(dn, query, join_keys)
+            except Exception as e:
+                logger.warning(f'Unable to use temporary table for join keys: {e}')
+                strategy = JoinKeysStrategy.CHUNKS if is_splittable_query(query) else JoinKeysStrategy.IN_LIST
+
+        if strategy == JoinKeysStrategy.CHUNKS:
+            data_frames, columns = [], None
+            for i in range(0, len(join_keys.values), JOIN_KEYS_IN_LIST_SIZE):
+                join_keys.set_values(join_keys.values[i: i + JOIN_KEYS_IN_LIST_SIZE])
+                response = dn.query(query=query, session=self.session)
+                data_frames.append(response.data_frame)
+                if columns is None:
+                    columns = response.columns
+            result = pd.concat(data_frames, ignore_index=True), columns
+
+        elif strategy == JoinKeysStrategy.IN_LIST:
+            join_keys.set_values(join_keys.values)
+            response = dn.query(query=query, session=self.session)
+            result = response.data_frame, response.columns
+
+        if hasattr(dn, 'observe_join_keys'):
+            dn.observe_join_keys(strategy, len(join_keys.values))
+        return result
+
+    def _fetch_with_temp_table(self, dn, query: Select, join_keys: JoinKeys) -> tuple:
+        table_name = f'mindsdb_join_keys_{uuid.uuid4().hex[:16]}'
+        column_name = join_keys.column.parts[-1]
+        keys_rs = ResultSet().from_df(pd.DataFrame({column_name: join_keys.values}))
+
+        try:
+            # table is not used by other queries, results of them in the cache are still valid
+            dn.create_table(Identifier(table_name), result_set=keys_rs, is_create=True, invalidate_cache=False)
+            join_keys.set_table(table_name, column_name)
+            response = dn.query(query=query, session=self.session)
+        finally:
+            try:
+                dn.drop_table(Identifier(table_name), if_exists=True, invalidate_cache=False)
+            except Exception as e:
+                logger.warning(f'Unable to drop temporary table {table_name}: {e}')
+
+        return response.data_frame, response.columns
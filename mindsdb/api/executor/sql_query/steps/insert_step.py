@@ -1,3 +1,5 @@
+from functools import partial
+
 from mindsdb_sql_parser.ast import (
     Identifier,
 )
@@ -91,11 +93,18 @@ class InsertToTableCall(BaseStepCall):
             else:
                 col_names.add(col.alias)
 
+        progress_callback = None
+        run_query = self.sql_query.run_query
+        if run_query is not None:
+            # store progress of the insert in query context
+            progress_callback = partial(run_query.set_insert_progress, str(table_name))
+
         response = dn.create_table(
             table_name=table_name,
             result_set=data,
             is_replace=is_replace,
-            is_create=is_create
+            is_create=is_create,
+            progress_callback=progress_callback
         )
         return ResultSet(affected_rows=response.affected_rows)
 
@@ -1,17 +1,37 @@
+import copy
+
 from mindsdb_sql_parser.ast import (
     BinaryOperation,
     Identifier,
     Constant,
     Update,
+    Case,
+    Tuple,
 )
 from mindsdb.api.executor.planner.steps import UpdateToTable
+from mindsdb.integrations.libs.base import DatabaseHandler
 from mindsdb.integrations.utilities.query_traversal import query_traversal
 
 from mindsdb.api.executor.sql_query.result_set import ResultSet
 from mindsdb.api.executor.exceptions import WrongArgumentError
+from mindsdb.utilities import log
 
 from .base import BaseStepCall
 
+logger = log.getLogger(__name__)
+
+# count of input rows which are applied by one set-based update statement
+UPDATE_BATCH_SIZE = 1000
+
+# parts of error messages of databases which are not able to parse or execute set-based statement
+UNSUPPORTED_STATEMENT_MESSAGES = ('syntax', 'not supported', 'unsupported', 'not implemented')
+# sql states: syntax error, undefined function, class of 'feature not supported' errors
+UNSUPPORTED_STATEMENT_SQLSTATES = ('42601', '42883', '0A')
+
+
+class SetUpdateNotSupported(Exception):
+    """Database can't execute set-based form of update"""
+
 
 class UpdateToTableCall(BaseStepCall):
 
@@ -115,13 +135,301 @@ class UpdateToTableCall(BaseStepCall):
             if param_name not in data_header:
                 raise WrongArgumentError(f'Field {param_name} not found in input data. Input fields: {data_header}')
 
+        if result_data.length() == 0:
+            return ResultSet(affected_rows=0)
+
         # perform update
-        for row in result_data.get_records():
-            # run update from every row from input data
+        set_update = None
+        if isinstance(getattr(dn, 'integration_handler', None), DatabaseHandler):
+            set_update = SetUpdate.from_query(update_query, params_map_index)
+
+        affected_rows = None
+        if set_update is not None:
+            try:
+                affected_rows = self.run_set_update(dn, set_update, result_data)
+            except SetUpdateNotSupported as e:
+                # database can't execute statement: rows weren't updated, switch to update row by row
+                logger.warning(f'Unable to execute set-based update, updating rows one by one: {e}')
+                set_update = None
+
+        if set_update is None:
+            affected_rows = self.run_rows_update(dn, update_query, params_map_index, result_data)
+
+        return ResultSet(affected_rows=affected_rows)
+
+    def run_set_update(self, dn, set_update, result_data: ResultSet):
+        """
+        Apply input data with set-based statements, each of them updates UPDATE_BATCH_SIZE input rows
+        Raises SetUpdateNotSupported if the database can't execute the first statement
+        """
+        affected_rows = None
+        is_first = True
+        for rows in iter_records_chunks(result_data, UPDATE_BATCH_SIZE):
+            for query in set_update.make_queries(rows):
+                try:
+                    response = dn.query(query=query, session=self.session)
+                except Exception as e:
+                    # other errors (connection, access, timeout) would fail update row by row as well
+                    if is_first and is_unsupported_statement_error(e):
+                        raise SetUpdateNotSupported(str(e)) from e
+                    raise
+                is_first = False
+                affected_rows = sum_affected_rows(affected_rows, response.affected_rows)
+        return affected_rows
+
+    def run_rows_update(self, dn, update_query: Update, params_map_index: list, result_data: ResultSet):
+        """
+        Run update statement for every row of input data
+        """
+        affected_rows = None
+        for rows in iter_records_chunks(result_data, UPDATE_BATCH_SIZE):
+            for row in rows:
+                # run update from every row from input data
+
+                # fill params:
+                for param_name, param in params_map_index:
+                    param.value = row[param_name]
+
+                response = dn.query(query=update_query, session=self.session)
+                affected_rows = sum_affected_rows(affected_rows, response.affected_rows)
+        return affected_rows
+
+
+def iter_records_chunks(result_set: ResultSet, chunk_size: int):
+    """
+    Split records of result set to chunks
+    """
+    chunk = []
+    for row in result_set.get_records():
+        chunk.append(row)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def is_unsupported_statement_error(error: Exception) -> bool:
+    """
+    Check if the error (or the errors it was raised from) means that database can't parse or execute statement
+    """
+    seen = set()
+    while error is not None and id(error) not in seen:
+        seen.add(id(error))
+        if isinstance(error, NotImplementedError):
+            return True
+        sqlstate = getattr(error, 'sqlstate', None) or getattr(error, 'pgcode', None)
+        if isinstance(sqlstate, str):
+            if sqlstate.startswith(UNSUPPORTED_STATEMENT_SQLSTATES):
+                return True
+        else:
+            message = str(error).lower()
+            if any(part in message for part in UNSUPPORTED_STATEMENT_MESSAGES):
+                return True
+        error = error.__cause__ or error.__context__
+    return False
+
+
+def get_columns(nodes: list) -> set:
+    """
+    Names of columns used in nodes, in lower case
+    """
+    columns = set()
+
+    def find_columns(node, is_table, **kwargs):
+        if isinstance(node, Identifier) and not is_table:
+            columns.add(node.parts[-1].lower())
+    for node in nodes:
+        query_traversal(node, find_columns)
+    return columns
+
+
+def has_params(node, params_ids: dict) -> bool:
+    """
+    Check if node contains input parameters
+    """
+    found = []
+
+    def find_params(node, **kwargs):
+        if id(node) in params_ids:
+            found.append(node)
+    query_traversal(node, find_params)
+    return len(found) > 0
+
+
+def sum_affected_rows(total, value):
+    if value is None:
+        return total
+    if total is None:
+        return value
+    return total + value
+
+
+class SetUpdate:
+    """
+    Set-based form of update which uses input rows:
+      update tbl set col=<expr(input)> where key1=<input.key1> and key2=<input.key2> and <static condition>
+
+    Input rows are applied in one statement:
+      update tbl
+        set col = case when key1=<row1.key1> and key2=<row1.key2> then <expr(row1)> when ... else col end
+      where (key1=<row1.key1> and key2=<row1.key2> or ...) and <static condition>
+
+    If statement reads updated columns (set col = col + <input>), rows with the same key have to be applied
+    one after another: every statement applies only one row for every key
+    """
+
+    def __init__(self, update_query: Update, keys: list, conditions: list, params_map_index: list):
+        self.update_query = update_query
+        # list of [Identifier, param_name]
+        self.keys = keys
+        # conditions without input data
+        self.conditions = conditions
+        self.params_map_index = params_map_index
+        self.params_ids = {id(param): name for name, param in params_map_index}
+
+        # applying of the last row of the key gives the same result as applying all rows of the key one by one
+        updated_columns = {name.lower() for name in update_query.update_columns.keys()}
+        used_columns = get_columns(list(update_query.update_columns.values()) + conditions)
+        self.last_row_wins = len(updated_columns & used_columns) == 0
+
+    @classmethod
+    def from_query(cls, update_query: Update, params_map_index: list):
+        """
+        Check that update can be converted into set-based form, returns None if not.
+
+        Every input row has to update its own rows in the table:
+         - all conditions with input values are equality of table column and input value
+         - columns of these conditions are not updated
+        """
+        if update_query.where is None or len(params_map_index) == 0:
+            return None
+
+        params_ids = {id(param): name for name, param in params_map_index}
+
+        conditions = []
+        stack = [update_query.where]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, BinaryOperation) and node.op.lower() == 'and':
+                stack.extend(node.args)
+            else:
+                conditions.append(node)
+
+        keys, static_conditions = [], []
+        for condition in conditions:
+            if not has_params(condition, params_ids):
+                static_conditions.append(condition)
+                continue
+            if not (isinstance(condition, BinaryOperation) and condition.op == '='):
+                return None
+            arg1, arg2 = condition.args
+            if id(arg1) in params_ids:
+                arg1, arg2 = arg2, arg1
+            if not isinstance(arg1, Identifier) or id(arg2) not in params_ids:
+                return None
+            keys.append([arg1, params_ids[id(arg2)]])
+
+        if len(keys) == 0:
+            return None
+
+        updated_columns = {name.lower() for name in update_query.update_columns.keys()}
+        for identifier, _ in keys:
+            if identifier.parts[-1].lower() in updated_columns:
+                return None
+
+        return cls(update_query, keys, static_conditions, params_map_index)
+
+    def _get_value(self, expr, row):
+        if id(expr) in self.params_ids:
+            return Constant(row[self.params_ids[id(expr)]])
+
+        for param_name, param in self.params_map_index:
+            param.value = row[param_name]
+        return copy.deepcopy(expr)
+
+    def make_queries(self, rows: list):
+        """
+        Make update statements for list of input records, they have to be executed in the same order
+        """
+        # every group contains one row for every key
+        groups = []
+        key_counts = {}
+        for row in rows:
+            key = tuple(row[name] for _, name in self.keys)
+            if None in key:
+                # rows with empty keys don't match to any row in table
+                continue
+            if self.last_row_wins:
+                num = 0
+            else:
+                num = key_counts.get(key, 0)
+                key_counts[key] = num + 1
+            if num == len(groups):
+                groups.append({})
+            groups[num][key] = row
+
+        for rows_by_key in groups:
+            yield self.make_query(rows_by_key)
+
+    def make_query(self, rows_by_key: dict):
+        """
+        Make update statement for input records with unique keys
+
+        :param rows_by_key: input records by values of keys
+        """
+
+        single_key = len(self.keys) == 1
+        key_conditions = []
+        if not single_key:
+            for key in rows_by_key.keys():
+                key_conditions.append(self._and([
+                    BinaryOperation(op='=', args=[identifier, Constant(value)])
+                    for (identifier, _), value in zip(self.keys, key)
+                ]))
+
+        update_columns = {}
+        for col_name, expr in self.update_query.update_columns.items():
+            if not has_params(expr, self.params_ids):
+                update_columns[col_name] = expr
+                continue
+
+            values = [self._get_value(expr, row) for row in rows_by_key.values()]
+            if single_key:
+                rules = [
+                    [Constant(key[0]), value]
+                    for key, value in zip(rows_by_key.keys(), values)
+                ]
+                case = Case(rules=rules, default=Identifier(col_name), arg=self.keys[0][0])
+            else:
+                case = Case(rules=list(map(list, zip(key_conditions, values))), default=Identifier(col_name))
+            update_columns[col_name] = case
+
+        if single_key:
+            where = BinaryOperation(op='in', args=[
+                self.keys[0][0],
+                Tuple(items=[Constant(key[0]) for key in rows_by_key.keys()])
+            ])
+        else:
+            where = self._or(key_conditions)
+
+        return Update(
+            table=self.update_query.table,
+            update_columns=update_columns,
+            where=self._and([where] + self.conditions)
+        )
 
-            # fill params:
-            for param_name, param in params_map_index:
-                param.value = row[param_name]
+    @staticmethod
+    def _and(conditions: list):
+        where = conditions[0]
+        for condition in conditions[1:]:
+            where = BinaryOperation(op='and', args=[where, condition])
+        return where
 
-            response = dn.query(query=update_query, session=self.session)
-        return ResultSet(affected_rows=response.affected_rows)
+    @classmethod
+    def _or(cls, conditions: list):
+        # balanced tree: list of conditions can be long, chain would exceed recursion limit on render
+        if len(conditions) == 1:
+            return conditions[0]
+        middle = len(conditions) // 2
+        return BinaryOperation(op='or', args=[cls._or(conditions[:middle]), cls._or(conditions[middle:])])
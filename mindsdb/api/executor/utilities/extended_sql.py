@@ -0,0 +1,147 @@
+"""
+Statements which are not supported by mindsdb_sql_parser yet.
+
+They are recognized before the query is passed to the parser, the rest of statement
+(e.g. select of the view) is parsed by mindsdb_sql_parser as usual:
+
+    CREATE MATERIALIZED VIEW [IF NOT EXISTS] [project.]name [FROM integration] AS ( query )
+        [USING refresh_key = 'column'] [EVERY schedule]
+
+    REFRESH MATERIALIZED VIEW [project.]name [FULL]
+
+    FLUSH RESULT CACHE integration
+"""
+import re
+
+from mindsdb_sql_parser import parse_sql as parse_sql_base
+from mindsdb_sql_parser import ParsingException
+from mindsdb_sql_parser.ast import Identifier, Select
+from mindsdb_sql_parser.ast.base import ASTNode
+from mindsdb_sql_parser.ast.mindsdb import CreateView
+
+
+CREATE_MATERIALIZED_VIEW_RE = re.compile(r'^\s*create\s+materialized\s+view\s+', re.IGNORECASE)
+MATERIALIZED_VIEW_OPTIONS_RE = re.compile(
+    r'^\s*(?:using\s+(?P<using>.+?))?\s*(?:every\s+(?P<every>[\w\s]+?))?\s*$',
+    re.IGNORECASE | re.DOTALL
+)
+REFRESH_MATERIALIZED_VIEW_RE = re.compile(
+    r'^\s*refresh\s+materialized\s+view\s+(?P<name>[\w.`"]+)(?P<full>\s+full)?\s*$',
+    re.IGNORECASE
+)
+FLUSH_RESULT_CACHE_RE = re.compile(r'^\s*flush\s+result\s+cache\s+(?P<name>[\w`"]+)\s*$', re.IGNORECASE)
+
+
+class CreateMaterializedView(CreateView):
+    def __init__(self, *args, refresh_key: str = None, schedule: str = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.refresh_key = refresh_key
+        self.schedule = schedule
+
+    def to_tree(self, *args, level=0, **kwargs):
+        return f'{super().to_tree(*args, level=level, **kwargs)} refresh_key={self.refresh_key} schedule={self.schedule}'
+
+    def get_string(self, *args, **kwargs):
+        out_str = super().get_string(*args, **kwargs).replace('CREATE VIEW', 'CREATE MATERIALIZED VIEW', 1)
+        if self.refresh_key is not None:
+            out_str += f" USING refresh_key='{self.refresh_key}'"
+        if self.schedule is not None:
+            out_str += f' EVERY {self.schedule}'
+        return out_str
+
+
+class RefreshMaterializedView(ASTNode):
+    def __init__(self, name: Identifier, full: bool = False, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.name = name
+        self.full = full
+
+    def to_tree(self, *args, level=0, **kwargs):
+        return f'RefreshMaterializedView(name={self.name.to_string()}, full={self.full})'
+
+    def get_string(self, *args, **kwargs):
+        return f'REFRESH MATERIALIZED VIEW {self.name.to_string()}{" FULL" if self.full else ""}'
+
+
+class FlushResultCache(ASTNode):
+    def __init__(self, name: Identifier, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.name = name
+
+    def to_tree(self, *args, level=0, **kwargs):
+        return f'FlushResultCache(name={self.name.to_string()})'
+
+    def get_string(self, *args, **kwargs):
+        return f'FLUSH RESULT CACHE {self.name.to_string()}'
+
+
+def _parse_create_materialized_view(sql: str) -> CreateMaterializedView:
+    # options are placed after the closing parenthesis of the view query
+    body = CREATE_MATERIALIZED_VIEW_RE.sub('', sql, count=1)
+    query_end = body.rfind(')')
+    if query_end == -1:
+        raise ParsingException(f'Query of materialized view is expected in parentheses: {sql}')
+
+    options = MATERIALIZED_VIEW_OPTIONS_RE.match(body[query_end + 1:])
+    if options is None:
+        raise ParsingException(f'Unable to parse options of materialized view: {body[query_end + 1:]}')
+
+    view = parse_sql_base('CREATE VIEW ' + body[:query_end + 1])
+
+    params = {}
+    if options.group('using') is not None:
+        params = parse_sql_base(f"SELECT 1 USING {options.group('using')}").using
+        params = {k.lower(): v for k, v in params.items()}
+    unknown_params = set(params) - {'refresh_key'}
+    if len(unknown_params) > 0:
+        raise ParsingException(f'Unknown parameters of materialized view: {", ".join(unknown_params)}')
+
+    return CreateMaterializedView(
+        name=view.name,
+        query_str=view.query_str,
+        from_table=view.from_table,
+        if_not_exists=view.if_not_exists,
+        refresh_key=params.get('refresh_key'),
+        schedule=options.group('every'),
+    )
+
+
+def _parse_refresh_materialized_view(match: re.Match) -> RefreshMaterializedView:
+    query = parse_sql_base(f"SELECT * FROM {match.group('name')}")
+    if not isinstance(query, Select) or not isinstance(query.from_table, Identifier):
+        raise ParsingException(f"Wrong name of materialized view: {match.group('name')}")
+    return RefreshMaterializedView(name=query.from_table, full=match.group('full') is not None)
+
+
+def _parse_flush_result_cache(match: re.Match) -> FlushResultCache:
+    query = parse_sql_base(f"SELECT * FROM {match.group('name')}")
+    if not isinstance(query, Select) or not isinstance(query.from_table, Identifier):
+        raise ParsingException(f"Wrong name of database: {match.group('name')}")
+    return FlushResultCache(name=query.from_table)
+
+
+def parse_sql(sql: str, dialect: str = None) -> ASTNode:
+    """Parses sql with extra statements of this module, the rest is parsed by mindsdb_sql_parser
+
+    Args:
+        sql (str): sql query
+        dialect (str): ignored, kept for compatibility with mindsdb_sql_parser.parse_sql
+
+    Returns:
+        ASTNode: parsed query
+    """
+    # remove ending semicolon and spaces
+    stripped_sql = re.sub(r'[\s;]+$', '', sql)
+
+    if CREATE_MATERIALIZED_VIEW_RE.match(stripped_sql):
+        return _parse_create_materialized_view(stripped_sql)
+
+    match = REFRESH_MATERIALIZED_VIEW_RE.match(stripped_sql)
+    if match is not None:
+        return _parse_refresh_materialized_view(match)
+
+    match = FLUSH_RESULT_CACHE_RE.match(stripped_sql)
+    if match is not None:
+        return _parse_flush_result_cache(match)
+
+    return parse_sql_base(sql)
@@ -7,12 +7,16 @@ from flask_restx import Resource
 import mindsdb.utilities.hooks as hooks
 import mindsdb.utilities.profiler as profiler
 from mindsdb.api.http.utils import http_error
+from mindsdb.api.http.result_formats import (
+    JSON_FORMAT, ARROW_FORMAT, get_result_format, stream_result
+)
 from mindsdb.api.http.namespaces.configs.sql import ns_conf
 from mindsdb.api.mysql.mysql_proxy.classes.fake_mysql_proxy import FakeMysqlProxy
 from mindsdb.api.executor.data_types.response_type import (
     RESPONSE_TYPE as SQL_RESPONSE_TYPE,
 )
 from mindsdb.api.executor.exceptions import ExecutorException, UnknownError
+from mindsdb.metrics import metrics
 from mindsdb.metrics.metrics import api_endpoint_metrics
 from mindsdb.utilities import log
 from mindsdb.utilities.config import Config
@@ -41,6 +45,19 @@ class Query(Resource):
             )
         logger.debug(f'Incoming query: {query}')
 
+        # streaming formats of the table result are requested with 'Accept' header
+        result_format = get_result_format(request.accept_mimetypes)
+        if result_format == ARROW_FORMAT:
+            try:
+                import pyarrow  # noqa
+            except ImportError:
+                return http_error(
+                    HTTPStatus.NOT_ACCEPTABLE,
+                    'Format is not supported',
+                    'pyarrow is required for the result in Arrow format'
+                )
+        result_df = None
+
         if context.get("profiling") is True:
             profiler.enable()
 
@@ -64,15 +81,19 @@ class Query(Resource):
                         "affected_rows": result.affected_rows
                     }
                 elif result.type == SQL_RESPONSE_TYPE.TABLE:
-                    data = result.data.to_lists(json_types=True)
                     query_response = {
                         "type": SQL_RESPONSE_TYPE.TABLE,
-                        "data": data,
                         "column_names": [
                             x["alias"] or x["name"] if "alias" in x else x["name"]
                             for x in result.columns
                         ],
                     }
+                    if result_format == JSON_FORMAT:
+                        with profiler.Phase(metrics.RESULT_SERIALIZATION_TIME, 'http', 'json_rows'):
+                            query_response["data"] = result.data.to_lists(json_types=True)
+                    else:
+                        # rows are converted during sending of the response
+                        result_df = result.data.get_raw_df()
             except ExecutorException as e:
                 # classified error
                 error_type = "expected"
@@ -122,6 +143,9 @@ class Query(Resource):
             traceback=error_traceback,
         )
 
+        if result_df is not None:
+            return stream_result(result_df, result_format, query_response)
+
         return query_response, 200
 
 
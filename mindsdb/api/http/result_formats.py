@@ -0,0 +1,161 @@
+"""
+Formats of the table result of /api/sql/query.
+
+By default the result is returned as one JSON document. The client can ask for a streaming format with 'Accept' header:
+    - application/x-ndjson: the first line is the header of the result (type, column names and context),
+        then one JSON array per row
+    - text/csv: the first line is the column names, then one line per row
+    - application/vnd.apache.arrow.stream: Arrow IPC stream, one record batch per chunk of rows
+
+The rows are converted and sent by chunks, so the whole result is not converted to python objects at once
+and the client can start to parse it before the last row is encoded.
+"""
+import io
+import csv
+import json
+from typing import Iterator, List
+
+import numpy as np
+import pandas as pd
+from flask import Response
+from werkzeug.datastructures import MIMEAccept
+
+from mindsdb.utilities.json_encoder import CustomJSONEncoder
+
+JSON_FORMAT = 'application/json'
+NDJSON_FORMAT = 'application/x-ndjson'
+CSV_FORMAT = 'text/csv'
+ARROW_FORMAT = 'application/vnd.apache.arrow.stream'
+
+# the first is used if the client accepts any format
+RESULT_FORMATS = [JSON_FORMAT, NDJSON_FORMAT, CSV_FORMAT, ARROW_FORMAT]
+
+# count of rows which are converted at once
+RESULT_CHUNK_SIZE = 10000
+
+
+def get_result_format(accept_mimetypes: MIMEAccept) -> str:
+    """Returns the format of the result which is accepted by the client, JSON by default"""
+    return accept_mimetypes.best_match(RESULT_FORMATS, default=JSON_FORMAT)
+
+
+def to_json_types(df: pd.DataFrame) -> pd.DataFrame:
+    """Simplifies types of the values in the same way as ResultSet.to_lists(json_types=True)"""
+    df = df.copy()
+    for name, dtype in df.dtypes.to_dict().items():
+        if pd.api.types.is_datetime64_any_dtype(dtype):
+            df[name] = df[name].dt.strftime("%Y-%m-%d %H:%M:%S.%f")
+    return df.replace({np.nan: None})
+
+
+def iter_chunks(df: pd.DataFrame, chunk_size: int = RESULT_CHUNK_SIZE) -> Iterator[pd.DataFrame]:
+    for start in range(0, len(df), chunk_size):
+        yield df.iloc[start:start + chunk_size]
+
+
+def iter_ndjson(df: pd.DataFrame, header: dict) -> Iterator[bytes]:
+    """Yields the header and the rows of the result as JSON lines"""
+    encoder = CustomJSONEncoder()
+    yield (encoder.encode(header) + '\n').encode()
+    for chunk in iter_chunks(df):
+        rows = to_json_types(chunk).to_records(index=False).tolist()
+        yield ('\n'.join(map(encoder.encode, rows)) + '\n').encode()
+
+
+def iter_csv(df: pd.DataFrame, column_names: List[str]) -> Iterator[bytes]:
+    """Yields the column names and the rows of the result as CSV lines"""
+    def to_cell(value):
+        if isinstance(value, (list, dict)):
+            return json.dumps(value, cls=CustomJSONEncoder)
+        return value
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def flush() -> bytes:
+        data = buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate(0)
+        return data
+
+    writer.writerow(column_names)
+    yield flush()
+    for chunk in iter_chunks(df):
+        chunk = to_json_types(chunk)
+        for name, dtype in chunk.dtypes.to_dict().items():
+            if dtype == object:
+                chunk[name] = pd.Series([to_cell(value) for value in chunk[name]], index=chunk.index, dtype=object)
+        writer.writerows(chunk.to_records(index=False).tolist())
+        yield flush()
+
+
+def iter_arrow(df: pd.DataFrame, column_names: List[str]) -> Iterator[bytes]:
+    """Yields the result as Arrow IPC stream
+
+    Columns of objects are sent as strings, the rest of types are converted by pyarrow
+    """
+    import pyarrow as pa
+
+    encoder = CustomJSONEncoder()
+
+    def to_string(value):
+        if value is None or isinstance(value, str):
+            return value
+        if isinstance(value, (list, dict)):
+            return encoder.encode(value)
+        return str(encoder.default(value))
+
+    fields = []
+    for i, name in enumerate(column_names):
+        column = df.iloc[:, i]
+        if column.dtype == object:
+            arrow_type = pa.string()
+        else:
+            arrow_type = pa.array(column.iloc[:0]).type
+        fields.append(pa.field(name, arrow_type))
+    schema = pa.schema(fields)
+
+    sink = io.BytesIO()
+
+    def flush() -> bytes:
+        data = sink.getvalue()
+        sink.seek(0)
+        sink.truncate(0)
+        return data
+
+    with pa.ipc.new_stream(sink, schema) as writer:
+        yield flush()
+        for chunk in iter_chunks(df):
+            arrays = []
+            for i, field in enumerate(fields):
+                column = chunk.iloc[:, i]
+                if column.dtype == object:
+                    column = column.where(column.notna(), None).map(to_string)
+                arrays.append(pa.Array.from_pandas(column, type=field.type))
+            writer.write_batch(pa.RecordBatch.from_arrays(arrays, schema=schema))
+            yield flush()
+    # end of stream marker
+    yield flush()
+
+
+def stream_result(df: pd.DataFrame, result_format: str, header: dict) -> Response:
+    """Creates response which sends the result by chunks
+
+    Args:
+        df (pd.DataFrame): rows of the result
+        result_format (str): one of the streaming formats
+        header (dict): type, column names and context of the result
+
+    Returns:
+        Response: streaming response
+    """
+    if result_format == NDJSON_FORMAT:
+        return Response(iter_ndjson(df, header), mimetype=NDJSON_FORMAT)
+
+    # context is not a part of CSV or Arrow output
+    headers = {'X-MindsDB-Context': json.dumps(header['context'], cls=CustomJSONEncoder)}
+    if result_format == CSV_FORMAT:
+        rows = iter_csv(df, header['column_names'])
+    else:
+        rows = iter_arrow(df, header['column_names'])
+    return Response(rows, mimetype=result_format, headers=headers)
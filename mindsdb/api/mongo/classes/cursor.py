@@ -0,0 +1,195 @@
+import time
+import secrets
+
+import bson
+import pandas as pd
+from bson.int64 import Int64
+from bson.raw_bson import RawBSONDocument
+
+from mindsdb.api.mongo.utilities.bson_codecs import ENCODE_CODEC_OPTIONS
+from mindsdb.utilities import log
+
+logger = log.getLogger(__name__)
+
+# size of the first batch if client didn't set it, the same as in mongodb
+DEFAULT_FIRST_BATCH_SIZE = 101
+# size of the next batches if client didn't set it
+DEFAULT_BATCH_SIZE = 1000
+# batch can't be bigger than max size of bson document
+MAX_BATCH_BYTES = 16 * 1024 * 1024 - 16 * 1024
+# cursor is closed if client didn't fetch it for this time, the same as in mongodb
+DEFAULT_IDLE_TIMEOUT = 600
+
+
+def encode_records(df: pd.DataFrame, names: list, prepare_record=None, max_bytes: int = MAX_BATCH_BYTES) -> list:
+    """Converts rows of dataframe to bson documents
+
+    Values are converted to python types for the whole column at once,
+    so the encoder doesn't fall back to type codecs for every value.
+
+    Args:
+        df (pd.DataFrame): rows to encode
+        names (list): names of the columns of df
+        prepare_record (callable): function to modify every record before encoding
+        max_bytes (int): stop encoding if documents exceed this size, at least one document is returned
+
+    Returns:
+        list of RawBSONDocument
+    """
+    columns = []
+    for i in range(len(df.columns)):
+        column = df.iloc[:, i]
+        if column.dtype != object:
+            column = column.astype(object)
+        columns.append(column.where(column.notna(), None).tolist())
+
+    documents = []
+    size = 0
+    for row in zip(*columns):
+        # if columns have the same name: the last one is kept
+        record = dict(zip(names, row))
+        if prepare_record is not None:
+            prepare_record(record)
+        document = bson.encode(record, codec_options=ENCODE_CODEC_OPTIONS)
+
+        size += len(document)
+        if size > max_bytes and len(documents) > 0:
+            break
+        documents.append(RawBSONDocument(document))
+    return documents
+
+
+class Cursor:
+    """Server side cursor over result of the query. Rows are encoded in batches on fetch"""
+
+    def __init__(self, df: pd.DataFrame, names: list, ns: str, prepare_record=None):
+        self.id = Int64(secrets.randbits(62) + 1)
+        self.ns = ns
+        self.df = df
+        self.names = names
+        self.prepare_record = prepare_record
+        self.position = 0
+        self.last_used = time.monotonic()
+
+    @property
+    def exhausted(self) -> bool:
+        return self.position >= len(self.df)
+
+    def fetch(self, batch_size: int = None) -> list:
+        """Returns next batch of documents
+
+        Args:
+            batch_size (int): max count of documents, all remaining rows if None
+        """
+        self.last_used = time.monotonic()
+        if batch_size is None:
+            end = len(self.df)
+        else:
+            end = self.position + batch_size
+        documents = encode_records(self.df.iloc[self.position:end], self.names, self.prepare_record)
+        self.position += len(documents)
+        return documents
+
+
+class CursorRegistry:
+    """Open cursors of the connection"""
+
+    def __init__(self, idle_timeout: float = DEFAULT_IDLE_TIMEOUT):
+        self.idle_timeout = idle_timeout
+        self.cursors = {}
+
+    def first_batch(self, df: pd.DataFrame, names: list, ns: str, batch_size: int = None,
+                    single_batch: bool = False, prepare_record=None) -> dict:
+        """Creates cursor over dataframe and returns it with the first batch.
+        Cursor is not registered if all rows fit in the first batch
+
+        Args:
+            df (pd.DataFrame): data of the cursor
+            names (list): names of the columns
+            ns (str): namespace of the cursor
+            batch_size (int): size of the first batch
+            single_batch (bool): return only the first batch and close the cursor
+            prepare_record (callable): function to modify every record before encoding
+
+        Returns:
+            dict: cursor document of the response
+        """
+        self.remove_expired()
+
+        cursor = Cursor(df, names, ns, prepare_record=prepare_record)
+
+        if batch_size is None and not single_batch:
+            batch_size = DEFAULT_FIRST_BATCH_SIZE
+        documents = cursor.fetch(batch_size)
+
+        if single_batch or cursor.exhausted:
+            cursor_id = Int64(0)
+        else:
+            self.cursors[cursor.id] = cursor
+            cursor_id = cursor.id
+
+        return {
+            'id': cursor_id,
+            'ns': ns,
+            'firstBatch': documents
+        }
+
+    def next_batch(self, cursor_id: int, batch_size: int = None) -> dict:
+        """Returns next batch of registered cursor, cursor is removed when it is exhausted
+
+        Args:
+            cursor_id (int): id of the cursor
+            batch_size (int): size of the batch
+
+        Returns:
+            dict: cursor document of the response
+        """
+        self.remove_expired()
+
+        cursor = self.cursors.get(cursor_id)
+        if cursor is None:
+            raise CursorNotFound(f'cursor id {cursor_id} not found')
+
+        documents = cursor.fetch(batch_size or DEFAULT_BATCH_SIZE)
+
+        if cursor.exhausted:
+            del self.cursors[cursor_id]
+            cursor_id = Int64(0)
+
+        return {
+            'id': Int64(cursor_id),
+            'ns': cursor.ns,
+            'nextBatch': documents
+        }
+
+    def kill(self, cursor_ids: list) -> tuple:
+        """Closes cursors
+
+        Returns:
+            tuple: lists of killed and not found cursors ids
+        """
+        killed, not_found = [], []
+        for cursor_id in cursor_ids:
+            if self.cursors.pop(cursor_id, None) is None:
+                not_found.append(cursor_id)
+            else:
+                killed.append(cursor_id)
+        return killed, not_found
+
+    def remove_expired(self):
+        now = time.monotonic()
+        expired = [
+            cursor_id
+            for cursor_id, cursor in self.cursors.items()
+            if now - cursor.last_used > self.idle_timeout
+        ]
+        for cursor_id in expired:
+            logger.debug(f'Cursor {cursor_id} is closed by idle timeout')
+            del self.cursors[cursor_id]
+
+    def clear(self):
+        self.cursors.clear()
+
+
+class CursorNotFound(Exception):
+    pass
@@ -1,9 +1,10 @@
 from mindsdb.api.executor.controllers import SessionController
 from mindsdb.api.executor.command_executor import ExecuteCommands
+from mindsdb.api.executor.sql_query.result_set import ResultSet
 from mindsdb.utilities.config import config
 
 
-def run_sql_command(request_env, ast_query):
+def run_sql_query(request_env, ast_query) -> ResultSet:
     sql_session = SessionController()
     sql_session.database = request_env.get('database', config.get('default_project'))
 
@@ -14,6 +15,9 @@ def run_sql_command(request_env, ast_query):
 
     if ret.data is None:
         # return no data
-        return []
+        return ResultSet()
+    return ret.data
+
 
-    return list(ret.data.get_records())
+def run_sql_command(request_env, ast_query):
+    return list(run_sql_query(request_env, ast_query).get_records())
@@ -1,6 +1,7 @@
 import base64
 
 from mindsdb.api.mongo.classes.scram import Scram
+from mindsdb.api.mongo.classes.cursor import CursorRegistry, DEFAULT_IDLE_TIMEOUT
 
 
 class Session():
@@ -8,6 +9,9 @@ class Session():
         self.config = server_mindsdb_env['config']
         self.mindsdb_env = {'company_id': None}
         self.mindsdb_env.update(server_mindsdb_env)
+        self.cursors = CursorRegistry(
+            idle_timeout=self.config['api']['mongodb'].get('cursor_idle_timeout', DEFAULT_IDLE_TIMEOUT)
+        )
 
     def init_scram(self, method):
         self.scram = Scram(method=method, get_salted_password=self.get_salted_password)
@@ -24,6 +24,8 @@ from .list_collections import responder as responder_list_collections
 from .list_databases import responder as responder_list_databases
 
 from .find import responder as responder_find
+from .get_more import responder as responder_get_more
+from .kill_cursors import responder as responder_kill_cursors
 from .insert import responder as responder_insert
 from .delete import responder as responder_delete
 from .describe import responder as responder_describe
@@ -62,6 +64,8 @@ responders = [
     responder_list_collections,
     responder_list_databases,
     responder_find,
+    responder_get_more,
+    responder_kill_cursors,
     responder_insert,
     responder_delete,
     responder_describe,
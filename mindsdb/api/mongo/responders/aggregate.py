@@ -1,11 +1,9 @@
-from bson.int64 import Int64
-
 from mindsdb_sql_parser.ast import Identifier, Insert, CreateTable
 
 from mindsdb.api.mongo.classes import Responder
 import mindsdb.api.mongo.functions as helpers
 from mindsdb.api.mongo.responders.find import find_to_ast
-from mindsdb.api.mongo.classes.query_sql import run_sql_command
+from mindsdb.api.mongo.classes.query_sql import run_sql_query
 from mindsdb.utilities.config import config
 
 
@@ -65,7 +63,7 @@ class Responce(Responder):
         if '$match' in first_step:
             ast_query = aggregate_to_ast(query, request_env.get('database', config.get('default_project')))
 
-            data = run_sql_command(request_env, ast_query)
+            result = run_sql_query(request_env, ast_query)
 
         elif '$collStats' in first_step:
             raise ValueError(
@@ -76,11 +74,12 @@ class Responce(Responder):
         else:
             raise NotImplementedError
 
-        cursor = {
-            'id': Int64(0),
-            'ns': f"{db}.$cmd.{collection}",
-            'firstBatch': data
-        }
+        cursor = session.cursors.first_batch(
+            result.get_raw_df(),
+            result.get_column_names(),
+            ns=f"{db}.$cmd.{collection}",
+            batch_size=query.get('cursor', {}).get('batchSize')
+        )
         return {
             'cursor': cursor,
             'ok': 1
@@ -6,7 +6,7 @@ from mindsdb.api.mongo.classes import Responder
 from mindsdb.api.mongo.utilities.mongodb_ast import MongoToAst
 from mindsdb.interfaces.jobs.jobs_controller import JobsController
 
-from mindsdb.api.mongo.classes.query_sql import run_sql_command
+from mindsdb.api.mongo.classes.query_sql import run_sql_query
 
 
 def find_to_ast(query, database):
@@ -138,14 +138,14 @@ class Responce(Responder):
                     for job in jobs_controller.get_list(project_name):
                         obj_idx[job['name']] = job['id']
 
-        data = run_sql_command(request_env, ast_query)
+        result = run_sql_query(request_env, ast_query)
 
         if table_name == 'models':
             # for models and models_versions _id is:
             #   - first 20 bytes is version
             #   - next bytes is model id
 
-            for row in data:
+            def prepare_record(row):
                 model_id = obj_idx.get(row.get('NAME'))
                 if model_id is not None:
                     obj_id = model_id << 20
@@ -154,18 +154,23 @@ class Responce(Responder):
 
                     row['_id'] = helpers.int_to_objectid(obj_id)
         elif table_name == 'jobs':
-            for row in data:
+            def prepare_record(row):
                 obj_id = obj_idx.get(row.get('NAME'))
                 if obj_id is not None:
                     row['_id'] = helpers.int_to_objectid(obj_id)
+        else:
+            prepare_record = None
 
         db = mindsdb_env['config']['api']['mongodb']['database']
 
-        cursor = {
-            'id': Int64(0),
-            'ns': f"{db}.$cmd.{query['find']}",
-            'firstBatch': data
-        }
+        cursor = session.cursors.first_batch(
+            result.get_raw_df(),
+            result.get_column_names(),
+            ns=f"{db}.$cmd.{query['find']}",
+            batch_size=query.get('batchSize'),
+            single_batch=bool(query.get('singleBatch')),
+            prepare_record=prepare_record
+        )
         return {
             'cursor': cursor,
             'ok': 1
@@ -0,0 +1,25 @@
+from mindsdb.api.mongo.classes import Responder, CursorNotFound
+import mindsdb.api.mongo.functions as helpers
+
+
+class Responce(Responder):
+    when = {'getMore': helpers.is_true}
+
+    def result(self, query, request_env, mindsdb_env, session):
+        try:
+            cursor = session.cursors.next_batch(query['getMore'], query.get('batchSize'))
+        except CursorNotFound as e:
+            return {
+                'ok': 0,
+                'errmsg': str(e),
+                'code': 43,
+                'codeName': 'CursorNotFound'
+            }
+
+        return {
+            'cursor': cursor,
+            'ok': 1
+        }
+
+
+responder = Responce()
@@ -6,14 +6,10 @@ import traceback
 from bson import codec_options
 from collections import OrderedDict
 from abc import abstractmethod
-from bson.codec_options import CodecOptions
-from bson.codec_options import TypeCodec
-from bson.codec_options import TypeRegistry
-import numpy as np
-import datetime as dt
 
 import mindsdb.api.mongo.functions as helpers
 from mindsdb.api.mongo.classes import RespondersCollection, Session
+from mindsdb.api.mongo.utilities.bson_codecs import ENCODE_CODEC_OPTIONS
 from mindsdb.interfaces.storage import db
 from mindsdb.interfaces.model.model_controller import ModelController
 from mindsdb.interfaces.database.integrations import integration_controller
@@ -39,35 +35,6 @@ LONG = '<q'
 logger = log.getLogger(__name__)
 
 
-class NPIntCodec(TypeCodec):
-    python_type = np.int64
-    bson_type = bson.int64.Int64
-
-    def transform_python(self, value):
-        return bson.int64.Int64(value)
-
-    def transform_bson(self, value):
-        return np.int(value)
-
-
-class DateCodec(TypeCodec):
-    python_type = dt.date
-    bson_type = bson.datetime.datetime
-
-    def transform_python(self, value):
-        return dt.datetime(value.year, value.month, value.day)
-
-    def transform_bson(self, value):
-        return dt.datetime(value.year, value.month, value.day)
-
-
-def fallback_encoder(value):
-    return str(value)
-
-
-type_registry = TypeRegistry([NPIntCodec(), DateCodec()], fallback_encoder=fallback_encoder)
-
-
 def unpack(format, buffer, start=0):
     end = start + struct.calcsize(format)
     return struct.unpack(format, buffer[start:end])[0], end
@@ -185,8 +152,7 @@ class OpMsgResponder(OperationResponder):
             flags = struct.pack("<I", 0)  # TODO
         payload_type = struct.pack("<b", 0)  # TODO
 
-        codec_options = CodecOptions(type_registry=type_registry)
-        payload_data = bson.BSON.encode(response, codec_options=codec_options)
+        payload_data = bson.BSON.encode(response, codec_options=ENCODE_CODEC_OPTIONS)
         data = b''.join([flags, payload_type, payload_data])
 
         reply_id = 0  # TODO add seq here
@@ -290,6 +256,8 @@ class MongoRequestHandler(SocketServer.BaseRequestHandler):
 
             db.session.close()
 
+        self.session.cursors.clear()
+
     def get_answer(self, request_id, opcode, msg_bytes):
         if opcode not in self.server.operationsHandlersMap:
             raise NotImplementedError(f'Unknown opcode {opcode}')
@@ -0,0 +1,39 @@
+import datetime as dt
+
+import bson
+import numpy as np
+from bson.codec_options import CodecOptions
+from bson.codec_options import TypeCodec
+from bson.codec_options import TypeRegistry
+
+
+class NPIntCodec(TypeCodec):
+    python_type = np.int64
+    bson_type = bson.int64.Int64
+
+    def transform_python(self, value):
+        return bson.int64.Int64(value)
+
+    def transform_bson(self, value):
+        return np.int(value)
+
+
+class DateCodec(TypeCodec):
+    python_type = dt.date
+    bson_type = bson.datetime.datetime
+
+    def transform_python(self, value):
+        return dt.datetime(value.year, value.month, value.day)
+
+    def transform_bson(self, value):
+        return dt.datetime(value.year, value.month, value.day)
+
+
+def fallback_encoder(value):
+    return str(value)
+
+
+type_registry = TypeRegistry([NPIntCodec(), DateCodec()], fallback_encoder=fallback_encoder)
+
+# options to encode responses
+ENCODE_CODEC_OPTIONS = CodecOptions(type_registry=type_registry)
@@ -82,6 +82,7 @@ from mindsdb.api.executor import exceptions as exec_exc
 
 from mindsdb.api.common.check_auth import check_auth
 from mindsdb.api.mysql.mysql_proxy.utilities.lightwood_dtype import dtype
+from mindsdb.metrics import metrics
 from mindsdb.utilities import log
 from mindsdb.utilities.config import config
 from mindsdb.utilities.context import context as ctx
@@ -315,17 +316,18 @@ class MysqlProxy(SocketServer.BaseRequestHandler):
         if answer.type == RESPONSE_TYPE.TABLE:
             packages = []
 
-            if len(answer.data) > 1000:
-                # for big responses leverage pandas map function to convert data to packages
-                self.send_table_packets(columns=answer.columns, data=answer.data)
-            else:
-                packages += self.get_table_packets(columns=answer.columns, data=answer.data.to_lists())
+            with profiler.Phase(metrics.RESULT_SERIALIZATION_TIME, 'mysql', 'text_rows'):
+                if len(answer.data) > 1000:
+                    # for big responses leverage pandas map function to convert data to packages
+                    self.send_table_packets(columns=answer.columns, data=answer.data)
+                else:
+                    packages += self.get_table_packets(columns=answer.columns, data=answer.data.to_lists())
 
-            if answer.status is not None:
-                packages.append(self.last_packet(status=answer.status))
-            else:
-                packages.append(self.last_packet())
-            self.send_package_group(packages)
+                if answer.status is not None:
+                    packages.append(self.last_packet(status=answer.status))
+                else:
+                    packages.append(self.last_packet())
+                self.send_package_group(packages)
         elif answer.type == RESPONSE_TYPE.OK:
             self.packet(OkPacket, state_track=answer.state_track, affected_rows=answer.affected_rows).send()
         elif answer.type == RESPONSE_TYPE.ERROR:
@@ -884,6 +886,8 @@ class MysqlProxy(SocketServer.BaseRequestHandler):
             self.session.profiling = context["profiling"]
         if "predictor_cache" in context:
             self.session.predictor_cache = context["predictor_cache"]
+        if "integration_cache" in context:
+            self.session.integration_cache = context["integration_cache"]
         if "show_secrets" in context:
             self.session.show_secrets = context["show_secrets"]
 
@@ -897,6 +901,8 @@ class MysqlProxy(SocketServer.BaseRequestHandler):
             context["profiling"] = True
         if self.session.predictor_cache is False:
             context["predictor_cache"] = False
+        if self.session.integration_cache is False:
+            context["integration_cache"] = False
 
         return context
 
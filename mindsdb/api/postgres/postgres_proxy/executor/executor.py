@@ -1,6 +1,6 @@
 from typing import Union
 
-from mindsdb_sql_parser import parse_sql
+from mindsdb.api.executor.utilities.extended_sql import parse_sql
 from mindsdb.api.executor.planner import utils as planner_utils
 
 from numpy import dtype as np_dtype
@@ -89,7 +89,7 @@ class Executor:
         self.is_executed = True
 
         if ret.data is not None:
-            self.data = ret.data.to_lists()
+            self.data = ret.data.get_raw_df()
             self.columns = ret.data.columns
 
         self.state_track = ret.state_track
@@ -98,7 +98,7 @@ class Executor:
         params = {
             "columns": self.to_postgres_columns(self.columns),
             "params": self.to_postgres_columns(self.params),
-            "data": self.data,
+            "data": None if self.data is None else self.data.to_dict('split')['data'],
             "state_track": self.state_track,
             "server_status": self.server_status,
             "is_executed": self.is_executed,
@@ -140,18 +140,20 @@ class Executor:
             elif field_type == dtype.integer:
                 column_type = POSTGRES_TYPES.LONG
 
-            if "()" in column_record.alias:
-                column_record.alias = column_record.alias.strip("()")
-            if "()" in column_record.name:
-                column_record.name = column_record.name.strip("()")
+            name = column_record.name
+            alias = column_record.alias
+            if "()" in alias:
+                alias = alias.strip("()")
+            if "()" in name:
+                name = name.strip("()")
 
             result.append(
                 {
                     "database": column_record.database or database,
                     #  TODO add 'original_table'
                     "table_name": column_record.table_name,
-                    "name": column_record.name,
-                    "alias": column_record.alias or column_record.name,
+                    "name": name,
+                    "alias": alias or name,
                     # NOTE all work with text-type, but if/when wanted change types to real,
                     # it will need to check all types casts in BinaryResultsetRowPacket
                     "type": column_type,
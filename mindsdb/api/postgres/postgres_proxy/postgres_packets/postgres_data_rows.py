@@ -0,0 +1,233 @@
+"""
+Encoding of query results to DataRow messages.
+
+Values are encoded column by column, then DataRow messages are assembled from the encoded cells and returned in
+chunks of rows, so the result is not converted to python objects all at once and the client gets the first rows
+before the whole result is encoded.
+"""
+import json
+import struct
+import datetime
+from typing import Iterator, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from pandas.api import types as pd_types
+
+from mindsdb.api.postgres.postgres_proxy.postgres_packets.postgres_fields import PostgresField
+from mindsdb.api.postgres.postgres_proxy.postgres_packets.postgres_message_identifiers import \
+    PostgresBackendMessageIdentifier
+
+TEXT_FORMAT = 0
+BINARY_FORMAT = 1
+
+# count of rows in one write to the client
+DATA_ROWS_CHUNK_SIZE = 10000
+
+NULL_CELL = struct.pack('!i', -1)
+INT32 = struct.Struct('!i')
+DATA_ROW_HEADER = struct.Struct('!cih')
+DATA_ROW_IDENTIFIER = PostgresBackendMessageIdentifier.DATA_ROW.value
+
+# postgres epoch for date and timestamp in binary format
+POSTGRES_EPOCH = np.datetime64('2000-01-01T00:00:00', 'us')
+
+
+class BinaryType:
+    def __init__(self, object_id: int, size: int, dtype: str):
+        self.object_id = object_id
+        self.size = size
+        # numpy type of value in network byte order
+        self.dtype = dtype
+
+
+BOOL_TYPE = BinaryType(object_id=16, size=1, dtype='?')
+INT8_TYPE = BinaryType(object_id=20, size=8, dtype='>i8')
+FLOAT8_TYPE = BinaryType(object_id=701, size=8, dtype='>f8')
+TIMESTAMP_TYPE = BinaryType(object_id=1114, size=8, dtype='>i8')
+TIMESTAMPTZ_TYPE = BinaryType(object_id=1184, size=8, dtype='>i8')
+# text is used for all other types
+TEXT_TYPE = BinaryType(object_id=25, size=-1, dtype=None)
+
+
+def get_binary_type(column: pd.Series) -> BinaryType:
+    """Returns postgres type which is used to send column in binary format"""
+    dtype = column.dtype
+    if pd_types.is_bool_dtype(dtype):
+        if column.isna().any():
+            return TEXT_TYPE
+        return BOOL_TYPE
+    elif pd_types.is_integer_dtype(dtype):
+        return INT8_TYPE
+    elif pd_types.is_float_dtype(dtype):
+        return FLOAT8_TYPE
+    elif isinstance(dtype, pd.DatetimeTZDtype):
+        return TIMESTAMPTZ_TYPE
+    elif pd_types.is_datetime64_dtype(dtype):
+        return TIMESTAMP_TYPE
+    return TEXT_TYPE
+
+
+def get_result_formats(format_codes: Sequence[int], columns_count: int) -> List[int]:
+    """Expands result format codes of Bind message to the format of every column
+
+    Args:
+        format_codes (Sequence[int]): zero codes - all columns are text, one code - the code is used for all columns,
+            otherwise the code of every column
+        columns_count (int): count of columns in result
+    """
+    if len(format_codes) == 0:
+        return [TEXT_FORMAT] * columns_count
+    if len(format_codes) == 1:
+        return [format_codes[0]] * columns_count
+    return list(format_codes)
+
+
+def to_binary_fields(fields: Sequence[PostgresField], df: pd.DataFrame, formats: Sequence[int]) -> List[PostgresField]:
+    """Changes types of fields which are sent in binary format"""
+    for i, field in enumerate(fields):
+        if formats[i] != BINARY_FORMAT:
+            continue
+        binary_type = get_binary_type(df.iloc[:, i])
+        field.object_id = binary_type.object_id
+        field.dt_size = binary_type.size
+        field.format_code = BINARY_FORMAT
+    return fields
+
+
+def _value_to_text(value) -> str:
+    if value is None:
+        return ''
+    value_type = type(value)
+    if value_type is str:
+        return value
+    if value_type is int or value_type is float:
+        return str(value)
+    if value_type is list or value_type is dict:
+        return json.dumps(value)
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, datetime.date):
+        return value.strftime('%Y-%m-%d')
+    return str(value)
+
+
+def _to_cells(values: Sequence[Optional[bytes]]) -> List[bytes]:
+    # add length to every value
+    return [
+        NULL_CELL if value is None else INT32.pack(len(value)) + value
+        for value in values
+    ]
+
+
+def encode_text_column(column: pd.Series, charset: str) -> List[bytes]:
+    """Encodes values of the column to the cells of DataRow messages in text format
+
+    Args:
+        column (pd.Series): values
+        charset (str): encoding of strings
+
+    Returns:
+        List[bytes]: encoded values with their length
+    """
+    dtype = column.dtype
+    if pd_types.is_bool_dtype(dtype) and not pd_types.is_object_dtype(dtype) and not column.isna().any():
+        strings = np.where(column.to_numpy(dtype=bool), 'true', 'false').tolist()
+    elif pd_types.is_integer_dtype(dtype) and not column.isna().any():
+        strings = column.astype(str).tolist()
+    elif pd_types.is_float_dtype(dtype):
+        strings = column.astype(str).where(column.notna(), '').tolist()
+    elif pd_types.is_datetime64_any_dtype(dtype):
+        strings = column.dt.strftime('%Y-%m-%d').where(column.notna(), '').tolist()
+    else:
+        values = column.astype(object).where(column.notna(), None)
+        strings = [_value_to_text(value) for value in values]
+
+    values = [string.encode(charset) for string in strings]
+    # 'NULL' string is sent as null value
+    return [
+        NULL_CELL if value == b'NULL' else INT32.pack(len(value)) + value
+        for value in values
+    ]
+
+
+def encode_binary_column(column: pd.Series, charset: str) -> List[bytes]:
+    """Encodes values of the column to the cells of DataRow messages in binary format
+
+    Args:
+        column (pd.Series): values
+        charset (str): encoding of strings
+
+    Returns:
+        List[bytes]: encoded values with their length
+    """
+    binary_type = get_binary_type(column)
+    nulls = column.isna().to_numpy()
+
+    if binary_type is TEXT_TYPE:
+        values = column.astype(object).where(~nulls, None)
+        return _to_cells([
+            None if value is None else _value_to_text(value).encode(charset)
+            for value in values
+        ])
+
+    if binary_type in (TIMESTAMP_TYPE, TIMESTAMPTZ_TYPE):
+        if binary_type is TIMESTAMPTZ_TYPE:
+            column = column.dt.tz_convert('UTC').dt.tz_localize(None)
+        values = column.to_numpy(dtype='datetime64[us]')
+        # microseconds from postgres epoch
+        values = np.where(nulls, POSTGRES_EPOCH, values) - POSTGRES_EPOCH
+        values = values.astype('int64')
+    elif binary_type is FLOAT8_TYPE:
+        values = column.to_numpy(dtype='float64', na_value=0)
+    elif binary_type is INT8_TYPE:
+        values = column.to_numpy(dtype='int64', na_value=0)
+    else:
+        values = column.to_numpy(dtype=bool)
+
+    # every cell is length and value
+    cells = np.empty(len(values), dtype=[('length', '>i4'), ('value', binary_type.dtype)])
+    cells['length'] = binary_type.size
+    cells['value'] = values
+    buffer = cells.tobytes()
+
+    cell_size = cells.dtype.itemsize
+    return [
+        NULL_CELL if nulls[i] else buffer[i * cell_size:(i + 1) * cell_size]
+        for i in range(len(values))
+    ]
+
+
+def encode_data_rows(df: pd.DataFrame, formats: Sequence[int], charset: str) -> bytes:
+    """Encodes rows of dataframe to DataRow messages
+
+    Args:
+        df (pd.DataFrame): rows
+        formats (Sequence[int]): format of every column
+        charset (str): encoding of strings
+
+    Returns:
+        bytes: DataRow messages
+    """
+    columns = []
+    for i in range(len(df.columns)):
+        if formats[i] == BINARY_FORMAT:
+            columns.append(encode_binary_column(df.iloc[:, i], charset))
+        else:
+            columns.append(encode_text_column(df.iloc[:, i], charset))
+
+    columns_count = len(columns)
+    messages = []
+    for cells in zip(*columns):
+        body = b''.join(cells)
+        # length includes itself and count of columns
+        messages.append(DATA_ROW_HEADER.pack(DATA_ROW_IDENTIFIER, len(body) + 6, columns_count))
+        messages.append(body)
+    return b''.join(messages)
+
+
+def iter_data_rows(df: pd.DataFrame, formats: Sequence[int], charset: str,
+                   chunk_size: int = DATA_ROWS_CHUNK_SIZE) -> Iterator[bytes]:
+    """Yields DataRow messages of dataframe by chunks of rows"""
+    for start in range(0, len(df), chunk_size):
+        yield encode_data_rows(df.iloc[start:start + chunk_size], formats, charset)
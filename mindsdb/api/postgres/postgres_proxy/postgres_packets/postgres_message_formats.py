@@ -1,7 +1,10 @@
 from typing import BinaryIO, Sequence, Dict, Type
 
+import pandas as pd
+
 from mindsdb.api.mysql.mysql_proxy.classes.sql_statement_parser import SqlStatementParser
 from mindsdb.api.postgres.postgres_proxy.postgres_packets.postgres_fields import PostgresField
+from mindsdb.api.postgres.postgres_proxy.postgres_packets.postgres_data_rows import iter_data_rows
 from mindsdb.api.postgres.postgres_proxy.postgres_packets.postgres_message import PostgresMessage
 from mindsdb.api.postgres.postgres_proxy.postgres_packets.postgres_message_identifiers import \
     PostgresBackendMessageIdentifier, PostgresFrontendMessageIdentifier, PostgresAuthType
@@ -411,6 +414,26 @@ class DataRow(PostgresMessage):
                 .write(write_file=write_file)
 
 
+class DataRows(PostgresMessage):
+    """
+    DataRow (B) messages for every row of the dataframe, the format of the message is described in DataRow.
+
+    Values are encoded by columns and messages are written by chunks of rows. """
+
+    def __init__(self, df: pd.DataFrame, formats: Sequence[int], charset: str = "UTF-8"):
+        self.identifier = PostgresBackendMessageIdentifier.DATA_ROW
+        self.backend_capable = True
+        self.frontend_capable = False
+        self.df = df
+        self.formats = formats
+        self.charset = charset
+        super().__init__()
+
+    def send_internal(self, write_file: BinaryIO):
+        for chunk in iter_data_rows(self.df, self.formats, self.charset):
+            write_file.write(chunk)
+
+
 class NegotiateProtocolVersion(PostgresMessage):
     """
     NegotiateProtocolVersion (B)
@@ -733,7 +756,7 @@ class Describe(BaseFrontendMessage):
 
 IMPLEMENTED_BACKEND_POSTGRES_MESSAGE_CLASSES = [
     NoticeResponse, AuthenticationOk, AuthenticationClearTextPassword, ReadyForQuery, CommandComplete, Error,
-    RowDescriptions, DataRow, NegotiateProtocolVersion, ParameterStatus, ParseComplete, BindComplete,
+    RowDescriptions, DataRow, DataRows, NegotiateProtocolVersion, ParameterStatus, ParseComplete, BindComplete,
     ParameterDescription
 ]
 IMPLEMENTED_FRONTEND_POSTGRES_MESSAGE_CLASSES = [
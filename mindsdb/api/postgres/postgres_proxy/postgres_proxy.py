@@ -1,14 +1,12 @@
 import base64
-import datetime
 import os
-import json
 import select
 import socketserver
 import struct
 import sys
 from functools import partial
 import socket
-from typing import Callable, Dict, Type, Any, Iterable, Sequence
+from typing import Callable, Dict, Type, Any, Iterable, Sequence, List
 
 from mindsdb.api.executor.controllers import SessionController
 from mindsdb.api.postgres.postgres_proxy.executor import Executor
@@ -19,16 +17,20 @@ from mindsdb.api.mysql.mysql_proxy.mysql_proxy import SQLAnswer
 from mindsdb.api.postgres.postgres_proxy.postgres_packets.errors import POSTGRES_SYNTAX_ERROR_CODE
 from mindsdb.api.postgres.postgres_proxy.postgres_packets.postgres_fields import GenericField, PostgresField
 from mindsdb.api.postgres.postgres_proxy.postgres_packets.postgres_message_formats import Terminate, \
-    Query, AuthenticationClearTextPassword, AuthenticationOk, RowDescriptions, DataRow, CommandComplete, \
+    Query, AuthenticationClearTextPassword, AuthenticationOk, RowDescriptions, DataRows, CommandComplete, \
     ReadyForQuery, ConnectionFailure, ParameterStatus, Error, Execute, Bind, Parse, Sync, ParseComplete, \
     InvalidSQLStatementName, BindComplete, Describe, DataException, ParameterDescription
 from mindsdb.api.postgres.postgres_proxy.postgres_packets.postgres_message import PostgresMessage
+from mindsdb.api.postgres.postgres_proxy.postgres_packets.postgres_data_rows import get_result_formats, \
+    to_binary_fields
 from mindsdb.api.postgres.postgres_proxy.postgres_packets.postgres_packets import PostgresPacketReader, \
     PostgresPacketBuilder
 from mindsdb.api.postgres.postgres_proxy.utilities import strip_null_byte
+from mindsdb.metrics import metrics
 from mindsdb.utilities.config import config
 from mindsdb.utilities.context import context as ctx
 from mindsdb.utilities import log
+import mindsdb.utilities.profiler as profiler
 from mindsdb.api.mysql.mysql_proxy.external_libs.mysql_scramble import scramble as scramble_func
 
 
@@ -200,7 +202,14 @@ class PostgresProxyHandler(socketserver.StreamRequestHandler):
             self.send(DataException(message="Describe did not have correct type. Can be 'P' or 'S'"))
             return True
 
-        fields = self.to_postgres_fields(describing["executor"].columns)
+        executor = describing["executor"]
+        if message.describe_type == b'P':
+            # types of columns are known only after execution, it is not repeated on Execute
+            executor.stmt_execute(param_values=describing["bind"].parameters)
+        fields = self.to_postgres_fields(executor.to_postgres_columns(executor.columns))
+        if message.describe_type == b'P' and executor.data is not None:
+            formats = get_result_formats(describing["bind"].result_format_codes, len(fields))
+            fields = to_binary_fields(fields, executor.data, formats)
         self.send(RowDescriptions(fields=fields))
         return True
 
@@ -215,9 +224,13 @@ class PostgresProxyHandler(socketserver.StreamRequestHandler):
 
         executor = portal["executor"]
         params = portal["bind"].parameters
-        executor.stmt_execute(param_values=params)
+        with profiler.Context('postgres_query_processing'):
+            executor.stmt_execute(param_values=params)
         sql_answer = self.return_executor_data(executor)
-        self.respond_from_sql_answer(sql=executor.sql, sql_answer=sql_answer, row_descs=False)
+        formats = None
+        if sql_answer.columns is not None:
+            formats = get_result_formats(portal["bind"].result_format_codes, len(sql_answer.columns))
+        self.respond_from_sql_answer(sql=executor.sql, sql_answer=sql_answer, row_descs=False, formats=formats)
         return True
 
     def sync(self, message: Sync):
@@ -257,7 +270,8 @@ class PostgresProxyHandler(socketserver.StreamRequestHandler):
         )
         self.logger.debug("processing query\n%s", sql)
         try:
-            executor.query_execute(sql)
+            with profiler.Context('postgres_query_processing'):
+                executor.query_execute(sql)
         except Exception as e:
             return SQLAnswer(
                 resp_type=RESPONSE_TYPE.ERROR,
@@ -350,14 +364,16 @@ class PostgresProxyHandler(socketserver.StreamRequestHandler):
             sql: str = sql.decode(encoding)
         return strip_null_byte(sql).strip(';')
 
-    def return_table(self, sql_answer: SQLAnswer, row_descs=True):
+    def return_table(self, sql_answer: SQLAnswer, row_descs=True, formats: List[int] = None):
         fields = self.to_postgres_fields(sql_answer.columns)
-        rows = self.to_postgres_rows(sql_answer.data)
+        if formats is None:
+            formats = get_result_formats([], len(fields))
         if row_descs:
-            self.send(RowDescriptions(fields=fields))
-        self.send(DataRow(rows=rows))
+            self.send(RowDescriptions(fields=to_binary_fields(fields, sql_answer.data, formats)))
+        with profiler.Phase(metrics.RESULT_SERIALIZATION_TIME, 'postgres', 'data_rows'):
+            self.send(DataRows(df=sql_answer.data, formats=formats, charset=self.charset))
         encoding = self.get_encoding()
-        tag = ('SELECT %s' % str(len(rows))).encode(encoding)
+        tag = ('SELECT %s' % str(len(sql_answer.data))).encode(encoding)
         self.send(CommandComplete(tag=tag))
         return True
 
@@ -373,15 +389,15 @@ class PostgresProxyHandler(socketserver.StreamRequestHandler):
         self.send_ready()
         return True
 
-    def respond_from_sql_answer(self, sql, sql_answer: SQLAnswer, row_descs=True) -> bool:
+    def respond_from_sql_answer(self, sql, sql_answer: SQLAnswer, row_descs=True, formats: List[int] = None) -> bool:
         # TODO Add command complete passthrough for Complex Queries that exceed row limit in one go
         rows = 0
-        if sql_answer.data:
+        if sql_answer.data is not None:
             rows = len(sql_answer.data)
         if RESPONSE_TYPE.OK == sql_answer.type:
             return self.return_ok(sql, rows=rows)
         elif RESPONSE_TYPE.TABLE == sql_answer.type:
-            return self.return_table(sql_answer, row_descs=row_descs)
+            return self.return_table(sql_answer, row_descs=row_descs, formats=formats)
         elif RESPONSE_TYPE.ERROR == sql_answer.type:
             return self.return_error(sql_answer)
 
@@ -398,34 +414,6 @@ class PostgresProxyHandler(socketserver.StreamRequestHandler):
             i += 1
         return fields
 
-    def to_postgres_rows(self, rows: Iterable[Iterable[Any]]) -> Sequence[Sequence[bytes]]:
-        p_rows = []
-        for row in rows:
-            p_row = []
-            for column in row:
-                if column is None:
-                    column = ""
-                elif type(column) == int or type(column) == float:
-                    column = str(column)
-                elif type(column) == list or type(column) == dict:
-                    column = json.dumps(column)
-                if isinstance(column, datetime.date) or isinstance(column, datetime.datetime):
-                    try:
-                        column = datetime.datetime.strftime(column, '%Y-%m-%d')
-                    except ValueError:
-                        try:
-                            column = datetime.datetime.strftime(column, '%Y-%m-%dT%H:%M:%S')
-                        except ValueError:
-                            column = datetime.datetime.strptime(column, '%Y-%m-%dT%H:%M:%S.%f')
-                if isinstance(column, bool):
-                    if column:
-                        column = "true"
-                    else:
-                        column = "false"
-                p_row.append(column.encode(encoding=self.charset))
-            p_rows.append(p_row)
-        return p_rows
-
     def send_initial_data(self):
         server_encoding = self.charset.encode(self.charset)
         client_encoding = self.user_parameters.get(b'client_encoding', server_encoding)
@@ -433,6 +421,9 @@ class PostgresProxyHandler(socketserver.StreamRequestHandler):
         self.send(ParameterStatus(name=b"server_version", value=b"14.6"))
         self.send(ParameterStatus(name=b"server_encoding", value=server_encoding))
         self.send(ParameterStatus(name=b"client_encoding", value=client_encoding))
+        # timestamps in binary format are sent as integers in UTC
+        self.send(ParameterStatus(name=b"integer_datetimes", value=b"on"))
+        self.send(ParameterStatus(name=b"TimeZone", value=b"UTC"))
         # TODO Send Parameters to complete set on 55.2.7 Asynchronous Operations E.G. - At present there is a
         #  hard-wired set of parameters for which ParameterStatus will be generated: they are server_version,
         #  server_encoding, client_encoding, application_name, default_transaction_read_only, in_hot_standby,
@@ -1,5 +1,7 @@
 import os
-from typing import Dict, Optional
+import time
+import random
+from typing import Dict, List, Optional
 
 from PIL import Image
 import requests
@@ -8,6 +10,7 @@ from io import BytesIO
 import json
 import textwrap
 import google.generativeai as genai
+from google.api_core import exceptions as google_exceptions
 import pandas as pd
 from mindsdb.integrations.libs.base import BaseMLEngine
 from mindsdb.utilities import log
@@ -17,6 +20,81 @@ import concurrent.futures
 
 logger = log.getLogger(__name__)
 
+# max count of requests to the model at the same time
+DEFAULT_MAX_CONCURRENCY = 8
+DEFAULT_MAX_RETRIES = 5
+RETRY_INITIAL_DELAY = 1
+
+# errors which are raised on rate limit or temporary unavailability of API
+RETRY_ERRORS = (
+    google_exceptions.ResourceExhausted,
+    google_exceptions.TooManyRequests,
+    google_exceptions.ServiceUnavailable,
+    google_exceptions.DeadlineExceeded,
+    google_exceptions.InternalServerError,
+)
+
+
+def generate_content_with_retry(
+    model, prompt, max_retries: int = DEFAULT_MAX_RETRIES, initial_delay: float = RETRY_INITIAL_DELAY
+) -> str:
+    """
+    Get completion for the prompt, retry with exponential backoff on rate limit errors
+
+    Args:
+        model: gemini model
+        prompt: prompt for the model
+        max_retries (int): max count of retries
+        initial_delay (float): delay before the first retry in seconds
+
+    Returns:
+        str: text of the completion
+    """
+    delay = initial_delay
+    for attempt in range(max_retries + 1):
+        try:
+            return model.generate_content(prompt).text
+        except RETRY_ERRORS as e:
+            if attempt == max_retries:
+                raise
+            logger.warning(f"Gemini API error: {e}, retry in {delay:.1f}s")
+            time.sleep(delay * (1 + random.random() * 0.1))
+            delay *= 2
+
+
+def generate_completions(
+    model,
+    prompts: List[str],
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    initial_delay: float = RETRY_INITIAL_DELAY,
+) -> List[str]:
+    """
+    Get completions for the prompts concurrently. Identical prompts are sent once.
+
+    Args:
+        model: gemini model
+        prompts (List[str]): prompts for the model
+        max_concurrency (int): max count of requests at the same time
+        max_retries (int): max count of retries of every request
+        initial_delay (float): delay before the first retry in seconds
+
+    Returns:
+        List[str]: completions in the same order as prompts
+    """
+    unique_prompts = list(dict.fromkeys(prompts))
+    if len(unique_prompts) == 0:
+        return []
+
+    def generate(prompt):
+        return generate_content_with_retry(model, prompt, max_retries=max_retries, initial_delay=initial_delay)
+
+    max_workers = max(1, min(max_concurrency, len(unique_prompts)))
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        completions = dict(zip(unique_prompts, executor.map(generate, unique_prompts)))
+
+    return [completions[prompt] for prompt in prompts]
+
 
 class GoogleGeminiHandler(BaseMLEngine):
     """
@@ -102,6 +180,8 @@ class GoogleGeminiHandler(BaseMLEngine):
                 "max_tokens",
                 "temperature",
                 "api_key",
+                "max_concurrency",
+                "max_retries",
             }
         )
 
@@ -216,6 +296,7 @@ class GoogleGeminiHandler(BaseMLEngine):
                 prompts = list(df[args["question_column"]].apply(lambda x: str(x)))
 
         # remove prompts without signal from completion queue
+        empty_prompt_ids = set(empty_prompt_ids)
         prompts = [j for i, j in enumerate(prompts) if i not in empty_prompt_ids]
 
         api_key = self._get_google_gemini_api_key(args)
@@ -223,9 +304,19 @@ class GoogleGeminiHandler(BaseMLEngine):
 
         # called gemini model withinputs
         model = genai.GenerativeModel(args.get("model_name", self.default_model))
-        results = []
-        for m in prompts:
-            results.append(model.generate_content(m).text)
+        completions = generate_completions(
+            model,
+            prompts,
+            max_concurrency=int(pred_args.get("max_concurrency", args.get("max_concurrency", DEFAULT_MAX_CONCURRENCY))),
+            max_retries=int(pred_args.get("max_retries", args.get("max_retries", DEFAULT_MAX_RETRIES))),
+        )
+
+        # put empty results for prompts without signal, to keep order of input rows
+        completions = iter(completions)
+        results = [
+            None if i in empty_prompt_ids else next(completions)
+            for i in range(len(prompts) + len(empty_prompt_ids))
+        ]
 
         pred_df = pd.DataFrame(results, columns=[args["target"]])
         return pred_df
@@ -52,6 +52,18 @@ connection_args = OrderedDict(
         'description': 'Connection string parameters',
         'required': False,
         'label': 'connection_parameters'
+    },
+    server_side_cursor={
+        'type': ARG_TYPE.BOOL,
+        'description': 'Read results of select queries from a server side cursor by batches of fetch_size rows.',
+        'required': False,
+        'label': 'Server side cursor'
+    },
+    fetch_size={
+        'type': ARG_TYPE.INT,
+        'description': 'Count of rows which are fetched and converted at once. Default is 10000.',
+        'required': False,
+        'label': 'Fetch size'
     }
 )
 
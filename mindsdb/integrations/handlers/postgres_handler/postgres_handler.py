@@ -1,8 +1,11 @@
+import re
 import time
 import json
-from typing import Optional
+import uuid
+from typing import List, Optional
 import threading
 
+import numpy as np
 import pandas as pd
 import psycopg
 from psycopg.postgres import types
@@ -27,6 +30,22 @@ logger = log.getLogger(__name__)
 
 SUBSCRIBE_SLEEP_INTERVAL = 1
 
+# count of rows which are fetched and converted at once
+DEFAULT_FETCH_SIZE = 10000
+
+# pandas types of postgres types, used to cast columns of the result
+PG_TYPES_MAP = {
+    'int2': 'int16',
+    'int4': 'int32',
+    'int8': 'int64',
+    'numeric': 'float64',
+    'float4': 'float32',
+    'float8': 'float64'
+}
+
+# queries which can be executed with server side cursor
+SELECT_QUERY_RE = re.compile(r'^[\s(]*(select|with|values|table)\b', re.IGNORECASE)
+
 
 def _map_type(internal_type_name: str) -> MYSQL_DATA_TYPE:
     """Map Postgres types to MySQL types.
@@ -60,6 +79,62 @@ def _map_type(internal_type_name: str) -> MYSQL_DATA_TYPE:
     return MYSQL_DATA_TYPE.VARCHAR
 
 
+class ResultColumns:
+    """Collects rows of the result by batches, column by column.
+
+    Values of numeric columns are converted to numpy arrays in every batch, so python objects
+    of these values exist only for one batch. Other columns are kept as arrays of objects.
+    The dataframe is the same as DataFrame of all rows after PostgresHandler._cast_dtypes.
+    """
+
+    def __init__(self, description: list):
+        self.names = [column.name for column in description]
+        self.type_names = []
+        for column in description:
+            pg_type = types.get(column.type_code)
+            self.type_names.append(None if pg_type is None else pg_type.name)
+        self.values = [[] for _ in description]
+        self.has_values = [False] * len(description)
+        self.rows_count = 0
+
+    def add(self, rows: List[tuple]):
+        self.rows_count += len(rows)
+        for i, values in enumerate(zip(*rows)):
+            type_name = self.type_names[i]
+            if type_name not in PG_TYPES_MAP:
+                self.values[i].append(np.fromiter(values, dtype=object, count=len(values)))
+                continue
+
+            # values are compared by identity: comparison of Decimal with None is slow
+            if not self.has_values[i] and not all(value is None for value in values):
+                self.has_values[i] = True
+            if type_name == 'numeric':
+                # numeric is casted with nulls replaced by 0
+                array = np.array([0.0 if value is None else float(value) for value in values], dtype='float64')
+            elif any(value is None for value in values):
+                array = np.array([np.nan if value is None else value for value in values], dtype='float64')
+            elif type_name in ('float4', 'float8'):
+                array = np.array(values, dtype='float64')
+            else:
+                array = np.array(values, dtype='int64')
+            self.values[i].append(array)
+
+    def to_df(self) -> DataFrame:
+        columns = {}
+        for i, type_name in enumerate(self.type_names):
+            if type_name not in PG_TYPES_MAP:
+                # the same inference of type as in DataFrame of rows
+                columns[i] = pd.Series(np.concatenate(self.values[i])).infer_objects()
+            elif not self.has_values[i]:
+                # column of nulls is casted with nulls replaced by 0
+                columns[i] = np.zeros(self.rows_count, dtype=PG_TYPES_MAP[type_name])
+            else:
+                columns[i] = np.concatenate(self.values[i])
+        df = DataFrame(columns)
+        df.columns = self.names
+        return df
+
+
 class PostgresHandler(DatabaseHandler):
     """
     This handler handles connection and execution of the PostgreSQL statements.
@@ -79,6 +154,9 @@ class PostgresHandler(DatabaseHandler):
         self.is_connected = False
         self.thread_safe = True
 
+        self.server_side_cursor = self.connection_args.get('server_side_cursor', False)
+        self.fetch_size = int(self.connection_args.get('fetch_size') or DEFAULT_FETCH_SIZE)
+
         self._insert_lock = threading.Lock()
 
     def __del__(self):
@@ -189,32 +267,57 @@ class PostgresHandler(DatabaseHandler):
                 df (DataFrame)
                 description (list): psycopg cursor description
         """
-        types_map = {
-            'int2': 'int16',
-            'int4': 'int32',
-            'int8': 'int64',
-            'numeric': 'float64',
-            'float4': 'float32',
-            'float8': 'float64'
-        }
         columns = df.columns
         df.columns = list(range(len(columns)))
         for column_index, column_name in enumerate(df.columns):
             col = df[column_name]
             if str(col.dtype) == 'object':
                 pg_type = types.get(description[column_index].type_code)
-                if pg_type is not None and pg_type.name in types_map:
+                if pg_type is not None and pg_type.name in PG_TYPES_MAP:
                     col = col.fillna(0)
                     try:
-                        df[column_name] = col.astype(types_map[pg_type.name])
+                        df[column_name] = col.astype(PG_TYPES_MAP[pg_type.name])
                     except ValueError as e:
-                        logger.error(f'Error casting column {col.name} to {types_map[pg_type.name]}: {e}')
+                        logger.error(f'Error casting column {col.name} to {PG_TYPES_MAP[pg_type.name]}: {e}')
         df.columns = columns
 
+    def _fetch_df(self, cur: psycopg.Cursor, rows_count: Optional[int] = None) -> DataFrame:
+        """
+        Fetches result of the query. If the result is bigger than `fetch_size` rows,
+        the rows are fetched and converted to columns batch by batch.
+
+        Args:
+            cur (psycopg.Cursor): cursor with executed query
+            rows_count (int): count of rows in the result, None if it is unknown (server side cursor)
+
+        Returns:
+            DataFrame: result of the query
+        """
+        if rows_count is not None and rows_count <= self.fetch_size:
+            rows = cur.fetchall()
+        else:
+            rows = cur.fetchmany(self.fetch_size)
+
+        if len(rows) < self.fetch_size or len(rows) == rows_count:
+            # the whole result is fetched
+            df = DataFrame(
+                rows,
+                columns=[x.name for x in cur.description]
+            )
+            self._cast_dtypes(df, cur.description)
+            return df
+
+        result_columns = ResultColumns(cur.description)
+        while len(rows) > 0:
+            result_columns.add(rows)
+            rows = cur.fetchmany(self.fetch_size)
+        return result_columns.to_df()
+
     @profiler.profile()
     def native_query(self, query: str, params=None) -> Response:
         """
         Executes a SQL query on the PostgreSQL database and returns the result.
+        If `server_side_cursor` is enabled, the result of select is read from the named cursor by batches of `fetch_size` rows.
 
         Args:
             query (str): The SQL query to be executed.
@@ -225,21 +328,31 @@ class PostgresHandler(DatabaseHandler):
         need_to_close = not self.is_connected
 
         connection = self.connect()
-        with connection.cursor() as cur:
+        use_server_cursor = self.server_side_cursor and params is None and SELECT_QUERY_RE.match(query) is not None
+        if use_server_cursor:
+            # cursor has to outlive the transaction in autocommit mode
+            cursor = connection.cursor(name=f'mindsdb_{uuid.uuid4().hex}', withhold=connection.autocommit)
+            cursor.itersize = self.fetch_size
+        else:
+            cursor = connection.cursor()
+
+        with cursor as cur:
             try:
                 if params is not None:
                     cur.executemany(query, params)
                 else:
                     cur.execute(query)
-                if cur.pgresult is None or ExecStatus(cur.pgresult.status) == ExecStatus.COMMAND_OK:
+                if use_server_cursor:
+                    df = self._fetch_df(cur, rows_count=None)
+                    response = Response(
+                        RESPONSE_TYPE.TABLE,
+                        data_frame=df,
+                        affected_rows=len(df)
+                    )
+                elif cur.pgresult is None or ExecStatus(cur.pgresult.status) == ExecStatus.COMMAND_OK:
                     response = Response(RESPONSE_TYPE.OK, affected_rows=cur.rowcount)
                 else:
-                    result = cur.fetchall()
-                    df = DataFrame(
-                        result,
-                        columns=[x.name for x in cur.description]
-                    )
-                    self._cast_dtypes(df, cur.description)
+                    df = self._fetch_df(cur, rows_count=cur.rowcount)
                     response = Response(
                         RESPONSE_TYPE.TABLE,
                         data_frame=df,
@@ -1,7 +1,9 @@
 import concurrent.futures
 import io
+import os
 import re
 import traceback
+from collections import OrderedDict, deque, defaultdict
 from threading import Lock
 from typing import List
 from urllib.parse import urljoin, urlparse, urlunparse
@@ -11,10 +13,106 @@ import fitz  # PyMuPDF
 import pandas as pd
 import requests
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
 from mindsdb.utilities import log
+from mindsdb.utilities.context import context as ctx
 
 logger = log.getLogger(__name__)
 
+# count of pages which are downloaded at the same time
+CRAWL_MAX_WORKERS = 16
+# count of requests to the same host at the same time
+CRAWL_PER_HOST_LIMIT = 4
+# total size of pages (html and text) which are kept to be revalidated with ETag/Last-Modified
+PAGE_CACHE_MAX_SIZE = int(os.getenv('MINDSDB_WEB_PAGE_CACHE_MAX_SIZE', 64 * 1024 * 1024))
+
+# Add headers to mimic a real browser request
+CRAWL_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/74.0.3729.169 Safari/537.36"
+}
+
+
+class PageCache:
+    """
+    Keeps validators (ETag, Last-Modified) and parsed content of crawled pages.
+    If page wasn't changed the server responds with 304 and the stored content is used.
+
+    Pages are stored by company: content crawled by one company is not returned to another.
+    Total size of the stored content is limited, the least recently used pages are removed first.
+    """
+
+    def __init__(self, max_size: int = PAGE_CACHE_MAX_SIZE):
+        self.max_size = max_size
+        self.size = 0
+        self._pages = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, company_id, url: str) -> dict | None:
+        key = (company_id, url)
+        with self._lock:
+            entry = self._pages.get(key)
+            if entry is not None:
+                self._pages.move_to_end(key)
+            return entry
+
+    def set(self, company_id, url: str, etag: str | None, last_modified: str | None, result: dict):
+        key = (company_id, url)
+        size = get_page_size(result)
+        with self._lock:
+            if key in self._pages:
+                self._delete(key)
+            if size > self.max_size:
+                return
+            self._pages[key] = {
+                "etag": etag,
+                "last_modified": last_modified,
+                "result": result,
+                "size": size,
+            }
+            self.size += size
+            while self.size > self.max_size:
+                self._delete(next(iter(self._pages)))
+
+    def _delete(self, key):
+        entry = self._pages.pop(key)
+        self.size -= entry["size"]
+
+    def clear(self):
+        with self._lock:
+            self._pages.clear()
+            self.size = 0
+
+    def __len__(self):
+        return len(self._pages)
+
+
+def get_page_size(result: dict) -> int:
+    """
+    Approximate size of crawled page in memory: length of its content and links
+    """
+    size = len(result["url"]) + len(result["html_content"]) + len(result["text_content"])
+    return size + sum(len(url) for url in result["urls"])
+
+
+page_cache = PageCache()
+
+
+def create_session(pool_size: int = CRAWL_MAX_WORKERS) -> requests.Session:
+    """
+    Create HTTP session which is shared between workers of crawler: connections to the hosts are reused
+
+    Args:
+        pool_size (int): max count of kept connections per host
+
+    Returns:
+        requests.Session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
 
 def pdf_to_markdown(response, gap_threshold=10):
     """
@@ -79,67 +177,45 @@ def is_valid(url) -> bool:
     return bool(parsed.netloc) and bool(parsed.scheme)
 
 
-def parallel_get_all_website_links(urls) -> dict:
-    """
-    Fetch all website links from a list of URLs.
-
-    Args:
-        urls (list): a list of URLs to fetch links from
-
-    Returns:
-        A dictionary mapping each URL to a list of links found on that URL.
-
-    Raises:
-        Exception: if an error occurs while fetching links from a URL.
-    """
-    url_contents = {}
-
-    if len(urls) <= 10:
-        for url in urls:
-            url_contents[url] = get_all_website_links(url)
-        return url_contents
-
-    with concurrent.futures.ProcessPoolExecutor() as executor:
-        future_to_url = {
-            executor.submit(get_all_website_links, url): url for url in urls
-        }
-        for future in concurrent.futures.as_completed(future_to_url):
-            url = future_to_url[future]
-            try:
-                url_contents[url] = future.result()
-            except Exception as exc:
-                logger.error(f'{url} generated an exception: {exc}')
-                # don't raise the exception, just log it, continue processing other urls
-
-    return url_contents
-
-
-def get_all_website_links(url) -> dict:
+def get_all_website_links(url, session: requests.Session = None, cache: PageCache = None, company_id=None) -> dict:
     """
     Fetch all website links from a URL.
 
     Args:
         url (str): the URL to fetch links from
+        session (requests.Session): HTTP session to use, new one is created if it is not provided
+        cache (PageCache): cache for conditional request, page is downloaded unconditionally if it is not provided
+        company_id: owner of the pages in the cache
 
     Returns:
         A dictionary containing the URL, the extracted links, the HTML content, the text content, and any error that occurred.
     """
-    logger.info("rawling: {url} ...".format(url=url))
+    logger.info("Crawling: {url} ...".format(url=url))
     urls = set()
 
     domain_name = urlparse(url).netloc
     try:
-        session = requests.Session()
-
-        # Add headers to mimic a real browser request
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/74.0.3729.169 Safari/537.36"
-        }
+        if session is None:
+            session = requests.Session()
+
+        headers = CRAWL_HEADERS.copy()
+        cached = None
+        if cache is not None:
+            cached = cache.get(company_id, url)
+            if cached is not None:
+                if cached["etag"]:
+                    headers["If-None-Match"] = cached["etag"]
+                if cached["last_modified"]:
+                    headers["If-Modified-Since"] = cached["last_modified"]
 
         response = session.get(url, headers=headers)
         if "cookie" in response.request.headers:
             session.cookies.update(response.cookies)
 
+        if cached is not None and response.status_code == 304:
+            # page wasn't changed
+            return cached["result"].copy()
+
         content_type = response.headers.get("Content-Type", "").lower()
 
         if "application/pdf" in content_type:
@@ -179,7 +255,7 @@ def get_all_website_links(url) -> dict:
             "error": str(error_message),
         }
 
-    return {
+    result = {
         "url": url,
         "urls": urls,
         "html_content": content_html,
@@ -187,6 +263,13 @@ def get_all_website_links(url) -> dict:
         "error": None,
     }
 
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if cache is not None and response.status_code == 200 and (etag or last_modified):
+        cache.set(company_id, url, etag, last_modified, result.copy())
+
+    return result
+
 
 def get_readable_text_from_soup(soup) -> str:
     """
@@ -203,75 +286,111 @@ def get_readable_text_from_soup(soup) -> str:
     return html_converter.handle(str(soup))
 
 
-def get_all_website_links_recursively(url, reviewed_urls, limit=None, crawl_depth: int = 1, current_depth: int = 0, filters: List[str] = None):
+class WebCrawler:
     """
-    Recursively gathers all links from a given website up to a specified limit.
+    Crawls pages breadth-first from the frontier of found links.
 
-    Args:
-        url (str): The starting URL to fetch links from.
-        reviewed_urls (dict): A dictionary to keep track of reviewed URLs and associated data.
-        limit (int, optional): The maximum number of URLs to process.
-        crawl_depth: How deep to crawl from each base URL. 0 = scrape given URLs only
-        current_depth: How deep we are currently crawling from the base URL.
-        filters (List[str]): Crawl URLs that only match these regex patterns.
-
-    TODO: Refactor this function to use a iterative aproach instead of recursion
+    - at most `max_workers` pages are downloaded at the same time
+    - at most `per_host_limit` requests are sent to the same host at the same time
+    - connections are reused by all workers
+    - pages from cache are revalidated with conditional requests
     """
-    if limit is not None:
-        if len(reviewed_urls) >= limit:
-            return reviewed_urls
-
-    if not filters:
-        matches_filter = True
-    else:
-        matches_filter = any(re.match(f, url) is not None for f in filters)
-    if url not in reviewed_urls and matches_filter:
-        try:
-            reviewed_urls[url] = get_all_website_links(url)
-        except Exception as e:
-            error_message = traceback.format_exc().splitlines()[-1]
-            logger.error("An exception occurred: %s", str(e))
-            reviewed_urls[url] = {
-                "url": url,
-                "urls": [],
-                "html_content": "",
-                "text_content": "",
-                "error": str(error_message),
-            }
-
-    if crawl_depth is not None and crawl_depth == current_depth:
-        return reviewed_urls
 
-    to_rev_url_list = []
-
-    # create a list of new urls to review that don't exist in the already reviewed ones
-    for new_url in reviewed_urls[url]["urls"]:
-        if not filters:
-            matches_filter = True
-        else:
-            matches_filter = any(re.match(f, new_url) is not None for f in filters)
-        if not matches_filter:
-            continue
-        # if this is already in the urls, then no need to go and crawl for it
-        if new_url in reviewed_urls or new_url in to_rev_url_list:
-            continue
-
-        # insert immediately to count limit between threads. fill later
-        url_list_lock = Lock()
-        with url_list_lock:
-            if limit is None or len(reviewed_urls) < limit:
-                reviewed_urls[new_url] = {}
-                to_rev_url_list.append(new_url)
-            else:
-                break
-
-    if len(to_rev_url_list) > 0:
-        new_revised_urls = parallel_get_all_website_links(to_rev_url_list)
-
-        reviewed_urls.update(new_revised_urls)
+    def __init__(
+        self,
+        limit: int = None,
+        crawl_depth: int = 1,
+        filters: List[str] = None,
+        max_workers: int = CRAWL_MAX_WORKERS,
+        per_host_limit: int = CRAWL_PER_HOST_LIMIT,
+        cache: PageCache = page_cache,
+    ):
+        """
+        Args:
+            limit (int): Absolute max number of web pages to crawl, regardless of crawl depth.
+            crawl_depth (int): How deep to crawl from each base URL. 0 = scrape given URLs only, None = no limit
+            filters (List[str]): Crawl URLs that only match these regex patterns.
+            max_workers (int): count of pages which are downloaded at the same time
+            per_host_limit (int): count of requests to the same host at the same time
+            cache (PageCache): cache for conditional requests, None to disable
+        """
+        self.limit = limit
+        self.crawl_depth = crawl_depth
+        self.filters = filters
+        self.max_workers = max_workers
+        self.per_host_limit = per_host_limit
+        self.cache = cache
+        # context is not available in the threads of workers
+        self.company_id = getattr(ctx, "company_id", None)
+
+        self.session = create_session(max_workers)
+
+        # url -> result, urls are added in order they were found
+        self.reviewed_urls = {}
+        self.frontier = deque()
+
+    def matches_filter(self, url: str) -> bool:
+        if not self.filters:
+            return True
+        return any(re.match(f, url) is not None for f in self.filters)
+
+    def add_url(self, url: str, depth: int):
+        if url in self.reviewed_urls or not self.matches_filter(url):
+            return
+        if self.limit is not None and len(self.reviewed_urls) >= self.limit:
+            return
+        # insert immediately to count the limit, fill later
+        self.reviewed_urls[url] = {}
+        self.frontier.append((url, depth))
+
+    def fetch(self, url: str) -> dict:
+        return get_all_website_links(url, session=self.session, cache=self.cache, company_id=self.company_id)
+
+    def crawl(self, urls: List[str]) -> dict:
+        """
+        Crawl pages starting from the urls
+
+        Args:
+            urls (List[str]): start urls
+
+        Returns:
+            dict: url -> dictionary with the result of get_all_website_links
+        """
+        for url in urls:
+            self.add_url(url, 0)
 
-        for new_url in new_revised_urls:
-            get_all_website_links_recursively(new_url, reviewed_urls, limit, crawl_depth=crawl_depth, current_depth=current_depth + 1, filters=filters)
+        host_requests = defaultdict(int)
+        running = {}
+        try:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                while self.frontier or running:
+                    # send requests from frontier, skip hosts which are busy
+                    deferred = []
+                    while self.frontier and len(running) < self.max_workers:
+                        url, depth = self.frontier.popleft()
+                        host = urlparse(url).netloc
+                        if host_requests[host] >= self.per_host_limit:
+                            deferred.append((url, depth))
+                            continue
+                        host_requests[host] += 1
+                        running[executor.submit(self.fetch, url)] = (url, host, depth)
+                    self.frontier.extendleft(reversed(deferred))
+
+                    done, _ = concurrent.futures.wait(running, return_when=concurrent.futures.FIRST_COMPLETED)
+                    for future in done:
+                        url, host, depth = running.pop(future)
+                        host_requests[host] -= 1
+                        result = future.result()
+                        self.reviewed_urls[url] = result
+
+                        if self.crawl_depth is not None and depth >= self.crawl_depth:
+                            continue
+                        for new_url in sorted(result["urls"]):
+                            self.add_url(new_url, depth + 1)
+        finally:
+            self.session.close()
+
+        return self.reviewed_urls
 
 
 def get_all_websites(urls, limit=1, html=False, crawl_depth: int = 1, filters: List[str] = None) -> pd.DataFrame:
@@ -288,9 +407,8 @@ def get_all_websites(urls, limit=1, html=False, crawl_depth: int = 1, filters: L
     Returns:
         A DataFrame containing the results.
     """
-    reviewed_urls = {}
-
-    def fetch_url(url, crawl_depth: int = 1, filters: List[str] = None):
+    start_urls = []
+    for url in urls:
         # Allow URLs to be passed wrapped in quotation marks so they can be used
         # directly from the SQL editor.
         if url.startswith("'") and url.endswith("'"):
@@ -299,14 +417,10 @@ def get_all_websites(urls, limit=1, html=False, crawl_depth: int = 1, filters: L
         if urlparse(url).scheme == "":
             # Try HTTPS first
             url = "https://" + url
-        get_all_website_links_recursively(url, reviewed_urls, limit, crawl_depth=crawl_depth, filters=filters)
-
-    # Use a ThreadPoolExecutor to run the helper function in parallel.
-    with concurrent.futures.ThreadPoolExecutor() as executor:
-        future_to_url = {executor.submit(fetch_url, url, crawl_depth=crawl_depth, filters=filters): url for url in urls}
+        start_urls.append(url)
 
-        for future in concurrent.futures.as_completed(future_to_url):
-            future.result()
+    crawler = WebCrawler(limit=limit, crawl_depth=crawl_depth, filters=filters)
+    reviewed_urls = crawler.crawl(start_urls)
 
     columns_to_ignore = ["urls"]
     if html is False:
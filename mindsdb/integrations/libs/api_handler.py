@@ -1,5 +1,6 @@
-from typing import Any, List
+from typing import Any, List, Iterator
 import ast as py_ast
+from itertools import chain
 
 import pandas as pd
 from mindsdb_sql_parser.ast import ASTNode, Select, Insert, Update, Delete, Star
@@ -200,18 +201,16 @@ class APIResource(APITable):
             **kwargs
         )
 
-        filters = []
-        for cond in conditions:
-            if not cond.applied:
-                filters.append([cond.op.value, cond.column, cond.value])
+        if not isinstance(result, pd.DataFrame):
+            # list returned chunks
+            return self._select_from_chunks(result, conditions, sort, query.order_by, limit)
+
+        filters = self._get_unapplied_filters(conditions)
 
         result = filter_dataframe(result, filters)
 
         if sort:
-            sort_columns = []
-            for idx, a_sort in enumerate(sort):
-                if not a_sort.applied:
-                    sort_columns.append(query.order_by[idx])
+            sort_columns = self._get_unapplied_sort(sort, query.order_by)
 
             result = sort_dataframe(result, sort_columns)
 
@@ -220,6 +219,90 @@ class APIResource(APITable):
 
         return result
 
+    def _get_unapplied_filters(self, conditions: List[FilterCondition]) -> list:
+        filters = []
+        for cond in conditions:
+            if not cond.applied:
+                filters.append([cond.op.value, cond.column, cond.value])
+        return filters
+
+    def _get_unapplied_sort(self, sort: List[SortColumn], order_by: list) -> list:
+        sort_columns = []
+        for idx, a_sort in enumerate(sort):
+            if not a_sort.applied:
+                sort_columns.append(order_by[idx])
+        return sort_columns
+
+    def _select_from_chunks(
+        self,
+        chunks: Iterator[pd.DataFrame],
+        conditions: List[FilterCondition],
+        sort: List[SortColumn],
+        order_by: list,
+        limit: int = None
+    ) -> pd.DataFrame:
+        """
+        Filters and sorts chunks returned by list one by one.
+        Reading of chunks is stopped as soon as limit is reached.
+        If results have to be sorted and limited: only top `limit` rows are kept between chunks
+
+        Args:
+            chunks (Iterator[pd.DataFrame]): dataframes returned by list
+            conditions (List[FilterCondition]): conditions of the query
+            sort (List[SortColumn]): sorting of the query
+            order_by (list): order_by of the query
+            limit (int): limit of the query
+
+        Returns:
+            pd.DataFrame
+        """
+        chunks = iter(chunks)
+        # conditions are marked as applied when list is started
+        first_chunk = next(chunks, None)
+        if first_chunk is None:
+            try:
+                columns = self.get_columns()
+            except NotImplementedError:
+                columns = None
+            return pd.DataFrame([], columns=columns)
+
+        filters = self._get_unapplied_filters(conditions)
+        sort_columns = self._get_unapplied_sort(sort, order_by) if sort else []
+        if limit is not None:
+            limit = int(limit)
+
+        results = []
+        count = 0
+        try:
+            for chunk in chain([first_chunk], chunks):
+                if filters:
+                    chunk = filter_dataframe(chunk, filters)
+
+                if len(sort_columns) > 0:
+                    if limit is not None:
+                        # keep only top rows
+                        results = [sort_dataframe(pd.concat(results + [chunk]), sort_columns)[:limit]]
+                    else:
+                        results.append(chunk)
+                    continue
+
+                results.append(chunk)
+                count += len(chunk)
+                if limit is not None and count >= limit:
+                    break
+        finally:
+            if hasattr(chunks, 'close'):
+                chunks.close()
+
+        result = pd.concat(results, ignore_index=True)
+        if len(sort_columns) > 0:
+            result = sort_dataframe(result, sort_columns)
+
+        if limit is not None and len(result) > limit:
+            result = result[:limit]
+
+        return result
+
     def list(self,
              conditions: List[FilterCondition] = None,
              limit: int = None,
@@ -230,6 +313,11 @@ class APIResource(APITable):
         """
         List items based on specified conditions, limits, sorting, and targets.
 
+        The method can return one dataframe or yield dataframes chunk by chunk.
+        In the second case unapplied conditions are used for every chunk
+        and the reading is stopped when limit is reached.
+        Conditions and sorting have to be marked as applied before the first chunk is yielded.
+
         Args:
             conditions (List[FilterCondition]): Optional. A list of conditions to filter the items. Each condition
                                                 should be an instance of the FilterCondition class.
@@ -237,6 +325,9 @@ class APIResource(APITable):
             sort (List[SortColumn]): Optional. A list of sorting criteria
             targets (List[str]): Optional. A list of strings representing specific fields
 
+        Returns:
+            pd.DataFrame | Iterator[pd.DataFrame]
+
         Raises:
             NotImplementedError: This is an abstract method and should be implemented in a subclass.
         """
@@ -2,7 +2,10 @@ from dataclasses import dataclass
 import re
 from io import StringIO
 import json
-from typing import Dict, List, Any
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Callable, Iterator
 import yaml
 try:
     from yaml import CLoader as Loader
@@ -12,6 +15,7 @@ except ImportError:
 
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
 
 from mindsdb.integrations.utilities.sql_utils import (
@@ -20,6 +24,10 @@ from mindsdb.integrations.utilities.sql_utils import (
 from mindsdb.integrations.libs.api_handler import APIResource
 
 
+# default number of pages which can be downloaded at the same time
+DEFAULT_PREFETCH_PAGES = 4
+
+
 class ApiRequestException(Exception):
     pass
 
@@ -136,12 +144,32 @@ class APIResourceGenerator:
         self.url_base = url_base
         self.options = options or {}
         self.resources = {}
+        self._session = None
+        self._session_lock = threading.Lock()
+
+    def get_session(self) -> requests.Session:
+        """
+        Returns http session shared by all resources of the handler. It keeps connections alive between requests
+
+        Returns:
+            requests.Session
+        """
+        with self._session_lock:
+            if self._session is None:
+                pool_size = max(self.options.get('prefetch_pages', DEFAULT_PREFETCH_PAGES), 1)
+                adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+                session = requests.Session()
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                self._session = session
+        return self._session
 
     def check_connection(self):
         if 'check_connection_table' in self.options:
             table = self.resources.get(self.options['check_connection_table'])
             if table:
-                table.list(targets=[], limit=1, conditions=[])
+                # list yields pages, request the first one
+                next(table.list(targets=[], limit=1, conditions=[]), None)
 
     def generate_api_resources(self, handler, table_name_format='{url}') -> Dict[str, APIResource]:
         """
@@ -355,9 +383,102 @@ class APIResourceGenerator:
             return self.get_resource_type(schema['allOf'][0])
 
 
+class RestApiPaginator:
+    """
+    Downloads pages of the endpoint. Next pages are requested in parallel,
+    no more than `window` requests at the same time. Pages are returned in their order.
+
+    Pagination is stopped:
+     - when a page is shorter than page size
+     - when limit or total number of records is reached
+    """
+
+    def __init__(
+        self,
+        request_fnc: Callable,
+        page_size: int = None,
+        offset_param: str = None,
+        page_num_param: str = None,
+        window: int = DEFAULT_PREFETCH_PAGES
+    ):
+        self.request_fnc = request_fnc
+        self.page_size = page_size
+        self.offset_param = offset_param
+        self.page_num_param = page_num_param
+        self.window = max(window, 1)
+
+    def _page_filters(self, filters: dict, page_idx: int) -> dict:
+        # page_idx is 0 for the first page
+        page_filters = filters.copy()
+        if self.offset_param is not None:
+            page_filters[self.offset_param] = page_idx * self.page_size
+        else:
+            page_filters[self.page_num_param] = page_idx + 1
+        return page_filters
+
+    def pages(self, filters: dict, limit: int) -> Iterator[list]:
+        """
+        Yields lists of records page by page
+
+        Args:
+            filters (dict): request parameters
+            limit (int): max number of records to download
+
+        Returns:
+            Iterator[list]
+        """
+        resp, total = self.request_fnc(filters)
+        yield resp
+
+        if self.offset_param is None and self.page_num_param is None:
+            # pagination is not supported
+            return
+
+        count = len(resp)
+        if self.page_size is None:
+            # page size is unknown, consider the first page is full
+            self.page_size = count
+
+        max_count = limit
+        if total is not None:
+            max_count = min(max_count, total)
+
+        if self.page_size == 0 or count < self.page_size or count >= max_count:
+            return
+
+        executor = ThreadPoolExecutor(max_workers=self.window)
+        futures = deque()
+        next_page_idx = 1
+        requested_count = count
+        try:
+            while True:
+                # fill prefetch window
+                while requested_count < max_count and len(futures) < self.window:
+                    futures.append(executor.submit(self.request_fnc, self._page_filters(filters, next_page_idx)))
+                    next_page_idx += 1
+                    requested_count += self.page_size
+
+                if len(futures) == 0:
+                    break
+
+                resp, _ = futures.popleft().result()
+                if len(resp) == 0:
+                    # no results from next page
+                    break
+
+                yield resp
+                count += len(resp)
+
+                if len(resp) < self.page_size or count >= max_count:
+                    break
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
 class RestApiTable(APIResource):
     def __init__(self, *args, endpoint: APIEndpoint = None, resource_gen=None, **kwargs):
         self.endpoint = endpoint
+        self.resource_gen = resource_gen
         resource_types = resource_gen.resource_types
         self.connection_data = resource_gen.connection_data
         self.security_schemes = resource_gen.security_schemes
@@ -470,7 +591,7 @@ class RestApiTable(APIResource):
             raise ApiRequestException('Parameters are required: ' + ', '.join(placeholders))
 
         kwargs = self._handle_auth()
-        req = requests.request(self.endpoint.method, url, params=query, data=body, **kwargs)
+        req = self.resource_gen.get_session().request(self.endpoint.method, url, params=query, data=body, **kwargs)
 
         if req.status_code != 200:
             raise ApiResponseException(req.text)
@@ -498,7 +619,7 @@ class RestApiTable(APIResource):
         sort: List[SortColumn] = None,
         targets: List[str] = None,
         **kwargs
-    ) -> pd.DataFrame:
+    ) -> Iterator[pd.DataFrame]:
 
         if limit is None:
             limit = 20
@@ -531,44 +652,28 @@ class RestApiTable(APIResource):
             page_size = self.endpoint.params[page_size_param].default
             if page_size:
                 filters[page_size_param] = page_size
-        resp, total = self._api_request(filters)
-
-        # pagination
-        offset_param = self.get_setting_param('offset_param')
-        page_num_param = self.get_setting_param('page_num_param')
-        if offset_param is not None or page_num_param is not None:
-            page_num = 1
-            while True:
-                count = len(resp)
-                if limit <= count:
-                    break
+        paginator = RestApiPaginator(
+            self._api_request,
+            page_size=page_size,
+            offset_param=self.get_setting_param('offset_param'),
+            page_num_param=self.get_setting_param('page_num_param'),
+            window=self.options.get('prefetch_pages', DEFAULT_PREFETCH_PAGES)
+        )
 
-                if total is not None and total <= count:
-                    # total is reached
-                    break
+        columns = self.get_columns()
+        count = 0
+        for page in paginator.pages(filters, limit):
+            page = page[:limit - count]
+            count += len(page)
 
-                if page_size is not None and page_size > count:
-                    # number of results are more than page, don't go to next page
-                    break
+            yield self._records_to_df(page, columns)
 
-                # download more pages
-                if offset_param:
-                    filters[offset_param] = count
-                else:
-                    page_num += 1
-                    filters[page_num_param] = page_num
-                resp2, total = self._api_request(filters)
-                if len(resp2) == 0:
-                    # no results from next page
-                    break
-                resp.extend(resp2)
-
-        resp = resp[:limit]
+            if count >= limit:
+                break
 
+    def _records_to_df(self, records: list, columns: List[str]) -> pd.DataFrame:
         data = []
-
-        columns = self.get_columns()
-        for record in resp:
+        for record in records:
             item = {}
 
             if isinstance(record, dict):
@@ -579,5 +684,6 @@ class RestApiTable(APIResource):
             elif len(columns) > 0:
                 # response is value
                 item[columns[0]] = self.repr_value(record)
+                data.append(item)
 
         return pd.DataFrame(data, columns=columns)
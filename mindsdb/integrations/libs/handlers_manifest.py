@@ -0,0 +1,175 @@
+"""
+Manifest with precomputed metadata of handlers.
+
+At startup IntegrationController has to parse files of every handler to get its metadata.
+Manifest keeps result of that parsing for all handlers and it is read in one go.
+It is generated at build time:
+
+    python -m mindsdb.integrations.libs.handlers_manifest
+
+Every entry keeps size, modification time and hash of content of every file of handler's folder.
+Entry is used only if folder wasn't changed, otherwise handler is scanned again.
+
+Installation (pip, docker) changes mtime of files. In this case only content of files with changed mtime is compared,
+and new mtimes are saved to the refreshed manifest in the cache folder: the next start uses stats only.
+"""
+import os
+import json
+import hashlib
+from pathlib import Path
+from typing import Optional, Tuple
+
+from mindsdb.utilities import log
+from mindsdb.utilities.config import config
+
+logger = log.getLogger(__name__)
+
+HANDLERS_MANIFEST_FILE = 'handlers_manifest.json'
+HANDLERS_MANIFEST_VERSION = 2
+
+
+def get_handler_files_stat(handler_dir: Path) -> dict:
+    """
+    Get size and modification time of files in handler's folder (not recursive)
+
+    :param handler_dir: folder of handler
+    :return: dict {file_name: [size, mtime_ns]}
+    """
+    files = {}
+    with os.scandir(handler_dir) as it:
+        for entry in it:
+            if entry.is_file():
+                stat = entry.stat()
+                files[entry.name] = [stat.st_size, stat.st_mtime_ns]
+    return files
+
+
+def get_file_hash(file_path: Path) -> str:
+    """
+    Get hash of content of the file
+
+    :param file_path: path to file
+    :return: hex digest
+    """
+    return hashlib.md5(file_path.read_bytes()).hexdigest()
+
+
+def make_manifest_entry(handler_dir: Path, handler_data: dict) -> dict:
+    """
+    Add fingerprint of handler's folder to scanned data of handler
+
+    :param handler_dir: folder of handler
+    :param handler_data: data which was got by scanning the folder
+    :return: manifest entry
+    """
+    files = get_handler_files_stat(handler_dir)
+    for name, stat in files.items():
+        stat.append(get_file_hash(handler_dir / name))
+    return {
+        'files': files,
+        'data': handler_data
+    }
+
+
+def validate_manifest_entry(entry: dict, handler_dir: Path) -> Tuple[bool, bool]:
+    """
+    Check if handler's folder wasn't changed since the entry was created.
+    Files have to be the same, they are compared by size and mtime, if mtime is changed - by content.
+    Mtime of the files with the same content is updated in the entry
+
+    :param entry: manifest entry
+    :param handler_dir: folder of handler
+    :return: (entry can be used, mtime of files was updated in the entry)
+    """
+    try:
+        files = get_handler_files_stat(handler_dir)
+    except OSError:
+        return False, False
+
+    saved_files = entry.get('files', {})
+    if files.keys() != saved_files.keys():
+        return False, False
+
+    changed = []
+    for name, (size, mtime) in files.items():
+        saved_size, saved_mtime = saved_files[name][:2]
+        if size != saved_size:
+            return False, False
+        if mtime != saved_mtime:
+            changed.append(name)
+
+    if len(changed) == 0:
+        return True, False
+
+    # mtime can be changed on installation
+    try:
+        for name in changed:
+            if get_file_hash(handler_dir / name) != saved_files[name][2]:
+                return False, False
+    except (OSError, IndexError):
+        return False, False
+
+    for name in changed:
+        saved_files[name][1] = files[name][1]
+    return True, True
+
+
+def get_manifest_path(handlers_path: Path) -> Path:
+    return handlers_path.joinpath(HANDLERS_MANIFEST_FILE)
+
+
+def get_refreshed_manifest_path() -> Path:
+    """
+    Manifest with updated mtimes of files, folder of handlers can be not writable
+    """
+    return Path(config['paths']['cache']) / HANDLERS_MANIFEST_FILE
+
+
+def read_manifest(handlers_path: Path, manifest_path: Optional[Path] = None) -> dict:
+    """
+    Read manifest of handlers
+
+    :param handlers_path: folder with handlers
+    :param manifest_path: path to manifest, default is inside of handlers folder
+    :return: dict {handler_folder_name: entry}, empty if manifest doesn't exist or can't be read
+    """
+    if manifest_path is None:
+        manifest_path = get_manifest_path(handlers_path)
+    if not manifest_path.is_file():
+        return {}
+    try:
+        with open(manifest_path, 'rt') as f:
+            manifest = json.load(f)
+    except Exception as e:
+        logger.warning(f'Unable to read handlers manifest: {e}')
+        return {}
+    if manifest.get('version') != HANDLERS_MANIFEST_VERSION:
+        return {}
+    return manifest.get('handlers', {})
+
+
+def write_manifest(handlers_path: Path, entries: dict, manifest_path: Optional[Path] = None) -> Path:
+    """
+    Write manifest of handlers
+
+    :param handlers_path: folder with handlers
+    :param entries: dict {handler_folder_name: entry}
+    :param manifest_path: where to save manifest, default is inside of handlers folder
+    :return: path to manifest
+    """
+    if manifest_path is None:
+        manifest_path = get_manifest_path(handlers_path)
+    manifest = {
+        'version': HANDLERS_MANIFEST_VERSION,
+        'handlers': entries
+    }
+    with open(manifest_path, 'wt') as f:
+        json.dump(manifest, f, default=str)
+    return manifest_path
+
+
+if __name__ == '__main__':
+    from mindsdb.interfaces.database.integrations import integration_controller
+
+    path = integration_controller.save_handlers_manifest()
+    logger.info(f'Handlers manifest is saved to: {path}')
@@ -177,7 +177,7 @@ class BaseMLEngineExec:
             result = task.result()
         return result
 
-    def function_call(self, func_name, args):
+    def function_call(self, func_name, args, batch=False):
         with self._catch_exception():
             task = self.base_ml_executor.apply_async(
                 task_type=ML_TASK_TYPE.FUNC_CALL,
@@ -186,6 +186,7 @@ class BaseMLEngineExec:
                     'context': ctx.dump(),
                     'name': func_name,
                     'args': args,
+                    'batch': batch,
                     'handler_meta': {
                         'module_path': self.handler_module.__package__,
                         'engine': self.engine,
@@ -196,6 +197,18 @@ class BaseMLEngineExec:
             result = task.result()
         return result
 
+    def function_call_batch(self, func_name, args_list):
+        """ Calls function for every set of arguments from args_list in a single ML task
+
+            Args:
+                func_name (str): name of the function
+                args_list (list[tuple]): arguments for every call
+
+            Returns:
+                list: results of the calls in the same order as args_list
+        """
+        return self.function_call(func_name, args_list, batch=True)
+
     @profiler.profile()
     @mark_process(name='predict')
     def predict(self, model_name: str, df: pd.DataFrame, pred_format: str = 'dict',
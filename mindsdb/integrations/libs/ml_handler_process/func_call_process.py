@@ -3,7 +3,7 @@ import importlib
 from mindsdb.interfaces.storage.model_fs import HandlerStorage
 
 
-def func_call_process(name: str, args: dict, integration_id: int, module_path: str) -> None:
+def func_call_process(name: str, args: dict, integration_id: int, module_path: str, batch: bool = False) -> None:
     module = importlib.import_module(module_path)
 
     if module.import_error is not None:
@@ -13,12 +13,21 @@ def func_call_process(name: str, args: dict, integration_id: int, module_path: s
 
     if hasattr(module.Handler, 'function_call'):
         engine_storage = HandlerStorage(integration_id)
+        handler = module.Handler(
+            engine_storage=engine_storage,
+            model_storage=None
+        )
         try:
-            result = module.Handler(
-                engine_storage=engine_storage,
-                model_storage=None
-            ).function_call(name, args)
+            if not batch:
+                result = handler.function_call(name, args)
+            elif hasattr(handler, 'function_call_batch'):
+                result = handler.function_call_batch(name, args)
+            else:
+                # args is a list of arguments for every call
+                result = [handler.function_call(name, row_args) for row_args in args]
         except NotImplementedError:
+            if batch:
+                return [None] * len(args)
             return None
         except Exception as e:
             raise e
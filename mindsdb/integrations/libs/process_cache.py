@@ -326,6 +326,7 @@ class ProcessCache:
             kwargs = {
                 'name': payload['name'],
                 'args': payload['args'],
+                'batch': payload.get('batch', False),
                 'integration_id': integration_id,
                 'module_path': handler_module_path
             }
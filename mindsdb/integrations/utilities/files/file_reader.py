@@ -9,7 +9,6 @@ from typing import List
 import filetype
 import pandas as pd
 from charset_normalizer import from_bytes
-from langchain_text_splitters import RecursiveCharacterTextSplitter
 import fitz  # pymupdf
 
 from mindsdb.utilities import log
@@ -302,6 +301,7 @@ class FileReader(FormatDetector):
 
         try:
             from langchain_core.documents import Document
+            from langchain_text_splitters import RecursiveCharacterTextSplitter
         except ImportError:
             raise ImportError(
                 "To import TXT document please install 'langchain-community':\n"
@@ -326,6 +326,8 @@ class FileReader(FormatDetector):
 
     @staticmethod
     def read_pdf(file_obj: BytesIO, name=None, **kwargs):
+        # langchain is slow to import, it is loaded only when it is required
+        from langchain_text_splitters import RecursiveCharacterTextSplitter
 
         with fitz.open(stream=file_obj.read()) as pdf:  # open pdf
             text = chr(12).join([page.get_text() for page in pdf])
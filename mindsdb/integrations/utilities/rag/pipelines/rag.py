@@ -306,6 +306,10 @@ class LangChainRAGPipeline:
             value_prompt_template=retriever_config.value_prompt_template,
             boolean_system_prompt=retriever_config.boolean_system_prompt,
             generative_system_prompt=retriever_config.generative_system_prompt,
+            batch_ranking_prompt_template=retriever_config.batch_ranking_prompt_template,
+            ranking_batch_size=retriever_config.ranking_batch_size,
+            ranking_max_concurrency=retriever_config.ranking_max_concurrency,
+            ranking_cache_ttl=retriever_config.ranking_cache_ttl,
             num_retries=retriever_config.num_retries,
             embeddings_table=knowledge_base_table._kb.vector_database_table,
             source_table=retriever_config.source_table,
@@ -1,4 +1,8 @@
 import re
+import json
+import time
+import hashlib
+import threading
 
 from pydantic import BaseModel, Field
 from typing import List, Any, Optional, Dict, Tuple, Union, Callable
@@ -27,13 +31,22 @@ from mindsdb.integrations.utilities.rag.settings import (
     ColumnSchema,
     ValueSchema,
     SearchKwargs,
+    DEFAULT_BATCH_RANKING_PROMPT_TEMPLATE,
+    DEFAULT_RANKING_BATCH_SIZE,
+    DEFAULT_RANKING_MAX_CONCURRENCY,
+    DEFAULT_RANKING_CACHE_TTL,
 )
 from mindsdb.utilities import log
+from mindsdb.utilities.context_executor import ContextThreadPoolExecutor
 
 import numpy as np
 
 logger = log.getLogger(__name__)
 
+# number of random hyperplanes used to split query embeddings into buckets
+EMBEDDING_BUCKET_BITS = 16
+RANKING_CACHE_SIZE = 256
+
 
 class MetadataFilter(BaseModel):
     """Represents an LLM generated metadata filter to apply to a PostgreSQL query."""
@@ -61,6 +74,93 @@ class MetadataFilters(BaseModel):
     )
 
 
+class SchemaRanking(BaseModel):
+    """Relevance of a single schema candidate from a batched ranking prompt."""
+
+    index: int = Field(description="Number of the schema candidate")
+    answer: str = Field(
+        description="'yes' if the schema candidate is relevant to the user query, otherwise 'no'"
+    )
+    confidence: float = Field(
+        description="Confidence in the answer, from 0 to 1"
+    )
+
+
+class SchemaRankings(BaseModel):
+    """List of relevances of schema candidates from a batched ranking prompt."""
+
+    rankings: List[SchemaRanking] = Field(
+        description="Answer for every schema candidate"
+    )
+
+
+class SchemaRankingCache:
+    """Thread safe LRU cache of schema rankings.
+
+    Entries are keyed by (schema version, query embedding bucket), each entry is a dict
+    of {schema path: relevance} and expires after its ttl.
+    """
+
+    def __init__(self, max_size: int = RANKING_CACHE_SIZE):
+        self.max_size = max_size
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple, path: Tuple) -> Optional[float]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry["expires_at"] < time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry["rankings"].get(path)
+
+    def set(self, key: Tuple, path: Tuple, relevance: float, ttl: int):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry["expires_at"] < time.time():
+                entry = {"rankings": {}, "expires_at": time.time() + ttl}
+                self._entries[key] = entry
+            entry["rankings"][path] = relevance
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+schema_ranking_cache = SchemaRankingCache()
+
+_bucket_hyperplanes = {}
+
+
+def get_embedding_bucket(embedding: List[float], bits: int = EMBEDDING_BUCKET_BITS) -> int:
+    """Hashes the embedding by the side of fixed random hyperplanes it lies on.
+    Close embeddings (e.g. rephrased questions) are likely to get the same bucket."""
+    embedding = np.asarray(embedding, dtype=float)
+    key = (len(embedding), bits)
+    hyperplanes = _bucket_hyperplanes.get(key)
+    if hyperplanes is None:
+        hyperplanes = np.random.default_rng(0).standard_normal((bits, len(embedding)))
+        _bucket_hyperplanes[key] = hyperplanes
+    bucket = 0
+    for bit in (hyperplanes @ embedding) > 0:
+        bucket = (bucket << 1) | int(bit)
+    return bucket
+
+
+def _strip_relevance(item: Any) -> Any:
+    if isinstance(item, dict):
+        return {str(k): _strip_relevance(v) for k, v in item.items() if k != "relevance"}
+    if isinstance(item, list):
+        return [_strip_relevance(v) for v in item]
+    return item
+
+
 class SQLRetriever(BaseRetriever):
     """Retriever that uses a LLM to generate pgvector queries to do similarity search with metadata filters.
 
@@ -113,6 +213,12 @@ class SQLRetriever(BaseRetriever):
     # Re-rank and metadata generation model.
     llm: BaseChatModel
 
+    # schema ranking config
+    batch_ranking_prompt_template: str = DEFAULT_BATCH_RANKING_PROMPT_TEMPLATE
+    ranking_batch_size: int = DEFAULT_RANKING_BATCH_SIZE
+    ranking_max_concurrency: int = DEFAULT_RANKING_MAX_CONCURRENCY
+    ranking_cache_ttl: int = DEFAULT_RANKING_CACHE_TTL
+
     def _sort_schema_by_priority_key(
         self,
         schema_dict_item: Tuple[str, Union[TableSchema, ColumnSchema, ValueSchema]],
@@ -399,15 +505,9 @@ Below is a description of the contents in this column in list format:
             "logprobs"
         ]["content"]:
             #  Convert answer to score using the model's confidence
-            if content["token"].lower().strip() == "yes":
-                score = (
-                    1 + math.exp(content["logprob"])
-                ) / 2  # If yes, use the model's confidence
-                break
-            elif content["token"].lower().strip() == "no":
-                score = (
-                    1 - math.exp(content["logprob"])
-                ) / 2  # If no, invert the confidence
+            #  If yes, use the model's confidence. If no, invert the confidence
+            score = self._answer_to_score(content["token"], math.exp(content["logprob"]))
+            if score is not None:
                 break
 
         if score is None:
@@ -415,8 +515,161 @@ Below is a description of the contents in this column in list format:
 
         return score
 
-    def _breadth_first_search(self, query: str, greedy: bool = False) -> Tuple:
-        """Search breadth wise through Tables, then Columns, then Values.Uses a greedy strategy to maximize quota if greedy=True, otherwise a dynamic strategy."""
+    @staticmethod
+    def _extract_json_output(output: str) -> str:
+        # If the LLM outputs raw JSON, use it as-is.
+        # If the LLM outputs anything including a json markdown section, use the last one.
+        json_markdown_output = re.findall(r"```json.*```", output, re.DOTALL)
+        if json_markdown_output:
+            output = json_markdown_output[-1]
+            # Clean the json tags.
+            output = output[7:]
+            output = output[:-3]
+        return output
+
+    @staticmethod
+    def _answer_to_score(answer: str, confidence: float) -> Optional[float]:
+        """Convert yes/no answer and the model's confidence in it to relevance score from 0 to 1.
+        Returns None if the answer is neither yes nor no."""
+        confidence = min(max(confidence, 0.0), 1.0)
+        answer = answer.lower().strip()
+        if answer == "yes":
+            return (1 + confidence) / 2
+        if answer == "no":
+            return (1 - confidence) / 2
+        return None
+
+    def _get_schema_candidate_str(self, prompt: ChatPromptTemplate) -> str:
+        return (
+            prompt.messages[1]
+            .format(**prompt.partial_variables, query="See query below.")
+            .content
+        )
+
+    def _rank_schema_batch(
+        self, prompts: List[ChatPromptTemplate], query: str
+    ) -> List[Optional[float]]:
+        """Rank several schema candidates with a single LLM call.
+        Every candidate gets yes/no answer with confidence, which is converted to the same score as in _rank_schema.
+        Returns None for candidates the LLM did not rank."""
+        parser = PydanticOutputParser(pydantic_object=SchemaRankings)
+        candidates_str = ""
+        for i, prompt in enumerate(prompts):
+            candidates_str += f"""
+# **Candidate {i}**
+{self._get_schema_candidate_str(prompt)}
+"""
+        batch_prompt = ChatPromptTemplate.from_messages(
+            [
+                ("system", self.generative_system_prompt),
+                ("user", self.batch_ranking_prompt_template),
+            ]
+        ).partial(
+            format_instructions=parser.get_format_instructions(),
+            count=str(len(prompts)),
+            candidates=candidates_str,
+        )
+
+        scores = [None] * len(prompts)
+        try:
+            output = LLMChain(llm=self.llm, prompt=batch_prompt).predict(query=query)
+            rankings = parser.invoke(self._extract_json_output(output))
+        except OutputParserException as e:
+            logger.warning(f"LLM failed to rank schema candidates in batch: {str(e)}")
+            return scores
+
+        for ranking in rankings.rankings:
+            if 0 <= ranking.index < len(prompts):
+                scores[ranking.index] = self._answer_to_score(ranking.answer, ranking.confidence)
+        return scores
+
+    def _get_schema_version(self) -> str:
+        """Hash of the schema and ranking prompts. Rankings are cached only for the same version."""
+        schema = _strip_relevance(self.database_schema.model_dump())
+        version = json.dumps(
+            [
+                schema,
+                self.table_prompt_template,
+                self.column_prompt_template,
+                self.value_prompt_template,
+                self.boolean_system_prompt,
+                self.batch_ranking_prompt_template,
+            ],
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(version.encode()).hexdigest()
+
+    def _rank_schema_candidates(
+        self,
+        candidates: List[Tuple[Tuple, ChatPromptTemplate]],
+        query: str,
+        cache_key: Optional[Tuple] = None,
+    ) -> List[float]:
+        """Rank list of (schema path, prompt) candidates.
+
+        Cached rankings are reused. The rest of candidates are split into batches ranked by a single
+        LLM call each, batches are ranked concurrently. Candidates which could not be ranked in batch
+        are ranked one by one (concurrently as well).
+        """
+        scores = [None] * len(candidates)
+        if cache_key is not None:
+            for i, (path, _) in enumerate(candidates):
+                scores[i] = schema_ranking_cache.get(cache_key, path)
+
+        missed = [i for i, score in enumerate(scores) if score is None]
+        if len(missed) == 0:
+            return scores
+
+        batch_size = max(self.ranking_batch_size, 1)
+        batches = [missed[i:i + batch_size] for i in range(0, len(missed), batch_size)]
+
+        def rank_batch(batch: List[int]) -> List[Optional[float]]:
+            prompts = [candidates[i][1] for i in batch]
+            if len(prompts) == 1:
+                return [self._rank_schema(prompt=prompts[0], query=query)]
+            return self._rank_schema_batch(prompts=prompts, query=query)
+
+        max_workers = max(min(self.ranking_max_concurrency, len(missed)), 1)
+        with ContextThreadPoolExecutor(max_workers=max_workers) as executor:
+            for batch, batch_scores in zip(batches, executor.map(rank_batch, batches)):
+                for i, score in zip(batch, batch_scores):
+                    scores[i] = score
+
+            # fallback to separate calls for candidates which were skipped by LLM
+            not_ranked = [i for i in missed if scores[i] is None]
+            if not_ranked:
+                fallback_scores = executor.map(
+                    lambda i: self._rank_schema(prompt=candidates[i][1], query=query),
+                    not_ranked,
+                )
+                for i, score in zip(not_ranked, fallback_scores):
+                    scores[i] = score
+
+        if cache_key is not None and self.ranking_cache_ttl > 0:
+            for i in missed:
+                schema_ranking_cache.set(
+                    cache_key, candidates[i][0], scores[i], ttl=self.ranking_cache_ttl
+                )
+        return scores
+
+    def _breadth_first_search(
+        self,
+        query: str,
+        greedy: bool = False,
+        query_embedding: Optional[List[float]] = None,
+    ) -> Tuple:
+        """Search breadth wise through Tables, then Columns, then Values.Uses a greedy strategy to maximize quota if greedy=True, otherwise a dynamic strategy.
+
+        All candidates of the same level are ranked at once (see _rank_schema_candidates). If query_embedding is
+        provided, rankings are cached for similar queries until the schema is changed.
+        """
+        cache_key = None
+        if query_embedding is not None and self.ranking_cache_ttl > 0:
+            cache_key = (
+                self._get_schema_version(),
+                get_embedding_bucket(query_embedding),
+            )
 
         # sort based on priority
         ordered_database_schema = self._sort_database_schema_by_key(
@@ -424,14 +677,26 @@ Below is a description of the contents in this column in list format:
         )
 
         #  Rank Tables ########################################################
+        table_items = list(ordered_database_schema.tables.items())
+        table_scores = self._rank_schema_candidates(
+            [
+                (
+                    ("table", table_key),
+                    self._prepare_table_prompt(
+                        table_schema=table_schema, boolean_system_prompt=True
+                    ),
+                )
+                for table_key, table_schema in table_items
+            ],
+            query=query,
+            cache_key=cache_key,
+        )
+
         greedy_count = 0
         tables = {}
         # rank tables by relevance
-        for table_key, table_schema in ordered_database_schema.tables.items():
-            prompt: ChatPromptTemplate = self._prepare_table_prompt(
-                table_schema=table_schema, boolean_system_prompt=True
-            )
-            table_schema.relevance = self._rank_schema(prompt=prompt, query=query)
+        for (table_key, table_schema), score in zip(table_items, table_scores):
+            table_schema.relevance = score
 
             # only keep greedy tables
             tables[table_key] = table_schema
@@ -450,41 +715,52 @@ Below is a description of the contents in this column in list format:
         )
 
         #  Rank Columns #######################################################
+        #  take only the top n number of tables specified by the databases max filters
+        #  and only drop into tables above the filter threshold
+        selected_tables = [
+            (table_key, table_schema)
+            for table_key, table_schema in ordered_database_schema.tables.items()
+            if table_schema.relevance >= ordered_database_schema.filter_threshold
+        ][:ordered_database_schema.max_filters]
+
+        column_candidates = []
+        for table_key, table_schema in selected_tables:
+            for column_key, column_schema in table_schema.columns.items():
+                prompt: ChatPromptTemplate = self._prepare_column_prompt(
+                    column_schema=column_schema,
+                    table_schema=table_schema,
+                    boolean_system_prompt=True,
+                )
+                column_candidates.append((("column", table_key, column_key), prompt))
+        column_scores = iter(
+            self._rank_schema_candidates(
+                column_candidates, query=query, cache_key=cache_key
+            )
+        )
+
         #  iterate through tables to rank columns
         tables = {}
-        table_count = 0  # take only the top n number of tables specified by the databases max filters
-        for table_key, table_schema in ordered_database_schema.tables.items():
-            # only drop into tables above the filter threshold
-            if table_schema.relevance >= ordered_database_schema.filter_threshold:
-                greedy_count = 0
-                # rank columns by relevance
-                columns = {}
-                for column_key, column_schema in table_schema.columns.items():
-                    prompt: ChatPromptTemplate = self._prepare_column_prompt(
-                        column_schema=column_schema,
-                        table_schema=table_schema,
-                        boolean_system_prompt=True,
-                    )
-                    column_schema.relevance = self._rank_schema(
-                        prompt=prompt, query=query
-                    )
+        for table_key, table_schema in selected_tables:
+            greedy_count = 0
+            # rank columns by relevance
+            columns = {}
+            for column_key, column_schema in table_schema.columns.items():
+                # scores of all columns were consumed in the same order
+                column_schema.relevance = next(column_scores)
 
-                    columns[column_key] = column_schema
+                if greedy and greedy_count >= table_schema.max_filters:
+                    continue
 
-                    if greedy:
-                        if column_schema.relevance >= table_schema.filter_threshold:
-                            greedy_count += 1
-                        if greedy_count >= table_schema.max_filters:
-                            break
+                columns[column_key] = column_schema
 
-                # sort columns and keep only columns that made the cut.
-                tables[table_key] = self._sort_schema_by_key(
-                    table_schema, key=self._sort_schema_by_relevance_key, update=columns
-                )
+                if greedy:
+                    if column_schema.relevance >= table_schema.filter_threshold:
+                        greedy_count += 1
 
-                table_count += 1
-                if table_count >= ordered_database_schema.max_filters:
-                    break
+            # sort columns and keep only columns that made the cut.
+            tables[table_key] = self._sort_schema_by_key(
+                table_schema, key=self._sort_schema_by_relevance_key, update=columns
+            )
 
         # sort tables and keep only tables that made the cut.
         ordered_database_schema = self._sort_schema_by_key(
@@ -494,46 +770,59 @@ Below is a description of the contents in this column in list format:
         )
 
         #  Rank Values ########################################################
+        #  take only the top n number of columns of every table above the filter threshold
+        selected_columns = {}
+        value_candidates = []
+        for table_key, table_schema in ordered_database_schema.tables.items():
+            selected_columns[table_key] = [
+                (column_key, column_schema)
+                for column_key, column_schema in table_schema.columns.items()
+                if column_schema.relevance >= table_schema.filter_threshold
+            ][:table_schema.max_filters]
+            for column_key, column_schema in selected_columns[table_key]:
+                for value_key, value_schema in column_schema.values.items():
+                    prompt: ChatPromptTemplate = self._prepare_value_prompt(
+                        value_schema=value_schema,
+                        column_schema=column_schema,
+                        table_schema=table_schema,
+                        boolean_system_prompt=True,
+                    )
+                    value_candidates.append(
+                        (("value", table_key, column_key, value_key), prompt)
+                    )
+        value_scores = iter(
+            self._rank_schema_candidates(
+                value_candidates, query=query, cache_key=cache_key
+            )
+        )
+
         #  iterate through tables to rank values
         tables = {}
         for table_key, table_schema in ordered_database_schema.tables.items():
             columns = {}
-            column_count = 0
             # iterate through columns to rank values
-            for column_key, column_schema in table_schema.columns.items():
-                if column_schema.relevance >= table_schema.filter_threshold:
-                    greedy_count = 0
-                    values = {}
-                    #  rank values by relevance
-                    for value_key, value_schema in column_schema.values.items():
-                        prompt: ChatPromptTemplate = self._prepare_value_prompt(
-                            value_schema=value_schema,
-                            column_schema=column_schema,
-                            table_schema=table_schema,
-                            boolean_system_prompt=True,
-                        )
-                        value_schema.relevance = self._rank_schema(
-                            prompt=prompt, query=query
-                        )
+            for column_key, column_schema in selected_columns[table_key]:
+                greedy_count = 0
+                values = {}
+                #  rank values by relevance
+                for value_key, value_schema in column_schema.values.items():
+                    value_schema.relevance = next(value_scores)
 
-                        values[value_key] = value_schema
+                    if greedy and greedy_count >= column_schema.max_filters:
+                        continue
 
-                        if greedy:
-                            if value_schema.relevance >= column_schema.filter_threshold:
-                                greedy_count += 1
-                            if greedy_count >= column_schema.max_filters:
-                                break
-
-                    # sort values and keep only values that make the cut
-                    columns[column_key] = self._sort_schema_by_key(
-                        column_schema,
-                        key=self._sort_schema_by_relevance_key,
-                        update=values,
-                    )
+                    values[value_key] = value_schema
+
+                    if greedy:
+                        if value_schema.relevance >= column_schema.filter_threshold:
+                            greedy_count += 1
 
-                    column_count += 1
-                    if column_count >= table_schema.max_filters:
-                        break
+                # sort values and keep only values that make the cut
+                columns[column_key] = self._sort_schema_by_key(
+                    column_schema,
+                    key=self._sort_schema_by_relevance_key,
+                    update=values,
+                )
 
             # sort columns and keep only columns that made the cut
             tables[table_key] = self._sort_schema_by_key(
@@ -731,16 +1020,9 @@ Below is a description of the contents in this column in list format:
                                     query=query,
                                 )
 
-                                # If the LLM outputs raw JSON, use it as-is.
-                                # If the LLM outputs anything including a json markdown section, use the last one.
-                                json_markdown_output = re.findall(
-                                    r"```json.*```", metadata_filter_output, re.DOTALL
+                                metadata_filter_output = self._extract_json_output(
+                                    metadata_filter_output
                                 )
-                                if json_markdown_output:
-                                    metadata_filter_output = json_markdown_output[-1]
-                                    # Clean the json tags.
-                                    metadata_filter_output = metadata_filter_output[7:]
-                                    metadata_filter_output = metadata_filter_output[:-3]
 
                                 metadata_filter = parser.invoke(metadata_filter_output)
                                 model_dump = metadata_filter.model_dump()
@@ -805,7 +1087,7 @@ Below is a description of the contents in this column in list format:
 
         # Search for relevant filters
         ranked_database_schema, ablation_value_dict, ablation_quantiles = (
-            self._breadth_first_search(query=query)
+            self._breadth_first_search(query=query, query_embedding=embedded_query)
         )
 
         # Generate metadata filters
@@ -202,6 +202,16 @@ Below are descriptions of each column in this table:
 {query}
 """
 
+DEFAULT_BATCH_RANKING_PROMPT_TEMPLATE = """# **Schema Candidates**
+Below are {count} schema descriptions, numbered from 0. For each of them answer 'yes' if it is useful to search the database in relation to the user query, otherwise answer 'no'.
+Give your confidence in every answer from 0 to 1. Return an answer for every candidate.
+
+{candidates}
+
+## **Query**
+{query}
+"""
+
 DEFAULT_SQL_PROMPT_TEMPLATE = """
 Construct a valid {dialect} SQL query to select documents relevant to the user input.
 Source documents are found in the {source_table} table. You may need to join with other tables to get additional document metadata.
@@ -364,6 +374,11 @@ SQL Query:
 
 DEFAULT_NUM_QUERY_RETRIES = 2
 
+# Schema ranking of SQL retriever
+DEFAULT_RANKING_BATCH_SIZE = 20
+DEFAULT_RANKING_MAX_CONCURRENCY = 8
+DEFAULT_RANKING_CACHE_TTL = 3600
+
 
 class LLMConfig(BaseModel):
     model_name: str = Field(
@@ -672,6 +687,22 @@ class SQLRetrieverConfig(BaseModel):
         default=DEFAULT_GENERATIVE_SYSTEM_PROMPT,
         description="Prompt template to rewrite user input to be better suited for retrieval. Has 'input' input variable.",
     )
+    batch_ranking_prompt_template: str = Field(
+        default=DEFAULT_BATCH_RANKING_PROMPT_TEMPLATE,
+        description="Prompt template to rank several schema candidates at once. Has 'count', 'candidates' and 'query' input variables.",
+    )
+    ranking_batch_size: int = Field(
+        default=DEFAULT_RANKING_BATCH_SIZE,
+        description="Maximum number of schema candidates ranked in a single LLM call. 1 disables batching.",
+    )
+    ranking_max_concurrency: int = Field(
+        default=DEFAULT_RANKING_MAX_CONCURRENCY,
+        description="Maximum number of concurrent LLM calls used to rank the schema.",
+    )
+    ranking_cache_ttl: int = Field(
+        default=DEFAULT_RANKING_CACHE_TTL,
+        description="Seconds to keep schema rankings for similar queries. 0 disables the cache.",
+    )
     source_table: str = Field(
         description="Name of the source table containing the original documents that were embedded"
     )
@@ -1,7 +1,6 @@
 import datetime
-from typing import Dict, Iterator, List, Union, Tuple, Optional
+from typing import Dict, Iterator, List, Union, Tuple, Optional, TYPE_CHECKING
 
-from langchain_core.tools import BaseTool
 from sqlalchemy.orm.attributes import flag_modified
 from sqlalchemy import null
 import pandas as pd
@@ -16,8 +15,12 @@ from mindsdb.interfaces.skills.skills_controller import SkillsController
 from mindsdb.utilities.config import config
 from mindsdb.utilities.exception import EntityExistsError, EntityNotExistsError
 
-from .constants import ASSISTANT_COLUMN, SUPPORTED_PROVIDERS, PROVIDER_TO_MODELS
-from .langchain_agent import get_llm_provider
+from . import constants
+from .constants import ASSISTANT_COLUMN, SUPPORTED_PROVIDERS
+from .executor_cache import agent_executor_cache
+
+if TYPE_CHECKING:
+    from langchain_core.tools import BaseTool
 
 
 default_project = config.get('default_project')
@@ -67,9 +70,10 @@ class AgentsController:
         except PredictorRecordNotFound:
             if not provider:
                 # If provider is not given, get it from the model name
+                from .langchain_agent import get_llm_provider
                 provider = get_llm_provider({"model_name": model_name})
 
-            elif provider not in SUPPORTED_PROVIDERS and model_name not in PROVIDER_TO_MODELS.get(provider, []):
+            elif provider not in SUPPORTED_PROVIDERS and model_name not in constants.PROVIDER_TO_MODELS.get(provider, []):
                 raise ValueError(f'Model with name does not exist for provider {provider}: {model_name}')
 
         return model, provider
@@ -348,6 +352,7 @@ class AgentsController:
             # See: https://docs.sqlalchemy.org/en/20/orm/session_api.html#sqlalchemy.orm.attributes.flag_modified
             flag_modified(existing_agent, 'params')
         db.session.commit()
+        agent_executor_cache.invalidate(agent_id=existing_agent.id)
 
         return existing_agent
 
@@ -370,13 +375,14 @@ class AgentsController:
             raise ValueError('Unable to delete demo object')
         agent.deleted_at = datetime.datetime.now()
         db.session.commit()
+        agent_executor_cache.invalidate(agent_id=agent.id)
 
     def get_completion(
             self,
             agent: db.Agents,
             messages: List[Dict[str, str]],
             project_name: str = default_project,
-            tools: List[BaseTool] = None,
+            tools: List['BaseTool'] = None,
             stream: bool = False) -> Union[Iterator[object], pd.DataFrame]:
         """
         Queries an agent to get a completion.
@@ -417,7 +423,7 @@ class AgentsController:
             agent: db.Agents,
             messages: List[Dict[str, str]],
             project_name: str = default_project,
-            tools: List[BaseTool] = None) -> Iterator[object]:
+            tools: List['BaseTool'] = None) -> Iterator[object]:
         '''
         Queries an agent to get a stream of completion chunks.
 
@@ -1,12 +1,6 @@
 import os
 
-from langchain.agents import AgentType
-from langchain_openai import OpenAIEmbeddings
-
 from types import MappingProxyType
-from mindsdb.integrations.handlers.openai_handler.constants import (
-    CHAT_MODELS as OPEN_AI_CHAT_MODELS,
-)
 
 SUPPORTED_PROVIDERS = {
     "openai",
@@ -164,29 +158,40 @@ GOOGLE_GEMINI_CHAT_MODELS = (
 )
 
 # Define a read-only dictionary mapping providers to their models
-PROVIDER_TO_MODELS = MappingProxyType(
-    {
-        "anthropic": ANTHROPIC_CHAT_MODELS,
-        "ollama": OLLAMA_CHAT_MODELS,
-        "openai": OPEN_AI_CHAT_MODELS,
-        "nvidia_nim": NVIDIA_NIM_CHAT_MODELS,
-        "google": GOOGLE_GEMINI_CHAT_MODELS,
-    }
-)
-
 ASSISTANT_COLUMN = "answer"
 CONTEXT_COLUMN = "context"
 TRACE_ID_COLUMN = "trace_id"
 DEFAULT_AGENT_TIMEOUT_SECONDS = 300
 # These should require no additional arguments.
 DEFAULT_AGENT_TOOLS = []
-DEFAULT_AGENT_TYPE = AgentType.CONVERSATIONAL_REACT_DESCRIPTION
+# value of langchain.agents.AgentType.CONVERSATIONAL_REACT_DESCRIPTION
+DEFAULT_AGENT_TYPE = "conversational-react-description"
 DEFAULT_MAX_ITERATIONS = 10
 DEFAULT_MAX_TOKENS = 8096
 DEFAULT_MODEL_NAME = "gpt-4o"
 DEFAULT_TEMPERATURE = 0.0
 USER_COLUMN = "question"
 DEFAULT_EMBEDDINGS_MODEL_PROVIDER = "openai"
-DEFAULT_EMBEDDINGS_MODEL_CLASS = OpenAIEmbeddings
 DEFAULT_TIKTOKEN_MODEL_NAME = os.getenv('DEFAULT_TIKTOKEN_MODEL_NAME', 'gpt-4')
 AGENT_CHUNK_POLLING_INTERVAL_SECONDS = os.getenv('AGENT_CHUNK_POLLING_INTERVAL_SECONDS', 1.0)
+# count of built agent executors kept in memory
+AGENT_EXECUTOR_CACHE_SIZE = int(os.getenv('AGENT_EXECUTOR_CACHE_SIZE', 32))
+
+
+def __getattr__(name):
+    # langchain and openai handler are imported only when they are used
+    if name == 'DEFAULT_EMBEDDINGS_MODEL_CLASS':
+        from langchain_openai import OpenAIEmbeddings
+        return OpenAIEmbeddings
+    if name == 'PROVIDER_TO_MODELS':
+        from mindsdb.integrations.handlers.openai_handler.constants import CHAT_MODELS as OPEN_AI_CHAT_MODELS
+        return MappingProxyType(
+            {
+                "anthropic": ANTHROPIC_CHAT_MODELS,
+                "ollama": OLLAMA_CHAT_MODELS,
+                "openai": OPEN_AI_CHAT_MODELS,
+                "nvidia_nim": NVIDIA_NIM_CHAT_MODELS,
+                "google": GOOGLE_GEMINI_CHAT_MODELS,
+            }
+        )
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
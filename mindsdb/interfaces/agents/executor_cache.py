@@ -0,0 +1,62 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Hashable, Optional
+
+from mindsdb.interfaces.agents.constants import AGENT_EXECUTOR_CACHE_SIZE
+
+
+class AgentExecutorCache:
+    """
+    LRU cache of built agent executors (without memory of conversation).
+
+    Key of entry contains version of agent and its skills, so changed agent is built again.
+    Entries of changed or deleted agents and skills are also removed explicitly to release memory.
+    """
+
+    def __init__(self, max_size: int = AGENT_EXECUTOR_CACHE_SIZE):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: Hashable) -> Optional[dict]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry['value']
+
+    def set(self, key: Hashable, value: object, agent_id: int, skill_ids: list):
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = {
+                'value': value,
+                'agent_id': agent_id,
+                'skill_ids': set(skill_ids)
+            }
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, agent_id: int = None, skill_id: int = None):
+        """
+        Remove entries which belong to the agent or use the skill
+        """
+        with self._lock:
+            for key in list(self._entries.keys()):
+                entry = self._entries[key]
+                if (
+                    (agent_id is not None and entry['agent_id'] == agent_id)
+                    or (skill_id is not None and skill_id in entry['skill_ids'])
+                ):
+                    del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+agent_executor_cache = AgentExecutorCache()
@@ -5,6 +5,7 @@ from uuid import uuid4
 import queue
 import re
 import threading
+import time
 import numpy as np
 import pandas as pd
 
@@ -32,6 +33,8 @@ from mindsdb.integrations.utilities.handler_utils import get_api_key
 from mindsdb.integrations.utilities.rag.settings import DEFAULT_RAG_PROMPT_TEMPLATE
 from mindsdb.interfaces.agents.event_dispatch_callback_handler import EventDispatchCallbackHandler
 from mindsdb.interfaces.agents.constants import AGENT_CHUNK_POLLING_INTERVAL_SECONDS
+from mindsdb.interfaces.agents.executor_cache import agent_executor_cache
+from mindsdb.metrics import metrics
 from mindsdb.utilities import log
 from mindsdb.utilities.context_executor import ContextThreadPoolExecutor
 from mindsdb.interfaces.storage import db
@@ -352,20 +355,47 @@ class LangchainAgent:
         df.iloc[:-1, df.columns.get_loc(user_column)] = None
         return self.stream_agent(df, agent, args)
 
+    def _get_executor_cache_key(self, args: Dict) -> tuple:
+        """Key of built agent executor: version of the agent, its skills and arguments"""
+        skills = tuple(sorted(
+            (
+                rel.skill.id,
+                str(rel.skill.updated_at),
+                json.dumps(rel.parameters or {}, sort_keys=True, default=str)
+            )
+            for rel in self.agent.skills_relationships
+        ))
+        return (
+            ctx.company_id,
+            self.agent.id,
+            str(self.agent.updated_at),
+            skills,
+            json.dumps(args, sort_keys=True, default=str)
+        )
+
     def create_agent(self, df: pd.DataFrame, args: Dict = None) -> AgentExecutor:
-        # Set up tools.
-        llm = create_chat_model(args)
+        time_before_setup = time.perf_counter()
+
+        # Chat model and tools are built once per version of the agent, memory is created for every completion
+        cache_key = self._get_executor_cache_key(args)
+        cached = agent_executor_cache.get(cache_key)
+        if cached is None:
+            path = 'cold'
+            llm, agent_executor = self._build_agent_executor(args)
+            agent_executor_cache.set(
+                cache_key,
+                (llm, agent_executor),
+                agent_id=self.agent.id,
+                skill_ids=[rel.skill.id for rel in self.agent.skills_relationships]
+            )
+        else:
+            path = 'warm'
+            llm, agent_executor = cached
+            # Don't set embedding model for retrieval mode - let the knowledge base handle it
+            if args.get("mode") == "retrieval":
+                self.args.pop("mode")
         self.llm = llm
 
-        # Don't set embedding model for retrieval mode - let the knowledge base handle it
-        if args.get("mode") == "retrieval":
-            self.args.pop("mode")
-
-        tools = self._langchain_tools_from_skills(llm)
-
-        # Prefer prediction prompt template over original if provided.
-        prompt_template = args["prompt_template"]
-
         # Set up memory.
         memory = ConversationSummaryBufferMemory(
             llm=llm,
@@ -375,6 +405,8 @@ class LangchainAgent:
             memory_key="chat_history",
         )
 
+        # Prefer prediction prompt template over original if provided.
+        prompt_template = args["prompt_template"]
         memory.chat_memory.messages.insert(0, SystemMessage(content=prompt_template))
         # User - Assistant conversation. All except the last message.
         user_column = args.get("user_column", USER_COLUMN)
@@ -387,6 +419,23 @@ class LangchainAgent:
             if isinstance(answer, str) and len(answer) > 0:
                 memory.chat_memory.add_ai_message(answer)
 
+        # shallow copy: chat model and tools are shared with cached executor
+        agent_executor = agent_executor.model_copy(update={"memory": memory})
+
+        metrics.AGENT_EXECUTOR_SETUP_TIME.labels(path).observe(time.perf_counter() - time_before_setup)
+        return agent_executor
+
+    def _build_agent_executor(self, args: Dict) -> tuple:
+        # Set up tools.
+        llm = create_chat_model(args)
+        self.llm = llm
+
+        # Don't set embedding model for retrieval mode - let the knowledge base handle it
+        if args.get("mode") == "retrieval":
+            self.args.pop("mode")
+
+        tools = self._langchain_tools_from_skills(llm)
+
         agent_type = args.get("agent_type", DEFAULT_AGENT_TYPE)
         agent_executor = initialize_agent(
             tools,
@@ -405,10 +454,9 @@ class LangchainAgent:
             max_iterations=args.get(
                 "max_iterations", args.get("max_iterations", DEFAULT_MAX_ITERATIONS)
             ),
-            memory=memory,
             verbose=args.get("verbose", args.get("verbose", False))
         )
-        return agent_executor
+        return llm, agent_executor
 
     def _langchain_tools_from_skills(self, llm):
         # Makes Langchain compatible tools from a skill
@@ -489,7 +537,8 @@ class LangchainAgent:
 
         return all_callbacks
 
-    def _handle_parsing_errors(self, error: Exception) -> str:
+    @staticmethod
+    def _handle_parsing_errors(error: Exception) -> str:
         response = str(error)
         for p in _PARSING_ERROR_PREFIXES:
             if response.startswith(p):
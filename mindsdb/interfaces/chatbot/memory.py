@@ -1,4 +1,5 @@
 
+from collections import Counter
 from typing import Union
 
 from mindsdb_sql_parser.ast import Identifier, Select, BinaryOperation, Constant, OrderBy
@@ -18,6 +19,8 @@ class BaseMemory:
         self._modes = {}
         self._hide_history_before = {}
         self._cache = {}
+        # chats with new messages in the storage, their cached history has to be updated
+        self._stale = set()
         self.chat_params = chat_params
         self.chat_task = chat_task
 
@@ -64,28 +67,71 @@ class BaseMemory:
             chat_message,
             table_name=table_name
         )
-        if chat_id in self._cache:
-            del self._cache[chat_id]
+        # message is read back from the storage with the next update of the history
+        self._stale.add(self._get_key(chat_id, table_name))
 
-    def get_chat_history(self, chat_id, table_name=None, cached=True):
-        key = (chat_id, table_name) if table_name else chat_id
-        if cached and key in self._cache:
-            history = self._cache[key]
+    def _get_key(self, chat_id, table_name=None):
+        return (chat_id, table_name) if table_name else chat_id
 
-        else:
+    def get_chat_history(self, chat_id, table_name=None, cached=True):
+        key = self._get_key(chat_id, table_name)
+        if key not in self._cache:
             history = self._get_chat_history(
                 chat_id,
                 table_name
             )
             self._cache[key] = history
 
+        elif not cached or key in self._stale:
+            # append new messages to the history instead of fetching all of them
+            history = self._update_chat_history(chat_id, table_name, self._cache[key])
+            self._cache[key] = history
+
+        else:
+            history = self._cache[key]
+
+        self._stale.discard(key)
+
         history = self._apply_hiding(chat_id, history)
         return history
 
+    def _update_chat_history(self, chat_id, table_name, history):
+        if not history:
+            return self._get_chat_history(chat_id, table_name)
+
+        # messages can have the same time as the last one: get them too and skip as many of them as are cached.
+        # the same text can be sent several times, count of them is compared
+        last_sent_at = history[-1].sent_at
+        known = Counter(
+            (msg.text, msg.user)
+            for msg in history
+            if msg.sent_at == last_sent_at
+        )
+
+        new_messages = self._get_chat_history(chat_id, table_name, after=last_sent_at)
+        if new_messages is None:
+            return history
+        if len(new_messages) >= self.MAX_DEPTH:
+            # gap can be between cached and new messages
+            return new_messages
+
+        added = []
+        for msg in new_messages:
+            if msg.sent_at < last_sent_at:
+                continue
+            if msg.sent_at == last_sent_at and known[(msg.text, msg.user)] > 0:
+                known[(msg.text, msg.user)] -= 1
+                continue
+            added.append(msg)
+        return (history + added)[-self.MAX_DEPTH:]
+
     def _add_to_history(self, chat_id, chat_message, table_name=None):
         raise NotImplementedError
 
-    def _get_chat_history(self, chat_id, table_name=None):
+    def _get_chat_history(self, chat_id, table_name=None, after=None):
+        '''
+        get last messages of the chat, if 'after' is set: only messages sent at this time or later
+        '''
         raise NotImplementedError
 
 
@@ -98,7 +144,7 @@ class HandlerMemory(BaseMemory):
         # do nothing. sent message will be stored by handler db
         pass
 
-    def _get_chat_history(self, chat_id, table_name):
+    def _get_chat_history(self, chat_id, table_name, after=None):
         t_params = next(
             chat_params['chat_table'] for chat_params in self.chat_params if chat_params['chat_table']['name'] == table_name
         )
@@ -132,6 +178,17 @@ class HandlerMemory(BaseMemory):
             )
         )
 
+        if after is not None:
+            where_conditions.append(
+                BinaryOperation(
+                    op='>=',
+                    args=[
+                        Identifier(time_col),
+                        Constant(after)
+                    ]
+                )
+            )
+
         # Convert the WHERE conditions to a BinaryOperation object.
         where_conditions_binary_operation = None
         for condition in where_conditions:
@@ -146,7 +203,8 @@ class HandlerMemory(BaseMemory):
                      Identifier(time_col)],
             from_table=Identifier(t_params['name']),
             where=where_conditions_binary_operation,
-            order_by=[OrderBy(Identifier(time_col))],
+            # last messages
+            order_by=[OrderBy(Identifier(time_col), direction='DESC')],
             limit=Constant(self.MAX_DEPTH),
         )
 
@@ -155,9 +213,14 @@ class HandlerMemory(BaseMemory):
             return
 
         df = resp.data_frame
+        if after is not None:
+            # handler could ignore the filter
+            df = df[df[time_col] >= after]
 
-        # get last messages
-        df = df.iloc[-self.MAX_DEPTH:]
+        # get last messages, handler could ignore the limit
+        df = df.iloc[:self.MAX_DEPTH]
+        # older messages first
+        df = df.iloc[::-1]
 
         result = []
         for _, rec in df.iterrows():
@@ -210,7 +273,7 @@ class DBMemory(BaseMemory):
         db.session.add(message)
         db.session.commit()
 
-    def _get_chat_history(self, chat_id, table_name=None):
+    def _get_chat_history(self, chat_id, table_name=None, after=None):
         chat_bot_id = self.chat_task.bot_id
         destination = self._generate_chat_id_for_db(chat_id, table_name)
 
@@ -218,7 +281,11 @@ class DBMemory(BaseMemory):
             .filter(
                 db.ChatBotsHistory.chat_bot_id == chat_bot_id,
                 db.ChatBotsHistory.destination == destination
-            )\
+            )
+        if after is not None:
+            query = query.filter(db.ChatBotsHistory.sent_at >= after)
+
+        query = query\
             .order_by(db.ChatBotsHistory.sent_at.desc())\
             .limit(self.MAX_DEPTH)
 
@@ -1,8 +1,7 @@
 import secrets
 import threading
-import time
 
-from mindsdb_sql_parser.ast import Identifier, Select, Insert
+from mindsdb_sql_parser.ast import Identifier, Select, Insert, BinaryOperation, Constant
 
 from mindsdb.utilities import log
 from mindsdb.utilities.context import context as ctx
@@ -41,36 +40,82 @@ class BasePolling:
 
 
 class MessageCountPolling(BasePolling):
+    """
+    Checks count of messages in chats and processes the chats where it was changed.
+
+    If handler supports subscription to changes of the table, it is used instead of polling.
+    Polling interval grows while there are no new messages.
+    If 'time_col' (time of the last message in the chat) is set in polling params:
+      only chats changed after the previous check are requested
+    """
+
+    MIN_INTERVAL = 1
+    MAX_INTERVAL = 7
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
         self._to_stop = False
-        self.chats_prev = None
+        # count of messages of chats, by polling table
+        self.chats_prev = {}
+        # the latest time of the change of chats, by polling table
+        self._time_marks = {}
+
+        # subscription callback can be without context
+        self._ctx_dump = ctx.dump()
 
     def run(self, stop_event):
+        if not hasattr(self.chat_task.chat_handler, "subscribe"):
+            self.run_polling(stop_event, self.params)
+            return
+
+        threads = [
+            threading.Thread(
+                target=self.run_subscription,
+                args=(stop_event, chat_params),
+                name=f"MessageCountPolling.subscribe_{chat_params['polling']['table']}",
+            )
+            for chat_params in self.params
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    def run_subscription(self, stop_event, chat_params):
+        p_params = chat_params["polling"]
+        id_cols = p_params["chat_id_col"] if isinstance(p_params["chat_id_col"], list) else [p_params["chat_id_col"]]
+
+        def callback(row, key=None):
+            ctx.load(self._ctx_dump)
+            if key is not None:
+                row.update(key)
+
+            chat_id = tuple(row[id_col] for id_col in id_cols)
+            self.process_chat(chat_id, chat_params)
+
+        try:
+            self.chat_task.chat_handler.subscribe(
+                stop_event, callback, p_params["table"], columns=[p_params["count_col"]]
+            )
+        except Exception as e:
+            if stop_event.is_set():
+                return
+            logger.warning(f"Unable to subscribe to changes of {p_params['table']}, polling is used: {e}")
+            self.run_polling(stop_event, [chat_params])
+
+    def run_polling(self, stop_event, params):
+        interval = self.MIN_INTERVAL
         while True:
+            has_changes = False
             try:
-                for chat_params in self.params:
+                for chat_params in params:
                     chat_ids = self.check_message_count(chat_params)
                     logger.debug(f"number of chat ids found: {len(chat_ids)}")
 
                     for chat_id in chat_ids:
-                        try:
-                            chat_memory = self.chat_task.memory.get_chat(
-                                chat_id,
-                                table_name=chat_params["chat_table"]["name"],
-                            )
-                        except Exception as e:
-                            logger.error(f"Problem retrieving chat memory: {e}")
-
-                        try:
-                            message = self.get_last_message(chat_memory)
-                        except Exception as e:
-                            logger.error(f"Problem getting last message: {e}")
-                            message = None
-
-                        if message:
-                            self.chat_task.on_message(message, chat_memory=chat_memory, table_name=chat_params["chat_table"]["name"])
+                        has_changes = True
+                        self.process_chat(chat_id, chat_params)
 
             except Exception as e:
                 logger.error(e)
@@ -78,7 +123,34 @@ class MessageCountPolling(BasePolling):
             if stop_event.is_set():
                 return
             logger.debug(f"running {self.chat_task.bot_id}")
-            time.sleep(7)
+
+            # check often while users are chatting
+            if has_changes:
+                interval = self.MIN_INTERVAL
+            else:
+                interval = min(interval * 2, self.MAX_INTERVAL)
+            if stop_event.wait(interval):
+                return
+
+    def process_chat(self, chat_id, chat_params):
+        table_name = chat_params["chat_table"]["name"]
+        try:
+            chat_memory = self.chat_task.memory.get_chat(
+                chat_id,
+                table_name=table_name,
+            )
+        except Exception as e:
+            logger.error(f"Problem retrieving chat memory: {e}")
+            return
+
+        try:
+            message = self.get_last_message(chat_memory)
+        except Exception as e:
+            logger.error(f"Problem getting last message: {e}")
+            message = None
+
+        if message:
+            self.chat_task.on_message(message, chat_memory=chat_memory, table_name=table_name)
 
     def get_last_message(self, chat_memory):
         # retrive from history
@@ -95,15 +167,27 @@ class MessageCountPolling(BasePolling):
 
     def check_message_count(self, chat_params):
         p_params = chat_params["polling"]
+        table = p_params["table"]
 
         chat_ids = []
 
         id_cols = p_params["chat_id_col"] if isinstance(p_params["chat_id_col"], list) else [p_params["chat_id_col"]]
         msgs_col = p_params["count_col"]
+        time_col = p_params.get("time_col")
+
+        targets = [*[Identifier(id_col) for id_col in id_cols], Identifier(msgs_col)]
+        where = None
+        if time_col is not None:
+            targets.append(Identifier(time_col))
+            if table in self._time_marks:
+                # only changed chats. Time of the last check is included: chats can be changed in the same time
+                where = BinaryOperation(op=">=", args=[Identifier(time_col), Constant(self._time_marks[table])])
+
         # get chats status info
         ast_query = Select(
-            targets=[*[Identifier(id_col) for id_col in id_cols], Identifier(msgs_col)],
-            from_table=Identifier(p_params["table"]),
+            targets=targets,
+            from_table=Identifier(table),
+            where=where,
         )
 
         resp = self.chat_task.chat_handler.query(query=ast_query)
@@ -117,17 +201,25 @@ class MessageCountPolling(BasePolling):
 
             chats[chat_id] = msgs
 
-        if self.chats_prev is None:
+        if time_col is not None and len(resp.data_frame) > 0:
+            self._time_marks[table] = resp.data_frame[time_col].max()
+
+        chats_prev = self.chats_prev.get(table)
+        if chats_prev is None:
             # first run
-            self.chats_prev = chats
+            self.chats_prev[table] = chats
         else:
             # compare
             # for new keys
             for chat_id, count_msgs in chats.items():
-                if self.chats_prev.get(chat_id) != count_msgs:
+                if chats_prev.get(chat_id) != count_msgs:
                     chat_ids.append(chat_id)
 
-            self.chats_prev = chats
+            if time_col is None:
+                self.chats_prev[table] = chats
+            else:
+                # not changed chats were not requested
+                chats_prev.update(chats)
         return chat_ids
 
     def stop(self):
@@ -21,6 +21,7 @@ from mindsdb.utilities.config import Config
 from mindsdb.utilities.exception import EntityNotExistsError
 from mindsdb.interfaces.storage.fs import FsStore, FileStorage, RESOURCE_GROUP
 from mindsdb.interfaces.storage.model_fs import HandlerStorage
+from mindsdb.interfaces.database.result_cache import integration_result_cache, RESULT_CACHE_PARAM
 from mindsdb.interfaces.file.file_controller import FileController
 from mindsdb.integrations.libs.base import DatabaseHandler
 from mindsdb.integrations.libs.base import BaseMLEngine
@@ -31,10 +32,18 @@ from mindsdb.utilities.context import context as ctx
 from mindsdb.utilities import log
 from mindsdb.integrations.libs.ml_exec_base import BaseMLEngineExec
 from mindsdb.integrations.libs.base import BaseHandler
+from mindsdb.integrations.libs.handlers_manifest import (
+    read_manifest, write_manifest, make_manifest_entry, validate_manifest_entry, get_refreshed_manifest_path
+)
 import mindsdb.utilities.profiler as profiler
 
 logger = log.getLogger(__name__)
 
+# parameter of integration: keys of joined table can be loaded into a table created in the database
+JOIN_KEYS_TEMP_TABLE_PARAM = 'join_keys_temp_table'
+# parameters of integration which are used by mindsdb and not passed to the handler
+MINDSDB_INTEGRATION_PARAMS = (RESULT_CACHE_PARAM, JOIN_KEYS_TEMP_TABLE_PARAM)
+
 
 class HandlersCache:
     """ Cache for data handlers that keep connections opened during ttl time from handler last use
@@ -215,6 +224,7 @@ class IntegrationController:
     def modify(self, name, data):
         self.handlers_cache.delete(name)
         integration_record = self._get_integration_record(name)
+        integration_result_cache.invalidate(integration_record.id)
         if isinstance(integration_record.data, dict) and integration_record.data.get('is_demo') is True:
             raise ValueError("It is forbidden to change properties of the demo object")
         old_data = deepcopy(integration_record.data)
@@ -271,6 +281,7 @@ class IntegrationController:
 
         db.session.delete(integration_record)
         db.session.commit()
+        integration_result_cache.invalidate(integration_record.id)
 
     def _get_integration_record_data(self, integration_record, show_secrets=True):
         if (
@@ -409,6 +420,10 @@ class IntegrationController:
 
     def _make_handler_args(self, name: str, handler_type: str, connection_data: dict, integration_id: int = None,
                            file_storage: FileStorage = None, handler_storage: HandlerStorage = None):
+        if isinstance(connection_data, dict):
+            # parameters of mindsdb, not of the handler
+            connection_data = {k: v for k, v in connection_data.items() if k not in MINDSDB_INTEGRATION_PARAMS}
+
         handler_args = dict(
             name=name,
             integration_id=integration_id,
@@ -701,7 +716,7 @@ class IntegrationController:
             logger.error(f'Error reading icon for {handler_dir}, {e}!')
         return icon
 
-    def _load_handler_modules(self):
+    def _get_handlers_path(self) -> Path:
         mindsdb_path = Path(importlib.util.find_spec('mindsdb').origin).parent
         handlers_path = mindsdb_path.joinpath('integrations/handlers')
 
@@ -709,18 +724,79 @@ class IntegrationController:
         if not os.path.isdir(handlers_path):
             mindsdb_path = Path(importlib.util.find_spec('mindsdb').origin).parent.joinpath('mindsdb')
             handlers_path = mindsdb_path.joinpath('integrations/handlers')
+        return handlers_path
+
+    def _get_handler_dirs(self, handlers_path: Path) -> list:
+        return [
+            handler_dir
+            for handler_dir in handlers_path.iterdir()
+            if handler_dir.is_dir() and not handler_dir.name.startswith('__')
+        ]
+
+    def _scan_handler_dir(self, handler_dir: Path) -> dict:
+        """
+        Get handler metadata from its files without importing it
+
+        :param handler_dir: folder of handler
+        :return: handler info, dependencies and icon
+        """
+        handler_info = self._get_handler_info(handler_dir)
+        handler_data = {'info': handler_info}
+        if 'name' not in handler_info:
+            return handler_data
+
+        handler_data['dependencies'] = self._read_dependencies(handler_dir)
+        if 'icon_path' in handler_info:
+            icon = self._get_handler_icon(handler_dir, handler_info['icon_path'])
+            if icon:
+                handler_data['icon'] = icon
+        return handler_data
+
+    def save_handlers_manifest(self, manifest_path: Path = None) -> Path:
+        """
+        Scan all handlers and save their metadata to manifest
+
+        :param manifest_path: where to save manifest, default is inside of handlers folder
+        :return: path to manifest
+        """
+        handlers_path = self._get_handlers_path()
+        entries = {}
+        for handler_dir in self._get_handler_dirs(handlers_path):
+            entries[handler_dir.name] = make_manifest_entry(handler_dir, self._scan_handler_dir(handler_dir))
+        return write_manifest(handlers_path, entries, manifest_path)
+
+    def _load_handler_modules(self):
+        handlers_path = self._get_handlers_path()
+
+        # metadata of not changed handlers is taken from manifest
+        manifest = read_manifest(handlers_path)
+        # the same manifest with mtimes of files after installation
+        refreshed_path = get_refreshed_manifest_path()
+        refreshed_manifest = read_manifest(handlers_path, refreshed_path)
+        valid_entries = {}
+        is_refreshed = False
 
         self.handler_modules = {}
         self.handlers_import_status = {}
-        for handler_dir in handlers_path.iterdir():
-            if handler_dir.is_dir() is False or handler_dir.name.startswith('__'):
-                continue
+        for handler_dir in self._get_handler_dirs(handlers_path):
+            handler_data = None
+            for entry in (refreshed_manifest.get(handler_dir.name), manifest.get(handler_dir.name)):
+                if entry is None:
+                    continue
+                is_valid, is_changed = validate_manifest_entry(entry, handler_dir)
+                if is_valid:
+                    handler_data = entry['data']
+                    valid_entries[handler_dir.name] = entry
+                    is_refreshed = is_refreshed or is_changed
+                    break
+            if handler_data is None:
+                handler_data = self._scan_handler_dir(handler_dir)
 
-            handler_info = self._get_handler_info(handler_dir)
+            handler_info = handler_data['info']
             if 'name' not in handler_info:
                 continue
             handler_name = handler_info['name']
-            dependencies = self._read_dependencies(handler_dir)
+            dependencies = handler_data['dependencies']
             handler_meta = {
                 'path': handler_dir,
                 'import': {
@@ -735,12 +811,17 @@ class IntegrationController:
                 'class_type': handler_info.get('class_type', None),
                 'type': handler_info.get('type')
             }
-            if 'icon_path' in handler_info:
-                icon = self._get_handler_icon(handler_dir, handler_info['icon_path'])
-                if icon:
-                    handler_meta['icon'] = icon
+            if 'icon' in handler_data:
+                handler_meta['icon'] = handler_data['icon']
             self.handlers_import_status[handler_name] = handler_meta
 
+        if is_refreshed:
+            # content of files was checked, the next start can use their new mtimes
+            try:
+                write_manifest(handlers_path, valid_entries, refreshed_path)
+            except OSError as e:
+                logger.warning(f'Unable to save refreshed handlers manifest: {e}')
+
     def _get_connection_args(self, args_file: Path, param_name: str) -> dict:
         """
         Extract connection args dict from connection args file of a handler
@@ -8,7 +8,7 @@ from sqlalchemy.orm.attributes import flag_modified
 import numpy as np
 
 from mindsdb_sql_parser.ast.base import ASTNode
-from mindsdb_sql_parser.ast import Select, Star, Constant, Identifier
+from mindsdb_sql_parser.ast import Select, Star, Constant, Identifier, BinaryOperation
 from mindsdb_sql_parser import parse_sql
 
 from mindsdb.interfaces.storage import db
@@ -103,11 +103,13 @@ class Project:
             project_name=self.name
         )
 
-    def create_view(self, name: str, query: str):
+    def create_view(self, name: str, query: str, materialized: bool = False, refresh_key: str = None):
         ViewController().add(
             name,
             query=query,
-            project_name=self.name
+            project_name=self.name,
+            materialized=materialized,
+            refresh_key=refresh_key
         )
 
     def update_view(self, name: str, query: str):
@@ -132,15 +134,12 @@ class Project:
         view_meta['query_ast'] = parse_sql(view_meta['query'])
         return view_meta
 
-    def query_view(self, query, session):
-
-        view_meta = self.get_view_meta(query)
-
+    def _execute_view_query(self, view_meta: dict, query_ast: ASTNode, session):
         query_context_controller.set_context('view', view_meta['id'])
 
         try:
             sqlquery = SQLQuery(
-                view_meta['query_ast'],
+                query_ast,
                 session=session
             )
             df = sqlquery.fetched_data.to_df()
@@ -148,10 +147,83 @@ class Project:
             query_context_controller.release_context('view', view_meta['id'])
 
         # remove duplicated columns
-        df = df.loc[:, ~df.columns.duplicated()]
+        return df.loc[:, ~df.columns.duplicated()]
+
+    def query_view(self, query, session):
+
+        view_meta = self.get_view_meta(query)
+
+        df = None
+        if view_meta['materialized']:
+            df = ViewController().get_materialized_data(view_meta['id'])
+
+        if df is None:
+            df = self._execute_view_query(view_meta, view_meta['query_ast'], session)
 
         return query_df(df, query, session=session)
 
+    def refresh_view(self, name: str, session, full: bool = False) -> int:
+        """Execute query of materialized view and store its result.
+
+        If the view has refresh_key and was refreshed before, only rows with refresh_key greater
+        than the last stored value are fetched and appended to the stored data.
+
+        Args:
+            name (str): name of the view
+            session: session to execute the query
+            full (bool): fetch all rows even if incremental refresh is possible
+
+        Returns:
+            int: number of fetched rows
+        """
+        view_controller = ViewController()
+        view_meta = view_controller.get(name=name, project_name=self.name)
+        if not view_meta['materialized']:
+            raise ValueError(f"View '{name}' is not materialized")
+
+        query_ast = parse_sql(view_meta['query'])
+        refresh_key = view_meta['refresh_key']
+        last_key = view_meta['last_key']
+
+        incremental = not full and refresh_key is not None and last_key is not None
+        if incremental:
+            # condition is pushed down to the integration by planner
+            query_ast.parentheses = True
+            query_ast.alias = Identifier('view')
+            query_ast = Select(
+                targets=[Star()],
+                from_table=query_ast,
+                where=BinaryOperation(op='>', args=[
+                    Identifier(parts=['view', refresh_key]),
+                    Constant(last_key)
+                ])
+            )
+
+        try:
+            df = self._execute_view_query(view_meta, query_ast, session)
+
+            if refresh_key is not None:
+                if refresh_key not in df.columns:
+                    raise ValueError(f"Refresh key '{refresh_key}' is not in columns of view '{name}'")
+                if len(df) > 0:
+                    last_key = df[refresh_key].max()
+                    # to json serializable type
+                    if isinstance(last_key, np.generic):
+                        last_key = last_key.item()
+                    if not isinstance(last_key, (int, float, str)):
+                        last_key = str(last_key)
+
+            view_controller.save_materialized_data(view_meta['id'], df, append=incremental)
+        except Exception as e:
+            view_controller.set_refresh_state(view_meta['id'], error=str(e))
+            raise
+
+        row_count = len(df)
+        if incremental:
+            row_count += view_meta['row_count'] or 0
+        view_controller.set_refresh_state(view_meta['id'], last_key=last_key, row_count=row_count, error=None)
+        return len(df)
+
     @staticmethod
     def _get_model_data(predictor_record, integraion_record, with_secrets: bool = True):
         from mindsdb.interfaces.database.integrations import integration_controller
@@ -0,0 +1,197 @@
+"""
+Cache of results of select queries to integrations.
+
+It is enabled for integration by parameter 'result_cache' of the database:
+
+    CREATE DATABASE pg WITH ENGINE = 'postgres', PARAMETERS = {
+        ...,
+        "result_cache": {"ttl": 60, "max_entry_size": 10485760}
+    }
+
+'result_cache': true enables it with default ttl and max size of the entry.
+
+Key of the entry is the query rendered to string and the version of the integration (its id and time of update),
+so changed integration doesn't return results of the previous version. Entries of integration are also removed
+when it is changed or deleted, when a not-select query is sent to it, and by statement:
+
+    FLUSH RESULT CACHE pg
+
+The cache can be bypassed in the session with:
+
+    SET integration_cache = 0
+"""
+import os
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+from typing import Hashable, Optional
+
+import pandas as pd
+from mindsdb_sql_parser.ast import Select
+from mindsdb_sql_parser.ast.base import ASTNode
+from mindsdb_sql_parser.ast.select.union import CombiningQuery
+
+from mindsdb.utilities import log
+
+logger = log.getLogger(__name__)
+
+# name of the parameter of integration, it is not passed to the handler
+RESULT_CACHE_PARAM = 'result_cache'
+
+DEFAULT_RESULT_CACHE_TTL = 60
+DEFAULT_RESULT_CACHE_MAX_ENTRY_SIZE = 10 * 1024 * 1024
+# total size of the entries of all integrations
+RESULT_CACHE_MAX_SIZE = int(os.getenv('MINDSDB_INTEGRATION_RESULT_CACHE_MAX_SIZE', 256 * 1024 * 1024))
+
+SELECT_QUERY_RE = re.compile(r'^[\s(]*(select|with)\b', re.IGNORECASE)
+
+
+@dataclass(frozen=True)
+class ResultCacheParams:
+    ttl: float = DEFAULT_RESULT_CACHE_TTL
+    max_entry_size: int = DEFAULT_RESULT_CACHE_MAX_ENTRY_SIZE
+
+
+def get_result_cache_params(connection_data: Optional[dict]) -> Optional[ResultCacheParams]:
+    """Get parameters of the cache from parameters of integration
+
+    Args:
+        connection_data (dict): parameters of integration
+
+    Returns:
+        ResultCacheParams: parameters, None if cache is not enabled for the integration
+    """
+    if not isinstance(connection_data, dict):
+        return None
+    value = connection_data.get(RESULT_CACHE_PARAM)
+    if value in (None, False):
+        return None
+    if value is True:
+        return ResultCacheParams()
+    if not isinstance(value, dict):
+        logger.warning(f"Wrong value of '{RESULT_CACHE_PARAM}' parameter, dict or bool is expected: {value}")
+        return None
+    try:
+        params = ResultCacheParams(
+            ttl=float(value.get('ttl', DEFAULT_RESULT_CACHE_TTL)),
+            max_entry_size=int(value.get('max_entry_size', DEFAULT_RESULT_CACHE_MAX_ENTRY_SIZE))
+        )
+    except (TypeError, ValueError):
+        logger.warning(f"Wrong value of '{RESULT_CACHE_PARAM}' parameter: {value}")
+        return None
+    if params.ttl <= 0 or params.max_entry_size <= 0:
+        return None
+    return params
+
+
+def is_select_query(query: ASTNode | str) -> bool:
+    """Check if the query (AST or native) only reads data"""
+    if isinstance(query, str):
+        return SELECT_QUERY_RE.match(query) is not None
+    return isinstance(query, (Select, CombiningQuery))
+
+
+def get_dataframe_size(df: pd.DataFrame, max_size: int) -> Optional[int]:
+    """Size of the dataframe in bytes, None if it is bigger than max_size"""
+    # shallow size is fast and it is enough to reject big dataframes
+    if df.memory_usage(index=True, deep=False).sum() > max_size:
+        return None
+    size = int(df.memory_usage(index=True, deep=True).sum())
+    if size > max_size:
+        return None
+    return size
+
+
+class IntegrationResultCache:
+    """
+    LRU cache of results of integrations with expiration time of entries and limited total size.
+
+    Stored value is not copied by the cache: it is responsibility of the caller to not change it.
+
+    Every invalidation of integration increases its generation. Result of the query which was started before
+    the invalidation is not stored: it could be read before the change of the data.
+    """
+
+    def __init__(self, max_size: int = RESULT_CACHE_MAX_SIZE):
+        self.max_size = max_size
+        self.size = 0
+        self._entries = OrderedDict()
+        self._generations = {}
+        self._lock = Lock()
+
+    def get_generation(self, integration_id: int) -> int:
+        """Count of invalidations of the integration, it has to be taken before the query to integration"""
+        with self._lock:
+            return self._generations.get(integration_id, 0)
+
+    def get(self, key: Hashable) -> Optional[tuple]:
+        """Get stored value
+
+        Returns:
+            tuple: (value, size in bytes) or None if there is no actual entry
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry['expire_at'] <= time.monotonic():
+                self._delete(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry['value'], entry['size']
+
+    def set(self, key: Hashable, value: object, size: int, ttl: float, integration_id: int,
+            generation: Optional[int] = None):
+        """Store value
+
+        Args:
+            generation (int): generation of the integration when the value was fetched,
+                value is not stored if integration was invalidated after that
+        """
+        if size > self.max_size:
+            return
+        with self._lock:
+            if generation is not None and generation != self._generations.get(integration_id, 0):
+                return
+            if key in self._entries:
+                self._delete(key)
+            self._entries[key] = {
+                'value': value,
+                'size': size,
+                'expire_at': time.monotonic() + ttl,
+                'integration_id': integration_id
+            }
+            self.size += size
+            while self.size > self.max_size:
+                self._delete(next(iter(self._entries)))
+
+    def _delete(self, key: Hashable):
+        entry = self._entries.pop(key)
+        self.size -= entry['size']
+
+    def invalidate(self, integration_id: int):
+        """
+        Remove entries of the integration
+
+        Returns:
+            int: count of removed entries
+        """
+        with self._lock:
+            self._generations[integration_id] = self._generations.get(integration_id, 0) + 1
+            keys = [key for key, entry in self._entries.items() if entry['integration_id'] == integration_id]
+            for key in keys:
+                self._delete(key)
+        return len(keys)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+
+integration_result_cache = IntegrationResultCache()
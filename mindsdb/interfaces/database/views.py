@@ -1,13 +1,32 @@
+import datetime
+import io
+from typing import Optional
+
+import pandas as pd
 from sqlalchemy import func
+from sqlalchemy.orm.attributes import flag_modified
+
 from mindsdb.interfaces.storage import db
+from mindsdb.interfaces.storage.fs import FileStorage, RESOURCE_GROUP
 from mindsdb.interfaces.query_context.context_controller import query_context_controller
 from mindsdb.utilities.context import context as ctx
 from mindsdb.utilities.exception import EntityExistsError, EntityNotExistsError
 from mindsdb.interfaces.model.functions import get_project_record, get_project_records
 
 
+MATERIALIZED_DATA_PART = 'part-{:05d}.parquet'
+MATERIALIZED_DATA_GLOB = 'part-*.parquet'
+
+
+def get_refresh_job_name(view_name: str) -> str:
+    """Name of the job which refreshes materialized view by schedule.
+    It contains a character which is not allowed in names of user's jobs, so it can't be taken by them"""
+    from mindsdb.interfaces.jobs.jobs_controller import SYSTEM_JOB_NAME_MARKER
+    return f'{view_name}{SYSTEM_JOB_NAME_MARKER}refresh'
+
+
 class ViewController:
-    def add(self, name, query, project_name):
+    def add(self, name, query, project_name, materialized=False, refresh_key=None):
         name = name.lower()
         from mindsdb.interfaces.database.database import DatabaseController
 
@@ -33,7 +52,9 @@ class ViewController:
             name=name,
             company_id=ctx.company_id,
             query=query,
-            project_id=project_id
+            project_id=project_id,
+            materialized=materialized,
+            refresh_key=refresh_key
         )
         db.session.add(view_record)
         db.session.commit()
@@ -50,6 +71,9 @@ class ViewController:
         if rec is None:
             raise EntityNotExistsError('View not found', name)
         rec.query = query
+        if rec.materialized and rec.refresh_state:
+            # data of the old query can't be extended, the next refresh has to be full
+            rec.refresh_state = {**rec.refresh_state, 'last_key': None}
         db.session.commit()
 
     def delete(self, name, project_name):
@@ -67,6 +91,14 @@ class ViewController:
         db.session.commit()
 
         query_context_controller.drop_query_context('view', rec.id)
+        if rec.materialized:
+            self._get_storage(rec.id).delete()
+
+            from mindsdb.interfaces.jobs.jobs_controller import JobsController
+            try:
+                JobsController().delete(get_refresh_job_name(name), project_name)
+            except EntityNotExistsError:
+                pass
 
     def list(self, project_name):
 
@@ -90,17 +122,98 @@ class ViewController:
                 'name': record.name,
                 'project': project_names[record.project_id],
                 'query': record.query,
+                **self._get_materialized_data(record)
             })
 
         return data
 
+    @staticmethod
+    def _get_materialized_data(record):
+        refresh_state = record.refresh_state or {}
+        staleness = None
+        if record.refreshed_at is not None:
+            staleness = round((datetime.datetime.now() - record.refreshed_at).total_seconds())
+        return {
+            'materialized': bool(record.materialized),
+            'refresh_key': record.refresh_key,
+            'refreshed_at': record.refreshed_at,
+            'staleness': staleness,
+            'row_count': refresh_state.get('row_count'),
+            'last_key': refresh_state.get('last_key'),
+            'refresh_error': refresh_state.get('error'),
+        }
+
     def _get_view_record_data(self, record):
         return {
             'id': record.id,
             'name': record.name,
-            'query': record.query
+            'query': record.query,
+            **self._get_materialized_data(record)
         }
 
+    @staticmethod
+    def _get_storage(view_id: int) -> FileStorage:
+        return FileStorage(
+            resource_group=RESOURCE_GROUP.VIEW,
+            resource_id=view_id,
+            sync=True
+        )
+
+    def get_materialized_data(self, view_id: int) -> Optional[pd.DataFrame]:
+        """Read stored data of materialized view
+
+        Args:
+            view_id (int): id of the view
+
+        Returns:
+            Optional[pd.DataFrame]: stored data, None if the view was never refreshed
+        """
+        storage = self._get_storage(view_id)
+        storage.pull()
+        parts = sorted(storage.folder_path.glob(MATERIALIZED_DATA_GLOB))
+        if len(parts) == 0:
+            return None
+        dfs = [pd.read_parquet(io.BytesIO(storage.file_get(part.name))) for part in parts]
+        if len(dfs) == 1:
+            return dfs[0]
+        return pd.concat(dfs, ignore_index=True)
+
+    def save_materialized_data(self, view_id: int, df: pd.DataFrame, append: bool = False):
+        """Store data of materialized view in columnar format.
+        Appended data is saved as a new part, so incremental refresh doesn't rewrite the stored rows.
+
+        Args:
+            view_id (int): id of the view
+            df (pd.DataFrame): data to store
+            append (bool): add data to already stored, otherwise replace it
+        """
+        storage = self._get_storage(view_id)
+        storage.pull()
+        parts = sorted(storage.folder_path.glob(MATERIALIZED_DATA_GLOB))
+        if append:
+            part_num = len(parts)
+        else:
+            for part in parts:
+                storage.delete(part.name)
+            part_num = 0
+        storage.file_set(MATERIALIZED_DATA_PART.format(part_num), df.to_parquet(index=False))
+
+    def set_refresh_state(self, view_id: int, **state):
+        """Update state of the last refresh of materialized view
+
+        Args:
+            view_id (int): id of the view
+            state: keys to update: last_key, row_count, error
+        """
+        rec = db.session.query(db.View).filter_by(id=view_id, company_id=ctx.company_id).first()
+        if rec is None:
+            raise EntityNotExistsError('View not found', view_id)
+        if state.get('error') is None:
+            rec.refreshed_at = datetime.datetime.now()
+        rec.refresh_state = {**(rec.refresh_state or {}), **state}
+        flag_modified(rec, 'refresh_state')
+        db.session.commit()
+
     def get(self, id=None, name=None, project_name=None):
         project_record = get_project_record(project_name)
 
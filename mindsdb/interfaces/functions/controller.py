@@ -1,8 +1,18 @@
 import os
+from threading import Lock
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 from duckdb.typing import BIGINT, DOUBLE, VARCHAR, BLOB, BOOLEAN
-from mindsdb.interfaces.functions.to_markdown import ToMarkdown
 from mindsdb.interfaces.storage.model_fs import HandlerStorage
+from mindsdb.utilities import log
+
+logger = log.getLogger(__name__)
+
+# max number of simultaneous requests to LLM from one LLM() call
+LLM_DEFAULT_MAX_CONCURRENCY = 8
+# max number of prompts which answers are kept in the session cache
+LLM_RESULT_CACHE_SIZE = 1000
 
 
 def python_to_duckdb_type(py_type):
@@ -21,6 +31,37 @@ def python_to_duckdb_type(py_type):
         return VARCHAR
 
 
+def python_to_arrow_type(py_type):
+    import pyarrow as pa
+
+    if py_type == 'int':
+        return pa.int64()
+    elif py_type == 'float':
+        return pa.float64()
+    elif py_type == 'bool':
+        return pa.bool_()
+    elif py_type == 'bytes':
+        return pa.binary()
+    else:
+        return pa.string()
+
+
+def arrow_function_maker(batch_function, output_type):
+    """
+    Wraps function which accepts list of rows into duckdb vectorized (arrow) function.
+    Duckdb sends to the function one arrow array per argument and expects array of the same length as result
+    """
+    import pyarrow as pa
+
+    arrow_type = python_to_arrow_type(output_type)
+
+    def callback(*columns):
+        rows = list(zip(*[column.to_pylist() for column in columns]))
+        return pa.array(batch_function(rows), type=arrow_type)
+
+    return callback
+
+
 # duckdb doesn't like *args
 def function_maker(n_args, other_function):
     return [
@@ -90,6 +131,9 @@ class BYOMFunctionsController:
         def callback(*args):
             return self.method_call(engine, fnc_name, args)
 
+        def batch_callback(rows):
+            return self.method_call_batch(engine, fnc_name, rows)
+
         input_types = [
             param['type']
             for param in methods[fnc_name]['input_params']
@@ -98,6 +142,7 @@ class BYOMFunctionsController:
         meta = {
             'name': new_name,
             'callback': callback,
+            'batch_callback': batch_callback,
             'input_types': input_types,
             'output_type': methods[fnc_name]['output_type']
         }
@@ -108,6 +153,10 @@ class BYOMFunctionsController:
     def method_call(self, engine, method_name, args):
         return self.byom_handlers[engine].function_call(method_name, args)
 
+    def method_call_batch(self, engine, method_name, rows):
+        # all rows are sent to ml worker in one call
+        return self.byom_handlers[engine].function_call_batch(method_name, rows)
+
     def create_function_set(self):
         return DuckDBFunctions(self)
 
@@ -136,6 +185,7 @@ class FunctionController(BYOMFunctionsController):
             return self.callbacks[name]
 
         chat_model_params = self._parse_chat_model_params()
+        max_concurrency = int(chat_model_params.pop('max_concurrency', LLM_DEFAULT_MAX_CONCURRENCY))
 
         try:
             from langchain_core.messages import HumanMessage
@@ -144,13 +194,54 @@ class FunctionController(BYOMFunctionsController):
         except Exception as e:
             raise RuntimeError(f'Unable to use LLM function, check ENV variables: {e}')
 
-        def callback(question):
+        def llm_call(question):
             resp = llm([HumanMessage(question)])
             return resp.content
 
+        cache = OrderedDict()
+        cache_lock = Lock()
+
+        def batch_callback(rows):
+            """
+            Answers are cached by prompt. Every unique prompt which is not in the cache
+            is sent to LLM, with no more than max_concurrency requests at the same time
+            """
+            prompts = [row[0] for row in rows]
+
+            answers = {}
+            to_request = []
+            with cache_lock:
+                for prompt in dict.fromkeys(prompts):
+                    if prompt is None:
+                        continue
+                    if prompt in cache:
+                        cache.move_to_end(prompt)
+                        answers[prompt] = cache[prompt]
+                    else:
+                        to_request.append(prompt)
+
+            if len(to_request) == 1:
+                answers[to_request[0]] = llm_call(to_request[0])
+            elif len(to_request) > 1:
+                with ThreadPoolExecutor(max_workers=min(max_concurrency, len(to_request))) as executor:
+                    for prompt, answer in zip(to_request, executor.map(llm_call, to_request)):
+                        answers[prompt] = answer
+
+            with cache_lock:
+                for prompt in to_request:
+                    cache[prompt] = answers[prompt]
+                while len(cache) > LLM_RESULT_CACHE_SIZE:
+                    cache.popitem(last=False)
+
+            return [answers.get(prompt) for prompt in prompts]
+
+        def callback(question):
+            return batch_callback([(question,)])[0]
+
         meta = {
             'name': name,
             'callback': callback,
+            'batch_callback': batch_callback,
             'input_types': ['str'],
             'output_type': 'str'
         }
@@ -164,6 +255,8 @@ class FunctionController(BYOMFunctionsController):
             return self.callbacks[name]
 
         def callback(file_path_or_url, use_llm):
+            from mindsdb.interfaces.functions.to_markdown import ToMarkdown
+
             chat_model_params = self._parse_chat_model_params()
 
             llm_client = None
@@ -232,8 +325,19 @@ class DuckDBFunctions:
             for param in meta['input_types']
         ]
 
+        function_type = 'native'
+        callback = function_maker(len(input_types), meta['callback'])
+        if meta.get('batch_callback') is not None and len(input_types) > 0:
+            # vectorized function: gets whole batch of rows in one call
+            try:
+                callback = arrow_function_maker(meta['batch_callback'], meta['output_type'])
+                function_type = 'arrow'
+            except ImportError:
+                logger.debug(f'pyarrow is not installed, function {name} will be called for every row')
+
         self.functions[name] = {
-            'callback': function_maker(len(input_types), meta['callback']),
+            'callback': callback,
+            'type': function_type,
             'input': input_types,
             'output': python_to_duckdb_type(meta['output_type'])
         }
@@ -245,5 +349,6 @@ class DuckDBFunctions:
                 info['callback'],
                 info['input'],
                 info['output'],
+                type=info['type'],
                 null_handling="special"
             )
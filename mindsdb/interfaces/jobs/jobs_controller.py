@@ -5,10 +5,11 @@ from typing import List
 
 import sqlalchemy as sa
 
-from mindsdb_sql_parser import parse_sql, ParsingException
+from mindsdb_sql_parser import ParsingException
 from mindsdb_sql_parser.ast.mindsdb import CreateJob
 from mindsdb_sql_parser.ast import Select, Star, Identifier, BinaryOperation, Constant
 
+from mindsdb.api.executor.utilities.extended_sql import parse_sql
 from mindsdb.utilities.config import config
 from mindsdb.utilities.context import context as ctx
 from mindsdb.utilities.exception import EntityNotExistsError, EntityExistsError
@@ -23,6 +24,9 @@ logger = log.getLogger(__name__)
 
 default_project = config.get('default_project')
 
+# names of the jobs which are created by mindsdb itself contain this character, users can't create such jobs
+SYSTEM_JOB_NAME_MARKER = '$'
+
 
 def split_sql(sql):
     # split sql by ';' ignoring delimiter in quotes
@@ -110,6 +114,7 @@ class JobsController:
         end_at: dt.datetime = None,
         if_query: str = None,
         schedule_str: str = None,
+        system: bool = False,
     ) -> str:
         """
         Create a new job
@@ -126,9 +131,13 @@ class JobsController:
               job will not be executed
         :param schedule_str: description how to repeat job
             at the moment supports: 'every <number> <dimension>' or 'every <dimension>'
+        :param system: job is created by mindsdb itself, its name can contain SYSTEM_JOB_NAME_MARKER
         :return: name of created job
         """
 
+        if not system and SYSTEM_JOB_NAME_MARKER in name:
+            raise ValueError(f"Job name can't contain '{SYSTEM_JOB_NAME_MARKER}': {name}")
+
         project_controller = ProjectController()
         project = project_controller.get(name=project_name)
 
@@ -355,6 +364,28 @@ class JobsExecutor:
 
         return query.all()
 
+    def get_changes_marker(self) -> tuple:
+        """
+        Value which is changed on creation, altering or deletion of any active job
+        """
+        return tuple(db.session.query(
+            sa.func.max(db.Jobs.updated_at),
+            sa.func.count(db.Jobs.id),
+        ).filter(
+            db.Jobs.deleted_at == sa.null(),
+            db.Jobs.active == True,  # noqa
+        ).first())
+
+    def get_next_run_at(self) -> dt.datetime:
+        """
+        Nearest planned run of the jobs in the future
+        """
+        return db.session.query(sa.func.min(db.Jobs.next_run_at)).filter(
+            db.Jobs.next_run_at >= dt.datetime.now(),
+            db.Jobs.deleted_at == sa.null(),
+            db.Jobs.active == True,  # noqa
+        ).scalar()
+
     def update_task_schedule(self, record):
         # calculate next run
 
@@ -387,6 +418,12 @@ class JobsExecutor:
         # workaround for several concurrent workers on cloud:
         #  create history record before start of task
         record = db.Jobs.query.get(record_id)
+        if (
+            record is None or record.deleted_at is not None or not record.active
+            or record.next_run_at is None or record.next_run_at > dt.datetime.now()
+        ):
+            # job was changed after it was found as due
+            return None
 
         try:
 
@@ -1,8 +1,10 @@
 import datetime as dt
-import queue
 import random
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+from dataclasses import dataclass
+from typing import Optional
 
 from mindsdb.interfaces.jobs.jobs_controller import JobsExecutor
 from mindsdb.interfaces.storage import db
@@ -13,109 +15,283 @@ from mindsdb.utilities.sentry import sentry_sdk  # noqa: F401
 logger = log.getLogger(__name__)
 
 
-def execute_async(q_in, q_out):
-
-    while True:
-        task = q_in.get()
+def execute_async(record_id, history_id):
+    executor = JobsExecutor()
+    try:
+        executor.execute_task_local(record_id, history_id)
+    except Exception as e:
+        logger.error(f"Job {record_id} failed: {e}")
+        db.session.rollback()
+    finally:
+        # session of the worker thread
+        db.session.remove()
 
-        if task["type"] != "task":
-            return
 
-        record_id = task["record_id"]
-        history_id = task["history_id"]
+@dataclass
+class RunningJob:
+    project_id: int
+    # empty while the job is locked and not submitted to the worker yet
+    history_id: Optional[int] = None
+    future: Optional[Future] = None
 
-        executor = JobsExecutor()
-        try:
-            executor.execute_task_local(record_id, history_id)
-        except (KeyboardInterrupt, SystemExit):
-            q_out.put(True)
-            raise
 
-        except Exception:
-            db.session.rollback()
-
-        q_out.put(True)
+@dataclass
+class DueJob:
+    id: int
+    project_id: int
+    name: str
 
 
 class Scheduler:
+    # how often to check changes in jobs table: creation or altering of the job wakes up the scheduler
+    WAKEUP_INTERVAL = 1
+    # how often to update updated_at of running jobs. Lock of job is considered as dead after 30 seconds without update
+    HEARTBEAT_INTERVAL = 3
+
     def __init__(self, config=None):
         self.config = config
 
-        self.q_in = queue.Queue()
-        self.q_out = queue.Queue()
-        self.work_thread = threading.Thread(
-            target=execute_async, args=(self.q_in, self.q_out), name='Scheduler.execute_async'
-        )
-        self.work_thread.start()
+        # jobs executed by this instance, by job id
+        self._running = {}
+        # due jobs found by the last check of timetable which are not started yet because of limits of workers
+        self._ready = []
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stop_event = threading.Event()
+        self._pool = None
+        self._last_heartbeat = 0
 
     def __del__(self):
         self.stop_thread()
 
     def stop_thread(self):
-        self.q_in.put({"type": "exit"})
+        self._stop_event.set()
+        self._wakeup.set()
+        if self._pool is not None:
+            # running jobs are finished in their threads
+            self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def _get_config(self, name, default):
+        return self.config.get("jobs", {}).get(name, default)
+
+    def _get_pool(self):
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self._get_config("max_workers", 4), thread_name_prefix='Scheduler.execute_async'
+            )
+        return self._pool
 
     def scheduler_monitor(self):
-        check_interval = self.config.get("jobs", {}).get("check_interval", 30)
+        check_interval = self._get_config("check_interval", 30)
+        exec_method = self._get_config("executor", "local")
 
-        while True:
+        executor = JobsExecutor()
+        marker = None
+        next_run_at = None
+        next_check = 0
+        next_marker_check = 0
 
-            logger.debug("Scheduler check timetable")
+        while not self._stop_event.is_set():
             try:
-                self.check_timetable()
+                if self._wakeup.is_set():
+                    self._wakeup.clear()
+                    # freed workers take due jobs which were found by the previous check
+                    self.start_ready_jobs(exec_method)
+
+                if time.monotonic() >= next_marker_check:
+                    next_marker_check = time.monotonic() + self.WAKEUP_INTERVAL
+
+                    # cheap query to the jobs table, to react on new jobs without waiting of the full check
+                    new_marker = executor.get_changes_marker()
+                    to_check = (
+                        new_marker != marker
+                        or time.monotonic() >= next_check
+                        or (next_run_at is not None and next_run_at <= dt.datetime.now())
+                    )
+
+                    # new due jobs can be started only by free workers: otherwise check is postponed
+                    if to_check and self._has_free_workers():
+                        marker = new_marker
+
+                        logger.debug("Scheduler check timetable")
+                        self.check_timetable(wait_finish=False)
+                        next_run_at = executor.get_next_run_at()
+
+                        # different instances should start in not the same time
+                        next_check = time.monotonic() + check_interval + random.randint(1, 10)
+
+                self.heartbeat()
+                # don't keep snapshot of the tables between checks
+                db.session.rollback()
             except (SystemExit, KeyboardInterrupt):
                 raise
             except Exception as e:
                 logger.error(e)
+                db.session.rollback()
+                next_marker_check = time.monotonic() + self.WAKEUP_INTERVAL
 
-            # different instances should start in not the same time
+            # woken up by finished job or by the next check of changes
+            self._wakeup.wait(max(next_marker_check - time.monotonic(), 0))
 
-            time.sleep(check_interval + random.randint(1, 10))
+    def check_timetable(self, wait_finish=True):
+        """
+        Start due jobs in the workers
 
-    def check_timetable(self):
+        :param wait_finish: wait until all started jobs are finished.
+            Jobs which were not started because of the limits of workers are started when workers are free
+        """
         executor = JobsExecutor()
 
-        exec_method = self.config.get("jobs", {}).get("executor", "local")
-
-        for record in executor.get_next_tasks():
-            logger.info(f"Job execute: {record.name}({record.id})")
-            self.execute_task(record.id, exec_method)
+        exec_method = self._get_config("executor", "local")
 
-        db.session.remove()
+        started = set()
+        while True:
+            # records can be expired after commit, keep only required fields
+            self._ready = [
+                DueJob(id=record.id, project_id=record.project_id, name=record.name)
+                for record in executor.get_next_tasks()
+                if record.id not in started
+            ]
+            db.session.remove()
 
-    def execute_task(self, record_id, exec_method):
+            started.update(self.start_ready_jobs(exec_method))
 
-        executor = JobsExecutor()
-        if exec_method == "local":
-            history_id = executor.lock_record(record_id)
-            if history_id is None:
-                # db.session.remove()
-                logger.info(f"Unable create history record for {record_id}, is locked?")
+            if not wait_finish:
                 return
 
-            # run in thread
-
-            self.q_in.put(
-                {
-                    "type": "task",
-                    "record_id": record_id,
-                    "history_id": history_id,
-                }
-            )
-
+            # new check is required only if freed workers can't be filled from the list of due jobs
             while True:
-                try:
-                    self.q_out.get(timeout=3)
+                with self._lock:
+                    futures = [job.future for job in self._running.values() if job.future is not None]
+                if len(futures) == 0:
+                    return
+
+                wait(futures, timeout=self.HEARTBEAT_INTERVAL, return_when=FIRST_COMPLETED)
+                self.heartbeat()
+                started.update(self.start_ready_jobs(exec_method))
+                if self._has_free_workers():
                     break
-                except queue.Empty:
-                    # update last date:
-                    history_record = db.JobsHistory.query.get(history_id)
-                    history_record.updated_at = dt.datetime.now()
-                    db.session.commit()
 
-        else:
+    def start_ready_jobs(self, exec_method) -> list:
+        """
+        Start due jobs found by the last check of timetable, while there are free workers
+
+        :param exec_method: executor of the job, only 'local' is supported
+        :return: ids of started jobs
+        """
+        started = []
+        for job in list(self._ready):
+            if not self._has_free_workers():
+                break
+            if not self._reserve_worker(job.id, job.project_id):
+                # limit of the project, job waits in the list
+                continue
+            # job is started or locked by another instance
+            self._ready.remove(job)
+            if self._start_task(job.id, exec_method):
+                logger.info(f"Job execute: {job.name}({job.id})")
+                started.append(job.id)
+        return started
+
+    def execute_task(self, record, exec_method) -> bool:
+        """
+        Lock the job and start it in worker
+
+        :param record: job record
+        :param exec_method: executor of the job, only 'local' is supported
+        :return: True if the job was started
+        """
+        # record can be expired after commit, callback can't use it
+        record_id, project_id = record.id, record.project_id
+
+        if not self._reserve_worker(record_id, project_id):
+            return False
+        return self._start_task(record_id, exec_method)
+
+    def _has_free_workers(self) -> bool:
+        with self._lock:
+            return len(self._running) < self._get_config("max_workers", 4)
+
+    def _reserve_worker(self, record_id, project_id) -> bool:
+        """
+        Take a worker for the job if limits allow it
+
+        :return: True if worker is reserved
+        """
+        max_workers = self._get_config("max_workers", 4)
+        max_project_workers = self._get_config("max_project_workers", 2)
+
+        with self._lock:
+            if record_id in self._running:
+                # is still executed by this instance
+                return False
+
+            if len(self._running) >= max_workers:
+                return False
+
+            project_jobs = [job for job in self._running.values() if job.project_id == project_id]
+            if len(project_jobs) >= max_project_workers:
+                return False
+
+            self._running[record_id] = RunningJob(project_id=project_id)
+        return True
+
+    def _start_task(self, record_id, exec_method) -> bool:
+        """
+        Lock the job and submit it to the reserved worker, worker is released if the job can't be locked
+
+        :return: True if the job was started
+        """
+        if exec_method != "local":
+            self._task_done(record_id)
             # TODO add microservice mode
             raise NotImplementedError()
 
+        # history record is the lock between instances of scheduler.
+        # it is a query to database, other threads are not blocked during it
+        history_id = JobsExecutor().lock_record(record_id)
+        if history_id is None:
+            logger.info(f"Unable create history record for {record_id}, is locked?")
+            self._task_done(record_id)
+            return False
+
+        try:
+            future = self._get_pool().submit(execute_async, record_id, history_id)
+        except Exception:
+            # pool is stopped
+            self._task_done(record_id)
+            raise
+        with self._lock:
+            job = self._running[record_id]
+            job.history_id, job.future = history_id, future
+
+        future.add_done_callback(lambda _: self._task_done(record_id))
+        return True
+
+    def _task_done(self, record_id):
+        with self._lock:
+            self._running.pop(record_id, None)
+        # free worker can take delayed jobs
+        self._wakeup.set()
+
+    def heartbeat(self):
+        """
+        Update updated_at of history records of the running jobs: it shows they are still executed
+        """
+        if time.monotonic() - self._last_heartbeat < self.HEARTBEAT_INTERVAL:
+            return
+        self._last_heartbeat = time.monotonic()
+
+        with self._lock:
+            history_ids = [job.history_id for job in self._running.values() if job.history_id is not None]
+        if len(history_ids) == 0:
+            return
+
+        db.session.query(db.JobsHistory).filter(
+            db.JobsHistory.id.in_(history_ids)
+        ).update({'updated_at': dt.datetime.now()}, synchronize_session=False)
+        db.session.commit()
+
     def start(self):
 
         config = Config()
@@ -110,6 +110,20 @@ class RunningQuery:
 
         db.session.commit()
 
+    def set_insert_progress(self, table_name: str, inserted_rows: int, total_rows: int):
+        """
+           Store progress of insert to the table, it is called after every inserted batch
+        """
+
+        self.record.context['insert'] = {
+            'table': table_name,
+            'inserted_rows': inserted_rows,
+            'total_rows': total_rows
+        }
+        flag_modified(self.record, 'context')
+
+        db.session.commit()
+
     def on_error(self, error: Exception, step_num: int, steps_data: dict):
         """
             Saves error of the query in database
@@ -6,6 +6,7 @@ from sqlalchemy.orm.attributes import flag_modified
 
 from mindsdb.interfaces.storage import db
 from mindsdb.interfaces.database.projects import ProjectController
+from mindsdb.interfaces.agents.executor_cache import agent_executor_cache
 from mindsdb.utilities.config import config
 
 
@@ -160,6 +161,7 @@ class SkillsController:
             flag_modified(existing_skill, 'params')
 
         db.session.commit()
+        agent_executor_cache.invalidate(skill_id=existing_skill.id)
 
         return existing_skill
 
@@ -182,3 +184,4 @@ class SkillsController:
             raise ValueError("Unable to delete demo object")
         skill.deleted_at = datetime.datetime.now()
         db.session.commit()
+        agent_executor_cache.invalidate(skill_id=skill.id)
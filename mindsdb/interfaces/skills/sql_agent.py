@@ -1,7 +1,9 @@
 
 import re
 import csv
+import time
 import inspect
+import threading
 from io import StringIO
 from typing import Iterable, List, Optional, Any
 
@@ -11,11 +13,19 @@ from mindsdb_sql_parser.ast import Select, Show, Describe, Explain, Identifier
 
 from mindsdb.utilities import log
 from mindsdb.utilities.context import context as ctx
+from mindsdb.utilities.context_executor import ContextThreadPoolExecutor
 from mindsdb.integrations.utilities.query_traversal import query_traversal
 from mindsdb.integrations.libs.response import INF_SCHEMA_COLUMNS_NAMES
 
 logger = log.getLogger(__name__)
 
+# how long description of a table is kept in cache, in seconds
+TABLE_INFO_CACHE_TTL = 3600
+# count of tables which are described at the same time
+TABLE_INFO_MAX_WORKERS = 16
+# count of tables of one integration which are described at the same time
+TABLE_INFO_MAX_WORKERS_PER_INTEGRATION = 4
+
 
 def list_to_csv_str(array: List[List[Any]]) -> str:
     """Convert a 2D array into a CSV string.
@@ -84,7 +94,8 @@ class SQLAgent:
             include_tables: Optional[List[str]] = None,
             ignore_tables: Optional[List[str]] = None,
             sample_rows_in_table_info: int = 3,
-            cache: Optional[dict] = None
+            cache: Optional[dict] = None,
+            table_info_ttl: int = TABLE_INFO_CACHE_TTL
     ):
         self._command_executor = command_executor
         self._mindsdb_db_struct = databases_struct
@@ -99,6 +110,7 @@ class SQLAgent:
             # include_tables takes priority if it's set.
             self._tables_to_ignore = ignore_tables or []
         self._cache = cache
+        self._table_info_ttl = table_info_ttl
 
     def _call_engine(self, query: str, database=None):
         # switch database
@@ -249,19 +261,91 @@ class SQLAgent:
         if table_names is not None:
             all_tables = self._resolve_table_names(table_names, all_tables)
 
-        tables_info = []
-        for table in all_tables:
-            key = f"{ctx.company_id}_{table}_info"
-            table_info = self._cache.get(key) if self._cache else None
+        # version of integration's metadata: description of the table is invalid if integration was changed
+        integrations_versions = {
+            integration: self._get_integration_version(integration)
+            for integration in set(table.parts[0] for table in all_tables)
+        }
+
+        tables_info = [None] * len(all_tables)
+        missed_tables = []
+        for i, table in enumerate(all_tables):
+            table_info = self._get_cached_table_info(table, integrations_versions[table.parts[0]])
             if table_info is None:
-                table_info = self._get_single_table_info(table)
-                if self._cache:
-                    self._cache.set(key, table_info)
+                missed_tables.append(i)
+            else:
+                tables_info[i] = table_info
 
-            tables_info.append(table_info)
+        if len(missed_tables) > 0:
+            fetched_info = self._fetch_table_info([all_tables[i] for i in missed_tables])
+            for i, table_info in zip(missed_tables, fetched_info):
+                tables_info[i] = table_info
+                table = all_tables[i]
+                self._set_cached_table_info(table, integrations_versions[table.parts[0]], table_info)
 
         return "\n\n".join(tables_info)
 
+    def _get_integration_version(self, integration: str) -> Optional[str]:
+        """Get time of the last update of the integration, None if it is not an integration (project, files)"""
+        try:
+            integration_data = self._command_executor.session.integration_controller.get(integration)
+        except Exception:
+            return None
+        if not isinstance(integration_data, dict):
+            return None
+        return str(integration_data.get('date_last_update'))
+
+    def _get_cached_table_info(self, table: Identifier, version: Optional[str]) -> Optional[str]:
+        if not self._cache:
+            return None
+        entry = self._cache.get(f"{ctx.company_id}_{table}_info")
+        if (
+            not isinstance(entry, dict)
+            or entry.get('version') != version
+            or entry.get('expires_at', 0) < time.time()
+        ):
+            return None
+        return entry.get('info')
+
+    def _set_cached_table_info(self, table: Identifier, version: Optional[str], table_info: str):
+        if not self._cache:
+            return
+        self._cache.set(f"{ctx.company_id}_{table}_info", {
+            'info': table_info,
+            'version': version,
+            'expires_at': time.time() + self._table_info_ttl
+        })
+
+    def _fetch_table_info(self, tables: List[Identifier]) -> List[str]:
+        """Describe tables concurrently, count of parallel requests to one integration is limited
+
+        Args:
+            tables (List[Identifier]): tables to describe
+
+        Returns:
+            List[str]: descriptions of the tables in the same order
+        """
+        if len(tables) == 1:
+            return [self._get_single_table_info(tables[0])]
+
+        integration_locks = {
+            table.parts[0]: threading.Semaphore(TABLE_INFO_MAX_WORKERS_PER_INTEGRATION)
+            for table in tables
+        }
+
+        def _get_table_info(table):
+            with integration_locks[table.parts[0]]:
+                return self._get_single_table_info(table)
+
+        max_workers = min(
+            TABLE_INFO_MAX_WORKERS,
+            len(tables),
+            len(integration_locks) * TABLE_INFO_MAX_WORKERS_PER_INTEGRATION
+        )
+        with ContextThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(_get_table_info, table) for table in tables]
+            return [future.result() for future in futures]
+
     def _get_single_table_info(self, table: Identifier) -> str:
         if len(table.parts) < 2:
             raise ValueError(f"Database is required for table: {table}")
@@ -266,6 +266,11 @@ class View(Base):
     project_id = Column(
         Integer, ForeignKey("project.id", name="fk_project_id"), nullable=False
     )
+    materialized = Column(Boolean, default=False)
+    refresh_key = Column(String, nullable=True)
+    refreshed_at = Column(DateTime, nullable=True)
+    # last value of refresh_key, count of rows, error of the last refresh
+    refresh_state = Column(JSON, nullable=True)
     __table_args__ = (
         UniqueConstraint("name", "company_id", name="unique_view_name_company_id"),
     )
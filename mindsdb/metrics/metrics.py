@@ -3,7 +3,7 @@ import functools
 import time
 import os
 
-from prometheus_client import Histogram, Summary
+from prometheus_client import Counter, Histogram, Summary
 
 
 INTEGRATION_HANDLER_QUERY_TIME = Summary(
@@ -18,6 +18,55 @@ INTEGRATION_HANDLER_RESPONSE_SIZE = Summary(
     ('integration', 'response_type')
 )
 
+INTEGRATION_JOIN_KEYS_STRATEGY = Counter(
+    'mindsdb_integration_join_keys_strategy_total',
+    'How join keys are sent to integration: IN-list, chunks of IN-list or temporary table',
+    ('integration', 'strategy')
+)
+
+INTEGRATION_JOIN_KEYS_COUNT = Summary(
+    'mindsdb_integration_join_keys_count',
+    'How many join keys are sent to integration, grouped by strategy',
+    ('integration', 'strategy')
+)
+
+INTEGRATION_RESULT_CACHE_REQUESTS = Counter(
+    'mindsdb_integration_result_cache_requests_total',
+    'How many select queries to integration are answered from result cache (hit) or sent to integration (miss)',
+    ('integration', 'result')
+)
+
+INTEGRATION_RESULT_CACHE_SAVED_BYTES = Counter(
+    'mindsdb_integration_result_cache_saved_bytes_total',
+    'Size of the results which are taken from result cache instead of integration',
+    ('integration',)
+)
+
+AGENT_EXECUTOR_SETUP_TIME = Summary(
+    'mindsdb_agent_executor_setup_seconds',
+    'How long it takes to prepare agent executor for completion: built from scratch (cold) or taken from cache (warm)',
+    ('path',)
+)
+
+# parts of the sampled queries, see mindsdb.utilities.profiler.Phase
+EXECUTOR_STEP_TIME = Histogram(
+    'mindsdb_executor_step_seconds',
+    'How long steps of the query plan take to execute, grouped by type of step',
+    ('step',)
+)
+
+INTEGRATION_HANDLER_CALL_TIME = Histogram(
+    'mindsdb_integration_handler_call_seconds',
+    'How long calls of integration handlers take, grouped by handler and method',
+    ('integration', 'method')
+)
+
+RESULT_SERIALIZATION_TIME = Histogram(
+    'mindsdb_result_serialization_seconds',
+    'How long it takes to encode and send the result of the query to the client, grouped by API and phase',
+    ('api', 'phase')
+)
+
 _REST_API_LATENCY = Histogram(
     'mindsdb_rest_api_latency_seconds',
     'How long REST API requests take to complete, grouped by method, endpoint, and status',
@@ -0,0 +1,33 @@
+"""materialized_views
+
+Revision ID: 9c1b7f3a2d5e
+Revises: fda503400e43
+Create Date: 2025-04-02 12:10:31.418207
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import mindsdb.interfaces.storage.db  # noqa
+
+
+# revision identifiers, used by Alembic.
+revision = '9c1b7f3a2d5e'
+down_revision = 'fda503400e43'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('view', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('materialized', sa.Boolean(), nullable=True))
+        batch_op.add_column(sa.Column('refresh_key', sa.String(), nullable=True))
+        batch_op.add_column(sa.Column('refreshed_at', sa.DateTime(), nullable=True))
+        batch_op.add_column(sa.Column('refresh_state', sa.JSON(), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('view', schema=None) as batch_op:
+        batch_op.drop_column('refresh_state')
+        batch_op.drop_column('refreshed_at')
+        batch_op.drop_column('refresh_key')
+        batch_op.drop_column('materialized')
@@ -226,6 +226,13 @@ class Config:
             "tasks": {
                 "disable": False
             },
+            "processes": {
+                "start_method": "spawn",    # MINDSDB_PROCESS_START_METHOD: 'spawn' or 'forkserver'
+                # modules which are imported once by forkserver and shared with API processes
+                "forkserver_preload": [
+                    "numpy", "pandas", "duckdb", "sqlalchemy", "pydantic", "flask", "mindsdb_sql_parser"
+                ]
+            },
             "default_project": "mindsdb"
         }
         # endregion
@@ -263,7 +270,8 @@ class Config:
             'auth': {},
             'paths': {},
             'permanent_storage': {},
-            'ml_task_queue': {}
+            'ml_task_queue': {},
+            'processes': {}
         }
 
         # region storage root path
@@ -359,6 +367,9 @@ class Config:
                 }
         # endregion
 
+        if os.environ.get('MINDSDB_PROCESS_START_METHOD', '') != '':
+            self._env_config['processes']['start_method'] = os.environ['MINDSDB_PROCESS_START_METHOD'].lower()
+
         if os.environ.get('MINDSDB_DB_CON', '') != '':
             self._env_config['storage_db'] = os.environ['MINDSDB_DB_CON']
 
@@ -505,6 +516,13 @@ class Config:
                 "Use 'MINDSDB_HTTP_SERVER_TYPE' instead."
             )
 
+        start_method = self['processes']['start_method']
+        if start_method not in ('spawn', 'forkserver'):
+            logger.warning(
+                f"The value '{start_method}' of 'processes.start_method' is not valid. "
+                "It must be one of the following: 'spawn' or 'forkserver'."
+            )
+
         for env_name in ('MINDSDB_HTTP_SERVER_TYPE', 'MINDSDB_DEFAULT_SERVER'):
             env_value = os.environ.get(env_name, '')
             if env_value.lower() not in ('waitress', 'flask', 'gunicorn', ''):
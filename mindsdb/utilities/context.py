@@ -22,6 +22,7 @@ class Context:
             'profiling': {
                 'level': 0,
                 'enabled': False,
+                'sampled': False,
                 'pointer': None,
                 'tree': None
             },
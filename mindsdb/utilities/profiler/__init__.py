@@ -2,6 +2,7 @@ from mindsdb.utilities.profiler.profiler import (
     start,
     stop,
     Context,
+    Phase,
     profile,
     enable,
     disable,
@@ -12,6 +13,7 @@ __all__ = [
     'start',
     'stop',
     'Context',
+    'Phase',
     'profile',
     'enable',
     'disable',
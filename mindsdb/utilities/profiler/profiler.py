@@ -1,11 +1,20 @@
+import os
 import time
+import random
 from datetime import datetime, timezone
 from functools import wraps
 
+from opentelemetry import trace
+
 import mindsdb.utilities.hooks as hooks
 from mindsdb.utilities.config import Config
 from mindsdb.utilities.context import context as ctx
 
+# fraction of queries which parts are measured by Phase, from 0 to 1
+PROFILING_SAMPLE_RATE = float(os.getenv('MINDSDB_PROFILING_SAMPLE_RATE', 0))
+
+_tracer = trace.get_tracer(__name__)
+
 
 def _get_current_node(profiling: dict) -> dict:
     """ return the node that the pointer points to
@@ -103,10 +112,23 @@ def profiling_enabled():
         return False
 
 
+def sampled() -> bool:
+    """ is current query chosen to be measured by Phase
+    """
+    try:
+        return ctx.profiling.get('sampled', False) is True
+    except AttributeError:
+        return False
+
+
 def start(tag):
     """ add new node to profiling data
     """
     ctx.profiling['level'] += 1
+    if ctx.profiling['level'] == 1:
+        # root node: the query is started. The flag is kept till the next query, so sending of
+        # the result after the root node is closed is also measured
+        ctx.profiling['sampled'] = PROFILING_SAMPLE_RATE > 0 and random.random() < PROFILING_SAMPLE_RATE
     if profiling_enabled() is True:
         start_node(tag)
 
@@ -130,6 +152,39 @@ class Context:
         stop()
 
 
+class Phase:
+    """ Measure part of the sampled query: duration is observed by the histogram
+        and the part is sent as OTEL span (if tracing is enabled).
+        In not sampled queries it only checks the flag.
+
+        Args:
+            histogram (prometheus_client.Histogram): histogram with labels
+            *labels (str): values of the labels, joined they are the name of span
+    """
+    __slots__ = ('histogram', 'labels', 'start_at', 'span')
+
+    def __init__(self, histogram, *labels: str):
+        self.histogram = histogram
+        self.labels = labels
+        self.start_at = None
+        self.span = None
+
+    def __enter__(self):
+        if sampled():
+            self.span = _tracer.start_as_current_span(': '.join(self.labels))
+            self.span.__enter__()
+            self.start_at = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self.start_at is None:
+            return
+        self.histogram.labels(*self.labels).observe(time.perf_counter() - self.start_at)
+        self.span.__exit__(exc_type, exc_value, traceback)
+        self.start_at = None
+        self.span = None
+
+
 def profile(tag: str = None):
     def decorator(function):
         @wraps(function)
@@ -0,0 +1,158 @@
+import io
+import csv
+import json
+import time
+import datetime as dt
+from http import HTTPStatus
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import psutil
+import pyarrow as pa
+import pytest
+
+from mindsdb.api.executor.data_types.response_type import RESPONSE_TYPE
+from mindsdb.api.executor.sql_query.result_set import ResultSet
+from mindsdb.api.mysql.mysql_proxy.mysql_proxy import SQLAnswer
+
+
+def make_df(rows_count):
+    return pd.DataFrame({
+        'id': np.arange(rows_count),
+        'value': [i / 4 if i % 3 else None for i in range(rows_count)],
+        'name': [f'name {i}' if i % 5 else None for i in range(rows_count)],
+        'created_at': pd.date_range('2020-01-01', periods=rows_count, freq='s'),
+    })
+
+
+@pytest.fixture
+def query_result():
+    """Replaces execution of the query with the result from the dataframe"""
+    def set_result(df):
+        result = ResultSet().from_df(df)
+        answer = SQLAnswer(
+            resp_type=RESPONSE_TYPE.TABLE,
+            columns=[{'name': name, 'alias': name} for name in result.get_column_names()],
+            data=result
+        )
+        mock.side_effect = lambda query: answer
+
+    with patch('mindsdb.api.mysql.mysql_proxy.classes.fake_mysql_proxy.FakeMysqlProxy.process_query') as mock:
+        yield set_result
+
+
+def post_query(client, accept=None, **kwargs):
+    headers = {} if accept is None else {'Accept': accept}
+    return client.post('/api/sql/query', json={'query': 'select * from tbl'}, headers=headers, **kwargs)
+
+
+def test_json_format(client, query_result):
+    query_result(make_df(5))
+
+    for accept in (None, '*/*', 'application/json, text/plain, */*'):
+        response = post_query(client, accept)
+        assert response.status_code == HTTPStatus.OK
+        assert response.content_type == 'application/json'
+        data = response.get_json()
+        assert data['type'] == 'table'
+        assert data['column_names'] == ['id', 'value', 'name', 'created_at']
+        assert data['data'][1] == [1, 0.25, 'name 1', '2020-01-01 00:00:01.000000']
+        assert data['data'][0][1:3] == [None, None]
+
+
+def test_not_table_result(client):
+    # errors and ok responses are json in any format
+    response = post_query(client, 'text/csv')
+    assert response.content_type == 'application/json'
+    assert response.get_json()['type'] == 'error'
+
+    response = client.post('/api/sql/query', json={'query': 'set autocommit=1'}, headers={'Accept': 'text/csv'})
+    assert response.content_type == 'application/json'
+    assert response.get_json()['type'] == 'ok'
+
+
+def test_ndjson_format(client, query_result):
+    query_result(make_df(5))
+
+    response = post_query(client, 'application/x-ndjson')
+    assert response.status_code == HTTPStatus.OK
+    assert response.content_type == 'application/x-ndjson'
+    lines = [json.loads(line) for line in response.data.decode().splitlines()]
+    assert lines[0]['type'] == 'table'
+    assert lines[0]['column_names'] == ['id', 'value', 'name', 'created_at']
+    assert 'context' in lines[0]
+    assert len(lines) == 6
+    assert lines[2] == [1, 0.25, 'name 1', '2020-01-01 00:00:01.000000']
+    assert lines[1][1:3] == [None, None]
+
+
+def test_csv_format(client, query_result):
+    query_result(make_df(5))
+
+    response = post_query(client, 'text/csv')
+    assert response.status_code == HTTPStatus.OK
+    assert response.content_type.startswith('text/csv')
+    assert 'db' in json.loads(response.headers['X-MindsDB-Context'])
+    rows = list(csv.reader(io.StringIO(response.data.decode())))
+    assert rows[0] == ['id', 'value', 'name', 'created_at']
+    assert len(rows) == 6
+    assert rows[2] == ['1', '0.25', 'name 1', '2020-01-01 00:00:01.000000']
+    assert rows[1][1:3] == ['', '']
+
+
+def test_arrow_format(client, query_result):
+    df = make_df(25000)
+    df['obj'] = [[i] if i % 2 else dt.date(2020, 1, 1) for i in range(len(df))]
+    query_result(df)
+
+    response = post_query(client, 'application/vnd.apache.arrow.stream')
+    assert response.status_code == HTTPStatus.OK
+    assert response.content_type == 'application/vnd.apache.arrow.stream'
+
+    table = pa.ipc.open_stream(response.data).read_all()
+    assert table.num_rows == 25000
+    assert table.column_names == ['id', 'value', 'name', 'created_at', 'obj']
+    assert table.schema.field('id').type == pa.int64()
+    assert table.schema.field('created_at').type == pa.timestamp('ns')
+    result = table.to_pandas()
+    assert result['value'][0] is None or np.isnan(result['value'][0])
+    assert result['name'][1] == 'name 1'
+    assert result['obj'][0] == '2020-01-01'
+    assert result['obj'][1] == '[1]'
+
+
+def test_big_result(client, query_result):
+    rows_count = 1_000_000
+    df = make_df(rows_count)
+    query_result(df)
+
+    # memory is measured by rss: tracemalloc makes encoding too slow
+    process = psutil.Process()
+    start_rss = process.memory_info().rss
+    peak_rss = start_rss
+
+    start = time.time()
+    response = post_query(client, 'application/x-ndjson', buffered=False)
+    try:
+        chunks = iter(response.response)
+        header = json.loads(next(chunks))
+        first_rows = next(chunks)
+        time_to_first_rows = time.time() - start
+
+        count = first_rows.count(b'\n')
+        size = len(first_rows)
+        for chunk in chunks:
+            count += chunk.count(b'\n')
+            size += len(chunk)
+            peak_rss = max(peak_rss, process.memory_info().rss)
+    finally:
+        response.close()
+    total_time = time.time() - start
+
+    assert header['column_names'] == ['id', 'value', 'name', 'created_at']
+    assert count == rows_count
+    # the first rows are sent before the whole result is encoded
+    assert time_to_first_rows < total_time / 10
+    # the encoded result isn't held in memory
+    assert peak_rss - start_rss < size / 2
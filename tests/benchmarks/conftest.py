@@ -0,0 +1,102 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+try:
+    import pytest_benchmark  # noqa: F401
+except ImportError:
+    # suite requires pytest-benchmark, see requirements-test.txt
+    collect_ignore_glob = ['test_*.py']
+
+BENCHMARKS_STORAGE = Path(__file__).parent / '.benchmarks'
+DEFAULT_DATA_ROWS = 10000
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        '--data-rows', type=int, default=DEFAULT_DATA_ROWS,
+        help=f'Count of rows in generated tables of benchmarks, default: {DEFAULT_DATA_ROWS}'
+    )
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    # baselines are stored near the suite, not in current dir
+    if getattr(config.option, 'benchmark_storage', None) == 'file://./.benchmarks':
+        config.option.benchmark_storage = f'file://{BENCHMARKS_STORAGE}'
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_terminal_summary(terminalreporter, config):
+    """Change of median of every benchmark against the baseline in percent"""
+    session = getattr(config, '_benchmarksession', None)
+    if session is None or not session.compared_mapping:
+        return
+
+    baseline = {}
+    for compared in session.compared_mapping.values():
+        baseline.update(compared)
+
+    changes = []
+    for bench in session.benchmarks:
+        if not bench or bench.fullname not in baseline:
+            continue
+        before = baseline[bench.fullname]['stats']['median']
+        changes.append(((bench.stats.median / before - 1) * 100, bench.name))
+
+    if not changes:
+        return
+    terminalreporter.section('change of median against baseline')
+    for change, name in sorted(changes, reverse=True):
+        terminalreporter.write_line(f'{change:+8.1f} %   {name}')
+
+
+@pytest.fixture(scope='session')
+def data_rows(request):
+    return request.config.getoption('--data-rows')
+
+
+def make_orders(rows_count: int) -> pd.DataFrame:
+    """Orders of customers, generated with fixed seed: every run measures the same data"""
+    rng = np.random.default_rng(42)
+    customers_count = max(rows_count // 10, 1)
+    return pd.DataFrame({
+        'id': np.arange(rows_count),
+        'customer_id': rng.integers(0, customers_count, rows_count),
+        'amount': rng.random(rows_count).round(2) * 1000,
+        'status': rng.choice(['new', 'paid', 'shipped', 'delivered', 'canceled'], rows_count),
+        'created_at': pd.Timestamp('2024-01-01') + pd.to_timedelta(rng.integers(0, 365 * 24, rows_count), unit='h'),
+    })
+
+
+def make_customers(rows_count: int) -> pd.DataFrame:
+    rng = np.random.default_rng(43)
+    customers_count = max(rows_count // 10, 1)
+    return pd.DataFrame({
+        'id': np.arange(customers_count),
+        'name': [f'customer {i}' for i in range(customers_count)],
+        'country': rng.choice(['US', 'DE', 'FR', 'JP', 'BR', 'IN'], customers_count),
+    })
+
+
+@pytest.fixture(scope='session')
+def orders_data(data_rows):
+    return make_orders(data_rows)
+
+
+@pytest.fixture(scope='session')
+def customers_data(data_rows):
+    return make_customers(data_rows)
+
+
+@pytest.fixture
+def orders_df(orders_data):
+    # result set renames columns of the dataframe in place: every test gets its own copy
+    return orders_data.copy()
+
+
+@pytest.fixture
+def customers_df(customers_data):
+    return customers_data.copy()
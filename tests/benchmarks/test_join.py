@@ -0,0 +1,41 @@
+"""
+Join of the fetched tables in duckdb, without integrations
+"""
+from types import SimpleNamespace
+
+import pytest
+from mindsdb_sql_parser import parse_sql
+from mindsdb_sql_parser.ast import Identifier, Join
+
+from mindsdb.api.executor.planner.steps import JoinStep
+from mindsdb.api.executor.planner.step_result import Result
+from mindsdb.api.executor.sql_query.result_set import ResultSet
+from mindsdb.api.executor.sql_query.steps.join_step import JoinStepCall
+
+CONDITIONS = {
+    'keys': 'o.customer_id = c.id',
+    'keys_and_filter': "o.customer_id = c.id and c.country = 'US'",
+    'expression': 'o.customer_id = c.id and o.amount > c.id',
+}
+
+
+def make_sql_query(orders_df, customers_df):
+    steps_data = {
+        0: ResultSet().from_df(orders_df, database='files', table_name='orders', table_alias='o'),
+        1: ResultSet().from_df(customers_df, database='pg', table_name='customers', table_alias='c'),
+    }
+    return SimpleNamespace(steps_data=steps_data, context={}, session=None)
+
+
+@pytest.mark.parametrize('join_type', ['join', 'left join'])
+@pytest.mark.parametrize('condition', list(CONDITIONS))
+def test_join(benchmark, orders_df, customers_df, join_type, condition):
+    sql_query = make_sql_query(orders_df, customers_df)
+    join = Join(
+        left=Identifier('o'), right=Identifier('c'), join_type=join_type,
+        condition=parse_sql(f'select * from x where {CONDITIONS[condition]}').where
+    )
+    step = JoinStep(left=Result(0), right=Result(1), query=join)
+
+    result = benchmark(lambda: JoinStepCall(sql_query).call(step))
+    assert len(result) > 0
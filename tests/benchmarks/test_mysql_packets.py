@@ -0,0 +1,45 @@
+"""
+Encoding of the result to packets of mysql text protocol
+"""
+import pytest
+
+from tests.unit.executor_test_base import BaseUnitTest
+
+
+class SocketSink:
+    """Socket which counts sent bytes"""
+
+    def __init__(self):
+        self.sent = 0
+
+    def sendall(self, data):
+        self.sent += len(data)
+
+
+class TestMysqlPackets(BaseUnitTest):
+
+    # small results are encoded row by row, big ones by columns of dataframe
+    @pytest.mark.parametrize('rows', [1000, None], ids=['rows', 'dataframe'])
+    @pytest.mark.parametrize('deprecate_eof', [True, False], ids=['ok', 'eof'])
+    def test_send_query_answer(self, benchmark, orders_df, rows, deprecate_eof):
+        from mindsdb.api.executor.data_types.response_type import RESPONSE_TYPE
+        from mindsdb.api.executor.sql_query.result_set import ResultSet
+        from mindsdb.api.mysql.mysql_proxy.classes.client_capabilities import ClentCapabilities
+        from mindsdb.api.mysql.mysql_proxy.classes.fake_mysql_proxy import FakeMysqlProxy
+        from mindsdb.api.mysql.mysql_proxy.libs.constants.mysql import CAPABILITIES
+        from mindsdb.api.mysql.mysql_proxy.mysql_proxy import SQLAnswer
+
+        proxy = FakeMysqlProxy()
+        proxy.socket = SocketSink()
+        proxy.client_capabilities = ClentCapabilities(CAPABILITIES.CLIENT_DEPRECATE_EOF if deprecate_eof else 0)
+
+        df = orders_df if rows is None else orders_df[:rows]
+        data = ResultSet().from_df(df, database='files', table_name='orders')
+        answer = SQLAnswer(
+            resp_type=RESPONSE_TYPE.TABLE,
+            columns=proxy.to_mysql_columns(data.columns),
+            data=data,
+        )
+
+        benchmark(proxy.send_query_answer, answer)
+        assert proxy.socket.sent > 0
@@ -0,0 +1,88 @@
+import copy
+
+import pytest
+from mindsdb_sql_parser import parse_sql
+
+from mindsdb.api.executor.planner import plan_query
+
+PREDICTOR_METADATA = {
+    'pred': {'timeseries': False},
+    'ts_pred': {
+        'timeseries': True,
+        'order_by_column': 'created_at',
+        'group_by_columns': ['status'],
+        'window': 10,
+        'horizon': 3,
+    },
+}
+
+QUERIES = {
+    'select': '''
+        select id, amount from pg.orders
+        where amount > 100 and status in ('new', 'paid')
+        order by created_at desc
+        limit 100
+    ''',
+    'join': '''
+        select o.id, o.amount, c.name from pg.orders o
+        join files.customers c on o.customer_id = c.id
+        where o.amount > 100 and c.country = 'US'
+    ''',
+    'join_3_tables': '''
+        select * from pg.orders o
+        join files.customers c on o.customer_id = c.id
+        left join pg.orders o2 on o2.customer_id = c.id and o2.id != o.id
+        where o.status = 'paid'
+    ''',
+    'nested_select': '''
+        select country, count(*) cnt from (
+            select c.country, o.amount from pg.orders o
+            join files.customers c on o.customer_id = c.id
+        ) t
+        group by country
+        having count(*) > 10
+    ''',
+    'union': '''
+        select id, status from pg.orders
+        union all
+        select id, country from files.customers
+    ''',
+    'predictor': '''
+        select o.id, m.predicted from pg.orders o
+        join mindsdb.pred m
+        where o.amount > 100
+    ''',
+    'timeseries_predictor': '''
+        select * from pg.orders o
+        join mindsdb.ts_pred m
+        where o.created_at > latest and o.status = 'paid'
+    ''',
+    'insert_from_select': '''
+        insert into pg.orders_copy (
+            select o.* from pg.orders o
+            join files.customers c on o.customer_id = c.id
+        )
+    ''',
+}
+
+
+@pytest.mark.parametrize('name', list(QUERIES))
+def test_plan_query(benchmark, name):
+    query = parse_sql(QUERIES[name])
+
+    def setup():
+        # planner changes the query
+        args = (copy.deepcopy(query),)
+        kwargs = {
+            'integrations': ['pg', 'files'],
+            'predictor_metadata': copy.deepcopy(PREDICTOR_METADATA),
+        }
+        return args, kwargs
+
+    plan = benchmark.pedantic(plan_query, setup=setup, rounds=200)
+    assert len(plan.steps) > 0
+
+
+@pytest.mark.parametrize('name', list(QUERIES))
+def test_parse_query(benchmark, name):
+    benchmark(parse_sql, QUERIES[name])
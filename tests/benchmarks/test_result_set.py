@@ -0,0 +1,47 @@
+from mindsdb.api.executor.sql_query.result_set import ResultSet
+
+
+def make_result_set(df):
+    return ResultSet().from_df(df, database='files', table_name='orders', table_alias='o')
+
+
+def test_from_df(benchmark, orders_df):
+    # columns of dataframe are renamed in place, every round gets a fresh copy
+    benchmark.pedantic(make_result_set, setup=lambda: ((orders_df.copy(),), {}), rounds=100)
+
+
+def test_to_df(benchmark, orders_df):
+    result_set = make_result_set(orders_df)
+    df = benchmark(result_set.to_df)
+    assert len(df) == len(orders_df)
+
+
+def test_to_lists(benchmark, orders_df):
+    result_set = make_result_set(orders_df)
+    rows = benchmark(result_set.to_lists)
+    assert len(rows) == len(orders_df)
+
+
+def test_to_df_cols(benchmark, orders_df):
+    result_set = make_result_set(orders_df)
+    benchmark(result_set.to_df_cols)
+
+
+def test_from_df_cols(benchmark, orders_df):
+    df, col_names = make_result_set(orders_df).to_df_cols()
+    benchmark.pedantic(
+        lambda df, col_names: ResultSet().from_df_cols(df, col_names),
+        setup=lambda: ((df.copy(), col_names), {}),
+        rounds=100
+    )
+
+
+def test_find_columns(benchmark, orders_df):
+    result_set = make_result_set(orders_df)
+    names = result_set.get_column_names()
+
+    def find():
+        for name in names:
+            result_set.get_col_index(result_set.find_columns(name, 'o')[0])
+
+    benchmark(find)
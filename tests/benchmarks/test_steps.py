@@ -0,0 +1,212 @@
+"""
+Every step of the query plan executed by mindsdb/api/executor/sql_query/steps, measured by query which produces it.
+
+Data sources are local: the files integration and mocked postgres integration which executes queries with duckdb
+(see BaseExecutorTest.set_handler). Models use dummy_ml engine.
+"""
+from unittest.mock import patch
+
+import pytest
+from mindsdb_sql_parser import parse_sql
+from mindsdb_sql_parser.ast import Select, Star, Identifier, BinaryOperation, Constant, Data
+
+from tests.unit.executor_test_base import BaseExecutorDummyML
+
+# count of rounds of the queries which change the data, the data is restored before every round
+CHANGING_QUERY_ROUNDS = 5
+
+STEP_QUERIES = {
+    'FetchDataframeStep': '''
+        select * from files.orders where amount > 500
+    ''',
+    'FetchDataframeStepPartition': '''
+        select * from pg.orders o
+        join mindsdb.pred m
+        using batch_size = 1000, track_column = id
+    ''',
+    'JoinStep': '''
+        select * from files.orders o
+        join pg.customers c on o.customer_id = c.id
+    ''',
+    'ProjectStep': '''
+        select amount, predicted from mindsdb.pred where amount = 100 and status = 'new'
+    ''',
+    'LimitOffsetStep': '''
+        select * from files.orders o
+        join mindsdb.ts_pred m
+        where o.status = 'paid'
+        limit 100
+    ''',
+    'SubSelectStep': '''
+        select c.country, count(*) orders, sum(o.amount) amount from files.orders o
+        join pg.customers c on o.customer_id = c.id
+        group by c.country
+        order by amount desc
+    ''',
+    'QueryStep': '''
+        select * from files.orders o
+        join pg.customers c on o.customer_id = c.id
+        where o.amount > c.id
+    ''',
+    'UnionStep': '''
+        select id, status from files.orders
+        union all
+        select id, country from pg.customers
+    ''',
+    'ApplyPredictorStep': '''
+        select * from files.orders o
+        join mindsdb.pred m
+    ''',
+    'ApplyPredictorRowStep': '''
+        select * from mindsdb.pred where amount = 100 and status = 'new'
+    ''',
+    'ApplyTimeseriesPredictorStep': '''
+        select * from files.orders o
+        join mindsdb.ts_pred m
+        where o.status = 'paid'
+    ''',
+    'MapReduceStep': '''
+        select * from files.orders o
+        join mindsdb.pred m
+        using partition_size = 1000
+    ''',
+    'MultipleSteps': '''
+        select * from files.orders o
+        join mindsdb.ts_pred_nogroup m
+        where o.created_at > '2024-12-01'
+    ''',
+    'InsertToTable': '''
+        insert into files.orders_copy (select * from files.orders where amount > 500)
+    ''',
+    'SaveToTable': '''
+        create or replace table files.orders_copy (select * from files.orders where amount > 500)
+    ''',
+    'CreateTableStep': '''
+        create or replace table files.orders_new (id int, amount float)
+    ''',
+    'UpdateToTable': '''
+        update pg.customers set name = s.name
+        from (select customer_id, status as name from files.orders where amount > 995) as s
+        where id = s.customer_id
+    ''',
+    'DeleteStep': '''
+        delete from pg.customers
+        where id in (select customer_id from files.orders where amount > 900)
+    ''',
+}
+
+# steps of preparation of statement, they are called directly
+PREPARE_STEPS = {
+    'GetTableColumns': {'namespace': 'files', 'table': 'orders'},
+    'GetPredictorColumns': {'namespace': 'mindsdb', 'predictor': Identifier('pred')},
+}
+
+
+class TestSteps(BaseExecutorDummyML):
+
+    def set_data(self, data_handler, orders_df, customers_df):
+        self.save_file('orders', orders_df)
+        self.save_file('orders_copy', orders_df[:0])
+        self.set_handler(data_handler, name='pg', tables={'orders': orders_df, 'customers': customers_df})
+
+        self.run_sql('''
+            create model mindsdb.pred
+            from files (select * from orders)
+            predict amount
+            using engine = 'dummy_ml', join_learn_process = true
+        ''')
+        self.run_sql('''
+            create model mindsdb.ts_pred
+            from files (select * from orders)
+            predict amount
+            order by created_at
+            group by status
+            window 10 horizon 3
+            using engine = 'dummy_ml', join_learn_process = true
+        ''')
+        # dummy_ml returns the target: predicted time is required to filter the forecast by time
+        self.run_sql('''
+            create model mindsdb.ts_pred_nogroup
+            from files (select * from orders)
+            predict created_at
+            order by created_at
+            window 10 horizon 3
+            using engine = 'dummy_ml', output = '2024-12-15', join_learn_process = true
+        ''')
+
+    def get_executed_steps(self, fnc) -> list:
+        from mindsdb.api.executor.sql_query import SQLQuery
+
+        executed = []
+        execute_step = SQLQuery.execute_step
+
+        def execute_step_f(sql_query, step, *args, **kwargs):
+            executed.append(step.__class__.__name__)
+            return execute_step(sql_query, step, *args, **kwargs)
+
+        with patch.object(SQLQuery, 'execute_step', execute_step_f):
+            fnc()
+        return executed
+
+    def execute(self, query):
+        if isinstance(query, str):
+            query = parse_sql(query)
+        ret = self.command_executor.execute_command(query)
+        assert ret.error_code is None
+        return ret
+
+    def test_all_steps_measured(self):
+        from mindsdb.api.executor.sql_query import SQLQuery
+
+        SQLQuery.register_steps()
+        measured = set(STEP_QUERIES) | set(PREPARE_STEPS) | {'DataStep'}
+        assert set(SQLQuery.step_handlers) == measured
+
+    @pytest.mark.parametrize('step_name', list(STEP_QUERIES))
+    @patch('mindsdb.integrations.handlers.postgres_handler.Handler')
+    def test_step(self, data_handler, step_name, benchmark, orders_df, customers_df):
+        self.set_data(data_handler, orders_df, customers_df)
+        sql = STEP_QUERIES[step_name]
+
+        executed = self.get_executed_steps(lambda: self.execute(sql))
+        assert step_name in executed, f'{step_name} is not in the plan: {executed}'
+
+        if step_name in ('InsertToTable', 'SaveToTable'):
+            # restore table changed by the query
+            def setup():
+                self.file_controller.delete_file('orders_copy')
+                self.save_file('orders_copy', orders_df[:0])
+
+            benchmark.pedantic(self.execute, args=(sql,), setup=setup, rounds=CHANGING_QUERY_ROUNDS)
+        else:
+            # the tables of mocked integration are recreated on every query
+            benchmark(self.execute, sql)
+
+    @pytest.mark.parametrize('step_name', list(PREPARE_STEPS))
+    @patch('mindsdb.integrations.handlers.postgres_handler.Handler')
+    def test_prepare_step(self, data_handler, step_name, benchmark, orders_df, customers_df):
+        from mindsdb.api.executor.planner import steps
+        from mindsdb.api.executor.sql_query import SQLQuery
+
+        self.set_data(data_handler, orders_df, customers_df)
+        sql_query = SQLQuery(parse_sql('select 1'), session=self.command_executor.session, execute=False)
+        step_class = getattr(steps, step_name)
+
+        result = benchmark(lambda: sql_query.execute_step(step_class(**PREPARE_STEPS[step_name])))
+        assert len(result.columns) > 0
+
+    def test_data_step(self, benchmark, orders_df):
+        # rows are injected into the query by triggers
+        records = orders_df.to_dict('records')
+
+        def query():
+            return Select(
+                targets=[Star()],
+                from_table=Data(records, alias=Identifier('t')),
+                where=BinaryOperation('>', args=[Identifier('t.amount'), Constant(500)])
+            )
+
+        executed = self.get_executed_steps(lambda: self.execute(query()))
+        assert 'DataStep' in executed
+
+        benchmark.pedantic(self.execute, setup=lambda: ((query(),), {}), rounds=CHANGING_QUERY_ROUNDS * 4)
@@ -0,0 +1,76 @@
+import datetime
+from unittest.mock import patch
+
+import pandas as pd
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+from mindsdb.interfaces.storage import db
+from mindsdb.interfaces.agents import langchain_agent
+from mindsdb.interfaces.agents.langchain_agent import LangchainAgent
+from mindsdb.interfaces.agents.executor_cache import agent_executor_cache, AgentExecutorCache
+
+
+def make_agent():
+    agent = db.Agents()
+    agent.id = 1
+    agent.name = 'my_agent'
+    agent.model_name = 'gpt-4o'
+    agent.provider = 'openai'
+    agent.params = {'prompt_template': 'Answer the user input in a helpful way'}
+    agent.updated_at = datetime.datetime(2024, 1, 1)
+    return agent
+
+
+@patch.object(langchain_agent, 'create_chat_model')
+def test_warm_agent_executor(mock_create_chat_model):
+    mock_create_chat_model.side_effect = lambda args: FakeListChatModel(responses=['hi'])
+    agent_executor_cache.clear()
+    agent = make_agent()
+
+    messages = pd.DataFrame([
+        {'question': 'first', 'answer': 'answer'},
+        {'question': 'second', 'answer': None},
+    ])
+
+    lang_agent = LangchainAgent(agent)
+    executor1 = lang_agent.create_agent(messages, lang_agent.args)
+    assert mock_create_chat_model.call_count == 1
+
+    # the same agent: executor is taken from cache, memory is new
+    lang_agent = LangchainAgent(agent)
+    executor2 = lang_agent.create_agent(messages[1:], lang_agent.args)
+    assert mock_create_chat_model.call_count == 1
+    assert executor2.agent is executor1.agent
+    assert executor2.memory is not executor1.memory
+    assert len(executor1.memory.chat_memory.messages) == 3
+    assert len(executor2.memory.chat_memory.messages) == 1
+
+    # agent is changed
+    agent.updated_at = datetime.datetime(2024, 1, 2)
+    lang_agent = LangchainAgent(agent)
+    lang_agent.create_agent(messages, lang_agent.args)
+    assert mock_create_chat_model.call_count == 2
+
+    # cache is invalidated
+    agent_executor_cache.invalidate(agent_id=agent.id)
+    lang_agent = LangchainAgent(agent)
+    lang_agent.create_agent(messages, lang_agent.args)
+    assert mock_create_chat_model.call_count == 3
+
+
+def test_agent_executor_cache_lru():
+    cache = AgentExecutorCache(max_size=2)
+    cache.set('a', 1, agent_id=1, skill_ids=[10])
+    cache.set('b', 2, agent_id=2, skill_ids=[10, 20])
+    assert cache.get('a') == 1
+
+    # 'b' is least recently used
+    cache.set('c', 3, agent_id=3, skill_ids=[])
+    assert cache.get('b') is None
+    assert len(cache) == 2
+
+    cache.set('b', 2, agent_id=2, skill_ids=[10, 20])
+    cache.invalidate(skill_id=10)
+    assert cache.get('a') is None
+    assert cache.get('b') is None
+    assert cache.get('c') == 3
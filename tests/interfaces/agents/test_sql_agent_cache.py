@@ -1,28 +1,124 @@
+import time
+import threading
+
 import pytest
 from unittest.mock import MagicMock, patch
 
+from mindsdb.interfaces.skills import sql_agent as sql_agent_module
 from mindsdb.interfaces.skills.sql_agent import SQLAgent
+from mindsdb.utilities.context import context as ctx
+
+
+class DictCache:
+    def __init__(self):
+        self.data = {}
+
+    def get(self, name):
+        return self.data.get(name)
+
+    def set(self, name, value):
+        self.data[name] = value
+
+
+TABLES = ['db1.table1', 'db1.table2', 'db2.table3']
 
 
 @pytest.fixture
 def sql_agent_setup():
     command_executor = MagicMock()
-    cache_mock = MagicMock()
-    sql_agent = SQLAgent(command_executor=command_executor, database='test_db', cache=cache_mock)
-    return sql_agent, cache_mock
+    versions = {'db1': 'v1', 'db2': 'v1'}
+    command_executor.session.integration_controller.get.side_effect = lambda name: {'date_last_update': versions[name]}
+    cache = DictCache()
+    sql_agent = SQLAgent(
+        command_executor=command_executor,
+        databases=['db1', 'db2'],
+        databases_struct={},
+        include_tables=TABLES,
+        cache=cache
+    )
+    return sql_agent, cache, versions
+
+
+def get_single_table_info(self, table):
+    return f'info of {table}'
 
 
 def test_get_table_info_cache_miss(sql_agent_setup):
-    sql_agent, cache_mock = sql_agent_setup
-    cache_mock.get.return_value = None
-    with patch.object(SQLAgent, '_fetch_table_info') as mock_fetch_table_info:
-        sql_agent.get_table_info(['test_table'])
+    sql_agent, cache, _ = sql_agent_setup
+    with patch.object(SQLAgent, '_fetch_table_info', return_value=['table_info']) as mock_fetch_table_info:
+        assert sql_agent.get_table_info(['db1.table1']) == 'table_info'
         mock_fetch_table_info.assert_called_once()
 
 
 def test_get_table_info_cache_hit(sql_agent_setup):
-    sql_agent, cache_mock = sql_agent_setup
-    cache_mock.get.return_value = {'test_table': 'table_info'}
+    sql_agent, cache, _ = sql_agent_setup
+    with patch.object(SQLAgent, '_get_single_table_info', get_single_table_info):
+        sql_agent.get_table_info(['db1.table1'])
+
     with patch.object(SQLAgent, '_fetch_table_info') as mock_fetch_table_info:
-        sql_agent.get_table_info(['test_table'])
+        assert sql_agent.get_table_info(['db1.table1']) == 'info of db1.table1'
         assert not mock_fetch_table_info.called
+
+
+def test_get_table_info_invalidation(sql_agent_setup):
+    sql_agent, cache, versions = sql_agent_setup
+
+    fetched = []
+
+    def _get_single_table_info(self, table):
+        fetched.append(str(table))
+        return f'info of {table}'
+
+    with patch.object(SQLAgent, '_get_single_table_info', _get_single_table_info):
+        info = sql_agent.get_table_info()
+        assert info == '\n\n'.join(f'info of {t}' for t in TABLES)
+        assert sorted(fetched) == TABLES
+
+        # all from cache
+        fetched.clear()
+        assert sql_agent.get_table_info() == info
+        assert fetched == []
+
+        # one table is expired
+        cache.data[f'{ctx.company_id}_{TABLES[1]}_info']['expires_at'] = time.time() - 1
+        assert sql_agent.get_table_info() == info
+        assert fetched == [TABLES[1]]
+
+        # integration is changed: only its tables are described again
+        fetched.clear()
+        versions['db2'] = 'v2'
+        assert sql_agent.get_table_info() == info
+        assert fetched == [TABLES[2]]
+
+
+def test_fetch_table_info_parallel(sql_agent_setup):
+    sql_agent, _, _ = sql_agent_setup
+
+    lock = threading.Lock()
+    active = {}
+    max_active = {}
+
+    def _get_single_table_info(self, table):
+        integration = table.parts[0]
+        with lock:
+            active[integration] = active.get(integration, 0) + 1
+            max_active[integration] = max(max_active.get(integration, 0), active[integration])
+        time.sleep(0.05)
+        with lock:
+            active[integration] -= 1
+        return f'info of {table}'
+
+    tables = [f'db1.table{i}' for i in range(10)] + [f'db2.table{i}' for i in range(10)]
+    sql_agent._tables_to_include = tables
+
+    with patch.object(SQLAgent, '_get_single_table_info', _get_single_table_info), \
+            patch.object(sql_agent_module, 'TABLE_INFO_MAX_WORKERS_PER_INTEGRATION', 3):
+        start = time.perf_counter()
+        info = sql_agent.get_table_info()
+        elapsed = time.perf_counter() - start
+
+    # order of tables is kept
+    assert info == '\n\n'.join(f'info of {t}' for t in tables)
+    assert max_active == {'db1': 3, 'db2': 3}
+    # 20 tables by 0.05s in serial mode would take 1s
+    assert elapsed < 0.6
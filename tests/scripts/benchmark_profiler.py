@@ -0,0 +1,131 @@
+"""
+Overhead of sampling profiler on the query
+
+    python tests/scripts/benchmark_profiler.py [--rows 10 1000 100000] [--repeat 100]
+
+The query is simulated by the same measured parts as in the APIs: root node of profiler, call of integration handler,
+steps of the plan (join and projection) and encoding of the result by postgres protocol.
+It is executed with sample rate 0 (profiling is off), 0.1 and 1. Cost of one measured part is reported separately.
+"""
+import io
+import sys
+import time
+import statistics
+import argparse
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+from mindsdb_sql_parser.ast import Identifier, BinaryOperation, Join, Star
+
+from mindsdb.api.executor.planner.steps import JoinStep, ProjectStep
+from mindsdb.api.executor.planner.step_result import Result
+from mindsdb.api.executor.sql_query.result_set import ResultSet
+from mindsdb.api.executor.sql_query.steps.join_step import JoinStepCall
+from mindsdb.api.executor.sql_query.steps.project_step import ProjectStepCall
+from mindsdb.api.postgres.postgres_proxy.postgres_packets.postgres_message_formats import DataRows
+from mindsdb.metrics import metrics
+from mindsdb.utilities.profiler import profiler
+
+
+SAMPLE_RATES = (0, 0.1, 1)
+
+
+def measure(fnc, repeat):
+    """Runs the query with every sample rate in turn, so the drift of the machine affects them equally"""
+    timings = {sample_rate: [] for sample_rate in SAMPLE_RATES}
+    for _ in range(repeat):
+        for sample_rate in SAMPLE_RATES:
+            profiler.PROFILING_SAMPLE_RATE = sample_rate
+            start = time.perf_counter()
+            fnc()
+            timings[sample_rate].append(time.perf_counter() - start)
+    profiler.PROFILING_SAMPLE_RATE = 0
+    return {
+        sample_rate: (min(values), statistics.median(values))
+        for sample_rate, values in timings.items()
+    }
+
+
+def report(name, timings, base=None):
+    overhead = ''
+    if base is not None:
+        overhead = f'   overhead: {(timings[1] / base[1] - 1) * 100:6.2f} %'
+    print(f'{name:<30} min: {timings[0] * 1000:9.3f} ms   median: {timings[1] * 1000:9.3f} ms{overhead}')
+
+
+def measure_phase(repeat):
+    """Cost of one measured part of the query"""
+    for sample_rate in SAMPLE_RATES[::2]:
+        profiler.PROFILING_SAMPLE_RATE = sample_rate
+        with profiler.Context('benchmark_query_processing'):
+            start = time.perf_counter()
+            for _ in range(repeat):
+                with profiler.Phase(metrics.EXECUTOR_STEP_TIME, 'BenchmarkStep'):
+                    pass
+            elapsed = time.perf_counter() - start
+        print(f'  sample rate {sample_rate:<16} {elapsed / repeat * 1e6:9.3f} us')
+    profiler.PROFILING_SAMPLE_RATE = 0
+
+
+def make_df(rows_count):
+    return pd.DataFrame({
+        'id': np.arange(rows_count),
+        'value': np.arange(rows_count) / 3,
+        'name': [f'name {i}' for i in range(rows_count)],
+    })
+
+
+def make_query(rows_count):
+    df_a, df_b = make_df(rows_count), make_df(rows_count)
+
+    def fetch(df, table):
+        with profiler.Phase(metrics.INTEGRATION_HANDLER_CALL_TIME, 'BenchmarkHandler', 'query'):
+            return ResultSet().from_df(df.copy(), database='db', table_name=table)
+
+    def query():
+        with profiler.Context('benchmark_query_processing'):
+            steps_data = {}
+            sql_query = SimpleNamespace(steps_data=steps_data, context={}, session=None)
+            with profiler.Phase(metrics.EXECUTOR_STEP_TIME, 'FetchDataframeStep'):
+                steps_data[0] = fetch(df_a, 'a')
+            with profiler.Phase(metrics.EXECUTOR_STEP_TIME, 'FetchDataframeStep'):
+                steps_data[1] = fetch(df_b, 'b')
+
+            condition = BinaryOperation(op='=', args=[Identifier('a.id'), Identifier('b.id')])
+            step = JoinStep(
+                left=Result(0), right=Result(1),
+                query=Join(left=Identifier('a'), right=Identifier('b'), join_type='JOIN', condition=condition)
+            )
+            with profiler.Phase(metrics.EXECUTOR_STEP_TIME, 'JoinStep'):
+                steps_data[2] = JoinStepCall(sql_query).call(step)
+
+            step = ProjectStep(dataframe=Result(2), columns=[Star()])
+            with profiler.Phase(metrics.EXECUTOR_STEP_TIME, 'ProjectStep'):
+                result = ProjectStepCall(sql_query).call(step)
+
+        with profiler.Phase(metrics.RESULT_SERIALIZATION_TIME, 'postgres', 'data_rows'):
+            DataRows(df=result.get_raw_df(), formats=[0] * len(result.columns)).send(io.BytesIO())
+
+    return query
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, nargs='+', default=[10, 1000, 100000])
+    parser.add_argument('--repeat', type=int, default=100)
+    args = parser.parse_args()
+
+    print('one measured part of the query')
+    measure_phase(100000)
+
+    for rows_count in args.rows:
+        print(f'query, {rows_count} rows')
+        query = make_query(rows_count)
+        # warm up
+        query()
+
+        timings = measure(query, max(5, args.repeat * 100 // max(rows_count, 100)))
+        for sample_rate in SAMPLE_RATES:
+            report(f'  sample rate {sample_rate}', timings[sample_rate], None if sample_rate == 0 else timings[0])
+    sys.exit(0)
@@ -0,0 +1,125 @@
+"""
+Micro-benchmarks of columns of ResultSet on wide tables
+
+    python tests/scripts/benchmark_result_set.py [--columns 100 500 1000] [--rows 1000] [--repeat 5]
+
+Lookups of the columns are compared with linear scan of the list of columns,
+join and projection measure the steps of the query which use these lookups.
+"""
+import sys
+import time
+import argparse
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+from mindsdb_sql_parser.ast import Identifier, BinaryOperation, Join, Star
+
+from mindsdb.api.executor.planner.steps import JoinStep, ProjectStep
+from mindsdb.api.executor.planner.step_result import Result
+from mindsdb.api.executor.sql_query.result_set import ResultSet
+from mindsdb.api.executor.sql_query.steps.join_step import JoinStepCall
+from mindsdb.api.executor.sql_query.steps.project_step import ProjectStepCall
+
+
+def measure(fnc, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fnc()
+        timings.append(time.perf_counter() - start)
+    return min(timings), sum(timings) / len(timings)
+
+
+def report(name, timings):
+    print(f'{name:<40} min: {timings[0] * 1000:9.2f} ms   avg: {timings[1] * 1000:9.2f} ms')
+
+
+def make_result_set(columns_count, rows_count, table):
+    df = pd.DataFrame(
+        np.arange(columns_count * rows_count).reshape(rows_count, columns_count),
+        columns=['id'] + [f'col_{i}' for i in range(1, columns_count)]
+    )
+    return ResultSet().from_df(df, database='db', table_name=table)
+
+
+def linear_find_columns(result_set, alias=None, table_alias=None):
+    # lookup without index
+    col_list = []
+    for col in result_set.columns:
+        if alias is not None and col.alias.lower() != alias.lower():
+            continue
+        if table_alias is not None and col.table_alias.lower() != table_alias.lower():
+            continue
+        col_list.append(col)
+    return col_list
+
+
+def linear_get_col_index(result_set, col):
+    for i, col0 in enumerate(result_set.columns):
+        if col0 is col:
+            return i
+
+
+def benchmark_lookups(result_set, repeat):
+    names = result_set.get_column_names()
+
+    def indexed():
+        for name in names:
+            col = result_set.find_columns(name, 'tbl')[0]
+            result_set.get_col_index(col)
+
+    def linear():
+        for name in names:
+            col = linear_find_columns(result_set, name, 'tbl')[0]
+            linear_get_col_index(result_set, col)
+
+    report('  find column + index: indexed', measure(indexed, repeat))
+    report('  find column + index: linear scan', measure(linear, repeat))
+
+
+def make_sql_query(steps_data):
+    return SimpleNamespace(steps_data=steps_data, context={}, session=None)
+
+
+def benchmark_join(columns_count, rows_count, repeat):
+    def join():
+        steps_data = {
+            0: make_result_set(columns_count, rows_count, 'a'),
+            1: make_result_set(columns_count, rows_count, 'b'),
+        }
+        condition = BinaryOperation(op='=', args=[Identifier('a.id'), Identifier('b.id')])
+        step = JoinStep(
+            left=Result(0), right=Result(1),
+            query=Join(left=Identifier('a'), right=Identifier('b'), join_type='JOIN', condition=condition)
+        )
+        JoinStepCall(make_sql_query(steps_data)).call(step)
+
+    report('  join of two tables', measure(join, repeat))
+
+
+def benchmark_project(columns_count, rows_count, repeat):
+    result_set = make_result_set(columns_count, rows_count, 'tbl')
+    targets = [Identifier(parts=['tbl', name]) for name in result_set.get_column_names()]
+
+    def project():
+        steps_data = {0: ResultSet(columns=list(result_set.columns), df=result_set.get_raw_df().copy(), values=[])}
+        step = ProjectStep(dataframe=Result(0), columns=[Star()] + targets)
+        ProjectStepCall(make_sql_query(steps_data)).call(step)
+
+    report('  projection of all columns', measure(project, repeat))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--columns', type=int, nargs='+', default=[100, 500, 1000])
+    parser.add_argument('--rows', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    for columns_count in args.columns:
+        print(f'{columns_count} columns, {args.rows} rows')
+        benchmark_lookups(make_result_set(columns_count, args.rows, 'tbl'), args.repeat)
+        benchmark_join(columns_count, args.rows, args.repeat)
+        benchmark_project(columns_count, args.rows, args.repeat)
+    sys.exit(0)
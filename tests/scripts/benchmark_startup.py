@@ -0,0 +1,109 @@
+"""
+Measures time of startup steps
+
+    python tests/scripts/benchmark_startup.py [--repeat N]
+"""
+import sys
+import time
+import subprocess
+import multiprocessing as mp
+import argparse
+import shutil
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+
+def measure(fnc, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fnc()
+        timings.append(time.perf_counter() - start)
+    return min(timings), sum(timings) / len(timings)
+
+
+def report(name, timings):
+    print(f'{name:<40} min: {timings[0] * 1000:9.2f} ms   avg: {timings[1] * 1000:9.2f} ms')
+
+
+def benchmark_handlers_loading(repeat):
+    from mindsdb.interfaces.database import integrations
+    from mindsdb.interfaces.database.integrations import integration_controller, IntegrationController
+    from mindsdb.integrations.libs import handlers_manifest
+
+    # without manifest
+    with patch.object(handlers_manifest, 'HANDLERS_MANIFEST_FILE', 'not_existing_manifest.json'):
+        report('load handlers: scan', measure(integration_controller._load_handler_modules, repeat))
+
+    # with manifest
+    with tempfile.TemporaryDirectory() as temp_dir:
+        manifest_path = Path(temp_dir) / 'handlers_manifest.json'
+        refreshed_path = Path(temp_dir) / 'refreshed_manifest.json'
+        integration_controller.save_handlers_manifest(manifest_path)
+        with patch.object(handlers_manifest, 'get_manifest_path', return_value=manifest_path), \
+                patch.object(integrations, 'get_refreshed_manifest_path', return_value=refreshed_path):
+            report('load handlers: manifest', measure(integration_controller._load_handler_modules, repeat))
+
+    # installation changed mtime of all files: content is compared on the first start only
+    handlers_path = integration_controller._get_handlers_path()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        manifest_path = Path(temp_dir) / 'handlers_manifest.json'
+        refreshed_path = Path(temp_dir) / 'refreshed_manifest.json'
+        integration_controller.save_handlers_manifest(manifest_path)
+
+        installed_path = Path(temp_dir) / 'handlers'
+        shutil.copytree(handlers_path, installed_path, copy_function=shutil.copyfile)
+
+        def first_start():
+            refreshed_path.unlink(missing_ok=True)
+            integration_controller._load_handler_modules()
+
+        with patch.object(handlers_manifest, 'get_manifest_path', return_value=manifest_path), \
+                patch.object(integrations, 'get_refreshed_manifest_path', return_value=refreshed_path), \
+                patch.object(IntegrationController, '_get_handlers_path', return_value=installed_path):
+            report('load handlers: mtime changed, first', measure(first_start, repeat))
+            report('load handlers: mtime changed, next', measure(integration_controller._load_handler_modules, repeat))
+
+
+def benchmark_cold_import(repeat):
+    """ import of modules which are required by API processes, in a fresh interpreter """
+    for module in ('mindsdb.api.executor.controllers.session_controller', 'mindsdb.interfaces.agents.agents_controller'):
+        report(
+            f'cold import: {module.split(".")[-1]}',
+            measure(lambda: subprocess.run([sys.executable, '-c', f'import {module}'], check=True), repeat)
+        )
+
+
+def _process_target():
+    # the same modules API process needs before it is ready to serve requests
+    import mindsdb.api.executor.controllers.session_controller  # noqa
+
+
+def benchmark_process_start(repeat):
+    """ start (or restart) of trunk process with different start methods """
+    preload = ['numpy', 'pandas', 'duckdb', 'sqlalchemy', 'pydantic', 'flask', 'mindsdb_sql_parser']
+    for start_method in ('spawn', 'forkserver'):
+        if start_method not in mp.get_all_start_methods():
+            continue
+        ctx = mp.get_context(start_method)
+        if start_method == 'forkserver':
+            ctx.set_forkserver_preload(preload)
+
+        def start():
+            process = ctx.Process(target=_process_target)
+            process.start()
+            process.join()
+
+        report(f'process start: {start_method}', measure(start, repeat))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args()
+
+    benchmark_handlers_loading(args.repeat)
+    benchmark_cold_import(args.repeat)
+    benchmark_process_start(args.repeat)
+    sys.exit(0)
@@ -0,0 +1,114 @@
+"""
+Compares update of table from input data: row by row and set-based
+
+    python tests/scripts/benchmark_update.py [--rows 100 1000 10000] [--postgres]
+
+By default in-memory sqlite database is used.
+With --postgres it uses local database, connection is set by env variables:
+  POSTGRES_HOST, POSTGRES_PORT, POSTGRES_USER, POSTGRES_PASSWORD, POSTGRES_DB
+"""
+import os
+import sys
+import time
+import sqlite3
+import argparse
+
+import pandas as pd
+from mindsdb_sql_parser.ast import Update, Identifier, Constant, BinaryOperation
+
+from mindsdb.api.executor.sql_query.result_set import ResultSet
+from mindsdb.api.executor.sql_query.steps.update_step import UpdateToTableCall, SetUpdate
+from mindsdb.integrations.libs.response import HandlerResponse, RESPONSE_TYPE
+from mindsdb.utilities.render.sqlalchemy_render import SqlalchemyRender
+
+
+class SqliteDataNode:
+    def __init__(self):
+        self.connection = sqlite3.connect(':memory:')
+        self.renderer = SqlalchemyRender('sqlite')
+
+    def native_query(self, sql):
+        cur = self.connection.execute(sql)
+        self.connection.commit()
+        return cur.rowcount
+
+    def query(self, query, session=None):
+        affected_rows = self.native_query(self.renderer.get_string(query, with_failback=False))
+        return HandlerResponse(RESPONSE_TYPE.OK, affected_rows=affected_rows)
+
+
+class PostgresDataNode:
+    def __init__(self):
+        from mindsdb.integrations.handlers.postgres_handler.postgres_handler import PostgresHandler
+
+        self.handler = PostgresHandler('pg', connection_data={
+            'host': os.environ.get('POSTGRES_HOST', 'localhost'),
+            'port': int(os.environ.get('POSTGRES_PORT', 5432)),
+            'user': os.environ.get('POSTGRES_USER', 'postgres'),
+            'password': os.environ.get('POSTGRES_PASSWORD', ''),
+            'database': os.environ.get('POSTGRES_DB', 'postgres'),
+        })
+
+    def native_query(self, sql):
+        response = self.handler.native_query(sql)
+        if response.type == RESPONSE_TYPE.ERROR:
+            raise RuntimeError(response.error_message)
+        return response.affected_rows
+
+    def query(self, query, session=None):
+        return self.handler.query(query)
+
+
+def make_update():
+    # update bench_table set value = input.value where id = input.id
+    id_param, value_param = Constant(None), Constant(None)
+    update_query = Update(
+        table=Identifier('bench_table'),
+        update_columns={'value': value_param},
+        where=BinaryOperation(op='=', args=[Identifier('id'), id_param])
+    )
+    return update_query, [['id', id_param], ['value', value_param]]
+
+
+def benchmark(dn, rows_count):
+    dn.native_query('drop table if exists bench_table')
+    dn.native_query('create table bench_table (id integer primary key, value text)')
+    dn.native_query(f'''
+        with recursive seq(id) as (select 0 union all select id + 1 from seq where id < {rows_count - 1})
+        insert into bench_table (id, value) select id, 'old' from seq
+    ''')
+
+    input_data = ResultSet().from_df(pd.DataFrame({
+        'id': range(rows_count),
+        'value': [f'new{i}' for i in range(rows_count)]
+    }))
+
+    step_call = UpdateToTableCall.__new__(UpdateToTableCall)
+    step_call.session = None
+
+    update_query, params_map_index = make_update()
+    start = time.perf_counter()
+    affected_rows = step_call.run_rows_update(dn, update_query, params_map_index, input_data)
+    rows_time = time.perf_counter() - start
+    assert affected_rows == rows_count
+
+    update_query, params_map_index = make_update()
+    set_update = SetUpdate.from_query(update_query, params_map_index)
+    start = time.perf_counter()
+    affected_rows = step_call.run_set_update(dn, set_update, input_data)
+    set_time = time.perf_counter() - start
+    assert affected_rows == rows_count
+
+    print(f'{rows_count:>8} rows   row by row: {rows_time:8.3f} s   set-based: {set_time:8.3f} s')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, nargs='+', default=[100, 1000, 10000])
+    parser.add_argument('--postgres', action='store_true')
+    args = parser.parse_args()
+
+    dn = PostgresDataNode() if args.postgres else SqliteDataNode()
+    for rows_count in args.rows:
+        benchmark(dn, rows_count)
+    sys.exit(0)
@@ -195,6 +195,102 @@ class TestSelect(BaseExecutorDummyML):
         assert ret['c'][0] == 1  # alias is the same as column
         assert ret['col1'][0] == 7
 
+    @patch('mindsdb.integrations.handlers.postgres_handler.Handler')
+    def test_join_keys_strategies(self, data_handler):
+        from mindsdb.integrations.libs.base import DatabaseHandler
+        from mindsdb.integrations.libs.response import HandlerResponse as Response, RESPONSE_TYPE
+        from mindsdb_sql_parser.ast import Select, CreateTable, DropTables
+
+        df = pd.DataFrame([{'a': i * 10, 'c': i} for i in range(10)])
+        self.set_handler(data_handler, name='pg', tables={'tbl2': df})
+        self.run_sql('create table files.tbl1 (select * from pg.tbl2)')
+
+        sql = '''
+            SELECT * FROM files.tbl1 as t1
+            JOIN pg.tbl2 as t2 on t1.c=t2.c
+        '''
+        module = 'mindsdb.api.executor.sql_query.steps.fetch_dataframe'
+
+        # one IN-list
+        data_handler().query.reset_mock()
+        ret = self.run_sql(sql)
+        assert len(ret) == 10
+        assert data_handler().query.call_count == 1
+
+        # chunks of IN-list
+        data_handler().query.reset_mock()
+        with patch(f'{module}.JOIN_KEYS_IN_LIST_SIZE', 3):
+            ret = self.run_sql(sql)
+        assert len(ret) == 10
+        assert data_handler().query.call_count == 4
+
+        # database can create temporary table, but integration doesn't allow it: chunks are used
+        data_handler().__class__ = DatabaseHandler
+        data_handler().query.reset_mock()
+        with patch(f'{module}.JOIN_KEYS_IN_LIST_SIZE', 3), patch(f'{module}.JOIN_KEYS_TEMP_TABLE_SIZE', 5):
+            ret = self.run_sql(sql)
+        assert len(ret) == 10
+        calls = [call[0][0] for call in data_handler().query.call_args_list]
+        assert [type(query) for query in calls] == [Select] * 4
+
+        # temporary table
+        record = self.db.Integration.query.filter_by(name='pg').first()
+        record.data = {**record.data, 'join_keys_temp_table': True}
+        self.db.session.commit()
+        query_fnc = data_handler().query.side_effect
+
+        def query_f(query):
+            if isinstance(query, Select) and isinstance(query.where.args[1], Select):
+                # temporary table doesn't exist in mocked database
+                return Response(RESPONSE_TYPE.TABLE, df.copy())
+            return query_fnc(query)
+
+        data_handler().query.side_effect = query_f
+        data_handler().query.reset_mock()
+        with patch(f'{module}.JOIN_KEYS_IN_LIST_SIZE', 3), patch(f'{module}.JOIN_KEYS_TEMP_TABLE_SIZE', 5):
+            ret = self.run_sql(sql)
+        assert len(ret) == 10
+        calls = [call[0][0] for call in data_handler().query.call_args_list]
+        assert [type(query) for query in calls] == [CreateTable, Select, DropTables]
+        table_name = calls[0].name.parts[-1]
+        assert calls[1].to_string() == f'SELECT * FROM tbl2 AS t2 WHERE c IN (SELECT c FROM {table_name})'
+        assert data_handler().insert.call_args[0][0] == table_name
+        assert calls[2].tables[0].parts[-1] == table_name
+
+        # database doesn't allow to create table: chunks are used
+        def query_f(query):
+            if isinstance(query, CreateTable):
+                raise RuntimeError('permission denied')
+            return query_fnc(query)
+
+        data_handler().query.side_effect = query_f
+        data_handler().query.reset_mock()
+        with patch(f'{module}.JOIN_KEYS_IN_LIST_SIZE', 3), patch(f'{module}.JOIN_KEYS_TEMP_TABLE_SIZE', 5):
+            ret = self.run_sql(sql)
+        assert len(ret) == 10
+        calls = [call[0][0] for call in data_handler().query.call_args_list]
+        assert [type(query) for query in calls] == [CreateTable, DropTables] + [Select] * 4
+
+    @patch('mindsdb.integrations.handlers.postgres_handler.Handler')
+    def test_join_keys_duplicated(self, data_handler):
+        df = pd.DataFrame([{'a': i * 10, 'c': i} for i in range(5)])
+        self.set_handler(data_handler, name='pg', tables={'tbl2': df})
+        # every key is repeated, copies are in different chunks
+        self.save_file('keys', pd.DataFrame({'c': [0, 1, 2, 3, 4, 4, 3, 2, 1, 0]}))
+
+        sql = 'select * from pg.tbl2 where c in (select c from files.keys)'
+        module = 'mindsdb.api.executor.sql_query.steps.fetch_dataframe'
+
+        ret = self.run_sql(sql)
+        assert len(ret) == 5
+
+        data_handler().query.reset_mock()
+        with patch(f'{module}.JOIN_KEYS_IN_LIST_SIZE', 3):
+            ret = self.run_sql(sql)
+        assert sorted(ret['c']) == [0, 1, 2, 3, 4]
+        # 5 unique keys in 2 chunks
+        assert data_handler().query.call_count == 2
+
     @patch('mindsdb.integrations.handlers.postgres_handler.Handler')
     def test_implicit_join(self, data_handler):
         df1 = pd.DataFrame([
@@ -6,6 +6,7 @@ import json
 
 import pandas as pd
 import numpy as np
+from mindsdb_sql_parser.ast import Update, Case
 
 from mindsdb.utilities.render.sqlalchemy_render import SqlalchemyRender
 
@@ -686,6 +687,114 @@ class TestComplexQueries(BaseExecutorMockPredictor):
         # second is update
         assert mock_handler().query.call_args_list[1][0][0].to_string() == "update table2 set a1=1, c1='ccc' where a1 = 1 AND b1 = 'ccc'"
 
+    @patch('mindsdb.integrations.handlers.postgres_handler.Handler')
+    def test_update_from_select_set_based(self, mock_handler):
+        from mindsdb.integrations.libs.base import DatabaseHandler
+
+        table2 = pd.DataFrame([
+            {'a1': 1, 'b1': 'aaa', 'c1': 'x'},
+            {'a1': 2, 'b1': 'bbb', 'c1': 'x'},
+            {'a1': 3, 'b1': 'ccc', 'c1': 'x'},
+        ])
+        self.set_handler(mock_handler, name='pg', tables={'tasks': self.df, 'table2': table2})
+        # is sql database
+        mock_handler().__class__ = DatabaseHandler
+
+        sql = '''
+            update pg.table2
+            set c1 = df.b
+            from (SELECT a, b FROM pg.tasks) as df
+            where table2.a1 = df.a
+        '''
+        ret = self.execute(sql)
+
+        # 1 select and 1 update
+        calls = mock_handler().query.call_args_list
+        assert len(calls) == 2
+        # the last row wins
+        assert calls[1][0][0].to_string() == (
+            "update table2 set c1=CASE a1 WHEN 1 THEN 'ccc' WHEN 2 THEN 'bbb' ELSE c1 END where a1 IN (1, 2)"
+        )
+        assert ret.affected_rows == 2
+
+        # database can't execute it: update row by row
+        mock_handler().query.reset_mock()
+        query_fnc = mock_handler().query.side_effect
+
+        def query_f(query):
+            if isinstance(query, Update) and isinstance(query.update_columns['c1'], Case):
+                raise ValueError('CASE is not supported')
+            return query_fnc(query)
+
+        mock_handler().query.side_effect = query_f
+        ret = self.execute(sql)
+
+        calls = mock_handler().query.call_args_list
+        # 1 select, 1 failed update and 3 updates
+        assert len(calls) == 5
+        assert ret.affected_rows == 3
+
+    @patch('mindsdb.integrations.handlers.postgres_handler.Handler')
+    def test_update_from_select_set_based_duplicated_keys(self, mock_handler):
+        from mindsdb.integrations.libs.base import DatabaseHandler
+
+        table2 = pd.DataFrame([
+            {'a1': 1, 'b1': 'aaa', 'c1': 'x'},
+            {'a1': 2, 'b1': 'bbb', 'c1': 'x'},
+        ])
+        self.set_handler(mock_handler, name='pg', tables={'tasks': self.df, 'table2': table2})
+        mock_handler().__class__ = DatabaseHandler
+
+        # updated column is used in expression: every input row of the key has to be applied
+        sql = '''
+            update pg.table2
+            set c1 = c1 || df.b
+            from (SELECT a, b FROM pg.tasks) as df
+            where table2.a1 = df.a
+        '''
+        self.execute(sql)
+
+        calls = mock_handler().query.call_args_list
+        # 1 select and 2 updates: the second one applies the second row of key 1
+        assert len(calls) == 3
+        assert calls[1][0][0].to_string() == (
+            "update table2 set c1=CASE a1 WHEN 1 THEN c1 || 'aaa' WHEN 2 THEN c1 || 'bbb' ELSE c1 END"
+            " where a1 IN (1, 2)"
+        )
+        assert calls[2][0][0].to_string() == (
+            "update table2 set c1=CASE a1 WHEN 1 THEN c1 || 'ccc' ELSE c1 END where a1 IN (1)"
+        )
+
+    @patch('mindsdb.integrations.handlers.postgres_handler.Handler')
+    def test_update_from_select_set_based_error(self, mock_handler):
+        from mindsdb.integrations.libs.base import DatabaseHandler
+
+        table2 = pd.DataFrame([{'a1': 1, 'b1': 'aaa', 'c1': 'x'}])
+        self.set_handler(mock_handler, name='pg', tables={'tasks': self.df, 'table2': table2})
+        mock_handler().__class__ = DatabaseHandler
+
+        query_fnc = mock_handler().query.side_effect
+
+        def query_f(query):
+            if isinstance(query, Update):
+                raise ConnectionError('server closed the connection unexpectedly')
+            return query_fnc(query)
+
+        mock_handler().query.side_effect = query_f
+
+        sql = '''
+            update pg.table2
+            set c1 = df.b
+            from (SELECT a, b FROM pg.tasks) as df
+            where table2.a1 = df.a
+        '''
+        with pytest.raises(Exception, match='server closed the connection'):
+            self.execute(sql)
+
+        # error is not related to statement: update isn't repeated row by row
+        calls = mock_handler().query.call_args_list
+        assert len(calls) == 2
+
     @patch('mindsdb.integrations.handlers.postgres_handler.Handler')
     def test_update_in_integration(self, mock_handler):
         self.set_handler(mock_handler, name='pg', tables={})
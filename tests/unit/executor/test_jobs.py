@@ -1,4 +1,7 @@
 import datetime as dt
+import threading
+import time
+from collections import Counter
 from unittest.mock import patch
 
 import pytest
@@ -245,3 +248,159 @@ class TestJobs(BaseExecutorDummyML):
         # getting next value, greater than max previous
         assert 'a > 2' in sql
         assert "b = 'b'" in sql
+
+
+class TestSchedulerWorkers(BaseExecutorDummyML):
+
+    def run_monitor(self, scheduler):
+        thread = threading.Thread(target=scheduler.scheduler_monitor)
+        thread.start()
+        return thread
+
+    def test_wakeup_on_create(self):
+        from mindsdb.interfaces.jobs.scheduler import Scheduler
+
+        # full check of timetable is rare
+        scheduler = Scheduler({'jobs': {'check_interval': 1000}})
+        thread = self.run_monitor(scheduler)
+        try:
+            time.sleep(1)
+            self.run_sql('create job j1 (select * from models)')
+
+            # job is executed without waiting of the next check
+            start = time.time()
+            while time.time() - start < 10:
+                if len(self.run_sql('select * from log.jobs_history')) > 0:
+                    break
+                time.sleep(0.2)
+            ret = self.run_sql('select * from log.jobs_history')
+            assert len(ret) == 1
+            assert ret['run_end'][0] is not None
+        finally:
+            scheduler.stop_thread()
+            thread.join()
+
+    def test_bounded_lateness(self):
+        from mindsdb.interfaces.jobs.jobs_controller import JobsExecutor
+        from mindsdb.interfaces.jobs.scheduler import Scheduler
+
+        max_workers, max_project_workers = 4, 2
+        long_jobs, short_jobs, short_projects = 20, 100, 20
+
+        # one project with slow jobs and many projects with fast jobs, all of them are due
+        next_run_at = dt.datetime.now() - dt.timedelta(seconds=1)
+        durations = {}
+        for i in range(long_jobs + short_jobs):
+            is_long = i < long_jobs
+            record = self.db.Jobs(
+                company_id=None, name=f'j{i}', query_str='select 1', next_run_at=next_run_at,
+                project_id=1000 if is_long else 1001 + i % short_projects,
+            )
+            self.db.session.add(record)
+            self.db.session.flush()
+            durations[record.id] = 0.5 if is_long else 0.01
+        self.db.session.commit()
+
+        lock = threading.Lock()
+        running = Counter()
+        max_running = Counter()
+        max_total = 0
+        started = {}
+
+        def execute_task_local(executor, record_id, history_id):
+            nonlocal max_total
+            record = self.db.Jobs.query.get(record_id)
+            with lock:
+                started.setdefault(record_id, []).append(dt.datetime.now())
+                running[record.project_id] += 1
+                max_running[record.project_id] = max(max_running[record.project_id], running[record.project_id])
+                max_total = max(max_total, sum(running.values()))
+            time.sleep(durations[record_id])
+            with lock:
+                running[record.project_id] -= 1
+            # one time job
+            record.deleted_at = dt.datetime.now()
+            self.db.session.commit()
+
+        scheduler = Scheduler({'jobs': {'max_workers': max_workers, 'max_project_workers': max_project_workers}})
+
+        lock_record = JobsExecutor.lock_record
+        locked_scheduler = []
+
+        def lock_record_f(executor, record_id):
+            # query to database doesn't block other threads of scheduler
+            locked_scheduler.append(scheduler._lock.locked())
+            return lock_record(executor, record_id)
+
+        with patch.object(JobsExecutor, 'execute_task_local', execute_task_local), \
+                patch.object(JobsExecutor, 'lock_record', lock_record_f):
+            thread = self.run_monitor(scheduler)
+            try:
+                deadline = time.time() + 60
+                while len(started) < long_jobs + short_jobs and time.time() < deadline:
+                    time.sleep(0.2)
+            finally:
+                scheduler.stop_thread()
+                thread.join()
+                scheduler._get_pool().shutdown(wait=True)
+
+        assert not any(locked_scheduler)
+
+        # every job is executed once
+        assert len(started) == long_jobs + short_jobs
+        assert all(len(starts) == 1 for starts in started.values())
+
+        # limits of workers
+        assert max_total <= max_workers
+        assert max(max_running.values()) <= max_project_workers
+
+        # fast jobs are not waiting for slow ones: behind them they would be late for 5 seconds.
+        # they are started by freed workers, at the latest by the next check of the scheduler.
+        # lateness is counted from the start of the first job: it doesn't include start of the scheduler
+        first_start = min(starts[0] for starts in started.values())
+        short_lateness = [
+            (starts[0] - first_start).total_seconds()
+            for record_id, starts in started.items()
+            if durations[record_id] < 0.5
+        ]
+        assert max(short_lateness) < Scheduler.WAKEUP_INTERVAL + 1
+
+    def test_several_instances(self):
+        from mindsdb.interfaces.jobs.jobs_controller import JobsExecutor
+        from mindsdb.interfaces.jobs.scheduler import Scheduler
+
+        next_run_at = dt.datetime.now() - dt.timedelta(seconds=1)
+        for i in range(100):
+            self.db.session.add(self.db.Jobs(
+                company_id=None, name=f'j{i}', query_str='select 1', next_run_at=next_run_at, project_id=i % 10
+            ))
+        self.db.session.commit()
+
+        lock = threading.Lock()
+        executed = Counter()
+
+        def execute_task_local(executor, record_id, history_id):
+            with lock:
+                executed[record_id] += 1
+            time.sleep(0.01)
+            record = self.db.Jobs.query.get(record_id)
+            record.deleted_at = dt.datetime.now()
+            self.db.session.commit()
+
+        schedulers = [Scheduler({}), Scheduler({})]
+        with patch.object(JobsExecutor, 'execute_task_local', execute_task_local):
+            threads = [self.run_monitor(scheduler) for scheduler in schedulers]
+            try:
+                deadline = time.time() + 60
+                while len(executed) < 100 and time.time() < deadline:
+                    time.sleep(0.2)
+                # give a chance to run job twice
+                time.sleep(1)
+            finally:
+                for scheduler, thread in zip(schedulers, threads):
+                    scheduler.stop_thread()
+                    thread.join()
+
+        # job is locked by one of instances
+        assert len(executed) == 100
+        assert max(executed.values()) == 1
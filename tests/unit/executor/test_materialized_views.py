@@ -0,0 +1,122 @@
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from tests.unit.executor_test_base import BaseExecutorTest
+
+
+@pytest.fixture(scope="class")
+def scheduler():
+    from mindsdb.interfaces.jobs.scheduler import Scheduler
+    scheduler_ = Scheduler({})
+
+    yield scheduler_
+
+    scheduler_.stop_thread()
+
+
+class TestMaterializedViews(BaseExecutorTest):
+
+    def run_sql(self, sql):
+        from mindsdb.api.executor.utilities.extended_sql import parse_sql
+
+        ret = self.command_executor.execute_command(parse_sql(sql))
+        assert ret.error_code is None
+        if ret.data is not None:
+            return ret.data.to_df()
+        return ret
+
+    @patch('mindsdb.integrations.handlers.postgres_handler.Handler')
+    def test_refresh(self, data_handler):
+        tables = {'tbl': pd.DataFrame([{'id': i, 'a': i * 10} for i in range(4)])}
+        self.set_handler(data_handler, name='pg', tables=tables)
+
+        ret = self.run_sql('''
+            create materialized view mview (
+                select * from pg.tbl where a < 1000
+            ) using refresh_key='id'
+        ''')
+        assert ret.affected_rows == 4
+
+        # view is read from storage
+        data_handler().query.reset_mock()
+        ret = self.run_sql('select * from mview where id > 1')
+        assert list(ret.id) == [2, 3]
+        assert data_handler().query.call_count == 0
+
+        # new rows: only they are fetched
+        tables['tbl'] = pd.DataFrame([{'id': i, 'a': i * 10} for i in range(6)])
+        ret = self.run_sql('refresh materialized view mindsdb.mview')
+        assert ret.affected_rows == 2
+        sql = data_handler().query.call_args[0][0].to_string()
+        assert 'id > 3' in sql.replace('`', '').replace('"', '')
+
+        ret = self.run_sql('select * from mview')
+        assert list(ret.id) == list(range(6))
+
+        # staleness in information schema
+        ret = self.run_sql("select * from information_schema.views where name = 'mview'")
+        row = ret.iloc[0]
+        assert bool(row.MATERIALIZED) is True
+        assert row.REFRESH_KEY == 'id'
+        assert row.ROW_COUNT == 6
+        assert row.REFRESHED_AT is not None
+        assert row.REFRESH_ERROR is None
+
+        # full refresh replaces data
+        tables['tbl'] = pd.DataFrame([{'id': i, 'a': i * 10} for i in range(3)])
+        ret = self.run_sql('refresh materialized view mview full')
+        assert ret.affected_rows == 3
+        ret = self.run_sql('select * from mview')
+        assert list(ret.id) == [0, 1, 2]
+
+    @patch('mindsdb.integrations.handlers.postgres_handler.Handler')
+    def test_not_materialized(self, data_handler):
+        tables = {'tbl': pd.DataFrame([{'id': i} for i in range(3)])}
+        self.set_handler(data_handler, name='pg', tables=tables)
+
+        self.run_sql('create materialized view mview (select * from pg.tbl)')
+        self.run_sql('create view view1 (select * from pg.tbl)')
+
+        tables['tbl'] = pd.DataFrame([{'id': i} for i in range(5)])
+
+        # view without refresh key is refreshed in full
+        self.run_sql('refresh materialized view mview')
+        assert len(self.run_sql('select * from mview')) == 5
+
+        with pytest.raises(Exception, match='not materialized'):
+            self.run_sql('refresh materialized view view1')
+
+        ret = self.run_sql("select * from information_schema.views where name = 'view1'")
+        assert bool(ret.iloc[0].MATERIALIZED) is False
+        assert len(self.run_sql('select * from view1')) == 5
+
+    @patch('mindsdb.integrations.handlers.postgres_handler.Handler')
+    def test_schedule(self, data_handler, scheduler):
+        tables = {'tbl': pd.DataFrame([{'id': i} for i in range(3)])}
+        self.set_handler(data_handler, name='pg', tables=tables)
+
+        self.run_sql("create materialized view mview (select * from pg.tbl) using refresh_key='id' every 2 hours")
+
+        ret = self.run_sql('select * from information_schema.jobs')
+        assert list(ret.NAME) == ['mview$refresh']
+        assert ret.iloc[0].QUERY == 'REFRESH MATERIALIZED VIEW mindsdb.mview'
+        assert ret.iloc[0].SCHEDULE_STR == 'every 2 hours'
+
+        # refreshed by scheduler
+        tables['tbl'] = pd.DataFrame([{'id': i} for i in range(5)])
+        scheduler.check_timetable()
+        assert list(self.run_sql('select * from mview').id) == list(range(5))
+        ret = self.run_sql('select * from log.jobs_history')
+        assert ret.error[0] is None
+
+        # name of refresh job is reserved
+        with pytest.raises(Exception, match="can't contain"):
+            self.run_sql('create job `mview$refresh` (refresh materialized view mview) every 1 hour')
+        self.run_sql('create job mview_refresh (select 1) every 1 hour')
+
+        # job is removed with view, user's job is kept
+        self.run_sql('drop view mview')
+        ret = self.run_sql('select * from information_schema.jobs')
+        assert list(ret.NAME) == ['mview_refresh']
@@ -4,9 +4,12 @@ import threading
 import inspect
 from unittest.mock import patch
 import tempfile
+import tracemalloc
 import os
 
+import pytest
 from pymongo import MongoClient
+from pymongo.errors import CursorNotFound
 from mindsdb_sql_parser import parse_sql
 
 from mindsdb.api.executor.data_types.answer import ExecuteAnswer
@@ -94,6 +97,49 @@ class TestMongoDBServer(BaseUnitTest):
         '''
         assert parse_sql(expected_sql).to_string() == ast.to_string()
 
+    def t_get_more(self, client_con, mock_executor):
+        # ==== test iteration by batches ===
+        rows_count = 100000
+        result = ResultSet(
+            columns=[Column('id'), Column('name')],
+            values=[[i, f'name {i}'] for i in range(rows_count)]
+        )
+        mock_executor.side_effect = lambda x: ExecuteAnswer(data=result)
+
+        # batches are sent to client on demand
+        db = client_con.mindsdb
+        ret = db.command({'find': 'big_table', 'filter': {}, 'batchSize': 10})
+        assert [row['id'] for row in ret['cursor']['firstBatch']] == list(range(10))
+        cursor_id = ret['cursor']['id']
+        assert cursor_id != 0
+
+        ret = db.command({'getMore': cursor_id, 'collection': 'big_table', 'batchSize': 20})
+        assert [row['id'] for row in ret['cursor']['nextBatch']] == list(range(10, 30))
+        assert ret['cursor']['id'] == cursor_id
+
+        ret = db.command({'killCursors': 'big_table', 'cursors': [cursor_id]})
+        assert ret['cursorsKilled'] == [cursor_id]
+        with pytest.raises(CursorNotFound):
+            db.command({'getMore': cursor_id, 'collection': 'big_table'})
+
+        # iterate whole result: memory isn't allocated for all rows at once
+        tracemalloc.start()
+        try:
+            count = 0
+            for row in db.big_table.find({}, batch_size=1000):
+                assert row['id'] == count
+                count += 1
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        assert count == rows_count
+        assert peak < 2 * 1024 * 1024
+
+        # all rows in single batch
+        ret = db.command({'find': 'big_table', 'filter': {}, 'singleBatch': True, 'batchSize': 5})
+        assert len(ret['cursor']['firstBatch']) == 5
+        assert ret['cursor']['id'] == 0
+
     def t_single_join(self, client_con, mock_executor):
         # ==== test join ===
 
@@ -254,3 +300,20 @@ class TestMongoDBServer(BaseUnitTest):
         #   delete model and version by _id
         #   need to mock model_controller
         pass
+
+
+def test_cursor_idle_timeout():
+    import pandas as pd
+    from mindsdb.api.mongo.classes.cursor import CursorRegistry
+
+    df = pd.DataFrame([[i] for i in range(10)])
+    registry = CursorRegistry(idle_timeout=60)
+    cursor = registry.first_batch(df, ['a'], ns='mindsdb.tbl', batch_size=3)
+    cursor_id = cursor['id']
+    assert [dict(row) for row in cursor['firstBatch']] == [{'a': 0}, {'a': 1}, {'a': 2}]
+
+    # not fetched for long time
+    registry.cursors[cursor_id].last_used -= 61
+    registry.first_batch(df, ['a'], ns='mindsdb.tbl', batch_size=3)
+    assert cursor_id not in registry.cursors
+    assert len(registry.cursors) == 1
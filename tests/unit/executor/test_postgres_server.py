@@ -0,0 +1,146 @@
+import datetime as dt
+import io
+import threading
+import tracemalloc
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import psycopg
+
+from tests.unit.executor_test_base import BaseUnitTest
+
+
+def make_df(rows_count):
+    return pd.DataFrame({
+        'int': np.arange(rows_count),
+        'float': [i / 3 if i % 5 else None for i in range(rows_count)],
+        'str': [f'name {i}' if i % 7 else None for i in range(rows_count)],
+        'datetime': pd.date_range('2020-01-01 10:30', periods=rows_count, freq='h'),
+        'bool': [i % 2 == 0 for i in range(rows_count)],
+        'object': [[i] if i % 3 == 0 else {'a': i} if i % 3 == 1 else dt.date(2020, 1, 1 + i % 28) for i in range(rows_count)],
+    })
+
+
+def to_postgres_rows(rows, charset='utf8'):
+    # previous row by row implementation, kept to check the encoding
+    import json
+
+    p_rows = []
+    for row in rows:
+        p_row = []
+        for column in row:
+            if column is None:
+                column = ""
+            elif type(column) == int or type(column) == float:
+                column = str(column)
+            elif type(column) == list or type(column) == dict:
+                column = json.dumps(column)
+            if isinstance(column, dt.date) or isinstance(column, dt.datetime):
+                column = dt.datetime.strftime(column, '%Y-%m-%d')
+            if isinstance(column, bool):
+                if column:
+                    column = "true"
+                else:
+                    column = "false"
+            p_row.append(column.encode(encoding=charset))
+        p_rows.append(p_row)
+    return p_rows
+
+
+class TestPostgresServer(BaseUnitTest):
+
+    def test_postgres_server(self):
+        with patch('mindsdb.api.executor.command_executor.ExecuteCommands.execute_command') as mock_executor:
+            from mindsdb.api.postgres.postgres_proxy.postgres_proxy import PostgresProxyHandler, TcpServer
+
+            server = TcpServer(('127.0.0.1', 0), PostgresProxyHandler)
+            server.connection_id = 0
+            server.check_auth = lambda *args, **kwargs: {'success': True, 'username': 'mindsdb'}
+            server_thread = threading.Thread(name='Postgres server', target=server.serve_forever)
+
+            try:
+                server_thread.start()
+                port = server.server_address[1]
+                with psycopg.connect(f'host=127.0.0.1 port={port} user=mindsdb dbname=mindsdb') as con:
+                    self.t_text_format(con, mock_executor)
+                    self.t_binary_format(con, mock_executor)
+                    self.t_big_result(con, mock_executor)
+            finally:
+                server.shutdown()
+                server_thread.join()
+                server.server_close()
+
+    @staticmethod
+    def set_result(mock_executor, df):
+        from mindsdb.api.executor.data_types.answer import ExecuteAnswer
+        from mindsdb.api.executor.sql_query.result_set import ResultSet
+
+        result = ResultSet().from_df(df.copy())
+        mock_executor.side_effect = lambda query: ExecuteAnswer(data=result)
+
+    def t_text_format(self, con, mock_executor):
+        self.set_result(mock_executor, make_df(10))
+
+        cur = con.cursor()
+        cur.execute('select * from tbl')
+        rows = cur.fetchall()
+        assert len(rows) == 10
+        assert rows[1] == ('1', '0.3333333333333333', 'name 1', '2020-01-01', 'false', '{"a": 1}')
+        # missing values are empty strings
+        assert rows[0][1] == '' and rows[0][2] == ''
+
+    def t_binary_format(self, con, mock_executor):
+        df = make_df(10)
+        df['datetime_tz'] = df['datetime'].dt.tz_localize('Europe/Berlin')
+        df.loc[3, 'datetime'] = None
+        self.set_result(mock_executor, df)
+
+        cur = con.cursor(binary=True)
+        cur.execute('select * from tbl where a = %s', (1,))
+        assert [c.type_code for c in cur.description] == [20, 701, 25, 1114, 16, 25, 1184]
+
+        rows = cur.fetchall()
+        assert rows[1] == (
+            1, 1 / 3, 'name 1', dt.datetime(2020, 1, 1, 11, 30), False, '{"a": 1}',
+            dt.datetime(2020, 1, 1, 10, 30, tzinfo=dt.timezone.utc)
+        )
+        assert rows[0][1:3] == (None, None)
+        assert rows[3][3] is None
+        assert rows[2][5] == '2020-01-03'
+
+    def t_big_result(self, con, mock_executor):
+        rows_count = 50000
+        self.set_result(mock_executor, make_df(rows_count))
+
+        # the result is encoded by chunks: memory isn't allocated for all rows at once
+        tracemalloc.start()
+        try:
+            count = 0
+            cur = con.cursor()
+            cur.execute('select * from tbl')
+            for row in cur:
+                assert row[0] == str(count)
+                count += 1
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        assert count == rows_count
+        assert peak < 12 * 1024 * 1024
+
+    def test_text_encoding(self):
+        from mindsdb.api.executor.sql_query.result_set import ResultSet
+        from mindsdb.api.postgres.postgres_proxy.postgres_packets.postgres_message_formats import DataRow, DataRows
+
+        df = make_df(1000)
+        df['int_with_null'] = [i if i % 4 else None for i in range(len(df))]
+        df.loc[5, 'datetime'] = None
+        result = ResultSet().from_df(df)
+
+        expected = io.BytesIO()
+        DataRow(rows=to_postgres_rows(result.to_lists())).send(expected)
+
+        buffer = io.BytesIO()
+        DataRows(df=result.get_raw_df(), formats=[0] * len(df.columns)).send(buffer)
+
+        assert buffer.getvalue() == expected.getvalue()
@@ -0,0 +1,65 @@
+from unittest.mock import patch
+
+import pandas as pd
+
+from tests.unit.executor_test_base import BaseExecutorTest
+
+
+def get_count(histogram, **labels):
+    for metric in histogram.collect():
+        for sample in metric.samples:
+            if sample.name.endswith('_count') and all(sample.labels.get(k) == v for k, v in labels.items()):
+                return sample.value
+    return 0
+
+
+class TestProfilerSampling(BaseExecutorTest):
+
+    def run_sql(self, sql):
+        from mindsdb_sql_parser import parse_sql
+        from mindsdb.utilities import profiler
+
+        # root node of the query, as in the APIs
+        with profiler.Context('test_query_processing'):
+            ret = self.command_executor.execute_command(parse_sql(sql))
+        assert ret.error_code is None
+        return ret
+
+    @patch('mindsdb.integrations.handlers.postgres_handler.Handler')
+    def test_sampling(self, data_handler):
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+        from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+        from mindsdb.metrics import metrics
+        from mindsdb.utilities.profiler import profiler
+
+        self.set_handler(data_handler, name='pg', tables={'tbl': pd.DataFrame([{'id': 1, 'a': 2}])})
+
+        exporter = InMemorySpanExporter()
+        provider = TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(exporter))
+
+        def get_counts():
+            return (
+                get_count(metrics.EXECUTOR_STEP_TIME, step='FetchDataframeStep'),
+                get_count(metrics.INTEGRATION_HANDLER_CALL_TIME, method='query'),
+            )
+
+        counts = get_counts()
+        with patch.object(profiler, '_tracer', provider.get_tracer('test')):
+            # not sampled
+            with patch.object(profiler, 'PROFILING_SAMPLE_RATE', 0):
+                self.run_sql('select * from pg.tbl')
+            assert get_counts() == counts
+            assert len(exporter.get_finished_spans()) == 0
+
+            # all queries are sampled
+            with patch.object(profiler, 'PROFILING_SAMPLE_RATE', 1):
+                self.run_sql('select * from pg.tbl')
+            assert get_counts() == (counts[0] + 1, counts[1] + 1)
+
+        spans = {span.name: span for span in exporter.get_finished_spans()}
+        step_span = spans['FetchDataframeStep']
+        handler_span = [span for name, span in spans.items() if name.endswith(': query')][0]
+        # handler is called inside of the step
+        assert handler_span.parent.span_id == step_span.context.span_id
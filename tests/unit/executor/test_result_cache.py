@@ -0,0 +1,160 @@
+import time
+from unittest.mock import patch
+
+import pandas as pd
+
+from tests.unit.executor_test_base import BaseExecutorTest
+
+
+class TestResultCache(BaseExecutorTest):
+
+    def run_sql(self, sql):
+        from mindsdb.api.executor.utilities.extended_sql import parse_sql
+
+        ret = self.command_executor.execute_command(parse_sql(sql))
+        assert ret.error_code is None
+        if ret.data is not None:
+            return ret.data.to_df()
+        return ret
+
+    def get_metric(self, result):
+        from mindsdb.metrics import metrics
+
+        for metric in metrics.INTEGRATION_RESULT_CACHE_REQUESTS.collect():
+            for sample in metric.samples:
+                if sample.name.endswith('_total') and sample.labels['result'] == result:
+                    return sample.value
+        return 0
+
+    @patch('mindsdb.integrations.handlers.postgres_handler.Handler')
+    def test_result_cache(self, data_handler):
+        from mindsdb.interfaces.database.integrations import integration_controller
+        from mindsdb.interfaces.database.result_cache import integration_result_cache
+
+        integration_result_cache.clear()
+        tables = {'tbl': pd.DataFrame([{'id': i, 'a': i * 10} for i in range(4)])}
+        self.set_handler(data_handler, name='pg', tables=tables)
+
+        # not enabled by default
+        self.run_sql('select * from pg.tbl')
+        self.run_sql('select * from pg.tbl')
+        assert data_handler().query.call_count == 2
+        assert len(integration_result_cache) == 0
+
+        integration_controller.modify('pg', {'result_cache': {'ttl': 60}})
+        hits = self.get_metric('hit')
+
+        data_handler().query.reset_mock()
+        ret = self.run_sql('select * from pg.tbl where a > 10')
+        assert list(ret.id) == [2, 3]
+        # the result is changed by executor, it doesn't affect the cache
+        ret = self.run_sql('select id, a + 1 as a from pg.tbl where a > 10')
+        ret = self.run_sql('select * from pg.tbl where a > 10')
+        assert list(ret.id) == [2, 3]
+        assert list(ret.a) == [20, 30]
+        assert data_handler().query.call_count == 2
+        assert self.get_metric('hit') == hits + 1
+
+        # parameter of cache is not passed to handler
+        handler_args = [call.kwargs for call in data_handler.call_args_list if 'connection_data' in call.kwargs]
+        assert 'result_cache' not in handler_args[-1]['connection_data']
+
+        # bypass in session
+        self.run_sql('set integration_cache = 0')
+        self.run_sql('select * from pg.tbl where a > 10')
+        assert data_handler().query.call_count == 3
+        self.run_sql('set integration_cache = 1')
+
+        # flush
+        ret = self.run_sql('flush result cache pg')
+        assert ret.affected_rows == 2
+        self.run_sql('select * from pg.tbl where a > 10')
+        assert data_handler().query.call_count == 4
+
+        # not select query removes entries of integration
+        self.run_sql('delete from pg.tbl where id = 1')
+        assert len(integration_result_cache) == 0
+
+        # expired entry
+        integration_controller.modify('pg', {'result_cache': {'ttl': 0.1}})
+        data_handler().query.reset_mock()
+        self.run_sql('select * from pg.tbl')
+        self.run_sql('select * from pg.tbl')
+        assert data_handler().query.call_count == 1
+        time.sleep(0.2)
+        self.run_sql('select * from pg.tbl')
+        assert data_handler().query.call_count == 2
+
+        # too big entry
+        integration_controller.modify('pg', {'result_cache': {'max_entry_size': 10}})
+        self.run_sql('select * from pg.tbl')
+        self.run_sql('select * from pg.tbl')
+        assert data_handler().query.call_count == 4
+        assert len(integration_result_cache) == 0
+
+    @patch('mindsdb.integrations.handlers.postgres_handler.Handler')
+    def test_interleaved_change(self, data_handler):
+        from mindsdb_sql_parser.ast import Select, Delete, Identifier, Star
+        from mindsdb.interfaces.database.integrations import integration_controller
+        from mindsdb.interfaces.database.result_cache import integration_result_cache
+
+        integration_result_cache.clear()
+        tables = {'tbl': pd.DataFrame([{'id': i, 'a': i * 10} for i in range(4)])}
+        self.set_handler(data_handler, name='pg', tables=tables)
+        integration_controller.modify('pg', {'result_cache': {'ttl': 60}})
+        dn = self.command_executor.session.datahub.get('pg')
+
+        def select():
+            return dn.query(query=Select(targets=[Star()], from_table=Identifier('tbl')))
+
+        def delete():
+            return dn.query(query=Delete(table=Identifier('tbl')))
+
+        query_fnc = data_handler().query.side_effect
+        parallel = []
+
+        def query_f(query):
+            # query of another session is executed while the handler executes this query
+            if parallel:
+                parallel.pop()()
+            return query_fnc(query)
+
+        data_handler().query.side_effect = query_f
+
+        # select is executed while the table is changed: result of select isn't cached
+        parallel.append(select)
+        delete()
+        assert len(integration_result_cache) == 0
+
+        # table is changed while select is executed: select could read the previous state, it isn't cached
+        parallel.append(delete)
+        select()
+        assert len(integration_result_cache) == 0
+
+        # without changes result is cached
+        select()
+        assert len(integration_result_cache) == 1
+
+    def test_cache_limits(self):
+        from mindsdb.interfaces.database.result_cache import IntegrationResultCache
+
+        cache = IntegrationResultCache(max_size=100)
+        cache.set('a', 'value a', size=40, ttl=60, integration_id=1)
+        cache.set('b', 'value b', size=40, ttl=60, integration_id=2)
+        assert cache.get('a') == ('value a', 40)
+
+        # the least recently used entry is removed
+        cache.set('c', 'value c', size=40, ttl=60, integration_id=1)
+        assert cache.get('b') is None
+        assert cache.size == 80
+
+        assert cache.invalidate(integration_id=1) == 2
+        assert len(cache) == 0 and cache.size == 0
+
+        # value fetched before invalidation is not stored
+        generation = cache.get_generation(integration_id=1)
+        cache.invalidate(integration_id=1)
+        cache.set('a', 'value a', size=40, ttl=60, integration_id=1, generation=generation)
+        assert cache.get('a') is None
+        cache.set('a', 'value a', size=40, ttl=60, integration_id=1, generation=cache.get_generation(1))
+        assert cache.get('a') == ('value a', 40)
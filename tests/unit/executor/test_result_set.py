@@ -0,0 +1,97 @@
+import copy
+
+import pandas as pd
+import pytest
+
+from mindsdb.api.executor.exceptions import WrongArgumentError
+from mindsdb.api.executor.sql_query.result_set import Column, ResultSet
+
+
+def make_result_set():
+    df = pd.DataFrame([[1, 'a', 1.5]], columns=['id', 'Name', 'value'])
+    return ResultSet().from_df(df, database='db', table_name='tbl', table_alias='T')
+
+
+class TestColumn:
+
+    def test_immutable(self):
+        col = Column('a', table_name='tbl', type='int')
+        assert col.alias == 'a' and col.table_alias == 'tbl'
+
+        with pytest.raises(AttributeError):
+            col.alias = 'b'
+        with pytest.raises(AttributeError):
+            col.other = 1
+
+        col2 = col.replace(alias='b')
+        assert (col2.name, col2.alias, col2.table_name, col2.type) == ('a', 'b', 'tbl', 'int')
+        assert col.alias == 'a'
+
+    def test_copy(self):
+        col = Column('a', table_name='tbl')
+        for col2 in (copy.copy(col), copy.deepcopy(col)):
+            assert col2 is not col
+            assert repr(col2) == repr(col)
+
+
+class TestResultSetColumns:
+
+    def test_find_columns(self):
+        rs = make_result_set()
+        cols = rs.columns
+
+        assert rs.find_columns('name') == [cols[1]]
+        assert rs.find_columns('NAME', 't') == [cols[1]]
+        assert rs.find_columns('name', 'tbl') == []
+        assert rs.find_columns(table_alias='t') == cols
+        assert rs.find_columns() == cols
+        assert rs.find_columns('absent') == []
+
+        assert [rs.get_col_index(col) for col in cols] == [0, 1, 2]
+        with pytest.raises(WrongArgumentError, match='not found'):
+            rs.get_col_index(Column('id'))
+
+    def test_add_del_column(self):
+        rs = make_result_set()
+        id_col, name_col, value_col = rs.columns
+
+        rs.add_column(Column('name', table_name='other'), values=['b'])
+        assert len(rs.find_columns('name')) == 2
+        assert rs.get_col_index(rs.find_columns('name', 'other')[0]) == 3
+
+        rs.del_column(name_col)
+        assert rs.get_column_names() == ['id', 'value', 'name']
+        assert rs.find_columns('name', 't') == []
+        assert rs.get_col_index(value_col) == 1
+        assert rs.to_lists() == [[1, 1.5, 'b']]
+
+        # values of the existing column are replaced
+        rs.set_column_values('value', [2.5])
+        assert rs.get_column_names() == ['id', 'value', 'name']
+        assert rs.to_lists() == [[1, 2.5, 'b']]
+
+    def test_set_col_type(self):
+        rs = make_result_set()
+        id_col = rs.columns[0]
+
+        rs.set_col_type(0, 'float')
+        new_col = rs.columns[0]
+        assert new_col is not id_col and new_col.type == 'float'
+        assert rs.find_columns('id') == [new_col]
+        assert rs.get_col_index(new_col) == 0
+        with pytest.raises(WrongArgumentError):
+            rs.get_col_index(id_col)
+
+    def test_from_df_cols(self):
+        rs = make_result_set()
+        df, col_names = rs.to_df_cols(prefix='A')
+
+        rs2 = ResultSet().from_df_cols(df, col_names)
+        assert rs2.find_columns('value', 't') == [rs.columns[2]]
+        assert rs2.get_col_index(rs.columns[2]) == 2
+
+        # columns are shared between result sets: each one has own index
+        rs3 = rs2[:1]
+        rs3.add_column(Column('extra'), values=[0])
+        assert rs2.find_columns('extra') == rs3.find_columns('extra')
+        assert rs3.get_col_index(rs.columns[1]) == 1
@@ -0,0 +1,298 @@
+import copy
+import datetime as dt
+import itertools
+import random
+import re
+from types import SimpleNamespace
+
+import dateinfer
+import pandas as pd
+import pytest
+from mindsdb_sql_parser.ast import BinaryOperation, BetweenOperation, Identifier, Constant
+from mindsdb_sql_parser.ast.mindsdb import Latest
+
+from mindsdb.api.executor.sql_query.result_set import ResultSet
+from mindsdb.api.executor.sql_query.steps.apply_predictor_step import ApplyPredictorStepCall
+
+
+def legacy_apply_ts_filter(predictor_data, table_data, step, predictor_metadata):
+    # implementation with lists of dicts, results of the new one are compared to it
+
+    if step.output_time_filter is None:
+        # no filter, exit
+        return predictor_data
+
+        # apply filter
+    group_cols = predictor_metadata['group_by_columns']
+    order_col = predictor_metadata['order_by_column']
+
+    filter_args = step.output_time_filter.args
+    filter_op = step.output_time_filter.op
+
+    # filter field must be order column
+    if not (
+        isinstance(filter_args[0], Identifier)
+        and filter_args[0].parts[-1] == order_col
+    ):
+        # exit otherwise
+        return predictor_data
+
+    def get_date_format(samples):
+        # dateinfer reads sql date 2020-04-01 as yyyy-dd-mm. workaround for in
+        for date_format, pattern in (
+            ('%Y-%m-%d', r'[\d]{4}-[\d]{2}-[\d]{2}'),
+            ('%Y-%m-%d %H:%M:%S', r'[\d]{4}-[\d]{2}-[\d]{2} [\d]{2}:[\d]{2}:[\d]{2}'),
+            # ('%Y-%m-%d %H:%M:%S%z', r'[\d]{4}-[\d]{2}-[\d]{2} [\d]{2}:[\d]{2}:[\d]{2}\+[\d]{2}:[\d]{2}'),
+            # ('%Y', '[\d]{4}')
+        ):
+            if re.match(pattern, samples[0]):
+                # suggested format
+                for sample in samples:
+                    try:
+                        dt.datetime.strptime(sample, date_format)
+                    except ValueError:
+                        date_format = None
+                        break
+                if date_format is not None:
+                    return date_format
+
+        return dateinfer.infer(samples)
+
+    model_types = predictor_metadata['model_types']
+    if model_types.get(order_col) in ('float', 'integer'):
+        # convert strings to digits
+        fnc = {
+            'integer': int,
+            'float': float
+        }[model_types[order_col]]
+
+        # convert predictor_data
+        if len(predictor_data) > 0:
+            if isinstance(predictor_data[0][order_col], str):
+
+                for row in predictor_data:
+                    row[order_col] = fnc(row[order_col])
+            elif isinstance(predictor_data[0][order_col], dt.date):
+                # convert to datetime
+                for row in predictor_data:
+                    row[order_col] = fnc(row[order_col])
+
+        # convert predictor_data
+        if isinstance(table_data[0][order_col], str):
+
+            for row in table_data:
+                row[order_col] = fnc(row[order_col])
+        elif isinstance(table_data[0][order_col], dt.date):
+            # convert to datetime
+            for row in table_data:
+                row[order_col] = fnc(row[order_col])
+
+        # convert args to date
+        samples = [
+            arg.value
+            for arg in filter_args
+            if isinstance(arg, Constant) and isinstance(arg.value, str)
+        ]
+        if len(samples) > 0:
+
+            for arg in filter_args:
+                if isinstance(arg, Constant) and isinstance(arg.value, str):
+                    arg.value = fnc(arg.value)
+
+    if model_types.get(order_col) in ('date', 'datetime') or isinstance(predictor_data[0][order_col], pd.Timestamp):  # noqa
+        # convert strings to date
+        # it is making side effect on original data by changing it but let it be
+
+        def _cast_samples(data, order_col):
+            if isinstance(data[0][order_col], str):
+                samples = [row[order_col] for row in data]
+                date_format = get_date_format(samples)
+
+                for row in data:
+                    row[order_col] = dt.datetime.strptime(row[order_col], date_format)
+            elif isinstance(data[0][order_col], dt.datetime):
+                pass  # check because dt.datetime is instance of dt.date but here we don't need to add HH:MM:SS
+            elif isinstance(data[0][order_col], dt.date):
+                # convert to datetime
+                for row in data:
+                    row[order_col] = dt.datetime.combine(row[order_col], dt.datetime.min.time())
+
+        # convert predictor_data
+        if len(predictor_data) > 0:
+            _cast_samples(predictor_data, order_col)
+
+        # convert table data
+        _cast_samples(table_data, order_col)
+
+        # convert args to date
+        samples = [
+            arg.value
+            for arg in filter_args
+            if isinstance(arg, Constant) and isinstance(arg.value, str)
+        ]
+        if len(samples) > 0:
+            date_format = get_date_format(samples)
+
+            for arg in filter_args:
+                if isinstance(arg, Constant) and isinstance(arg.value, str):
+                    arg.value = dt.datetime.strptime(arg.value, date_format)
+        # TODO can be dt.date in args?
+
+    # first pass: get max values for Latest in table data
+    latest_vals = {}
+    if Latest() in filter_args:
+
+        for row in table_data:
+            if group_cols is None:
+                key = 0  # the same for any value
+            else:
+                key = tuple([str(row[i]) for i in group_cols])
+            val = row[order_col]
+            if key not in latest_vals or latest_vals[key] < val:
+                latest_vals[key] = val
+
+    # second pass: do filter rows
+    data2 = []
+    for row in predictor_data:
+        val = row[order_col]
+
+        if isinstance(step.output_time_filter, BetweenOperation):
+            if val >= filter_args[1].value and val <= filter_args[2].value:
+                data2.append(row)
+        elif isinstance(step.output_time_filter, BinaryOperation):
+            op_map = {
+                '<': '__lt__',
+                '<=': '__le__',
+                '>': '__gt__',
+                '>=': '__ge__',
+                '=': '__eq__',
+            }
+            arg = filter_args[1]
+            if isinstance(arg, Latest):
+                if group_cols is None:
+                    key = 0  # the same for any value
+                else:
+                    key = tuple([str(row[i]) for i in group_cols])
+                if key not in latest_vals:
+                    # pass this row
+                    continue
+                arg = latest_vals[key]
+            elif isinstance(arg, Constant):
+                arg = arg.value
+
+            if filter_op not in op_map:
+                # unknown operation, exit immediately
+                return predictor_data
+
+            # check condition
+            filter_op2 = op_map[filter_op]
+            if getattr(val, filter_op2)(arg):
+                data2.append(row)
+        else:
+            # unknown operation, add anyway
+            data2.append(row)
+
+    return data2
+
+
+def make_series(groups_count, rows_count, date_type, seed=0):
+    rnd = random.Random(seed)
+    rows = []
+    start = dt.datetime(2020, 1, 1)
+    for g in range(groups_count):
+        for i in range(rows_count):
+            date = start + dt.timedelta(days=i + rnd.randint(0, 3))
+            if date_type == 'str':
+                date = date.strftime('%Y-%m-%d')
+            elif date_type == 'date':
+                date = date.date()
+            elif date_type == 'int':
+                date = date.toordinal()
+            rows.append({'g1': g % 3, 'g2': f'group {g}', 'date': date, 'value': rnd.random()})
+    return pd.DataFrame(rows)
+
+
+def make_filter(op, arg):
+    if op == 'between':
+        return BetweenOperation(args=[Identifier('t.date'), Constant(arg[0]), Constant(arg[1])])
+    return BinaryOperation(op, args=[Identifier('t.date'), arg])
+
+
+def apply_filters(predictions, table, output_time_filter, metadata):
+    # the same way as in ApplyPredictorStepCall.call
+    result_set = ResultSet().from_df(table)
+
+    step = SimpleNamespace(output_time_filter=copy.deepcopy(output_time_filter))
+    expected = legacy_apply_ts_filter(
+        predictions.to_dict(orient='records'), list(result_set.get_records()), step, metadata
+    )
+    expected = pd.DataFrame(expected)
+
+    step = SimpleNamespace(output_time_filter=copy.deepcopy(output_time_filter))
+    ret = ApplyPredictorStepCall.apply_ts_filter(None, predictions, result_set.to_df(), step, metadata)
+    return ret, expected
+
+
+DATE_ARGS = {
+    'str': ('2020-01-05', '2020-01-09'),
+    'datetime': ('2020-01-05 00:00:00', '2020-01-09 12:00:00'),
+    'date': ('2020-01-05', '2020-01-09'),
+    'int': (str(dt.date(2020, 1, 5).toordinal()), str(dt.date(2020, 1, 9).toordinal())),
+}
+
+
+@pytest.mark.parametrize('date_type, group_by, op, latest', [
+    (date_type, group_by, op, latest)
+    for date_type, group_by, (op, latest) in itertools.product(
+        ['str', 'datetime', 'date', 'int'],
+        [None, ['g2'], ['g1', 'g2']],
+        [('>', True), ('=', True), ('<=', True), ('>=', False), ('<', False), ('between', False)]
+    )
+])
+def test_ts_filter(date_type, group_by, op, latest):
+    table = make_series(groups_count=12, rows_count=10, date_type=date_type)
+    # predictions: forecasts around the last dates of table
+    predictions = make_series(groups_count=12, rows_count=14, date_type=date_type, seed=1)
+
+    if latest:
+        arg = Latest()
+    elif op == 'between':
+        arg = DATE_ARGS[date_type]
+    else:
+        arg = Constant(DATE_ARGS[date_type][0])
+
+    metadata = {
+        'group_by_columns': group_by,
+        'order_by_column': 'date',
+        'model_types': {'date': 'integer' if date_type == 'int' else 'date'},
+    }
+    ret, expected = apply_filters(predictions, table, make_filter(op, arg), metadata)
+
+    assert len(expected) > 0
+    pd.testing.assert_frame_equal(ret, expected)
+
+
+def test_ts_filter_missed_groups():
+    table = make_series(groups_count=4, rows_count=10, date_type='datetime')
+    predictions = make_series(groups_count=8, rows_count=14, date_type='datetime', seed=1)
+    # missing values are the part of group key
+    table.loc[table.g2 == 'group 1', 'g2'] = None
+    predictions.loc[predictions.g2 == 'group 1', 'g2'] = None
+
+    metadata = {
+        'group_by_columns': ['g1', 'g2'],
+        'order_by_column': 'date',
+        'model_types': {'date': 'datetime'},
+    }
+    ret, expected = apply_filters(predictions, table, make_filter('>', Latest()), metadata)
+
+    # groups which are not in table are skipped
+    assert None in set(ret.g2)
+    assert set(ret.g2) <= {None, 'group 0', 'group 2', 'group 3'}
+    pd.testing.assert_frame_equal(ret, expected)
+
+    # nothing is found: columns are kept
+    metadata['group_by_columns'] = ['value']
+    ret, expected = apply_filters(predictions, table, make_filter('>', Latest()), metadata)
+    assert len(ret) == 0 and len(expected) == 0
+    assert list(ret.columns) == list(predictions.columns)
@@ -2,7 +2,7 @@ import os
 from textwrap import dedent
 from tempfile import TemporaryDirectory
 
-from unittest.mock import patch
+from unittest.mock import patch, MagicMock
 
 import pandas as pd
 import pytest
@@ -115,3 +115,37 @@ class TestBYOM(BaseExecutorDummyML):
             where input_col = 'my_input'
         ''')
         assert ret['output_col'][0] == 'my_input>my_response'
+
+
+class TestLLMFunction(BaseExecutorDummyML):
+
+    @patch('mindsdb.integrations.handlers.postgres_handler.Handler')
+    @patch('mindsdb.interfaces.agents.langchain_agent.create_chat_model')
+    def test_llm_batch(self, create_chat_model, data_handler):
+        df = pd.DataFrame([
+            {'id': i, 'question': f'question {i % 3}'}
+            for i in range(10)
+        ])
+        df.loc[9, 'question'] = None
+        self.set_handler(data_handler, name='pg', tables={'sample': df})
+
+        questions = []
+
+        def llm_call(messages):
+            questions.append(messages[0].content)
+            return MagicMock(content=messages[0].content.replace('question', 'answer'))
+
+        create_chat_model.return_value = llm_call
+
+        ret = self.run_sql('select id, llm(question) answer from pg.sample')
+
+        ret = ret.sort_values('id')
+        assert list(ret['answer'])[:9] == [f'answer {i % 3}' for i in range(9)]
+        assert ret['answer'][9] is None
+
+        # every prompt is sent only once
+        assert sorted(questions) == ['question 0', 'question 1', 'question 2']
+
+        # answers are taken from cache
+        self.run_sql('select llm(question) from pg.sample')
+        assert len(questions) == 3
@@ -96,8 +96,9 @@ class BaseUnitTest:
 
     def setup_method(self):
         self._dummy_db_path = os.path.join(tempfile.mkdtemp(), '_mindsdb_duck_db')
-        self.clear_db(self.db)
+        # before clear_db: it imports modules which register metrics again
         self.reset_prom_collectors()
+        self.clear_db(self.db)
 
     def clear_db(self, db):
         # drop
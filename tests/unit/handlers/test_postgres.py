@@ -1,4 +1,6 @@
 from collections import OrderedDict
+from datetime import datetime
+from decimal import Decimal
 import unittest
 from unittest.mock import patch, MagicMock
 
@@ -127,6 +129,7 @@ class TestPostgresHandler(BaseDatabaseHandlerTest, unittest.TestCase):
             [1, 'name1'],
             [2, 'name2']
         ])
+        mock_cursor.rowcount = 2
 
         # Create proper description objects with necessary type_code for _cast_dtypes
         mock_cursor.description = [
@@ -148,6 +151,92 @@ class TestPostgresHandler(BaseDatabaseHandlerTest, unittest.TestCase):
         self.assertIsInstance(data.data_frame, DataFrame)
         self.assertEqual(list(data.data_frame.columns), ['id', 'name'])
 
+    def fetch_by_batches(self, rows, description, fetch_size):
+        """
+        Executes the query with mocked cursor which returns `rows` by batches of `fetch_size`
+        """
+        mock_conn = MagicMock()
+        mock_cursor = MockCursorContextManager()
+
+        self.handler.connect = MagicMock(return_value=mock_conn)
+        self.handler.fetch_size = fetch_size
+        mock_conn.cursor = MagicMock(return_value=mock_cursor)
+
+        batches = [rows[i:i + fetch_size] for i in range(0, len(rows), fetch_size)]
+        mock_cursor.fetchmany = MagicMock(side_effect=batches + [[]])
+        mock_cursor.fetchall = MagicMock(return_value=rows)
+        mock_cursor.rowcount = len(rows)
+        mock_cursor.description = description
+
+        mock_pgresult = MagicMock()
+        mock_pgresult.status = ExecStatus.TUPLES_OK
+        mock_cursor.pgresult = mock_pgresult
+
+        return self.handler.native_query("SELECT * FROM table"), mock_conn, mock_cursor
+
+    def test_native_query_by_batches(self):
+        """
+        Tests that the result bigger than `fetch_size` is fetched by batches
+        and has the same types and values as the result fetched at once
+        """
+        rows = [
+            (
+                i,
+                i if i % 3 else None,
+                Decimal(f'{i}.5') if i % 4 else None,
+                i / 2,
+                None,
+                f'name{i}' if i % 5 else None,
+                datetime(2020, 1, 1 + i % 28),
+                i % 2 == 0,
+            )
+            for i in range(25)
+        ]
+        description = [
+            ColumnDescription(name='int4_col', type_code=23),
+            ColumnDescription(name='int8_null_col', type_code=20),
+            ColumnDescription(name='numeric_col', type_code=1700),
+            ColumnDescription(name='float8_col', type_code=701),
+            ColumnDescription(name='int2_empty_col', type_code=21),
+            ColumnDescription(name='text_col', type_code=25),
+            ColumnDescription(name='timestamp_col', type_code=1114),
+            ColumnDescription(name='bool_col', type_code=16),
+        ]
+
+        expected, _, mock_cursor = self.fetch_by_batches(rows, description, fetch_size=100)
+        mock_cursor.fetchall.assert_called_once()
+        mock_cursor.fetchmany.assert_not_called()
+
+        data, _, mock_cursor = self.fetch_by_batches(rows, description, fetch_size=10)
+        mock_cursor.fetchall.assert_not_called()
+        self.assertEqual(mock_cursor.fetchmany.call_count, 4)
+
+        self.assertEqual(data.type, RESPONSE_TYPE.TABLE)
+        self.assertEqual(data.affected_rows, 25)
+        pd.testing.assert_frame_equal(data.data_frame, expected.data_frame)
+        self.assertEqual(data.data_frame['int2_empty_col'].dtype, 'int16')
+        self.assertEqual(data.data_frame['numeric_col'].iloc[4], 0)
+
+    def test_native_query_server_side_cursor(self):
+        """
+        Tests that select is executed with named cursor if `server_side_cursor` is enabled
+        """
+        self.handler.server_side_cursor = True
+        rows = [(i,) for i in range(5)]
+        description = [ColumnDescription(name='id', type_code=23)]
+
+        data, mock_conn, mock_cursor = self.fetch_by_batches(rows, description, fetch_size=2)
+        self.assertEqual(list(data.data_frame['id']), list(range(5)))
+        self.assertEqual(data.affected_rows, 5)
+        self.assertTrue(mock_conn.cursor.call_args.kwargs['name'].startswith('mindsdb_'))
+        self.assertEqual(mock_cursor.itersize, 2)
+        mock_cursor.fetchall.assert_not_called()
+        mock_conn.commit.assert_called_once()
+
+        # other queries are executed with client side cursor
+        self.handler.native_query("UPDATE table SET a = 1")
+        self.assertEqual(mock_conn.cursor.call_args.kwargs, {})
+
     def test_native_query_with_params(self):
         """
         Tests the `native_query` method with parameters to ensure executemany is called correctly
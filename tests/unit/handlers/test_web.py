@@ -1,5 +1,7 @@
 from urllib.parse import urljoin
-import concurrent.futures
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+import threading
+import time
 
 import pytest
 import unittest
@@ -71,36 +73,6 @@ class TestWebHelpers(unittest.TestCase):
 
         assert expected == actual
 
-    @patch("mindsdb.integrations.handlers.web_handler.urlcrawl_helpers.get_all_website_links")
-    @patch("concurrent.futures.ProcessPoolExecutor")
-    def test_parallel_get_all_website_links(self, mock_executor, mock_get_links):
-        # Setup: Mock the get_all_website_links function to return a list of links
-        mock_get_links.return_value = ["link1", "link2", "link3"]
-
-        # Setup: Mock the ProcessPoolExecutor class to return a mock executor
-        mock_executor_instance = MagicMock()
-        mock_executor.return_value.__enter__.return_value = mock_executor_instance
-
-        # Setup: Mock the executor to return a future that immediately completes with a result
-        mock_future = concurrent.futures.Future()
-        mock_future.set_result(["link1", "link2", "link3"])
-        mock_executor_instance.submit.return_value = mock_future
-
-        # Call the function with a list of URLs
-        urls = ["url1", "url2", "url3"]
-        result = helpers.parallel_get_all_website_links(urls)
-
-        # Assert: Check if the function returns the expected result
-        expected = {
-            "url1": ["link1", "link2", "link3"],
-            "url2": ["link1", "link2", "link3"],
-            "url3": ["link1", "link2", "link3"],
-        }
-        assert result == expected
-
-        # Assert: Check if the mocks were called as expected
-        mock_get_links.assert_called()
-
 
 def html_get(url, **kwargs):
     # generate html page with 10 sub-links in the same domain
@@ -228,3 +200,164 @@ class TestWebHandler(unittest.TestCase):
         # 4 results but limited
         df = crawler_table.list(conditions=[two_urls, depth_2, per_url_2], limit=3)
         assert len(df) == 3
+
+
+# local site: page -> links from the page
+SITE_LINKS = {
+    '/': ['/a', '/b', 'https://www.google.com/'],
+    '/a': ['/', '/a/1', '/a/2'],
+    '/b': ['/a', '/b/1'],
+    '/a/1': [],
+    '/a/2': ['/a/2/x'],
+    '/b/1': [],
+    '/a/2/x': [],
+}
+
+
+class SiteRequestHandler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        site = self.server.site
+        path = self.path.rstrip('/') or '/'
+        with site.lock:
+            site.active += 1
+            site.max_active = max(site.max_active, site.active)
+        try:
+            time.sleep(0.01)
+            if path not in SITE_LINKS:
+                self.send_response(404)
+                self.end_headers()
+                return
+
+            etag = f'"{path}-v{site.version}"'
+            if self.headers.get('If-None-Match') == etag:
+                site.hits.append((path, 304))
+                self.send_response(304)
+                self.send_header('ETag', etag)
+                self.end_headers()
+                return
+
+            site.hits.append((path, 200))
+            links = ''.join(f'<a href="{link}">{link}</a>' for link in SITE_LINKS[path])
+            body = f'<html><body><p>page {path}</p>{links}</body></html>'.encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html')
+            self.send_header('ETag', etag)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        finally:
+            with site.lock:
+                site.active -= 1
+
+
+class TestWebCrawler(unittest.TestCase):
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), SiteRequestHandler)
+        self.server.site = self
+        self.hits = []
+        self.version = 1
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base_url = f'http://127.0.0.1:{self.server.server_address[1]}'
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def crawl(self, **kwargs):
+        crawler = helpers.WebCrawler(**kwargs)
+        result = crawler.crawl([self.base_url])
+        return {url[len(self.base_url):] or '/': page for url, page in result.items()}
+
+    def test_topology(self):
+        cache = helpers.PageCache()
+
+        pages = self.crawl(crawl_depth=0, cache=cache)
+        assert list(pages.keys()) == ['/']
+
+        pages = self.crawl(crawl_depth=1, cache=None)
+        assert set(pages.keys()) == {'/', '/a', '/b'}
+
+        pages = self.crawl(crawl_depth=None, cache=None)
+        assert set(pages.keys()) == set(SITE_LINKS.keys())
+        assert 'page /a/2/x' in pages['/a/2/x']['text_content']
+        assert all(page['error'] is None for page in pages.values())
+
+        # every page is requested once
+        paths = [path for path, _ in self.hits]
+        assert sorted(paths[-len(SITE_LINKS):]) == sorted(SITE_LINKS.keys())
+
+        # breadth-first: limit takes the nearest pages
+        pages = self.crawl(crawl_depth=None, limit=3, cache=None)
+        assert set(pages.keys()) == {'/', '/a', '/b'}
+
+        pages = self.crawl(crawl_depth=None, filters=[f'{self.base_url}/?$', f'{self.base_url}/a.*'], cache=None)
+        assert set(pages.keys()) == {'/', '/a', '/a/1', '/a/2', '/a/2/x'}
+
+    def test_per_host_limit(self):
+        self.crawl(crawl_depth=None, max_workers=8, per_host_limit=2, cache=None)
+        assert len(self.hits) == len(SITE_LINKS)
+        assert self.max_active <= 2
+
+    def test_conditional_fetch(self):
+        cache = helpers.PageCache()
+
+        first = self.crawl(crawl_depth=None, cache=cache)
+        assert {status for _, status in self.hits} == {200}
+
+        # not changed: content is taken from cache
+        self.hits.clear()
+        second = self.crawl(crawl_depth=None, cache=cache)
+        assert len(self.hits) == len(SITE_LINKS)
+        assert {status for _, status in self.hits} == {304}
+        assert second == first
+
+        # changed: downloaded again
+        self.version = 2
+        self.hits.clear()
+        self.crawl(crawl_depth=None, cache=cache)
+        assert {status for _, status in self.hits} == {200}
+
+    def test_cache_is_separated_by_company(self):
+        ctx = helpers.ctx
+        cache = helpers.PageCache()
+        ctx.company_id = 1
+        self.crawl(crawl_depth=0, cache=cache)
+
+        # page of another company is not in the cache
+        ctx.company_id = 2
+        self.hits.clear()
+        self.crawl(crawl_depth=0, cache=cache)
+        assert {status for _, status in self.hits} == {200}
+
+        ctx.company_id = 1
+        self.hits.clear()
+        self.crawl(crawl_depth=0, cache=cache)
+        assert {status for _, status in self.hits} == {304}
+        ctx.company_id = None
+
+    def test_cache_size(self):
+        def page(url, text):
+            return {'url': url, 'urls': set(), 'html_content': text, 'text_content': text, 'error': None}
+
+        cache = helpers.PageCache(max_size=100)
+        cache.set(None, 'a', 'etag', None, page('a', 'x' * 20))
+        cache.set(None, 'b', 'etag', None, page('b', 'x' * 20))
+        assert cache.size == 82
+        assert cache.get(None, 'a') is not None
+
+        # the least recently used page is removed
+        cache.set(None, 'c', 'etag', None, page('c', 'x' * 20))
+        assert cache.get(None, 'b') is None
+        assert cache.size == 82
+
+        # too big page isn't stored
+        cache.set(None, 'd', 'etag', None, page('d', 'x' * 100))
+        assert cache.get(None, 'd') is None
+        assert len(cache) == 2
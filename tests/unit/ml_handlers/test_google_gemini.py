@@ -1,7 +1,14 @@
 import os
+import time
+import threading
 import pytest
 import pandas as pd
-from unittest.mock import patch
+from unittest.mock import patch, MagicMock
+
+from mindsdb.integrations.handlers.google_gemini_handler.google_gemini_handler import (
+    GoogleGeminiHandler,
+    generate_completions,
+)
 
 from .base_ml_test import BaseMLAPITest
 
@@ -103,3 +110,80 @@ class TestGeminiHandler(BaseMLAPITest):
         )
         assert "stockholm" in result_df["answer"].iloc[0].lower()
         assert "venus" in result_df["answer"].iloc[1].lower()
+
+
+class FakeGeminiModel:
+    """Model with latency of the network, counts requests"""
+
+    def __init__(self, latency=0.05, rate_limit_errors=0):
+        self.latency = latency
+        self.rate_limit_errors = rate_limit_errors
+        self.prompts = []
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def generate_content(self, prompt):
+        from google.api_core.exceptions import ResourceExhausted
+
+        with self.lock:
+            if self.rate_limit_errors > 0:
+                self.rate_limit_errors -= 1
+                raise ResourceExhausted('quota')
+            self.prompts.append(prompt)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self.latency)
+        with self.lock:
+            self.active -= 1
+        return MagicMock(text=f'answer: {prompt}')
+
+
+class TestGeminiCompletions:
+
+    def test_concurrent_completions(self):
+        prompts = [f'question {i}' for i in range(40)]
+
+        model = FakeGeminiModel()
+        start = time.perf_counter()
+        serial = generate_completions(model, prompts, max_concurrency=1)
+        serial_time = time.perf_counter() - start
+        assert model.max_active == 1
+
+        model = FakeGeminiModel()
+        start = time.perf_counter()
+        results = generate_completions(model, prompts, max_concurrency=8)
+        concurrent_time = time.perf_counter() - start
+        assert 1 < model.max_active <= 8
+
+        # order of input
+        assert results == serial == [f'answer: {p}' for p in prompts]
+        assert concurrent_time < serial_time / 3
+
+    def test_deduplicate_and_retry(self):
+        model = FakeGeminiModel(latency=0, rate_limit_errors=2)
+        prompts = ['a', 'b', 'a', 'c', 'b']
+        results = generate_completions(model, prompts, max_concurrency=4, initial_delay=0.01)
+
+        assert results == ['answer: a', 'answer: b', 'answer: a', 'answer: c', 'answer: b']
+        assert sorted(model.prompts) == ['a', 'b', 'c']
+
+        # retries are exhausted
+        model = FakeGeminiModel(latency=0, rate_limit_errors=10)
+        with pytest.raises(Exception, match='quota'):
+            generate_completions(model, ['a'], max_retries=2, initial_delay=0.01)
+
+    def test_predict_keeps_rows(self):
+        model_storage = MagicMock()
+        model_storage.json_get.return_value = {
+            'target': 'answer', 'question_column': 'question', 'api_key': 'key', 'max_concurrency': 4
+        }
+        handler = GoogleGeminiHandler(model_storage=model_storage, engine_storage=MagicMock())
+
+        model = FakeGeminiModel(latency=0)
+        df = pd.DataFrame({'question': ['x', None, 'y', 'x']})
+        with patch('google.generativeai.GenerativeModel', return_value=model), patch('google.generativeai.configure'):
+            result = handler.predict(df, {'predict_params': {}})
+
+        assert list(result['answer']) == ['answer: x', None, 'answer: y', 'answer: x']
+        assert sorted(model.prompts) == ['x', 'y']
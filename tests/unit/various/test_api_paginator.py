@@ -0,0 +1,69 @@
+import time
+import threading
+
+from mindsdb.integrations.libs.api_handler_generator import RestApiPaginator
+
+
+class FakeApi:
+    """
+    Endpoint with paginated list of numbers
+    """
+    def __init__(self, records=95, page_size=10, delay=0.05):
+        self.records = list(range(records))
+        self.page_size = page_size
+        self.delay = delay
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def request(self, filters):
+        with self.lock:
+            self.calls.append(filters)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delay)
+        with self.lock:
+            self.in_flight -= 1
+
+        if 'offset' in filters:
+            start = filters['offset']
+        else:
+            start = (filters.get('page', 1) - 1) * self.page_size
+        return self.records[start:start + self.page_size], None
+
+
+class TestRestApiPaginator:
+
+    def test_page_num(self):
+        api = FakeApi()
+        paginator = RestApiPaginator(api.request, page_size=10, page_num_param='page', window=3)
+
+        records = []
+        for page in paginator.pages({}, limit=1000):
+            records.extend(page)
+
+        assert records == api.records
+        # stopped after short page, only prefetched pages could be requested after it
+        assert 10 <= len(api.calls) <= 12
+        assert 1 < api.max_in_flight <= 3
+
+    def test_offset_limit(self):
+        api = FakeApi()
+        paginator = RestApiPaginator(api.request, offset_param='offset', window=4)
+
+        records = []
+        for page in paginator.pages({}, limit=25):
+            records.extend(page)
+
+        assert records[:25] == api.records[:25]
+        # page size was taken from the first page, only required pages are requested
+        assert [call.get('offset') for call in api.calls] == [None, 10, 20]
+
+    def test_no_pagination(self):
+        api = FakeApi()
+        paginator = RestApiPaginator(api.request, page_size=10)
+
+        pages = list(paginator.pages({}, limit=100))
+        assert pages == [api.records[:10]]
+        assert len(api.calls) == 1
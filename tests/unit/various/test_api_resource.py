@@ -0,0 +1,84 @@
+from types import SimpleNamespace
+
+import pandas as pd
+
+from mindsdb_sql_parser import parse_sql
+
+from mindsdb.integrations.libs.api_handler import APIResource
+from mindsdb.integrations.libs.api_handler_generator import RestApiTable
+
+
+class ChunkedTable(APIResource):
+    """
+    Yields 10 chunks with 10 records each, applies only 'type' condition
+    """
+
+    def __init__(self):
+        super().__init__(None)
+        self.chunks_read = 0
+
+    def get_columns(self):
+        return ['id', 'type', 'value']
+
+    def list(self, conditions=None, limit=None, sort=None, targets=None, **kwargs):
+        type_filter = None
+        for condition in conditions:
+            if condition.column == 'type':
+                type_filter = condition.value
+                condition.applied = True
+
+        for i in range(10):
+            self.chunks_read += 1
+            df = pd.DataFrame([
+                {'id': i * 10 + j, 'type': 'a' if j % 2 else 'b', 'value': (i * 10 + j) % 7}
+                for j in range(10)
+            ])
+            if type_filter is not None:
+                df = df[df['type'] == type_filter]
+            yield df
+
+
+class DataFrameTable(ChunkedTable):
+
+    def list(self, **kwargs):
+        return pd.concat(super().list(**kwargs), ignore_index=True)
+
+
+class TestAPIResource:
+
+    def test_chunks_limit(self):
+        table = ChunkedTable()
+        df = table.select(parse_sql("select * from tbl where type = 'a' and value > 2 limit 5"))
+
+        assert list(df['id']) == [3, 5, 11, 13, 17]
+        # reading stopped after limit
+        assert table.chunks_read == 2
+
+    def test_chunks_order_limit(self):
+        table = ChunkedTable()
+        query = "select * from tbl where value < 6 order by value desc, id limit 4"
+        df = table.select(parse_sql(query))
+
+        expected = DataFrameTable().select(parse_sql(query))
+        assert list(df['id']) == list(expected['id']) == [5, 12, 19, 26]
+        assert table.chunks_read == 10
+
+    def test_chunks_empty(self):
+        table = ChunkedTable()
+        table.list = lambda **kwargs: iter([])
+        df = table.select(parse_sql("select * from tbl"))
+        assert len(df) == 0
+        assert list(df.columns) == ['id', 'type', 'value']
+
+
+class TestRestApiTable:
+
+    def test_value_records(self):
+        # endpoint returns list of values instead of objects
+        endpoint = SimpleNamespace(response={'type': 'string'}, params={})
+        resource_gen = SimpleNamespace(resource_types={}, connection_data={}, security_schemes={}, options={})
+        table = RestApiTable(None, endpoint=endpoint, resource_gen=resource_gen)
+
+        df = table._records_to_df(['a', 'b', ['c', 'd']], table.get_columns())
+        assert list(df.columns) == ['value']
+        assert list(df['value']) == ['a', 'b', 'c,d']
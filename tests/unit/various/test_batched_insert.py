@@ -0,0 +1,108 @@
+import sqlite3
+from unittest.mock import MagicMock
+
+import duckdb
+import pandas as pd
+from mindsdb_sql_parser.ast import Identifier, Insert
+
+from mindsdb.api.executor.datahub.datanodes.integration_datanode import IntegrationDataNode, split_insert_values
+from mindsdb.api.executor.sql_query.result_set import ResultSet
+from mindsdb.integrations.libs.response import HandlerResponse, RESPONSE_TYPE
+from mindsdb.utilities.render.sqlalchemy_render import SqlalchemyRender
+
+
+class SqliteHandler:
+    # every batch is one multi-row INSERT statement
+    insert_batch_size = 300
+
+    def __init__(self):
+        self.connection = sqlite3.connect(':memory:')
+        self.renderer = SqlalchemyRender('sqlite')
+        self.inserts = 0
+
+    def query(self, query):
+        if isinstance(query, Insert):
+            self.inserts += 1
+        cur = self.connection.execute(self.renderer.get_string(query, with_failback=False))
+        self.connection.commit()
+        return HandlerResponse(RESPONSE_TYPE.OK, affected_rows=cur.rowcount)
+
+    def select(self, sql):
+        return self.connection.execute(sql).fetchall()
+
+
+class DuckDBHandler:
+    # every batch is executed with executemany
+    insert_batch_size = 400
+    insert_batch_max_bytes = 10 ** 9
+
+    def __init__(self):
+        self.connection = duckdb.connect(':memory:')
+        self.renderer = SqlalchemyRender('postgres')
+        self.inserts = 0
+
+    def query(self, query):
+        if isinstance(query, Insert):
+            self.inserts += 1
+            sql, params = self.renderer.get_exec_params(query, with_failback=False)
+            self.connection.executemany(sql.replace('%s', '?'), params)
+            return HandlerResponse(RESPONSE_TYPE.OK, affected_rows=len(params))
+        self.connection.execute(self.renderer.get_string(query, with_failback=False))
+        return HandlerResponse(RESPONSE_TYPE.OK)
+
+    def select(self, sql):
+        return self.connection.execute(sql).fetchall()
+
+
+def make_datanode(handler):
+    integration_controller = MagicMock()
+    integration_controller.get_data_handler.return_value = handler
+    return IntegrationDataNode('test', ds_type='test', integration_controller=integration_controller)
+
+
+class TestBatchedInsert:
+
+    def test_split_values(self):
+        values = [[i, 'x' * 10] for i in range(10)]
+
+        batches = list(split_insert_values(values, batch_size=4, max_bytes=10 ** 6))
+        assert [len(b) for b in batches] == [4, 4, 2]
+
+        # limited by size: ~16 bytes per row
+        batches = list(split_insert_values(values, batch_size=100, max_bytes=40))
+        assert [len(b) for b in batches] == [2] * 5
+        assert sum(batches, []) == values
+
+        # row bigger than limit is sent alone
+        batches = list(split_insert_values([['x' * 100]], batch_size=100, max_bytes=10))
+        assert batches == [[['x' * 100]]]
+
+    def _check_insert(self, handler, rows_count, expected_inserts):
+        dn = make_datanode(handler)
+
+        data = ResultSet().from_df(pd.DataFrame({
+            'id': range(rows_count),
+            'name': [f'name{i}' for i in range(rows_count)]
+        }))
+
+        progress = []
+        response = dn.create_table(
+            table_name=Identifier('tbl1'),
+            result_set=data,
+            is_create=True,
+            progress_callback=lambda inserted, total: progress.append((inserted, total))
+        )
+
+        assert response.affected_rows == rows_count
+        assert handler.inserts == expected_inserts
+        assert progress[-1] == (rows_count, rows_count)
+        assert len(progress) == expected_inserts
+
+        assert handler.select('select count(*), max(id) from tbl1')[0] == (rows_count, rows_count - 1)
+        assert handler.select('select name from tbl1 where id = 500')[0] == ('name500',)
+
+    def test_sqlite(self):
+        self._check_insert(SqliteHandler(), 1000, expected_inserts=4)
+
+    def test_duckdb(self):
+        self._check_insert(DuckDBHandler(), 1000, expected_inserts=3)
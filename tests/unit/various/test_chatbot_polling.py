@@ -0,0 +1,221 @@
+import datetime as dt
+import threading
+from types import SimpleNamespace
+
+import pandas as pd
+
+from tests.unit.executor_test_base import BaseUnitTest
+
+CHAT_PARAMS = [{
+    'polling': {'type': 'message_count', 'table': 'chats', 'chat_id_col': 'chat_id', 'count_col': 'count',
+                'time_col': 'updated_at'},
+    'chat_table': {'name': 'messages', 'chat_id_col': 'chat_id', 'username_col': 'user', 'text_col': 'text',
+                   'time_col': 'created_at'},
+}]
+
+START = dt.datetime(2024, 1, 1)
+
+
+class FakeChatHandler:
+    """
+    Chat database: table of messages and table with count of messages in every chat
+    """
+
+    def __init__(self):
+        self.messages = []
+        self.queries = []
+
+    def add_message(self, chat_id, text, user='user', created_at=None):
+        if created_at is None:
+            created_at = START + dt.timedelta(minutes=len(self.messages))
+        self.messages.append({
+            'chat_id': chat_id, 'text': text, 'user': user, 'created_at': created_at,
+        })
+
+    def query(self, query):
+        from mindsdb.api.executor.utilities.sql import query_df
+
+        self.queries.append(query)
+
+        messages = pd.DataFrame(self.messages)
+        tables = {
+            'messages': messages,
+            'chats': messages.groupby('chat_id').agg(
+                count=('text', 'count'), updated_at=('created_at', 'max')
+            ).reset_index(),
+        }
+        df = query_df(tables[query.from_table.parts[0]], query)
+        return SimpleNamespace(data_frame=df)
+
+    def table_queries(self, table):
+        return [query for query in self.queries if query.from_table.parts[0] == table]
+
+
+class SubscribedChatHandler(FakeChatHandler):
+
+    def __init__(self, events):
+        super().__init__()
+        self.events = events
+
+    def subscribe(self, stop_event, callback, table_name, columns=None):
+        assert table_name == 'chats' and columns == ['count']
+        for row in self.events:
+            callback(row)
+
+
+def make_polling(handler):
+    from mindsdb.interfaces.chatbot.memory import HandlerMemory
+    from mindsdb.interfaces.chatbot.polling import MessageCountPolling
+
+    chat_task = SimpleNamespace(
+        chat_handler=handler,
+        bot_id=1,
+        bot_params={'bot_username': 'bot'},
+        on_message=lambda message, chat_memory, table_name: received.append(message.text),
+    )
+    received = []
+    chat_task.memory = HandlerMemory(chat_task, CHAT_PARAMS)
+    return MessageCountPolling(chat_task, CHAT_PARAMS), received
+
+
+class TestMessageCountPolling(BaseUnitTest):
+
+    def test_changed_chats(self):
+        handler = FakeChatHandler()
+        handler.add_message('c1', 'hi')
+        handler.add_message('c2', 'hello')
+        polling, received = make_polling(handler)
+
+        # first check remembers state of chats
+        assert polling.check_message_count(CHAT_PARAMS[0]) == []
+        assert handler.queries[-1].where is None
+
+        handler.add_message('c1', 'how are you?')
+        assert polling.check_message_count(CHAT_PARAMS[0]) == [('c1',)]
+        # only chats changed after previous check are requested
+        assert 'updated_at >=' in handler.queries[-1].where.to_string()
+
+        assert polling.check_message_count(CHAT_PARAMS[0]) == []
+
+    def test_history_is_appended(self):
+        from mindsdb.interfaces.chatbot.chatbot_task import HOLDING_MESSAGE
+
+        handler = FakeChatHandler()
+        handler.add_message('c1', 'hi')
+        handler.add_message('c1', 'hello', user='bot')
+        handler.add_message('c1', 'question 1')
+        polling, received = make_polling(handler)
+
+        polling.process_chat(('c1',), CHAT_PARAMS[0])
+        assert received == ['question 1']
+        assert 'created_at >=' not in handler.table_queries('messages')[-1].where.to_string()
+
+        handler.add_message('c1', HOLDING_MESSAGE, user='bot')
+        handler.add_message('c1', 'answer 1', user='bot')
+        handler.add_message('c1', 'question 2')
+        polling.process_chat(('c1',), CHAT_PARAMS[0])
+        assert received == ['question 1', 'question 2']
+
+        # only new messages are requested
+        assert 'created_at >=' in handler.table_queries('messages')[-1].where.to_string()
+        history = polling.chat_task.memory.get_chat_history(('c1',), 'messages')
+        assert [msg.text for msg in history] == ['hi', 'hello', 'question 1', 'answer 1', 'question 2']
+
+    def test_repeated_message(self):
+        handler = FakeChatHandler()
+        handler.add_message('c1', 'yes', created_at=START)
+        polling, received = make_polling(handler)
+        memory = polling.chat_task.memory
+
+        history = memory.get_chat_history(('c1',), 'messages')
+        assert [msg.text for msg in history] == ['yes']
+
+        # the same message is sent again at the same time
+        handler.add_message('c1', 'yes', created_at=START)
+        handler.add_message('c1', 'no', created_at=START)
+        history = memory.get_chat_history(('c1',), 'messages', cached=False)
+        assert sorted(msg.text for msg in history) == ['no', 'yes', 'yes']
+
+        # cached messages are not added twice
+        history = memory.get_chat_history(('c1',), 'messages', cached=False)
+        assert sorted(msg.text for msg in history) == ['no', 'yes', 'yes']
+
+    def test_last_messages(self):
+        from mindsdb.interfaces.chatbot.memory import HandlerMemory
+
+        handler = FakeChatHandler()
+        handler.add_message('c1', 'hi')
+        polling, received = make_polling(handler)
+        memory = polling.chat_task.memory
+
+        history = memory.get_chat_history(('c1',), 'messages')
+        assert [msg.text for msg in history] == ['hi']
+
+        # more new messages than the depth of history: the newest of them are kept
+        for i in range(HandlerMemory.MAX_DEPTH + 10):
+            handler.add_message('c1', f'message {i}')
+        history = memory.get_chat_history(('c1',), 'messages', cached=False)
+        assert [msg.text for msg in history] == [
+            f'message {i}' for i in range(10, HandlerMemory.MAX_DEPTH + 10)
+        ]
+
+    def test_subscribe(self):
+        handler = SubscribedChatHandler(events=[{'chat_id': 'c1', 'count': 1}])
+        handler.add_message('c1', 'hi')
+        polling, received = make_polling(handler)
+
+        polling.run(threading.Event())
+
+        assert received == ['hi']
+        # count of messages is not polled
+        assert handler.table_queries('chats') == []
+
+    def test_subscribe_fallback(self):
+        handler = SubscribedChatHandler(events=[])
+
+        def subscribe(*args, **kwargs):
+            raise NotImplementedError()
+
+        handler.subscribe = subscribe
+        handler.add_message('c1', 'hi')
+        polling, received = make_polling(handler)
+
+        stop_event = threading.Event()
+        query = handler.query
+
+        def query_once(*args, **kwargs):
+            # stop after the first check
+            stop_event.set()
+            return query(*args, **kwargs)
+
+        handler.query = query_once
+        polling.run(stop_event)
+
+        # count of messages is polled
+        assert len(handler.table_queries('chats')) == 1
+
+    def test_backoff(self):
+        handler = FakeChatHandler()
+        handler.add_message('c1', 'hi')
+        polling, received = make_polling(handler)
+
+        class StopEvent:
+            def __init__(self):
+                self.intervals = []
+
+            def is_set(self):
+                return False
+
+            def wait(self, interval):
+                self.intervals.append(interval)
+                if len(self.intervals) == 4:
+                    # user writes to chat
+                    handler.add_message('c1', 'question')
+                return len(self.intervals) == 6
+
+        stop_event = StopEvent()
+        polling.run_polling(stop_event, CHAT_PARAMS)
+
+        # interval grows while chats are idle and is reset by new message
+        assert stop_event.intervals == [2, 4, 7, 7, 1, 2]
+        assert received == ['question']
@@ -0,0 +1,68 @@
+import os
+import shutil
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+from mindsdb.interfaces.database import integrations
+from mindsdb.interfaces.database.integrations import IntegrationController
+from mindsdb.integrations.libs import handlers_manifest
+from mindsdb.integrations.libs.handlers_manifest import read_manifest
+
+
+class TestHandlersManifest:
+
+    def _copy_handlers(self, temp_dir):
+        handlers_path = IntegrationController()._get_handlers_path()
+        dst_path = Path(temp_dir)
+        for name in ('postgres_handler', 'openai_handler', 'web_handler'):
+            shutil.copytree(handlers_path / name, dst_path / name)
+        return dst_path
+
+    def test_manifest(self):
+        with TemporaryDirectory(prefix='handlers_') as temp_dir, TemporaryDirectory(prefix='cache_') as cache_dir:
+            handlers_path = self._copy_handlers(temp_dir)
+            refreshed_path = Path(cache_dir) / 'handlers_manifest.json'
+            with patch.object(IntegrationController, '_get_handlers_path', return_value=handlers_path), \
+                    patch.object(integrations, 'get_refreshed_manifest_path', return_value=refreshed_path):
+                scanned = IntegrationController().handlers_import_status
+
+                controller = IntegrationController()
+                controller.save_handlers_manifest()
+                assert set(read_manifest(handlers_path).keys()) == {'postgres_handler', 'openai_handler', 'web_handler'}
+
+                with patch.object(IntegrationController, '_scan_handler_dir') as scan:
+                    controller._load_handler_modules()
+                    # everything is taken from manifest
+                    scan.assert_not_called()
+                assert controller.handlers_import_status == scanned
+
+                # mtime is changed, but content is the same
+                init_file = handlers_path / 'openai_handler' / '__init__.py'
+                os.utime(init_file, (0, 0))
+                get_file_hash = handlers_manifest.get_file_hash
+                with patch.object(IntegrationController, '_scan_handler_dir') as scan, \
+                        patch.object(handlers_manifest, 'get_file_hash', side_effect=get_file_hash) as file_hash:
+                    controller._load_handler_modules()
+                    scan.assert_not_called()
+                    # only changed file is read
+                    assert [call.args[0] for call in file_hash.call_args_list] == [init_file]
+
+                # new mtime is saved, content is not checked anymore
+                assert set(read_manifest(handlers_path, refreshed_path).keys()) == {'postgres_handler', 'openai_handler', 'web_handler'}
+                with patch.object(IntegrationController, '_scan_handler_dir') as scan, \
+                        patch.object(handlers_manifest, 'get_file_hash') as file_hash:
+                    controller._load_handler_modules()
+                    scan.assert_not_called()
+                    file_hash.assert_not_called()
+
+                # content is changed: only this handler is scanned again
+                with open(handlers_path / 'postgres_handler' / '__init__.py', 'a') as f:
+                    f.write('\ntitle = "Postgres v2"\n')
+
+                scan_handler_dir = IntegrationController._scan_handler_dir
+                with patch.object(IntegrationController, '_scan_handler_dir', autospec=True,
+                                  side_effect=scan_handler_dir) as scan:
+                    controller._load_handler_modules()
+                    assert [call.args[1].name for call in scan.call_args_list] == ['postgres_handler']
+                assert controller.handlers_import_status['postgres']['icon'] == scanned['postgres']['icon']
@@ -0,0 +1,247 @@
+import json
+import math
+import re
+import threading
+import time
+from typing import Any, Dict, List, Optional
+from unittest.mock import MagicMock
+
+import pytest
+
+from langchain_core.embeddings import Embeddings
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.retrievers import BaseRetriever
+
+from mindsdb.integrations.libs.vectordatabase_handler import DistanceFunction, VectorStoreHandler
+from mindsdb.integrations.utilities.rag.retrievers import sql_retriever as sql_retriever_module
+from mindsdb.integrations.utilities.rag.retrievers.sql_retriever import SQLRetriever
+from mindsdb.integrations.utilities.rag.settings import (
+    DEFAULT_BOOLEAN_PROMPT_TEMPLATE,
+    DEFAULT_COLUMN_PROMPT_TEMPLATE,
+    DEFAULT_GENERATIVE_SYSTEM_PROMPT,
+    DEFAULT_SEMANTIC_PROMPT_TEMPLATE,
+    DEFAULT_TABLE_PROMPT_TEMPLATE,
+    DEFAULT_VALUE_PROMPT_TEMPLATE,
+    ColumnSchema,
+    DatabaseSchema,
+    SearchKwargs,
+    TableSchema,
+    ValueSchema,
+)
+
+LATENCY = 0.05
+
+
+class FakeRankingLLM(BaseChatModel):
+    """Answers 'yes' with confidence 0.8 to every schema, every call takes fixed time"""
+
+    latency: float = LATENCY
+    # ignore batched prompts, to test fallback to single calls
+    skip_batch: bool = False
+    # (answer, confidence) by table name
+    answers: Dict[str, Any] = {}
+    # tables which are not ranked in batched prompts
+    batch_skip: List[str] = []
+    calls: List[str] = []
+    active: int = 0
+    max_active: int = 0
+    lock: Any = None
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.lock = threading.Lock()
+        self.calls = []
+
+    @property
+    def _llm_type(self) -> str:
+        return 'fake-ranking'
+
+    def _generate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None, run_manager=None, **kwargs) -> ChatResult:
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self.latency)
+        with self.lock:
+            self.active -= 1
+
+        content = messages[-1].content
+        count = re.search(r'Below are (\d+) schema descriptions', content)
+        if count is not None:
+            self.calls.append('batch')
+            rankings = []
+            for i in range(int(count.group(1))):
+                candidate = content.split(f'# **Candidate {i}**')[1].split('# **Candidate ')[0]
+                table = self._get_table(candidate)
+                if self.skip_batch or table in self.batch_skip:
+                    continue
+                answer, confidence = self.answers.get(table, ('yes', 0.8))
+                rankings.append({'index': i, 'answer': answer, 'confidence': confidence})
+            message = AIMessage(content=json.dumps({'rankings': rankings}))
+        else:
+            self.calls.append('single')
+            answer, confidence = self.answers.get(self._get_table(content), ('yes', 0.8))
+            message = AIMessage(
+                content=answer,
+                response_metadata={'logprobs': {'content': [{'token': answer, 'logprob': math.log(confidence)}]}}
+            )
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    @staticmethod
+    def _get_table(content: str) -> Optional[str]:
+        table = re.search(r'The name of this table in the database: (\w+)', content)
+        return None if table is None else table.group(1)
+
+
+def make_schema(tables_count=5, columns_count=4, values_count=3):
+    tables = {}
+    for t in range(tables_count):
+        columns = {}
+        for c in range(columns_count):
+            values = {
+                f'value{v}': ValueSchema(value=v, type='int', description=f'value {v}', usage='filter')
+                for v in range(values_count)
+            }
+            columns[f'column{c}'] = ColumnSchema(
+                column=f'column{c}', type='int', description=f'column {c}', usage='filter',
+                values=values, max_filters=columns_count
+            )
+        tables[f'table{t}'] = TableSchema(
+            table=f'table{t}', description=f'table {t}', usage='filter',
+            columns=columns, max_filters=columns_count
+        )
+    return DatabaseSchema(
+        database='db', description='database', usage='search', tables=tables, max_filters=tables_count
+    )
+
+
+def make_retriever(llm, **kwargs):
+    params = dict(
+        fallback_retriever=MagicMock(spec=BaseRetriever),
+        vector_store_handler=MagicMock(spec=VectorStoreHandler),
+        max_filters=10,
+        filter_threshold=0.0,
+        min_k=1,
+        database_schema=make_schema(),
+        embeddings_model=MagicMock(spec=Embeddings),
+        search_kwargs=SearchKwargs(k=5),
+        rewrite_prompt_template=DEFAULT_SEMANTIC_PROMPT_TEMPLATE,
+        table_prompt_template=DEFAULT_TABLE_PROMPT_TEMPLATE,
+        column_prompt_template=DEFAULT_COLUMN_PROMPT_TEMPLATE,
+        value_prompt_template=DEFAULT_VALUE_PROMPT_TEMPLATE,
+        boolean_system_prompt=DEFAULT_BOOLEAN_PROMPT_TEMPLATE,
+        generative_system_prompt=DEFAULT_GENERATIVE_SYSTEM_PROMPT,
+        num_retries=2,
+        embeddings_table='embeddings',
+        source_table='source',
+        source_id_column='id',
+        distance_function=DistanceFunction.SQUARED_EUCLIDEAN_DISTANCE,
+        llm=llm,
+    )
+    params.update(kwargs)
+    return SQLRetriever(**params)
+
+
+def count_schema(schema):
+    # count of ranked tables, columns, values
+    tables = list(schema.tables.values())
+    columns = [c for t in tables for c in t.columns.values()]
+    values = [v for c in columns for v in c.values.values()]
+    return len(tables), len(columns), len(values)
+
+
+class TestSchemaRanking:
+
+    def setup_method(self):
+        sql_retriever_module.schema_ranking_cache.clear()
+
+    def test_batched_ranking(self):
+        llm = FakeRankingLLM()
+        retriever = make_retriever(llm)
+
+        start = time.perf_counter()
+        ranked_schema, ablation_value_dict, _ = retriever._breadth_first_search(query='question')
+        elapsed = time.perf_counter() - start
+
+        # 5 tables + 20 columns + 60 values would take 85 sequential calls
+        assert count_schema(ranked_schema) == (5, 20, 60)
+        assert len(ablation_value_dict) == 60
+        assert all(v.relevance == 0.9 for v in ranked_schema.tables['table0'].columns['column0'].values.values())
+        # one batch for tables, one for columns, 3 concurrent batches for values
+        assert llm.calls == ['batch'] * 5
+        assert llm.max_active == 3
+        # three sequential levels
+        assert elapsed < LATENCY * 6
+
+    def test_fallback_to_single_calls(self):
+        llm = FakeRankingLLM(skip_batch=True)
+        retriever = make_retriever(
+            llm, database_schema=make_schema(tables_count=3, columns_count=2, values_count=2),
+            ranking_max_concurrency=20
+        )
+
+        start = time.perf_counter()
+        ranked_schema, _, _ = retriever._breadth_first_search(query='question')
+        elapsed = time.perf_counter() - start
+
+        assert count_schema(ranked_schema) == (3, 6, 12)
+        # score from logprobs
+        assert ranked_schema.tables['table0'].relevance == 0.9
+        assert llm.calls.count('single') == 3 + 6 + 12
+        # every level: batch + concurrent single calls
+        assert elapsed < LATENCY * 10
+
+    def test_not_batched(self):
+        llm = FakeRankingLLM()
+        retriever = make_retriever(
+            llm, database_schema=make_schema(tables_count=4, columns_count=2, values_count=2),
+            ranking_batch_size=1, ranking_max_concurrency=4
+        )
+        ranked_schema, _, _ = retriever._breadth_first_search(query='question')
+
+        assert count_schema(ranked_schema) == (4, 8, 16)
+        assert llm.calls == ['single'] * (4 + 8 + 16)
+        assert llm.max_active == 4
+
+    def test_ranking_cache(self):
+        llm = FakeRankingLLM()
+        retriever = make_retriever(llm)
+
+        embedding = [0.1, 0.2, 0.3, 0.4]
+        similar_embedding = [0.1, 0.2, 0.3, 0.41]
+        retriever._breadth_first_search(query='question', query_embedding=embedding)
+        assert len(llm.calls) == 5
+
+        # similar question: rankings are taken from cache
+        llm.calls.clear()
+        ranked_schema, _, _ = retriever._breadth_first_search(query='question?', query_embedding=similar_embedding)
+        assert llm.calls == []
+        assert count_schema(ranked_schema) == (5, 20, 60)
+
+        # other question
+        retriever._breadth_first_search(query='other', query_embedding=[-0.1, 0.2, -0.3, 0.4])
+        assert len(llm.calls) == 5
+
+        # schema is changed
+        llm.calls.clear()
+        retriever.database_schema.tables['table0'].description = 'changed'
+        retriever._breadth_first_search(query='question', query_embedding=embedding)
+        assert len(llm.calls) == 5
+
+    def test_batch_and_single_scores_are_same(self):
+        # the same answers give the same filtering, whether the candidate is ranked in batch or by fallback
+        answers = {'table0': ('yes', 0.8), 'table1': ('no', 0.8), 'table2': ('yes', 0.3)}
+        for batch_skip in ([], ['table0'], ['table1', 'table2'], ['table0', 'table1', 'table2']):
+            sql_retriever_module.schema_ranking_cache.clear()
+            llm = FakeRankingLLM(answers=answers, batch_skip=batch_skip)
+            schema = make_schema(tables_count=3, columns_count=1, values_count=1)
+            schema.filter_threshold = 0.7
+            retriever = make_retriever(llm, database_schema=schema)
+
+            ranked_schema, _, _ = retriever._breadth_first_search(query='question')
+
+            assert list(ranked_schema.tables) == ['table0']
+            assert ranked_schema.tables['table0'].relevance == pytest.approx(0.9)
+            # skipped tables, then the single column and value of table0
+            assert llm.calls.count('single') == len(batch_skip) + 2